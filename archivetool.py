@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Convert block db(s) in the storage path to archive mode"""
+
+import getopt
+import glob
+import logging
+import os
+import sys
+
+sys.path.append("loopchain/protos")
+import loopchain.utils as util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+from loopchain.storage import KeyValueStoreError, open_key_value_store
+
+
+def archive_block_db(db_path, depth):
+    """db_path 의 block db 에서 depth 이상 지난 block 의 body 를 archive 로 옮긴다.
+    peer 가 사용하고 있지 않은 block db 에만 사용해야 한다.
+
+    :param db_path: block db path (.storage/db_*)
+    :param depth: 마지막 block 으로부터 depth 이상 지난 block 을 옮긴다.
+    :return: archive 를 처리한 block 의 갯수, block db 가 아니면 -1
+    """
+    block_db = open_key_value_store(db_path, create_if_missing=False)
+    try:
+        block_db.Get(BlockChain.LAST_BLOCK_KEY)
+    except KeyError:
+        # peer id 등을 저장하는 block db 가 아닌 level db
+        return -1
+
+    blockchain = BlockChain(block_db, archive_path=db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX)
+    total_count = 0
+    while True:
+        count = blockchain.archive_blocks(depth)
+        if count == 0:
+            break
+        total_count += count
+        logging.info(f"archived blocks of {db_path} to height({blockchain.archived_height})")
+
+    # LevelDB 에서 지운 block body 의 공간을 정리한다.
+    block_db.CompactRange()
+    return total_count
+
+
+def main(argv):
+    try:
+        opts, args = getopt.getopt(argv, "dho:", ["help", "depth=", "configure_file_path="])
+    except getopt.GetoptError as e:
+        logging.error(e)
+        usage()
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if (opt == "-o") or (opt == "--configure_file_path"):
+            conf.Configure().load_configure_json(arg)
+
+    depth = conf.BLOCK_ARCHIVE_DEPTH
+    for opt, arg in opts:
+        if opt == "--depth":
+            depth = int(arg)
+        elif opt == "-d":
+            util.set_log_level_debug()
+        elif (opt == "-h") or (opt == "--help"):
+            usage()
+            return
+
+    db_paths = args
+    if not db_paths:
+        db_paths = [db_path for db_path in sorted(glob.glob(os.path.join(conf.DEFAULT_STORAGE_PATH, 'db_*')))
+                    if os.path.isdir(db_path) and not db_path.endswith(conf.BLOCK_ARCHIVE_PATH_SUFFIX)]
+
+    for db_path in db_paths:
+        try:
+            count = archive_block_db(db_path, depth)
+        except KeyValueStoreError as e:
+            print(f"skip {db_path}: fail to open block db({e})")
+            continue
+
+        if count < 0:
+            print(f"skip {db_path}: not a block db")
+        else:
+            print(f"{db_path}: archived {count} blocks into {db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX}")
+
+
+def usage():
+    print("USAGE: LoopChain Block Archive Tool")
+    print("python3 archivetool.py [option] [value] ... [block db path] ...")
+    print("move bodies of old blocks into archive segment files.")
+    print("if block db path is not given, all block db in DEFAULT_STORAGE_PATH(.storage/db_*) are converted.")
+    print("stop the peer before converting its block db, "
+          "and run the peer with ENABLE_BLOCK_ARCHIVE = True after converting.")
+    print("-------------------------------")
+    print("option list")
+    print("-------------------------------")
+    print("-o or --configure_file_path : json configure file path")
+    print("-h or --help : print this usage")
+    print("-d : Display colored log.")
+    print("--depth : archive blocks older than this depth from the last block (default BLOCK_ARCHIVE_DEPTH)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,10 +1,19 @@
 #!/bin/sh
 # by winDy
 # grpc 를 위한 python 코드를 자동으로 생성한다.
+# 생성된 코드는 requirements.txt 의 grpcio-tools 버전에 맞아야 하므로 다른 버전으로는 생성하지 않는다.
+
+REQUIRED_VERSION=$(sed -n 's/^grpcio-tools *== *\([0-9.]*\).*/\1/p' requirements.txt)
+INSTALLED_VERSION=$(python3 -m pip show grpcio-tools 2>/dev/null | sed -n 's/^Version: //p')
+if [ "$REQUIRED_VERSION" != "$INSTALLED_VERSION" ]; then
+    echo "grpcio-tools $REQUIRED_VERSION is required, but installed version is '$INSTALLED_VERSION'"
+    echo "pip3 install grpcio-tools==$REQUIRED_VERSION"
+    exit 1
+fi
 
 echo "Generating python grpc code from proto...."
 echo "into > " $PWD
 cd loopchain
-python3 -m grpc.tools.protoc -I'./protos' --python_out='./protos' --grpc_python_out='./protos' './protos/loopchain.proto'
+python3 -m grpc_tools.protoc -I'./protos' --python_out='./protos' --grpc_python_out='./protos' './protos/loopchain.proto'
 cd ..
 echo ""
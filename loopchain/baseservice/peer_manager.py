@@ -22,6 +22,7 @@ import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, StubManager, PeerStatus, PeerObject
 from loopchain.protos import loopchain_pb2_grpc, message_code
+from loopchain.tools import PublicVerifierContainer
 
 # loopchain_pb2 를 아래와 같이 import 하지 않으면 broadcast 시도시 pickle 오류가 발생함
 import loopchain_pb2
@@ -133,10 +134,20 @@ class PeerManager:
         self.peer_list_data = peer_list_data
         if do_reset:
             self.__reset_peer_status()
+        self.__warm_up_public_verifier(self.peer_list_data.peer_info_list.get(conf.ALL_GROUP_ID, {}).values())
         self.__set_peer_object_list()
 
         return self
 
+    @staticmethod
+    def __warm_up_public_verifier(peer_info_list):
+        """peer 들의 cert 를 미리 parse 해서 block, vote 의 signature 검증에 바로 쓸 수 있게 한다.
+
+        :param peer_info_list: [PeerInfo, ...]
+        """
+        created_count = PublicVerifierContainer.warm_up([peer_info.cert for peer_info in peer_info_list])
+        util.logger.spam(f"peer_manager:warm up public verifier({created_count})")
+
     def __set_peer_object_list(self):
         """ peer_info_list convert peer_object_list"""
 
@@ -188,6 +199,8 @@ class PeerManager:
 
         self.__init_peer_group(peer_info.group_id)
 
+        self.__warm_up_public_verifier([peer_info])
+
         util.logger.spam(f"peer_manager::add_peer try make PeerObject")
         peer = PeerObject(peer_info)
 
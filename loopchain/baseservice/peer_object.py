@@ -20,7 +20,7 @@ from enum import IntEnum
 from loopchain import configure as conf
 from loopchain.baseservice import StubManager
 from loopchain.protos import loopchain_pb2_grpc
-from loopchain.tools import PublicVerifier
+from loopchain.tools import PublicVerifier, PublicVerifierContainer
 
 
 class PeerStatus(IntEnum):
@@ -123,7 +123,7 @@ class PeerObject:
             logging.exception(f"Create Peer create stub_manager fail target : {self.__peer_info.target} \n"
                               f"exception : {e}")
         try:
-            self.__cert_verifier = PublicVerifier(self.peer_info.cert)
+            self.__cert_verifier = PublicVerifierContainer.get_public_verifier(self.peer_info.cert)
         except Exception as e:
             logging.exception(f"create cert verifier error : {self.__peer_info.cert} \n"
                               f"exception {e}")
@@ -15,6 +15,17 @@
 
 from .exception import *
 from .score_base import *
+from .verified_tx_cache import *
 from .transaction import *
+from .tx_verifier import *
+from .mempool import *
+from .block_codec import *
+from .merkle_tree import *
 from .block import *
+from .block_cache import *
+from .block_archive import *
+from .invoke_result_store import *
+from .tx_filter import *
 from .blockchain import *
+from .chain_snapshot import *
+from .chain_verifier import *
@@ -21,7 +21,7 @@ from enum import Enum
 
 from loopchain import utils as util
 from loopchain.baseservice import ObjectManager
-from loopchain.blockchain import TransactionStatus, TransactionType, Transaction
+from loopchain.blockchain import TransactionStatus, TransactionType, Transaction, TxVerifier, BlockCodec, MerkleTree
 from loopchain.blockchain.exception import *
 from loopchain.blockchain.score_base import *
 from loopchain import configure as conf
@@ -44,18 +44,36 @@ class Block:
     Transaction 들을 담아서 Peer들과 주고 받는 Block Object.
     """
 
+    # binary encoding of block (see serialize_block), version is increased when the layout is changed.
+    ENCODING_MAGIC = b'LCB'
+    ENCODING_VERSION = 1
+    # magic(3s), version(B), height(Q), time_stamp(Q), made_block_count(q), block_status(B), block_type(B), flags(B)
+    __ENCODING_HEADER = struct.Struct('>3sBQQqBBB')
+    __ENCODING_LENGTH = struct.Struct('>I')
+    __FLAG_PREV_BLOCK_CONFIRM = 0x01
+    __FLAG_DIVIDED_BLOCK = 0x02
+    __FLAG_PEER_MANAGER = 0x04
+    __FLAG_RAW_MERKLE = 0x08
+
+    # block 의 tx 들을 worker pool 에서 검증한다. (validate, verify_integrity)
+    tx_verifier = TxVerifier()
+
     def __init__(self, channel_name, made_block_count=0, is_divided_block=False):
         # Block head
         self.version = "0.1a"
         self.prev_block_hash = ""
         self.prev_block_confirm = False  # SiEver 구현을 위한 값, AnnounceConfirmedBlock 메시지를 대체하여 다음 블럭에 투표 결과를 담아서 전송한다.
         self.merkle_tree_root_hash = ""
-        self.merkle_tree = []
         self.time_stamp = 0
         self.__channel_name = channel_name
+        self.__merkle_version = conf.MERKLE_TREE_VERSION
+        self.__merkle_tree = MerkleTree(version=self.__merkle_version)
+        self.__body_size = Block.__ENCODING_LENGTH.size
 
         # 검증된 트랜젝션 목록
         self.confirmed_transaction_list = []
+        # confirmed_transaction_list 의 tx hash -> index (중복 tx 확인과 find_transaction_index 에 쓴다.)
+        self.__tx_index = {}
         self.block_hash = ""
         self.height = 0
         self.block_status = BlockStatus.unconfirmed
@@ -71,7 +89,6 @@ class Block:
         self.__next_leader_peer_id = ""
         self.__peer_manager = None
 
-        self.merkle_tree = []
         self.merkle_tree_root_hash = ""
         self.height = 0
         self.time_stamp = 0
@@ -124,6 +141,46 @@ class Block:
     def peer_manager(self, peer_manager):
         self.__peer_manager = peer_manager
 
+    @property
+    def merkle_version(self):
+        return self.__merkle_version
+
+    @property
+    def merkle_tree(self):
+        """confirmed_transaction_list 의 merkle tree
+        put_transaction 으로 담은 tx 는 담을 때마다 tree 에 더하며, tree 는 proof 를 만들 때 다시 쓴다.
+        tx 목록이 바뀌었으면 (갯수가 다르면) 다시 만든다.
+
+        :return: MerkleTree
+        """
+        if self.__merkle_tree is None or self.__merkle_tree.leaf_count != len(self.confirmed_transaction_list):
+            self.__merkle_tree = MerkleTree([tx.get_tx_hash() for tx in self.confirmed_transaction_list],
+                                            self.__merkle_version)
+        return self.__merkle_tree
+
+    @property
+    def body_size(self):
+        """serialize_block_body 결과의 크기 (bytes, 압축 전)
+        put_transaction 으로 tx 를 담을 때마다 더해 두므로 block 을 serialize 하지 않고 크기를 알 수 있다.
+        """
+        if self.__body_size is None:
+            self.__body_size = Block.__ENCODING_LENGTH.size + \
+                sum(tx.serialized_size() for tx in self.confirmed_transaction_list)
+        return self.__body_size
+
+    def __get_tx_index(self):
+        """confirmed_transaction_list 의 tx hash -> index
+        put_transaction 으로 담은 tx 는 담을 때마다 더하며, tx 목록이 바뀌었으면 (갯수가 다르면) 다시 만든다.
+        같은 hash 의 tx 가 여러번 담겨 있으면 처음 index 를 쓴다.
+
+        :return: dict
+        """
+        if self.__tx_index is None or len(self.__tx_index) != len(self.confirmed_transaction_list):
+            self.__tx_index = {}
+            for index, tx in enumerate(self.confirmed_transaction_list):
+                self.__tx_index.setdefault(tx.get_tx_hash(), index)
+        return self.__tx_index
+
     def put_transaction(self, tx):
         """Block Generator 에서만 사용한다.
         tx는 단수 혹은 여러개 일 수 있다
@@ -152,83 +209,227 @@ class Block:
             else:
                 return False
 
-        # Block 에 검증된 Transaction 추가 : 목록에 존재하는지 확인 필요
-        if tx not in self.confirmed_transaction_list:
+        # Block 에 검증된 Transaction 추가 : 목록에 존재하는지 tx hash 로 확인한다.
+        tx_index = self.__get_tx_index()
+        if tx.get_tx_hash() not in tx_index:
+            tx_index[tx.get_tx_hash()] = len(self.confirmed_transaction_list)
             self.confirmed_transaction_list.append(tx)
+            # generate_block 에서는 root 만 계산하도록 tx 를 담을 때마다 merkle tree 에 더한다.
+            if self.__merkle_tree is not None and \
+                    self.__merkle_tree.leaf_count == len(self.confirmed_transaction_list) - 1:
+                self.__merkle_tree.append(tx.get_tx_hash())
+            else:
+                self.__merkle_tree = None
+            if self.__body_size is not None:
+                self.__body_size += tx.serialized_size()
         return True
 
+    def divide(self):
+        """지금까지 담은 tx 를 나누어진 block (is_divided_block) 으로 옮기고 이 block 은 비운다.
+        tx 목록과 merkle tree, body size 를 그대로 넘기므로 tx 갯수와 상관 없이 O(1) 이다.
+
+        :return: 나누어진 block
+        """
+        divided_block = Block(channel_name=self.__channel_name, is_divided_block=True)
+        divided_block.__merkle_version = self.__merkle_version
+        divided_block.confirmed_transaction_list = self.confirmed_transaction_list
+        divided_block.__tx_index = self.__tx_index
+        divided_block.__merkle_tree = self.__merkle_tree
+        divided_block.__body_size = self.__body_size
+
+        self.confirmed_transaction_list = []
+        self.__tx_index = {}
+        self.__merkle_tree = MerkleTree(version=self.__merkle_version)
+        self.__body_size = Block.__ENCODING_LENGTH.size
+        return divided_block
+
     @staticmethod
     def __calculate_merkle_tree_root_hash(block):
         """현재 들어온 Tx들만 가지고 Hash tree를 구성해서 merkle tree root hash 계산.
+        받은 block 을 검증할 때에도 쓰이므로 보관하던 merkle tree 는 버리고 다시 만든다.
 
         :return: 계산된 root hash
         """
+        block.__merkle_tree = None
+        merkle_tree = block.merkle_tree
 
-        # 머클트리 생성
-        # 일단 해당 블럭에 홀수개의 트랜잭션이 있으면 마지막 트랜잭션의 Hash를 복사하여 넣어줍니다.
-        # 바로 앞의 HASH(n) + HASH(n+1) 을 해싱해 줍니다.
-        # 1개가 나올때까지 반복 합니다.
-        # 마지막 1개가 merkle_tree_root_hash
-
-        mt_list = [tx.get_tx_hash() for tx in block.confirmed_transaction_list]
-        block.merkle_tree.extend(mt_list)
-
-        while True:
-            tree_length = len(mt_list)
-            tmp_mt_list = []
-            if tree_length <= 1:
-                # 0이나 1은 종료
-                break
-            elif tree_length % 2 == 1:
-                mt_list.append(mt_list[tree_length-1])
-                tree_length += 1
-
-            # 머클해쉬 생성
-            for row in range(int(tree_length/2)):
-                idx = row * 2
-                mk_sum = b''.join([mt_list[idx].encode(encoding='UTF-8'), mt_list[idx+1].encode(encoding='UTF-8')])
-                mk_hash = hashlib.sha256(mk_sum).hexdigest()
-                tmp_mt_list.append(mk_hash)
-            mt_list = tmp_mt_list
-            block.merkle_tree.extend(mt_list)
-
-        if len(mt_list) == 1:
-            block.merkle_tree_root_hash = mt_list[0]
+        if merkle_tree.leaf_count > 0:
+            block.merkle_tree_root_hash = merkle_tree.root
 
         return block.merkle_tree_root_hash
 
-    def serialize_block(self):
+    def serialize_block(self, codec=None):
         """블럭 Class serialize
-        Pickle 을 사용하여 serialize 함
+        versioned binary format 을 사용하여 serialize 함
+        (magic, version, 고정 길이 header field, 가변 길이 header field, tx section)
 
+        :param codec: tx section 을 압축할 BlockCodec 의 이름, None 이면 conf.BLOCK_WIRE_CODEC
         :return: serialize 결과
         """
-
-        return pickle.dumps(self, pickle.DEFAULT_PROTOCOL)
+        codec = (codec, conf.BLOCK_WIRE_CODEC)[codec is None]
+        return b''.join([self.serialize_block_header(), BlockCodec.encode(self.serialize_block_body(), codec)])
 
     def deserialize_block(self, block_dumps):
         """블럭 Class deserialize
         자기자신을 block_dumps의 data로 변환함
+        이전 버전에서 pickle 로 저장된 block 도 읽을 수 있다.
 
         :param block_dumps: deserialize 할 Block dump data
         """
 
-        dump_obj = pickle.loads(block_dumps)
-        if type(dump_obj) == Block:
-            self.__dict__ = dump_obj.__dict__
+        if block_dumps[:len(Block.ENCODING_MAGIC)] != Block.ENCODING_MAGIC:
+            dump_obj = pickle.loads(block_dumps)
+            if type(dump_obj) == Block:
+                self.__dict__ = dump_obj.__dict__
+                # 이전 버전의 block 은 HEX merkle tree 를 list 로 가지고 있다.
+                self.__dict__.pop('merkle_tree', None)
+                self.__merkle_version = MerkleTree.HEX
+                self.__merkle_tree = None
+                self.__body_size = None
+                self.__tx_index = None
+            return
+
+        block_dumps = memoryview(block_dumps)
+        offset = self.deserialize_block_header(block_dumps)
+        self.deserialize_block_body(block_dumps, offset)
+
+    def serialize_block_header(self):
+        """tx section 을 제외한 block header 만 serialize 한다.
+        serialize_block 의 결과는 serialize_block_header + serialize_block_body 와 같다.
+
+        :return: serialize 결과
+        """
+        flags = 0
+        if self.prev_block_confirm:
+            flags |= Block.__FLAG_PREV_BLOCK_CONFIRM
+        if self.__is_divided_block:
+            flags |= Block.__FLAG_DIVIDED_BLOCK
+        if self.__peer_manager is not None:
+            flags |= Block.__FLAG_PEER_MANAGER
+        if self.__merkle_version == MerkleTree.RAW:
+            flags |= Block.__FLAG_RAW_MERKLE
+
+        fields = [self.version.encode(conf.PEER_DATA_ENCODING),
+                  self.__channel_name.encode(conf.PEER_DATA_ENCODING),
+                  self.prev_block_hash.encode(conf.HASH_KEY_ENCODING),
+                  self.merkle_tree_root_hash.encode(conf.HASH_KEY_ENCODING),
+                  self.block_hash.encode(conf.HASH_KEY_ENCODING),
+                  self.peer_id.encode(conf.PEER_DATA_ENCODING),
+                  self.__next_leader_peer_id.encode(conf.PEER_DATA_ENCODING),
+                  self.__signature,
+                  b'' if self.__peer_manager is None else bytes(self.__peer_manager)]
+
+        dumps = [Block.__ENCODING_HEADER.pack(Block.ENCODING_MAGIC,
+                                              Block.ENCODING_VERSION,
+                                              self.height,
+                                              self.time_stamp,
+                                              self.__made_block_count,
+                                              self.block_status.value,
+                                              self.__block_type.value,
+                                              flags)]
+        for field in fields:
+            dumps.append(Block.__ENCODING_LENGTH.pack(len(field)))
+            dumps.append(field)
+
+        return b''.join(dumps)
+
+    def serialize_block_body(self, tx_offsets=None):
+        """block 의 tx section 만 serialize 한다.
+
+        :param tx_offsets: list 를 넘기면 serialize 결과 안에서 각 tx 가 시작하는 위치를 순서대로 채운다.
+        (Transaction.deserialize_tx 로 tx 하나만 읽을 때 사용)
+        :return: serialize 결과
+        """
+        dumps = [Block.__ENCODING_LENGTH.pack(len(self.confirmed_transaction_list))]
+        dumps.extend(tx.serialize_tx() for tx in self.confirmed_transaction_list)
+
+        if tx_offsets is not None:
+            offset = Block.__ENCODING_LENGTH.size
+            for tx_dump in dumps[1:]:
+                tx_offsets.append(offset)
+                offset += len(tx_dump)
+
+        return b''.join(dumps)
+
+    def deserialize_block_header(self, block_dumps, offset=0):
+        """serialize_block_header 의 결과로 block header 를 복원한다.
+        tx 목록은 비어 있는 상태가 된다.
+
+        :param block_dumps: serialize 된 block header (or block)
+        :param offset: block_dumps 안에서 header 가 시작하는 위치
+        :return: header 다음 위치 (offset)
+        """
+        magic, version, self.height, self.time_stamp, self.__made_block_count, block_status, block_type, flags = \
+            Block.__ENCODING_HEADER.unpack_from(block_dumps, offset)
+        if version != Block.ENCODING_VERSION:
+            raise BlockError(f"unknown block encoding version({version})")
+        offset += Block.__ENCODING_HEADER.size
+
+        fields = []
+        for _ in range(9):
+            length, = Block.__ENCODING_LENGTH.unpack_from(block_dumps, offset)
+            offset += Block.__ENCODING_LENGTH.size
+            fields.append(bytes(block_dumps[offset:offset + length]))
+            offset += length
+
+        self.version = fields[0].decode(conf.PEER_DATA_ENCODING)
+        self.__channel_name = fields[1].decode(conf.PEER_DATA_ENCODING)
+        self.prev_block_hash = fields[2].decode(conf.HASH_KEY_ENCODING)
+        self.merkle_tree_root_hash = fields[3].decode(conf.HASH_KEY_ENCODING)
+        self.block_hash = fields[4].decode(conf.HASH_KEY_ENCODING)
+        self.peer_id = fields[5].decode(conf.PEER_DATA_ENCODING)
+        self.__next_leader_peer_id = fields[6].decode(conf.PEER_DATA_ENCODING)
+        self.__signature = fields[7]
+        self.__peer_manager = fields[8] if flags & Block.__FLAG_PEER_MANAGER else None
+
+        self.block_status = BlockStatus(block_status)
+        self.__block_type = BlockType(block_type)
+        self.prev_block_confirm = bool(flags & Block.__FLAG_PREV_BLOCK_CONFIRM)
+        self.__is_divided_block = bool(flags & Block.__FLAG_DIVIDED_BLOCK)
+        self.__merkle_version = (MerkleTree.HEX, MerkleTree.RAW)[bool(flags & Block.__FLAG_RAW_MERKLE)]
+        self.__merkle_tree = None
+        self.__body_size = Block.__ENCODING_LENGTH.size
+        self.confirmed_transaction_list = []
+        self.__tx_index = {}
+
+        return offset
+
+    def deserialize_block_body(self, block_dumps, offset=0):
+        """serialize_block_body 의 결과로 block 의 tx 목록을 복원한다.
+        BlockCodec 으로 압축된 tx section 은 block_dumps 의 끝까지이다.
+
+        :param block_dumps: serialize 된 block body (or block)
+        :param offset: block_dumps 안에서 tx section 이 시작하는 위치
+        :return: tx section 다음 위치 (offset)
+        """
+        if BlockCodec.is_encoded(block_dumps, offset):
+            self.deserialize_block_body(BlockCodec.decode(block_dumps[offset:]))
+            return len(block_dumps)
+
+        body_offset = offset
+        tx_count, = Block.__ENCODING_LENGTH.unpack_from(block_dumps, offset)
+        offset += Block.__ENCODING_LENGTH.size
+
+        self.confirmed_transaction_list = []
+        for _ in range(tx_count):
+            tx = Transaction()
+            offset = tx.deserialize_tx(block_dumps, offset)
+            self.confirmed_transaction_list.append(tx)
+        self.__merkle_tree = None
+        self.__tx_index = None
+        self.__body_size = offset - body_offset
+
+        return offset
 
     def find_transaction_index(self, transaction_hash):
-        for idx, tx in enumerate(self.confirmed_transaction_list):
-            if tx.get_tx_hash() == transaction_hash:
-                return idx
-        return -1
+        return self.__get_tx_index().get(transaction_hash, -1)
 
     @staticmethod
-    def validate(block, tx_queue=None) -> bool:
+    def validate(block, mempool=None) -> bool:
         """validate block and all transactions in block
 
         :param: block
-        :param: tx_queue
+        :param: mempool: 주어지면 block 에 담긴 tx 를 mempool 에서 제거한다.
         :return validate success return true
         """
         mk_hash = Block.__calculate_merkle_tree_root_hash(block)
@@ -255,38 +456,39 @@ class Block:
             raise BlockError('Prev Block Hash not Exist')
 
         # Transaction Validate
-        confirmed_tx_list = []
-        for tx in block.confirmed_transaction_list:
-            if Transaction.validate(tx):
-                confirmed_tx_list.append(tx.tx_hash)
-            else:
-                raise BlockInValidError(f"block ({block.block_hash}) validate fails \n"
-                                        f"tx {tx.tx_hash} is invalid")
-
-        if tx_queue is not None:
-            block.__tx_validate_with_queue(tx_queue, confirmed_tx_list)
+        invalid_tx = Block.tx_verifier.verify(block.confirmed_transaction_list)
+        if invalid_tx is not None:
+            raise BlockInValidError(f"block ({block.block_hash}) validate fails \n"
+                                    f"tx {invalid_tx.tx_hash} is invalid")
+        if mempool is not None:
+            mempool.remove(tx.tx_hash for tx in block.confirmed_transaction_list)
 
         return True
 
-    def __tx_validate_with_queue(self, tx_queue, confirmed_tx_list):
-        remain_tx = []
-
-        while not tx_queue.empty():
-            tx_unloaded = tx_queue.get()
-            tx = pickle.loads(tx_unloaded)
+    def verify_integrity(self, verify_tx_signature=True, tx_verifier=None):
+        """peer service 없이 block 에 담긴 내용만으로 block 을 검증한다. (offline chain verifier)
+        tx hash, tx signature, merkle tree root hash, block hash 를 다시 계산하여 비교하며 block 을 바꾸지 않는다.
+        block signature 는 leader 의 인증서가 필요하므로 검증하지 않는다.
 
-            if tx.tx_hash not in confirmed_tx_list:
-                # logging.warning(f"tx_validate_with_queue not confirmed tx ({tx.tx_hash})({tx.type})")
-                # logging.warning(f"confirmed_tx list ({confirmed_tx_list})")
-                if tx.type == TransactionType.general:
-                    remain_tx.append(tx_unloaded)
+        :param verify_tx_signature: False 이면 tx 의 signature 는 검증하지 않는다.
+        :param tx_verifier: tx 들을 검증할 TxVerifier, None 이면 Block.tx_verifier
+        :raise BlockInValidError: 검증에 실패한 경우
+        """
+        tx_verifier = (tx_verifier, Block.tx_verifier)[tx_verifier is None]
+        invalid_tx = tx_verifier.verify(self.confirmed_transaction_list, verify_tx_signature)
+        if invalid_tx is not None:
+            if verify_tx_signature:
+                raise BlockInValidError(f"tx ({invalid_tx.get_tx_hash()}) hash or signature is invalid")
+            raise BlockInValidError(f"tx ({invalid_tx.get_tx_hash()}) hash is not same generate hash")
 
-        if len(remain_tx) != 0:
-            logging.warning(f"after tx validate, remain tx({len(remain_tx)})")
+        if len(self.confirmed_transaction_list) > 0:
+            merkle_tree = MerkleTree([tx.get_tx_hash() for tx in self.confirmed_transaction_list],
+                                     self.__merkle_version)
+            if merkle_tree.root != self.merkle_tree_root_hash:
+                raise BlockInValidError('Merkle Tree Root hash is not same')
 
-            for tx_unloaded in remain_tx:
-                ObjectManager().peer_service.channel_manager.get_block_manager(
-                    self.__channel_name).add_tx_unloaded(tx_unloaded)
+        if self.block_hash != Block.__generate_hash(self):
+            raise BlockInValidError('block Hash is not same generate hash')
 
     def generate_block(self, prev_block=None):
         """블럭을 생성한다 \n
@@ -310,8 +512,9 @@ class Block:
             self.time_stamp = util.get_time_stamp()  # ms단위
 
         # 트랜잭션이 있을 경우 머클트리 생성
+        # put_transaction 에서 tx 를 merkle tree 에 더해 두었으므로 root 만 계산한다.
         if len(self.confirmed_transaction_list) > 0:
-            Block.__calculate_merkle_tree_root_hash(self)
+            self.merkle_tree_root_hash = self.merkle_tree.root
         self.block_hash = Block.__generate_hash(self)
 
         return self.block_hash
@@ -338,6 +541,7 @@ class Block:
 
     def mk_merkle_proof(self, index):
         """Block안의 merkle tree에서 index 번째 Transaction이 merkle tree root를 구성하기 위한 나머지 node들의 hash값을 가져온다 (BITCOIN 머클트리 검증 proof 응용)
+        보관하던 merkle tree 에서 level 마다 sibling 하나씩을 찾으므로 proof 마다 tree 를 다시 만들지 않는다.
 
         :param index: Merkle tree안의 index 번째 Transaction.
 
@@ -348,31 +552,50 @@ class Block:
           *  block: 원래는 block header인데 따로 빼질 않아서 self를 return.
         """
 
-        nodes = [tx.get_tx_hash().encode(encoding='UTF-8') for tx in self.confirmed_transaction_list]
-        if len(nodes) % 2 and len(nodes) > 2:
-            nodes.append(nodes[-1])
-        layers = [nodes]
-
-        while len(nodes) > 1:
-            new_nodes = []
-            for i in range(0, len(nodes) - 1, 2):
-                new_nodes.append(
-                    hashlib.sha256(b''.join([nodes[i], nodes[i + 1]])).hexdigest().encode(encoding='UTF-8'))
-            if len(new_nodes) % 2 and len(new_nodes) > 2:
-                new_nodes.append(new_nodes[-1])
-            nodes = new_nodes
-            layers.append(nodes)
-        # Sanity check, make sure merkle root is valid
-        # assert nodes[0][::-1] == self.merkle_tree_root_hash
-        merkle_siblings = \
-            [layers[i][(index >> i) ^ 1] for i in range(len(layers)-1)]
-
         return {
             "transaction": self.confirmed_transaction_list[index].get_tx_hash(),
-            "siblings": [x.decode('utf-8') for x in merkle_siblings],
+            "siblings": self.merkle_tree.proof(index),
+            "block": self
+        }
+
+    def mk_merkle_proofs(self, indices):
+        """Block안의 merkle tree에서 여러 Transaction 이 merkle tree root 를 구성하기 위한 node 들을 한 번에 가져온다.
+        Transaction 들이 함께 쓰는 node 는 한 번만 담는다. (MerkleTree.multi_proof 참고)
+
+        :param indices: Merkle tree안의 Transaction index 목록
+        :return: 머클트리 검증 데이타 (indices, transactions, tx_count, nodes, block)
+
+          *  indices: 중복을 없애고 정렬한 transaction index 목록
+          *  transactions: indices 순서대로의 transaction hash
+          *  tx_count: block 안의 transaction 갯수 (merkle tree 의 leaf 갯수)
+          *  nodes: 검증하기 위한 node들의 hash들.
+          *  block: 원래는 block header인데 따로 빼질 않아서 self를 return.
+        """
+        merkle_tree = self.merkle_tree
+        nodes = merkle_tree.multi_proof(indices)
+        indices = sorted(set(indices))
+
+        return {
+            "indices": indices,
+            "transactions": [self.confirmed_transaction_list[index].get_tx_hash() for index in indices],
+            "tx_count": merkle_tree.leaf_count,
+            "nodes": nodes,
             "block": self
         }
 
+    @staticmethod
+    def merkle_paths(block, indices):
+        """머클트리 검증
+        주어진 block에서 여러 transaction 을 mk_merkle_proofs 의 결과로 한 번에 검증
+
+        :param block: 검증할 transaction 들이 있는 block.
+        :param indices: block안의 transaction index 목록
+        :return: True : 검증 완료
+        """
+        proofs = block.mk_merkle_proofs(indices)
+        return MerkleTree.verify_multi_proof(proofs['indices'], proofs['transactions'], proofs['tx_count'],
+                                             proofs['nodes'], block.merkle_tree_root_hash, block.merkle_version)
+
     @staticmethod
     def merkle_path(block, index):
         """머클트리 검증
@@ -383,32 +606,13 @@ class Block:
         :return: True : 검증 완료
         """
 
-        header = {}
         proof = block.mk_merkle_proof(index)
-        header['merkle_root'] = block.merkle_tree_root_hash
-        siblings = proof['siblings']
-        logging.debug("SLBLINGS : %s", siblings)
-        target_tx = block.confirmed_transaction_list[index].get_tx_hash()
-        # siblings = map( lambda x: x.decode('hex'), siblings)
-        siblings = [x.encode(encoding='UTF-8') for x in siblings]
-        resulthash = target_tx.encode(encoding='UTF-8')
-
-        for i in range(len(siblings)):
-            _proof = siblings[i]
-            # 0 means sibling is on the right; 1 means left
-            if index % 2 == 1:
-                left = _proof
-                right = resulthash
-            else:
-                left = resulthash
-                right = _proof
-            resulthash = hashlib.sha256(b''.join([left, right])).hexdigest().encode(encoding='UTF-8')
-            # logging.debug("%i st, %s %s => %s ", index, left, right, resulthash)
-            index = int(index / 2)
-
-        logging.debug('PROOF RESULT: %s , MK ROOT: %s', resulthash, block.merkle_tree_root_hash)
+        logging.debug("SLBLINGS : %s", proof['siblings'])
+        result = MerkleTree.verify_proof(proof['transaction'], index, proof['siblings'],
+                                         block.merkle_tree_root_hash, block.merkle_version)
+        logging.debug('PROOF RESULT: %s , MK ROOT: %s', result, block.merkle_tree_root_hash)
 
-        return resulthash == block.merkle_tree_root_hash.encode(encoding='UTF-8')
+        return result
 
     def sign(self, peer_auth):
         self.__signature = peer_auth.sign_data(self.block_hash, is_hash=True)
\ No newline at end of file
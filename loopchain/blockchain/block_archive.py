@@ -0,0 +1,173 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Append-only segment files for archived block bodies"""
+
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+
+from loopchain import configure as conf
+from loopchain.baseservice import CommonThread
+from loopchain.blockchain.exception import BlockError
+
+
+class BlockArchive:
+    """오래된 block 의 body 를 보관하는 append-only segment file 모음.
+    segment file 에는 (length, crc32) header 와 data 로 이루어진 record 를 이어서 기록하며,
+    기록한 record 는 (segment, offset, length) 로 찾는다. segment 는 mmap 으로 읽는다.
+    """
+
+    SEGMENT_FILE_NAME = "segment_{:08d}.dat"
+    __SEGMENT_FILE_PATTERN = re.compile(r'^segment_(\d{8})\.dat$')
+    # length, crc32
+    __RECORD_HEADER = struct.Struct('>II')
+    # segment, offset, length
+    __POINTER = struct.Struct('>III')
+
+    def __init__(self, archive_path, segment_max_bytes=None):
+        self.__archive_path = archive_path
+        self.__segment_max_bytes = (segment_max_bytes, conf.BLOCK_ARCHIVE_SEGMENT_MAX_BYTES)[segment_max_bytes is None]
+        self.__lock = threading.Lock()
+        self.__segment_maps = {}  # segment : mmap
+
+        os.makedirs(self.__archive_path, exist_ok=True)
+        segments = [int(match.group(1)) for match in
+                    (self.__SEGMENT_FILE_PATTERN.match(file_name) for file_name in os.listdir(self.__archive_path))
+                    if match is not None]
+        self.__segment = max(segments, default=0)
+        self.__segment_file = self.__open_segment(self.__segment)
+
+    @property
+    def archive_path(self):
+        return self.__archive_path
+
+    @staticmethod
+    def pack_pointer(segment, offset, length) -> bytes:
+        return BlockArchive.__POINTER.pack(segment, offset, length)
+
+    @staticmethod
+    def unpack_pointer(pointer):
+        """
+
+        :param pointer: pack_pointer 의 결과
+        :return: (segment, offset, length)
+        """
+        return BlockArchive.__POINTER.unpack(pointer)
+
+    def append(self, data):
+        """data 를 현재 segment 의 끝에 기록한다.
+        현재 segment 가 segment_max_bytes 를 넘으면 다음 segment 에 기록한다.
+        기록한 data 는 sync 를 호출하기 전까지 disk 에 sync 되지 않는다.
+
+        :param data: bytes
+        :return: (segment, offset, length), offset 은 record header 다음의 data 위치이다.
+        """
+        with self.__lock:
+            offset = self.__segment_file.tell()
+            if offset > 0 and offset + self.__RECORD_HEADER.size + len(data) > self.__segment_max_bytes:
+                self.__segment_file.flush()
+                os.fsync(self.__segment_file.fileno())
+                self.__segment_file.close()
+                self.__segment += 1
+                self.__segment_file = self.__open_segment(self.__segment)
+                offset = 0
+
+            self.__segment_file.write(self.__RECORD_HEADER.pack(len(data), zlib.crc32(data)))
+            self.__segment_file.write(data)
+
+            return self.__segment, offset + self.__RECORD_HEADER.size, len(data)
+
+    def sync(self):
+        """append 로 기록한 data 를 disk 에 sync 한다.
+        """
+        with self.__lock:
+            self.__segment_file.flush()
+            os.fsync(self.__segment_file.fileno())
+
+    def read(self, segment, offset, length):
+        """(segment, offset, length) 에 기록된 data 를 구한다.
+        segment 의 mmap 을 그대로 잘라서 돌려주므로 복사가 일어나지 않는다.
+
+        :return: memoryview
+        """
+        with self.__lock:
+            if segment == self.__segment:
+                self.__segment_file.flush()
+
+            segment_map = self.__segment_maps.get(segment)
+            if segment_map is None or segment_map.size() < offset + length:
+                # 현재 segment 는 계속 커지므로 읽으려는 위치가 mmap 보다 뒤에 있으면 다시 mmap 한다.
+                # 이전 mmap 은 이미 돌려준 memoryview 가 있을 수 있으므로 닫지 않는다.
+                try:
+                    with open(self.__segment_path(segment), 'rb') as segment_file:
+                        segment_map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError) as e:
+                    raise BlockError(f"fail to read archive segment({segment}): {e}")
+                self.__segment_maps[segment] = segment_map
+
+        record_offset = offset - self.__RECORD_HEADER.size
+        if record_offset < 0 or segment_map.size() < offset + length:
+            raise BlockError(f"wrong archive pointer({segment}, {offset}, {length})")
+
+        record_length, crc = self.__RECORD_HEADER.unpack_from(segment_map, record_offset)
+        data = memoryview(segment_map)[offset:offset + length]
+        if record_length != length or zlib.crc32(data) != crc:
+            raise BlockError(f"broken archive record({segment}, {offset}, {length})")
+
+        return data
+
+    def close(self):
+        with self.__lock:
+            self.__segment_file.close()
+            self.__segment_maps.clear()
+
+    def __open_segment(self, segment):
+        segment_file = open(self.__segment_path(segment), 'ab')
+        # append mode 로 열어도 tell() 이 파일 끝을 가리키지 않으므로 offset 계산을 위해 끝으로 이동한다.
+        segment_file.seek(0, os.SEEK_END)
+        return segment_file
+
+    def __segment_path(self, segment):
+        return os.path.join(self.__archive_path, self.SEGMENT_FILE_NAME.format(segment))
+
+
+class BlockArchiveCompactor(CommonThread):
+    """BlockChain 의 오래된 block body 를 주기적으로 archive 로 옮기는 thread
+    """
+
+    def __init__(self, blockchain, depth=None, interval=None):
+        CommonThread.__init__(self)
+        self.__blockchain = blockchain
+        self.__depth = depth
+        self.__interval = (interval, conf.BLOCK_ARCHIVE_INTERVAL)[interval is None]
+        self.__wake_up = threading.Event()
+
+    def stop(self):
+        CommonThread.stop(self)
+        self.__wake_up.set()
+
+    def run(self):
+        while self.is_run():
+            try:
+                while self.is_run() and self.__blockchain.archive_blocks(self.__depth) > 0:
+                    pass
+            except Exception as e:
+                logging.error(f"BlockArchiveCompactor fail to archive blocks: {e}")
+
+            self.__wake_up.wait(self.__interval)
+            self.__wake_up.clear()
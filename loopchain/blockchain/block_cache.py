@@ -0,0 +1,123 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A LRU cache of deserialized blocks"""
+
+import collections
+import threading
+
+
+class BlockCache:
+    """BlockChain 에서 읽거나 추가한 Block 을 보관하는 LRU cache.
+    block_hash 를 key 로 사용하며 height 로도 찾을 수 있다.
+    보관하는 block 의 갯수(max_count) 또는 serialize 크기의 합(max_bytes)을 넘으면 오래된 block 부터 제거한다.
+    cache 된 block 은 여러 thread 에서 공유되므로 읽기 용도로만 사용해야 한다.
+    """
+
+    def __init__(self, max_count, max_bytes):
+        self.__max_count = max_count
+        self.__max_bytes = max_bytes
+        self.__blocks = collections.OrderedDict()  # block_hash : (block, size)
+        self.__block_hash_by_height = {}  # height : block_hash
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+        self.__hit = 0
+        self.__miss = 0
+        self.__eviction = 0
+
+    @property
+    def is_enabled(self):
+        return self.__max_count > 0 and self.__max_bytes > 0
+
+    def get(self, block_hash):
+        """block_hash 로 cache 된 block 을 구한다.
+
+        :param block_hash: plain string
+        :return: None or Block
+        """
+        with self.__lock:
+            try:
+                block, size = self.__blocks[block_hash]
+            except KeyError:
+                self.__miss += 1
+                return None
+
+            self.__blocks.move_to_end(block_hash)
+            self.__hit += 1
+            return block
+
+    def get_by_height(self, height):
+        """height 로 cache 된 block 을 구한다.
+
+        :param height: int
+        :return: None or Block
+        """
+        with self.__lock:
+            block_hash = self.__block_hash_by_height.get(height)
+
+        if block_hash is None:
+            with self.__lock:
+                self.__miss += 1
+            return None
+
+        return self.get(block_hash)
+
+    def put(self, block, size):
+        """block 을 cache 에 추가한다.
+
+        :param block: tx 목록을 포함한 block
+        :param size: block 의 serialize 크기 (bytes)
+        """
+        if not self.is_enabled or size > self.__max_bytes:
+            return
+
+        with self.__lock:
+            if block.block_hash in self.__blocks:
+                self.__remove(block.block_hash)
+
+            self.__blocks[block.block_hash] = (block, size)
+            self.__block_hash_by_height[block.height] = block.block_hash
+            self.__bytes += size
+
+            while len(self.__blocks) > self.__max_count or self.__bytes > self.__max_bytes:
+                self.__remove(next(iter(self.__blocks)))
+                self.__eviction += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__blocks.clear()
+            self.__block_hash_by_height.clear()
+            self.__bytes = 0
+
+    def get_status(self):
+        """cache 의 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of count, bytes, hit, miss, eviction, hit_rate
+        """
+        with self.__lock:
+            request_count = self.__hit + self.__miss
+            return {
+                'count': len(self.__blocks),
+                'bytes': self.__bytes,
+                'hit': self.__hit,
+                'miss': self.__miss,
+                'eviction': self.__eviction,
+                'hit_rate': (self.__hit / request_count) if request_count > 0 else 0.0
+            }
+
+    def __remove(self, block_hash):
+        block, size = self.__blocks.pop(block_hash)
+        self.__bytes -= size
+        if self.__block_hash_by_height.get(block.height) == block_hash:
+            del self.__block_hash_by_height[block.height]
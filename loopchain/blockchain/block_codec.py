@@ -0,0 +1,151 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compression codecs of block body"""
+
+import lzma
+import struct
+import zlib
+
+from loopchain import configure as conf
+from loopchain.blockchain.exception import BlockError
+
+
+class BlockCodec:
+    """block body (Block.serialize_block_body) 의 압축 codec
+    압축한 body 앞에는 MAGIC 과 codec 의 tag 를 붙여 block 마다 어떤 codec 으로 압축했는지 기록한다.
+    none codec 은 tag 를 붙이지 않으므로 이전 버전의 body 와 같고, tag 가 없는 body 는 none 으로 읽는다.
+    (압축하지 않은 body 는 tx 갯수(>I)로 시작하므로 MAGIC 과 겹치지 않는다.)
+
+    encoded body: MAGIC(3s) | tag(B) | compressed body
+
+    다른 peer 에게 받은 body 도 풀어야 하므로 압축을 풀 때는 block 의 최대 크기까지만 푼다.
+    """
+
+    MAGIC = b'LCZ'
+    __HEADER = struct.Struct('>3sB')
+
+    none = 'none'
+    zlib = 'zlib'
+    lzma = 'lzma'
+
+    __codecs_by_name = {}
+    __codecs_by_tag = {}
+
+    def __init__(self, name, tag, compress, decompressor):
+        self.name = name
+        self.tag = tag
+        self.compress = compress
+        self.decompressor = decompressor
+
+    @staticmethod
+    def register(name, tag, compress, decompressor):
+        """codec 을 추가한다. 한 번 사용한 tag 는 다른 codec 에 쓰지 않아야 이전 block 을 읽을 수 있다.
+
+        :param name: conf.BLOCK_DB_CODEC, conf.BLOCK_WIRE_CODEC 에 사용하는 이름
+        :param tag: block 에 기록하는 codec 의 id (1 ~ 255)
+        :param compress: bytes -> bytes
+        :param decompressor: () -> decompress(data, max_length) 와 eof 가 있는 object
+        (zlib.decompressobj, lzma.LZMADecompressor)
+        """
+        if not 0 < tag < 256:
+            raise ValueError(f"codec tag({tag}) must be in 1 ~ 255")
+        registered = BlockCodec.__codecs_by_tag.get(tag)
+        if registered is not None and registered.name != name:
+            raise ValueError(f"codec tag({tag}) is already used by {registered.name}")
+
+        codec = BlockCodec(name, tag, compress, decompressor)
+        BlockCodec.__codecs_by_name[name] = codec
+        BlockCodec.__codecs_by_tag[tag] = codec
+
+    @staticmethod
+    def names():
+        return [BlockCodec.none] + list(BlockCodec.__codecs_by_name)
+
+    @staticmethod
+    def is_encoded(body, offset=0):
+        return body[offset:offset + len(BlockCodec.MAGIC)] == BlockCodec.MAGIC
+
+    @staticmethod
+    def codec_name(body):
+        """
+        :return: body 를 압축한 codec 의 이름
+        """
+        if not BlockCodec.is_encoded(body):
+            return BlockCodec.none
+        return BlockCodec.__find_codec(body).name
+
+    @staticmethod
+    def encode(body, codec_name):
+        """
+        :param body: Block.serialize_block_body 의 결과
+        :param codec_name: none 이면 body 를 그대로 리턴한다.
+        :return: encoded body
+        """
+        if codec_name == BlockCodec.none:
+            return body
+
+        codec = BlockCodec.__codecs_by_name.get(codec_name)
+        if codec is None:
+            raise BlockError(f"unknown block codec({codec_name})")
+        return BlockCodec.__HEADER.pack(BlockCodec.MAGIC, codec.tag) + codec.compress(bytes(body))
+
+    @staticmethod
+    def max_body_size():
+        """압축을 풀었을 때 허용하는 body 의 최대 크기 (bytes)"""
+        return conf.MAX_BLOCK_KBYTES * 1024 + conf.BLOCK_HEADER_RESERVED_BYTES
+
+    @staticmethod
+    def decode(body):
+        """
+        :param body: encode 의 결과 (tag 가 없으면 압축하지 않은 body)
+        :return: Block.serialize_block_body 의 결과
+        :raise BlockError: 압축을 풀 수 없거나 풀었을 때 max_body_size 보다 큰 경우
+        """
+        if not BlockCodec.is_encoded(body):
+            return body
+        codec = BlockCodec.__find_codec(body)
+        max_size = BlockCodec.max_body_size()
+
+        decompressor = codec.decompressor()
+        try:
+            decoded_body = decompressor.decompress(bytes(body[BlockCodec.__HEADER.size:]), max_size)
+            if not decompressor.eof and len(decoded_body) == max_size:
+                # body 가 정확히 max_size 이면 남은 checksum 등을 읽어야 eof 가 된다.
+                # (zlib 은 남은 input 을 unconsumed_tail 로 돌려주고 lzma 는 내부에 보관한다.)
+                extra = decompressor.decompress(getattr(decompressor, 'unconsumed_tail', b''), 1)
+                if extra:
+                    raise BlockError(f"decompressed block body is larger than {max_size} bytes")
+        except (zlib.error, lzma.LZMAError) as e:
+            raise BlockError(f"fail to decompress block body with {codec.name}: {e}")
+
+        if not decompressor.eof:
+            raise BlockError(f"block body compressed with {codec.name} is truncated")
+        return decoded_body
+
+    @staticmethod
+    def __find_codec(body):
+        magic, tag = BlockCodec.__HEADER.unpack_from(body)
+        codec = BlockCodec.__codecs_by_tag.get(tag)
+        if codec is None:
+            raise BlockError(f"unknown block codec tag({tag})")
+        return codec
+
+
+# lzma 는 header 없이 (FORMAT_RAW) 압축하므로 압축과 해제에 같은 filter 를 사용해야 한다.
+_LZMA_FILTERS = [{'id': lzma.FILTER_LZMA2, 'preset': 1}]
+
+BlockCodec.register(BlockCodec.zlib, 1, zlib.compress, zlib.decompressobj)
+BlockCodec.register(BlockCodec.lzma, 2,
+                    lambda body: lzma.compress(body, format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS),
+                    lambda: lzma.LZMADecompressor(format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS))
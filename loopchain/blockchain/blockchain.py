@@ -13,19 +13,24 @@
 # limitations under the License.
 """Block chain class with authorized blocks only"""
 
+import itertools
 import json
-import leveldb
+import struct
+import threading
+import time
 
 from fluent import event
 
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager
-from loopchain.blockchain import BlockStatus, Block
+from loopchain.blockchain import BlockStatus, BlockType, Block, BlockCache, BlockArchive, BlockCodec, \
+    InvokeResultStore, Transaction, TxBloomFilter
 from loopchain.blockchain.exception import *
 from loopchain.blockchain.score_base import *
 from loopchain.protos import message_code
 from loopchain.scoreservice import ScoreResponse
+from loopchain.storage import as_key_value_store, open_key_value_store
 
 
 class BlockChain:
@@ -34,27 +39,58 @@ class BlockChain:
     UNCONFIRM_BLOCK_KEY = b'UNCONFIRM_BLOCK'
     LAST_BLOCK_KEY = b'last_block_key'
     BLOCK_HEIGHT_KEY = b'block_height_key'
-
-    def __init__(self, blockchain_db=None, channel_name=None):
+    BLOCK_BODY_KEY = b'block_body_key'
+    CHAIN_META_KEY = b'chain_meta_key'
+    BLOCK_ARCHIVE_KEY = b'block_archive_key'
+    ARCHIVED_HEIGHT_KEY = b'archived_height_key'
+    # tx_hash - (block height, tx index, tx offset in block body)
+    TX_INDEX_STRUCT = struct.Struct('>QII')
+    # tx_hash, block_hash (sha256 hexdigest) 의 길이
+    __HASH_HEX_LENGTH = 64
+
+    def __init__(self, blockchain_db=None, channel_name=None, archive_path=None):
         if channel_name is None:
             channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL
         self.__block_height = 0
         self.__last_block = None
         self.__channel_name = channel_name
+        self.__total_tx = 0
+        self.__block_type_count = dict.fromkeys([block_type.name for block_type in BlockType], 0)
+        # snapshot 으로 만든 block db 는 pruned_height 까지의 block body 가 없다. (-1 이면 모든 block body 가 있다.)
+        # body 가 없는 block 의 tx 는 셀 수 없으므로 pruned_total_tx 로 chain meta 에 기록해 둔다.
+        self.__pruned_height = -1
+        self.__pruned_total_tx = 0
+        self.__block_cache = BlockCache(conf.BLOCK_CACHE_MAX_COUNT, conf.BLOCK_CACHE_MAX_BYTES)
+        self.__sync_lock = threading.Lock()
+        self.__sync_timer = None
+        self.__last_sync_time = 0
+        self.__archive_lock = threading.Lock()
+        self.__block_archive = None
+        if archive_path is not None:
+            self.__block_archive = BlockArchive(archive_path)
 
         self.__peer_id = None
         if ObjectManager().peer_service is not None:
             self.__peer_id = ObjectManager().peer_service.peer_id
 
-        # block db has [ block_hash - block | block_height - block_hash | BlockChain.LAST_BLOCK_KEY - block_hash ]
-        self.__confirmed_block_db = blockchain_db
+        # block db has [ block_hash - block header | BlockChain.BLOCK_BODY_KEY + block_hash - block body |
+        #                (block body 는 conf.BLOCK_DB_CODEC 으로 압축하며 block 마다 BlockCodec 의 tag 가 붙는다.)
+        #                block_height - block_hash | BlockChain.LAST_BLOCK_KEY - block_hash |
+        #                BlockChain.CHAIN_META_KEY - chain meta(json) |
+        #                BlockChain.BLOCK_ARCHIVE_KEY + block_hash - (segment, offset, length) of archived block body |
+        #                BlockChain.ARCHIVED_HEIGHT_KEY - height of last archived block |
+        #                tx_hash - BlockChain.TX_INDEX_STRUCT | invoke results (InvokeResultStore) ]
+        # KeyValueStore (leveldb.LevelDB 를 그대로 넘기면 LevelDBStore 로 감싼다.)
+        if blockchain_db is None:
+            self.__confirmed_block_db = open_key_value_store(conf.DEFAULT_LEVEL_DB_PATH)
+        else:
+            self.__confirmed_block_db = as_key_value_store(blockchain_db)
         # logging.debug(f"BlockChain::init confirmed_block_db({self.__confirmed_block_db})")
-
-        if self.__confirmed_block_db is None:
-            try:
-                self.__confirmed_block_db = leveldb.LevelDB(conf.DEFAULT_LEVEL_DB_PATH)
-            except leveldb.LevelDBError:
-                raise leveldb.LevelDBError("Fail To Create Level DB(path): " + conf.DEFAULT_LEVEL_DB_PATH)
+        self.__invoke_result_store = InvokeResultStore(self.__confirmed_block_db)
+        # genesis block 을 추가하거나 migration 한 다음 처음 tx 를 조회할 때 block db 를 순회하여 채운다.
+        self.__tx_filter = None
+        self.__tx_filter_builder = None
+        self.__tx_filter_lock = threading.Lock()
 
         # level DB에서 블럭을 읽어 들이며, 만약 levelDB에 블럭이 없을 경우 제네시스 블럭을 만든다
         try:
@@ -65,11 +101,14 @@ class BlockChain:
 
         if last_block_key:
             # DB에서 마지막 블럭을 가져와서 last_block 에 바인딩
-            self.__last_block = Block(channel_name=self.__channel_name)
-            block_dump = self.__confirmed_block_db.Get(last_block_key)
-            self.__last_block.deserialize_block(block_dump)
+            self.__last_block = self.__find_block_by_key(last_block_key)
             logging.debug("restore from last block hash(" + str(self.__last_block.block_hash) + ")")
             logging.debug("restore from last block height(" + str(self.__last_block.height) + ")")
+
+            # chain meta 가 없거나 (이전 버전의 DB) 마지막 블럭과 맞지 않으면 전체 블럭을 순회하여 다시 만든다.
+            # --rebuild 인 경우에도 pruned_height 를 알아야 하므로 chain meta 를 먼저 읽는다.
+            if not self.__load_chain_meta() or conf.REBUILD_CHAIN_META:
+                self.rebuild_blocks()
         else:
             # 제네시스 블럭 생성
             self.__add_genesisblock()
@@ -77,6 +116,12 @@ class BlockChain:
         # 블럭의 높이는 마지막 블럭의 높이와 같음
         self.__block_height = self.__last_block.height
 
+        if conf.ENABLE_TX_BLOOM_FILTER:
+            # 이후 add_block 의 tx 가 빠지지 않도록 filter 를 먼저 만들고, block db 의 tx 는 thread 에서 채운다.
+            # 시작 시간이 늘어나지 않도록 thread 는 처음 tx 를 조회할 때 시작한다.
+            self.__tx_filter = TxBloomFilter(max(conf.TX_BLOOM_FILTER_CAPACITY, self.__total_tx * 2),
+                                             conf.TX_BLOOM_FILTER_FALSE_POSITIVE_RATE)
+
         # made block count as a leader
         self.__made_block_count = 0
 
@@ -92,30 +137,120 @@ class BlockChain:
     def made_block_count(self):
         return self.__made_block_count
 
+    @property
+    def total_tx(self):
+        return self.__total_tx
+
+    @property
+    def pruned_height(self):
+        """body 가 없는 (snapshot 으로 가져온) 마지막 block 의 height, 모든 block body 가 있으면 -1"""
+        return self.__pruned_height
+
+    @property
+    def block_type_count(self):
+        return self.__block_type_count.copy()
+
     def increase_made_block_count(self):
         self.__made_block_count += 1
 
     def reset_made_block_count(self):
         self.__made_block_count = 0
 
+    def get_block_cache_status(self):
+        return self.__block_cache.get_status()
+
+    def get_tx_filter_status(self):
+        return None if self.__tx_filter is None else self.__tx_filter.get_status()
+
+    def wait_tx_filter_ready(self, timeout=None):
+        """block db 의 tx 로 tx bloom filter 를 다 채울 때까지 기다린다.
+
+        :return: filter 가 준비되었거나 사용하지 않으면 True, timeout 이면 False
+        """
+        if self.__tx_filter is None:
+            return True
+        self.__start_tx_filter_builder()
+        return self.__tx_filter.wait_ready(timeout)
+
+    def __is_unknown_tx(self, tx_hash):
+        """
+        :return: True 이면 block db 에 없는 tx 이다.
+        """
+        tx_filter = self.__tx_filter
+        if tx_filter is None:
+            return False
+        if not tx_filter.ready:
+            self.__start_tx_filter_builder()
+            return False
+        return not tx_filter.might_contain(tx_hash)
+
+    def __start_tx_filter_builder(self):
+        with self.__tx_filter_lock:
+            if self.__tx_filter_builder is None:
+                self.__tx_filter_builder = threading.Thread(
+                    target=self.__build_tx_filter, name="TxFilterBuilder", daemon=True)
+                self.__tx_filter_builder.start()
+
+    def __build_tx_filter(self):
+        """block db 의 tx index key (tx_hash) 를 모두 순회하여 tx bloom filter 를 채운다.
+        tx_hash 와 block_hash 는 같은 형식 (sha256 hex) 의 key 이므로 block_hash 도 filter 에 들어가지만
+        block_hash 로 tx 를 조회하는 경우에만 false positive 가 되므로 구분하지 않는다.
+        """
+        begin_time = time.monotonic()
+        tx_filter = self.__tx_filter
+
+        hash_length = BlockChain.__HASH_HEX_LENGTH
+        try:
+            for key in self.__confirmed_block_db.RangeIter(key_from=b'0' * hash_length, key_to=b'f' * hash_length,
+                                                           include_value=False, fill_cache=False):
+                if len(key) == hash_length:
+                    tx_filter.add(bytes(key).decode(encoding=conf.HASH_KEY_ENCODING))
+        except Exception as e:
+            # filter 를 사용하지 않고 block db 에서 조회한다.
+            logging.warning(f"fail to build tx bloom filter: {e}")
+            return
+
+        tx_filter.set_ready()
+        logging.info(f"build tx bloom filter, count({tx_filter.get_status()['count']}) "
+                     f"time({time.monotonic() - begin_time:.3f}s)")
+
     def rebuild_blocks(self):
-        # Genesis block 까지 순회하며 Block 정보를 복원한다.
+        """Genesis block 까지 순회하며 chain meta (total_tx, block type 별 갯수) 를 다시 만들어 저장한다.
+        chain meta 가 없는 이전 버전의 DB 이거나 --rebuild 로 peer 를 시작한 경우에만 사용된다.
+        순회하면서 이전 버전으로 저장된 block 과 tx_info 도 현재 형식으로 migration 한다.
+        snapshot 으로 만든 block db 이면 body 가 없는 block (pruned_height 까지) 은 header 만 읽고
+        그 block 들의 tx 는 chain meta 에 기록된 pruned_total_tx 에서 시작한다.
+
+        :return: total_tx
+        :raise BlockchainError: body 가 없는 block 이 있는데 chain meta 에 pruned_height 가 없는 경우
+        """
         logging.info("re-build blocks from DB....")
 
-        block = Block(channel_name=self.__channel_name)
         prev_block_hash = self.__last_block.block_hash
-        total_tx = 0
+        height = self.__last_block.height
+        total_tx = self.__pruned_total_tx
+        block_type_count = dict.fromkeys([block_type.name for block_type in BlockType], 0)
 
         while prev_block_hash != "":
-            block_dump = self.__confirmed_block_db.Get(prev_block_hash.encode(encoding='UTF-8'))
-            block.deserialize_block(block_dump)
-
-            # Rebuild Block 코드 구간. 현재는 total_tx 만 구하고 있음
-            # TODO 향후에도 rebuild_blocks가 total_tx만 구하는 경우 이 로직은 제거 하고 total_tx 는 다른 방식으로 구하도록 한다.
-            # logging.debug("re-build block: " + str(block.block_hash))
-            total_tx += block.confirmed_transaction_list.__len__()
+            is_pruned = height <= self.__pruned_height
+            block = self.__find_block_by_key(prev_block_hash.encode(encoding='UTF-8'), headers_only=is_pruned)
+            if block is None:
+                raise BlockchainError(f"there is no block body of height({height}) to rebuild chain meta, "
+                                      f"pruned height({self.__pruned_height}). "
+                                      f"the block db may be bootstrapped from a snapshot without chain meta.")
+            if not is_pruned:
+                self.__migrate_block(block)
+                total_tx += block.confirmed_transaction_list.__len__()
+            block_type_count[block.block_type.name] += 1
 
             prev_block_hash = block.prev_block_hash
+            height -= 1
+
+        self.__confirmed_block_db.Put(BlockChain.CHAIN_META_KEY,
+                                      self.__dump_chain_meta(self.__last_block, total_tx, block_type_count,
+                                                             self.__pruned_height, self.__pruned_total_tx))
+        self.__total_tx = total_tx
+        self.__block_type_count = block_type_count
 
         logging.info("rebuilt blocks, total_tx: " + str(total_tx))
         logging.info("block hash("
@@ -125,36 +260,350 @@ class BlockChain:
 
         return total_tx
 
-    def __find_block_by_key(self, key):
+    def __migrate_block(self, block):
+        """이전 버전으로 저장된 block 과 tx_info 를 현재 형식으로 다시 저장한다.
+        pickle 로 저장된 block 은 header / body 로 나누어 저장하고,
+        json 으로 저장된 tx_info (block_hash, result) 는 tx index (height, index, offset) 와
+        InvokeResultStore 의 block 별 invoke result 로 나누어 저장한다.
+
+        :param block: migration 할 block
+        """
+        block_hash_encoded = block.block_hash.encode(encoding='UTF-8')
+        tx_offsets = []
+        block_body = block.serialize_block_body(tx_offsets)
+        batch = self.__confirmed_block_db.WriteBatch()
+        need_write = False
+
+        if self.__confirmed_block_db.Get(block_hash_encoded)[:len(Block.ENCODING_MAGIC)] != Block.ENCODING_MAGIC:
+            batch.Put(block_hash_encoded, block.serialize_block_header())
+            batch.Put(BlockChain.BLOCK_BODY_KEY + block_hash_encoded,
+                      BlockCodec.encode(block_body, conf.BLOCK_DB_CODEC))
+            need_write = True
+
+        invoke_results = []
+        for tx_index, tx in enumerate(block.confirmed_transaction_list):
+            tx_hash = tx.get_tx_hash()
+            try:
+                tx_info = self.__find_tx_info(tx_hash)
+            except KeyError:
+                tx_info = None
+            if tx_info is None:
+                logging.warning(f"There is no tx_info to migrate, tx_hash: {tx_hash}")
+                invoke_results.append(None)
+                continue
+            if 'result' not in tx_info:
+                invoke_results.append(None)
+                continue
+
+            invoke_results.append(tx_info['result'])
+            batch.Put(tx_hash.encode(encoding=conf.HASH_KEY_ENCODING),
+                      self.__dump_tx_index(block.height, tx_index, tx_offsets[tx_index]))
+            need_write = True
+
+        if any(invoke_result is not None for invoke_result in invoke_results):
+            stored_results = self.__invoke_result_store.get_block(block.height) or []
+            for tx_index, invoke_result in enumerate(invoke_results):
+                if invoke_result is None:
+                    invoke_results[tx_index] = stored_results[tx_index] if tx_index < len(stored_results) \
+                        else {'code': ScoreResponse.NOT_INVOKED}
+            self.__invoke_result_store.put_block(batch, block.height, invoke_results)
+
+        if need_write:
+            logging.debug("migrate block: " + block.block_hash)
+            self.__confirmed_block_db.Write(batch)
+            self.__invoke_result_store.commit()
+
+    def __load_chain_meta(self):
+        """저장된 chain meta 를 읽는다.
+
+        :return: 마지막 블럭과 일치하는 chain meta 를 읽었으면 True
+        """
+        try:
+            chain_meta = json.loads(self.__confirmed_block_db.Get(BlockChain.CHAIN_META_KEY).decode(
+                conf.PEER_DATA_ENCODING))
+        except KeyError:
+            logging.warning("there is no chain meta in block db")
+            return False
+
+        # pruned block 은 마지막 block 과 상관 없으므로 chain meta 가 마지막 block 과 맞지 않아도 읽어 둔다.
+        self.__pruned_height = chain_meta.get('pruned_height', -1)
+        self.__pruned_total_tx = chain_meta.get('pruned_total_tx', 0)
+
+        if chain_meta['last_block_hash'] != self.__last_block.block_hash \
+                or chain_meta['height'] != self.__last_block.height:
+            logging.warning(f"chain meta is not match with last block "
+                            f"meta({chain_meta['last_block_hash']}, {chain_meta['height']}) "
+                            f"last block({self.__last_block.block_hash}, {self.__last_block.height})")
+            return False
+
+        self.__total_tx = chain_meta['total_tx']
+        self.__block_type_count.update(chain_meta['block_type_count'])
+        return True
+
+    @staticmethod
+    def __dump_chain_meta(last_block, total_tx, block_type_count, pruned_height=-1, pruned_total_tx=0):
+        chain_meta = {
+            'height': last_block.height,
+            'last_block_hash': last_block.block_hash,
+            'total_tx': total_tx,
+            'block_type_count': block_type_count,
+            'pruned_height': pruned_height,
+            'pruned_total_tx': pruned_total_tx
+        }
+        return json.dumps(chain_meta).encode(encoding=conf.PEER_DATA_ENCODING)
+
+    def __find_block_by_key(self, key, headers_only=False, fill_cache=True):
+        """block_hash(key) 로 저장된 block 을 구한다.
+
+        :param key: encoding 된 block_hash
+        :param headers_only: True 이면 block body(tx 목록) 는 읽지 않는다.
+        cache 된 block 이 있으면 headers_only 여부와 관계 없이 cache 된 block 을 리턴한다.
+        :param fill_cache: False 이면 읽은 block 을 cache 에 추가하지 않는다. (많은 block 을 순회하는 경우)
+        :return: None or Block
+        """
+        block = self.__block_cache.get(key.decode(encoding='UTF-8'))
+        if block is not None:
+            return block
+
         block = Block(channel_name=self.__channel_name)
 
         try:
             block_bytes = self.__confirmed_block_db.Get(key)
-            block.deserialize_block(block_bytes)
+            block_size = len(block_bytes)
+            if block_bytes[:len(Block.ENCODING_MAGIC)] != Block.ENCODING_MAGIC:
+                # 이전 버전에서 block 전체를 pickle 로 저장한 경우
+                block.deserialize_block(block_bytes)
+            else:
+                block.deserialize_block_header(block_bytes)
+                if headers_only:
+                    return block
+
+                body_bytes = BlockCodec.decode(self.__get_block_body(key))
+                block.deserialize_block_body(body_bytes)
+                block_size += len(body_bytes)
         except KeyError:
-            block = None
+            return None
 
+        if fill_cache:
+            self.__block_cache.put(block, block_size)
         return block
 
-    def find_block_by_hash(self, block_hash):
+    def __get_block_body(self, key):
+        """block_hash(key) 의 block body 를 구한다. archive 된 block 이면 segment file 에서 읽는다.
+
+        :param key: encoding 된 block_hash
+        :return: 저장된 그대로의 (BlockCodec 으로 압축되었을 수 있는) body, bytes or memoryview (archive 된 block)
+        :raise KeyError: block body 가 없는 경우
+        """
+        try:
+            return self.__confirmed_block_db.Get(BlockChain.BLOCK_BODY_KEY + key)
+        except KeyError:
+            if self.__block_archive is None:
+                raise
+
+        pointer = self.__confirmed_block_db.Get(BlockChain.BLOCK_ARCHIVE_KEY + key)
+        return self.__block_archive.read(*BlockArchive.unpack_pointer(pointer))
+
+    @property
+    def archived_height(self):
+        """archive 된 마지막 block 의 height, archive 된 block 이 없으면 -1
+        """
+        try:
+            return int.from_bytes(self.__confirmed_block_db.Get(BlockChain.ARCHIVED_HEIGHT_KEY), byteorder='big')
+        except KeyError:
+            return -1
+
+    def archive_blocks(self, depth=None, batch_count=None):
+        """마지막 block 으로부터 depth 이상 지난 block 들의 body 를 archive 의 segment file 로 옮긴다.
+        segment file 을 sync 한 다음 LevelDB 의 block body 를 지우고 archive pointer 를 기록하므로
+        중간에 실패하더라도 block body 를 잃지 않는다.
+
+        :param depth: None 이면 conf.BLOCK_ARCHIVE_DEPTH
+        :param batch_count: 한 번에 옮기는 block 의 최대 갯수, None 이면 conf.BLOCK_ARCHIVE_BATCH_COUNT
+        :return: 처리한 block 의 갯수 (0 이면 더 이상 archive 할 block 이 없다.)
+        """
+        if self.__block_archive is None:
+            return 0
+
+        depth = (depth, conf.BLOCK_ARCHIVE_DEPTH)[depth is None]
+        batch_count = (batch_count, conf.BLOCK_ARCHIVE_BATCH_COUNT)[batch_count is None]
+
+        with self.__archive_lock:
+            start_height = self.archived_height + 1
+            end_height = min(self.__block_height - depth, start_height + batch_count - 1)
+            if end_height < start_height:
+                return 0
+
+            batch = self.__confirmed_block_db.WriteBatch()
+            archived_count = 0
+            block_height_keys = self.__confirmed_block_db.RangeIter(
+                key_from=BlockChain.BLOCK_HEIGHT_KEY + start_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+                key_to=BlockChain.BLOCK_HEIGHT_KEY + end_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+                fill_cache=False)
+
+            for block_height_key, block_hash in block_height_keys:
+                block_hash = bytes(block_hash)
+                try:
+                    block_body = self.__confirmed_block_db.Get(BlockChain.BLOCK_BODY_KEY + block_hash, fill_cache=False)
+                except KeyError:
+                    # 이전 버전에서 pickle 로 저장된 block 은 body 가 따로 없으므로 옮기지 않는다.
+                    continue
+
+                pointer = BlockArchive.pack_pointer(*self.__block_archive.append(bytes(block_body)))
+                batch.Put(BlockChain.BLOCK_ARCHIVE_KEY + block_hash, pointer)
+                batch.Delete(BlockChain.BLOCK_BODY_KEY + block_hash)
+                archived_count += 1
+
+            self.__block_archive.sync()
+            batch.Put(BlockChain.ARCHIVED_HEIGHT_KEY, end_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
+            self.__confirmed_block_db.Write(batch, sync=True)
+
+        logging.debug(f"archive blocks from height({start_height}) to ({end_height}), count({archived_count})")
+        return end_height - start_height + 1
+
+    def find_block_by_hash(self, block_hash, headers_only=False):
         """블럭체인 해쉬 키로 해당 블럭을 찾음
 
         :param block_hash: plain string,
         key 로 사용되기전에 함수내에서 encoding 되므로 미리 encoding 된 key를 parameter 로 사용해선 안된다.
+        :param headers_only: True 이면 tx 목록이 비어있는 block header 만 구한다.
         :return: None or Block
         """
-        return self.__find_block_by_key(block_hash.encode(encoding='UTF-8'))
+        return self.__find_block_by_key(block_hash.encode(encoding='UTF-8'), headers_only)
 
-    def find_block_by_height(self, block_height):
+    def find_block_by_height(self, block_height, headers_only=False):
         """find block by its height
 
         :param block_height: int,
         it convert to key of blockchain db in this method so don't try already converted key.
+        :param headers_only: if True, find only block header (without transactions)
         :return None or Block
         """
+        block = self.__block_cache.get_by_height(block_height)
+        if block is not None:
+            return block
+
         key = self.__confirmed_block_db.Get(BlockChain.BLOCK_HEIGHT_KEY +
                                             block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
-        return self.__find_block_by_key(key)
+        return self.__find_block_by_key(key, headers_only)
+
+    def iter_blocks(self, start_height, end_height=None, headers_only=False):
+        """start_height 부터 end_height 까지의 block 을 height 순서대로 구한다.
+        block_height - block_hash index 를 range 로 순회하므로 height 마다 index 를 따로 조회하지 않는다.
+        순회한 block 은 block cache 에 추가하지 않는다.
+
+        :param start_height: int, 처음 block 의 height
+        :param end_height: int, 마지막 block 의 height (포함), None 이면 마지막 block 까지
+        :param headers_only: if True, find only block header (without transactions)
+        :return: generator of Block
+        """
+        if end_height is None:
+            end_height = self.__block_height
+        if start_height < 0 or start_height > end_height:
+            return
+
+        block_height_keys = self.__confirmed_block_db.RangeIter(
+            key_from=BlockChain.BLOCK_HEIGHT_KEY + start_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+            key_to=BlockChain.BLOCK_HEIGHT_KEY + end_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+            fill_cache=False)
+
+        for block_height_key, block_hash in block_height_keys:
+            block = self.__find_block_by_key(bytes(block_hash), headers_only, fill_cache=False)
+            if block is None:
+                logging.warning("There is No Block, block_hash: " + block_hash.decode(encoding='UTF-8'))
+                return
+            yield block
+
+    def snapshot_items(self, height=None, block_count=None):
+        """height 까지의 blockchain 을 snapshot 으로 내보내기 위한 block db 의 (key, value) 를 구한다.
+        모든 block 의 header, height index, tx index 와 invoke result 를 포함하며,
+        block body 는 마지막 block_count 개의 block 만 포함한다.
+        snapshot 으로 만든 block db 이면 body 가 없는 block (pruned_height 까지) 은 header 만 포함하고
+        그 block 들의 tx index 는 body 로 다시 만들 수 없으므로 저장된 그대로 옮긴다.
+        chain meta 와 last block key 는 가장 마지막에 나온다.
+
+        :param height: snapshot 의 마지막 block height, None 이면 마지막 block
+        :param block_count: body 를 포함할 block 의 갯수, None 이면 conf.SNAPSHOT_BLOCK_COUNT
+        :return: generator of (key, value)
+        """
+        height = (height, self.__block_height)[height is None]
+        block_count = (block_count, conf.SNAPSHOT_BLOCK_COUNT)[block_count is None]
+        if height < 0 or height > self.__block_height:
+            raise BlockchainError(f"wrong snapshot height({height}), block height({self.__block_height})")
+        if height <= self.__pruned_height:
+            raise BlockchainError(f"wrong snapshot height({height}), "
+                                  f"there is no block body until height({self.__pruned_height})")
+
+        # snapshot 으로 만든 block db 에서 body 가 없는 마지막 block 의 height
+        pruned_height = max(height - block_count, self.__pruned_height, -1)
+        pruned_total_tx = self.__pruned_total_tx
+        last_block = None
+        total_tx = self.__pruned_total_tx
+        block_type_count = dict.fromkeys([block_type.name for block_type in BlockType], 0)
+
+        blocks = itertools.chain(self.iter_blocks(0, self.__pruned_height, headers_only=True),
+                                 self.iter_blocks(self.__pruned_height + 1, height))
+        for block in blocks:
+            block_hash_encoded = block.block_hash.encode(encoding='UTF-8')
+            is_pruned = block.height <= self.__pruned_height
+
+            yield block_hash_encoded, block.serialize_block_header()
+            yield BlockChain.BLOCK_HEIGHT_KEY + block.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'), \
+                block_hash_encoded
+
+            if not is_pruned:
+                tx_offsets = []
+                block_body = block.serialize_block_body(tx_offsets)
+                if block.height > pruned_height:
+                    yield BlockChain.BLOCK_BODY_KEY + block_hash_encoded, \
+                        BlockCodec.encode(block_body, conf.BLOCK_DB_CODEC)
+
+                for tx_index, tx in enumerate(block.confirmed_transaction_list):
+                    yield tx.get_tx_hash().encode(encoding=conf.HASH_KEY_ENCODING), \
+                        self.__dump_tx_index(block.height, tx_index, tx_offsets[tx_index])
+
+            block_results_key = InvokeResultStore.block_results_key(block.height)
+            try:
+                yield block_results_key, bytes(self.__confirmed_block_db.Get(block_results_key))
+            except KeyError:
+                if not is_pruned:
+                    # migration 되지 않은 이전 버전의 tx_info 에 저장된 invoke result
+                    invoke_results = [self.find_invoke_result_by_tx_hash(tx.get_tx_hash())
+                                      for tx in block.confirmed_transaction_list]
+                    yield block_results_key, self.__invoke_result_store.encode_block(invoke_results)
+
+            if not is_pruned:
+                total_tx += len(block.confirmed_transaction_list)
+                if block.height <= pruned_height:
+                    pruned_total_tx += len(block.confirmed_transaction_list)
+            block_type_count[block.block_type.name] += 1
+            last_block = block
+
+        if last_block is None or last_block.height != height:
+            raise BlockchainError(f"There is No Block to make snapshot, height({height})")
+
+        yield from self.__pruned_tx_index_items()
+        yield from self.__invoke_result_store.dict_items()
+        yield BlockChain.CHAIN_META_KEY, self.__dump_chain_meta(last_block, total_tx, block_type_count,
+                                                                pruned_height, pruned_total_tx)
+        yield BlockChain.LAST_BLOCK_KEY, last_block.block_hash.encode(encoding='UTF-8')
+
+    def __pruned_tx_index_items(self):
+        """body 가 없는 block (pruned_height 까지) 의 tx index 를 저장된 그대로 구한다.
+
+        :return: generator of (tx_hash, tx index)
+        """
+        if self.__pruned_height < 0:
+            return
+
+        hash_length = BlockChain.__HASH_HEX_LENGTH
+        for key, value in self.__confirmed_block_db.RangeIter(key_from=b'0' * hash_length, key_to=b'f' * hash_length,
+                                                             fill_cache=False):
+            if len(key) != hash_length or len(value) != BlockChain.TX_INDEX_STRUCT.size or value[:1] == b'{':
+                continue
+            block_height, tx_index, offset = BlockChain.TX_INDEX_STRUCT.unpack(bytes(value))
+            if block_height <= self.__pruned_height:
+                yield bytes(key), bytes(value)
 
     def add_block(self, block: Block):
         """인증된 블럭만 추가합니다.
@@ -189,22 +638,42 @@ class BlockChain:
                 invoke_results = self.__create_invoke_result_specific_case(block.confirmed_transaction_list
                                                                            , score_container_exception_result)
 
-        # util.logger.spam(f"blockchain:add_block --2--")
-        self.__add_tx_to_block_db(block, invoke_results)
+        block_header = block.serialize_block_header()
+        tx_offsets = []
+        block_body = block.serialize_block_body(tx_offsets)
 
         block_hash_encoded = block.block_hash.encode(encoding='UTF-8')
 
-        batch = leveldb.WriteBatch()
-        batch.Put(block_hash_encoded, block.serialize_block())
+        total_tx = self.__total_tx + len(block.confirmed_transaction_list)
+        block_type_count = self.__block_type_count.copy()
+        block_type_count[block.block_type.name] += 1
+
+        # 기록한 tx 가 filter 에 없는 순간이 없도록 기록하기 전에 filter 에 추가한다. (기록에 실패하면 false positive 가 된다.)
+        if self.__tx_filter is not None:
+            for tx in block.confirmed_transaction_list:
+                self.__tx_filter.add(tx.get_tx_hash())
+
+        # block 과 tx_info 는 하나의 batch 로 기록하여 tx_info 만 저장되고 block 은 없는 상태가 생기지 않도록 한다.
+        batch = self.__confirmed_block_db.WriteBatch()
+        # util.logger.spam(f"blockchain:add_block --2--")
+        self.__add_tx_to_block_db(batch, block, invoke_results, tx_offsets)
+        batch.Put(block_hash_encoded, block_header)
+        batch.Put(BlockChain.BLOCK_BODY_KEY + block_hash_encoded, BlockCodec.encode(block_body, conf.BLOCK_DB_CODEC))
         batch.Put(BlockChain.LAST_BLOCK_KEY, block_hash_encoded)
         batch.Put(
             BlockChain.BLOCK_HEIGHT_KEY +
             block.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
             block_hash_encoded)
-        self.__confirmed_block_db.Write(batch)
+        batch.Put(BlockChain.CHAIN_META_KEY, self.__dump_chain_meta(block, total_tx, block_type_count,
+                                                                    self.__pruned_height, self.__pruned_total_tx))
+        self.__write_block_batch(batch)
+        self.__invoke_result_store.commit()
 
         self.__last_block = block
         self.__block_height = self.__last_block.height
+        self.__total_tx = total_tx
+        self.__block_type_count = block_type_count
+        self.__block_cache.put(block, len(block_header) + len(block_body))
 
         # logging.debug("ADD BLOCK Height : %i", block.height)
         # logging.debug("ADD BLOCK Hash : %s", block.block_hash)
@@ -231,25 +700,70 @@ class BlockChain:
             invoke_results[tx.get_tx_hash()] = invoke_result
         return invoke_results
 
-    def __add_tx_to_block_db(self, block, invoke_results):
-        """block db 에 block_hash - block_object 를 저장할때, tx_hash - block_hash 를 저장한다.
-        get tx by tx_hash 시 해당 block 을 효율적으로 찾기 위해서
+    def __write_block_batch(self, batch):
+        """block 을 추가하는 batch 를 기록한다.
+        conf.BLOCK_DB_SYNC_INTERVAL 이 0 이면 매 block 마다 disk 에 sync 하고,
+        0 보다 크면 마지막 sync 후 interval 이 지난 경우에만 sync 한다. (group commit)
+        sync 되지 않은 기록은 interval 이 지나면 timer 에서 sync 한다.
+
+        :param batch: block db 의 WriteBatch
+        """
+        sync_interval = conf.BLOCK_DB_SYNC_INTERVAL / 1000
+        if sync_interval <= 0:
+            self.__confirmed_block_db.Write(batch, sync=True)
+            return
+
+        with self.__sync_lock:
+            elapsed = time.monotonic() - self.__last_sync_time
+            is_sync = elapsed >= sync_interval
+            self.__confirmed_block_db.Write(batch, sync=is_sync)
+
+            if is_sync:
+                self.__last_sync_time = time.monotonic()
+            elif self.__sync_timer is None:
+                self.__sync_timer = threading.Timer(sync_interval - elapsed, self.sync_block_db)
+                self.__sync_timer.daemon = True
+                self.__sync_timer.start()
+
+    def sync_block_db(self):
+        """sync 되지 않은 block db 의 기록을 disk 에 sync 한다.
+        """
+        with self.__sync_lock:
+            if self.__sync_timer is not None:
+                self.__sync_timer.cancel()
+                self.__sync_timer = None
+
+            self.__confirmed_block_db.Write(self.__confirmed_block_db.WriteBatch(), sync=True)
+            self.__last_sync_time = time.monotonic()
+
+    def __add_tx_to_block_db(self, batch, block, invoke_results, tx_offsets):
+        """block db 에 block_hash - block_object 를 저장할때, tx_hash - tx index 를 저장한다.
+        tx index 에는 tx 가 담긴 block 의 height 와 block 안에서의 위치(index, block body 안의 offset)를 기록하여
+        get tx by tx_hash 시 block 전체를 읽지 않고 해당 tx 만 읽을 수 있도록 한다.
+        invoke result 는 tx 마다 따로 저장하지 않고 InvokeResultStore 에 block 단위로 압축하여 저장한다.
+
+        :param batch: block 과 함께 기록할 block db 의 WriteBatch
         :param block:
+        :param invoke_results: {tx_hash: invoke_result}
+        :param tx_offsets: serialize_block_body 로 구한 tx 별 offset
         """
         # loop all tx in block
         logging.debug("try add all tx in block to block db, block hash: " + block.block_hash)
 
-        for tx in block.confirmed_transaction_list:
+        block_invoke_results = []
+        for tx_index, tx in enumerate(block.confirmed_transaction_list):
             tx_hash = tx.get_tx_hash()
-            invoke_result = invoke_results[tx_hash]
+            block_invoke_results.append(invoke_results[tx_hash])
+
+            batch.Put(
+                tx_hash.encode(encoding=conf.HASH_KEY_ENCODING),
+                self.__dump_tx_index(block.height, tx_index, tx_offsets[tx_index]))
 
-            tx_info = dict()
-            tx_info['block_hash'] = block.block_hash
-            tx_info['result'] = invoke_result
+        self.__invoke_result_store.put_block(batch, block.height, block_invoke_results)
 
-            self.__confirmed_block_db.Put(
-                tx.get_tx_hash().encode(encoding=conf.HASH_KEY_ENCODING),
-                json.dumps(tx_info).encode(encoding=conf.PEER_DATA_ENCODING))
+    @staticmethod
+    def __dump_tx_index(block_height, tx_index, tx_offset):
+        return BlockChain.TX_INDEX_STRUCT.pack(block_height, tx_index, tx_offset)
 
     def find_tx_by_key(self, tx_hash_key):
         """tx 의 hash 로 저장된 tx 를 구한다.
@@ -257,6 +771,9 @@ class BlockChain:
         :param tx_hash_key: tx 의 tx_hash
         :return tx_hash_key 에 해당하는 transaction, 예외인 경우 None 을 리턴한다.
         """
+        if self.__is_unknown_tx(tx_hash_key):
+            return None
+
         # levle db 에서 tx 가 저장된 block 의 hash 를 구한다.
         try:
             tx_info_json = self.__find_tx_info(tx_hash_key)
@@ -264,25 +781,50 @@ class BlockChain:
             # Client 의 잘못된 요청이 있을 수 있으므로 Warning 처리후 None 을 리턴한다.
             # 시스템 Error 로 처리하지 않는다.
             logging.warning("blockchain::find_tx_by_key KeyError: " + str(e))
+            if self.__tx_filter is not None and self.__tx_filter.ready:
+                self.__tx_filter.record_false_positive()
             return None
         if tx_info_json is None:
             logging.warning("tx not found")
             return None
+        if 'offset' in tx_info_json:
+            # tx 의 위치가 기록되어 있으면 block body 에서 해당 tx 만 읽는다.
+            block = self.__block_cache.get_by_height(tx_info_json['block_height'])
+            if block is not None:
+                return block.confirmed_transaction_list[tx_info_json['tx_index']]
+
+            try:
+                block_key = tx_info_json.get('block_hash') or self.__find_block_hash_by_height(
+                    tx_info_json['block_height'])
+                logging.debug("block_key: " + str(block_key))
+                block_body = self.__get_block_body(block_key.encode(encoding='UTF-8'))
+            except KeyError:
+                logging.error(f"There is No Block, block_height: {tx_info_json['block_height']}")
+                return None
+
+            if BlockCodec.is_encoded(block_body):
+                # 압축된 body 는 tx 하나를 읽더라도 전체를 풀어야 하므로 block 을 읽어 cache 에 추가한다.
+                block = self.find_block_by_hash(block_key)
+                return None if block is None else block.confirmed_transaction_list[tx_info_json['tx_index']]
+
+            tx = Transaction()
+            tx.deserialize_tx(block_body, tx_info_json['offset'])
+            return tx
+
+        # 이전 버전의 tx_info (tx 위치가 없는 경우) 는 block object 에서 tx 를 찾는다.
         block_key = tx_info_json['block_hash']
         logging.debug("block_key: " + str(block_key))
-
-        # block 의 hash 로 block object 를 구한다.
         block = self.find_block_by_hash(block_key)
-        logging.debug("block: " + block.block_hash)
         if block is None:
-            logging.error("There is No Block, block_hash: " + block.block_hash)
+            logging.error("There is No Block, block_hash: " + block_key)
             return None
+        logging.debug("block: " + block.block_hash)
 
         # block object 에서 저장된 tx 를 구한다.
         tx_index = block.find_transaction_index(tx_hash_key)
         logging.debug("tx_index: " + str(tx_index))
         if tx_index < 0:
-            logging.error("block.find_transaction_index index error, index: " + tx_index)
+            logging.error("block.find_transaction_index index error, index: " + str(tx_index))
             return None
 
         tx = block.confirmed_transaction_list[tx_index]
@@ -296,25 +838,80 @@ class BlockChain:
         :param tx_hash: tx_hash
         :return: {"code" : "code", "error_message" : "error_message if not fail this is not exist"}
         """
+        # 아직 block 에 담기지 않은 tx 를 polling 하는 경우 block db 를 읽지 않는다.
+        if self.__is_unknown_tx(tx_hash):
+            return {'code': ScoreResponse.NOT_INVOKED}
+
         try:
             tx_info = self.__find_tx_info(tx_hash)
         except KeyError as e:
             # Client 의 잘못된 요청이 있을 수 있으므로 Warning 처리후 None 을 리턴한다.
             # 시스템 Error 로 처리하지 않는다.
             logging.warning("blockchain::find invoke_result KeyError: " + str(e))
+            if self.__tx_filter is not None and self.__tx_filter.ready:
+                self.__tx_filter.record_false_positive()
+            return {'code': ScoreResponse.NOT_INVOKED}
+        if tx_info is None:
+            return {'code': ScoreResponse.NOT_INVOKED}
+
+        if 'result' in tx_info:
+            # 이전 버전의 tx_info 에 저장된 invoke result
+            return tx_info['result']
+
+        invoke_result = self.__invoke_result_store.get(tx_info['block_height'], tx_info['tx_index'])
+        if invoke_result is None:
+            logging.warning(f"There is no invoke result of block height({tx_info['block_height']})")
             return {'code': ScoreResponse.NOT_INVOKED}
+        return invoke_result
 
-        return tx_info['result']
+    def __find_block_hash_by_height(self, block_height):
+        """
+        :return: block_hash (str)
+        :raise KeyError: height 의 block 이 없는 경우
+        """
+        block_hash = self.__confirmed_block_db.Get(
+            BlockChain.BLOCK_HEIGHT_KEY + block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
+        return bytes(block_hash).decode(encoding='UTF-8')
+
+    def contains_tx(self, tx_hash):
+        """tx_hash 의 tx 가 block db 에 있는지 확인한다. (tx 를 load 하지 않는다.)
+
+        :param tx_hash: tx 의 tx_hash
+        :return: block 에 담긴 tx 이면 True
+        """
+        if self.__is_unknown_tx(tx_hash):
+            return False
+
+        try:
+            self.__confirmed_block_db.Get(tx_hash.encode(encoding=conf.HASH_KEY_ENCODING))
+        except KeyError:
+            if self.__tx_filter is not None and self.__tx_filter.ready:
+                self.__tx_filter.record_false_positive()
+            return False
+        return True
 
     def __find_tx_info(self, tx_hash_key):
+        """tx_hash 의 tx index 를 구한다.
+
+        :return: {'block_height', 'tx_index', 'offset'},
+        이전 버전의 json tx_info 이면 {'block_hash', 'result'} 와 (있으면) 'block_height', 'tx_index', 'offset'
+        :raise KeyError: tx_hash 의 tx index 가 없는 경우
+        """
         try:
             tx_info = self.__confirmed_block_db.Get(
                 tx_hash_key.encode(encoding=conf.HASH_KEY_ENCODING))
-            tx_info_json = json.loads(tx_info, encoding=conf.PEER_DATA_ENCODING)
+            if len(tx_info) == BlockChain.TX_INDEX_STRUCT.size and tx_info[:1] != b'{':
+                block_height, tx_index, offset = BlockChain.TX_INDEX_STRUCT.unpack(bytes(tx_info))
+                return {'block_height': block_height, 'tx_index': tx_index, 'offset': offset}
+            tx_info_json = json.loads(tx_info.decode(conf.PEER_DATA_ENCODING))
 
         except UnicodeDecodeError as e:
             logging.warning("blockchain::find_tx_by_key UnicodeDecodeError: " + str(e))
             return None
+        except ValueError as e:
+            # tx_hash_key 가 tx 가 아닌 다른 값(block header 등)의 key 인 경우
+            logging.warning("blockchain::find_tx_by_key ValueError: " + str(e))
+            return None
 
         return tx_info_json
 
@@ -354,7 +951,8 @@ class BlockChain:
             return False, "generate_block_hash"
 
         # Save unconfirmed_block
-        self.__confirmed_block_db.Put(BlockChain.UNCONFIRM_BLOCK_KEY, unconfirmed_block.serialize_block())
+        self.__confirmed_block_db.Put(BlockChain.UNCONFIRM_BLOCK_KEY,
+                                      unconfirmed_block.serialize_block(conf.BLOCK_DB_CODEC))
         return True, "No reason"
 
     def confirm_block(self, confirmed_block_hash):
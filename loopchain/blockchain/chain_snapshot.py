@@ -0,0 +1,240 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Export and import a snapshot of the blockchain to bootstrap a new peer"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import tarfile
+import tempfile
+
+from loopchain import configure as conf
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.blockchain.exception import SnapshotError
+from loopchain.storage import as_key_value_store
+
+
+class ChainSnapshot:
+    """blockchain 의 snapshot 을 하나의 파일(tar)로 내보내거나 가져온다.
+    snapshot 에는 block db 의 (key, value) 목록(BlockChain.snapshot_items)과 score 의 state db 파일들이 들어가며,
+    manifest 에 각 파일의 sha256 을 기록하여 가져올 때 검증한다.
+    """
+
+    VERSION = 1
+    MANIFEST_NAME = "manifest.json"
+    BLOCK_DB_NAME = "block_db.dat"
+    SCORE_DIR_NAME = "score"
+    # key length, value length
+    __RECORD_HEADER = struct.Struct('>II')
+    __IMPORT_BATCH_COUNT = 10000
+
+    @staticmethod
+    def export_snapshot(blockchain, snapshot_path, height=None, block_count=None, score_storage_path=None):
+        """blockchain 의 snapshot 을 snapshot_path 에 만든다.
+        score state 를 포함하는 경우 peer 를 멈춘 상태에서 마지막 block 의 snapshot 을 만들어야 한다.
+
+        :param blockchain: BlockChain
+        :param snapshot_path: 만들 snapshot 파일의 path
+        :param height: snapshot 의 마지막 block height, None 이면 마지막 block
+        :param block_count: body 를 포함할 block 의 갯수, None 이면 conf.SNAPSHOT_BLOCK_COUNT
+        :param score_storage_path: 포함할 score state db 의 directory, None 이면 포함하지 않는다.
+        :return: manifest (dict)
+        """
+        height = (height, blockchain.block_height)[height is None]
+        if score_storage_path is not None and height != blockchain.block_height:
+            raise SnapshotError(f"score state is at height({blockchain.block_height}), not at height({height})")
+
+        members = {}
+        with tempfile.TemporaryFile() as block_db_file, tarfile.open(snapshot_path, 'w') as snapshot:
+            digest = hashlib.sha256()
+            for key, value in blockchain.snapshot_items(height, block_count):
+                record = ChainSnapshot.__RECORD_HEADER.pack(len(key), len(value)) + key + value
+                digest.update(record)
+                block_db_file.write(record)
+            members[ChainSnapshot.BLOCK_DB_NAME] = digest.hexdigest()
+
+            block_db_file.seek(0)
+            block_db_info = tarfile.TarInfo(ChainSnapshot.BLOCK_DB_NAME)
+            block_db_info.size = os.fstat(block_db_file.fileno()).st_size
+            snapshot.addfile(block_db_info, block_db_file)
+
+            if score_storage_path is not None:
+                for root, dirs, files in os.walk(score_storage_path):
+                    for file_name in sorted(files):
+                        file_path = os.path.join(root, file_name)
+                        name = os.path.join(ChainSnapshot.SCORE_DIR_NAME,
+                                            os.path.relpath(file_path, score_storage_path)).replace(os.sep, '/')
+                        members[name] = ChainSnapshot.__file_digest(file_path)
+                        snapshot.add(file_path, arcname=name, recursive=False)
+
+            last_block = blockchain.find_block_by_height(height, headers_only=True)
+            manifest = {
+                'version': ChainSnapshot.VERSION,
+                'channel': last_block.channel_name,
+                'height': height,
+                'block_hash': last_block.block_hash,
+                'block_count': (block_count, conf.SNAPSHOT_BLOCK_COUNT)[block_count is None],
+                'members': members
+            }
+            manifest_dumps = json.dumps(manifest).encode(encoding=conf.PEER_DATA_ENCODING)
+            manifest_info = tarfile.TarInfo(ChainSnapshot.MANIFEST_NAME)
+            manifest_info.size = len(manifest_dumps)
+            snapshot.addfile(manifest_info, io.BytesIO(manifest_dumps))
+
+        logging.info(f"export snapshot({snapshot_path}) height({height}) members({len(members)})")
+        return manifest
+
+    @staticmethod
+    def import_snapshot(snapshot_path, block_db, score_storage_path=None):
+        """snapshot 을 검증한 다음 비어 있는 block db 에 가져온다.
+        last block key 를 가장 마지막에 기록하므로 가져오는 중에 실패하면 block db 는 비어 있는 상태로 남는다.
+
+        :param snapshot_path: snapshot 파일의 path
+        :param block_db: snapshot 을 가져올 비어 있는 block db (KeyValueStore or leveldb.LevelDB)
+        :param score_storage_path: score state db 를 풀어 놓을 directory, None 이면 가져오지 않는다.
+        :return: manifest (dict)
+        """
+        block_db = as_key_value_store(block_db)
+        try:
+            block_db.Get(BlockChain.LAST_BLOCK_KEY)
+        except KeyError:
+            pass
+        else:
+            raise SnapshotError("block db is not empty")
+
+        try:
+            with tarfile.open(snapshot_path, 'r') as snapshot:
+                manifest = ChainSnapshot.__verify(snapshot)
+                score_files = ChainSnapshot.__score_files(manifest, score_storage_path)
+
+                block_db_file = snapshot.extractfile(ChainSnapshot.BLOCK_DB_NAME)
+                batch = block_db.WriteBatch()
+                batch_count = 0
+                for key, value in ChainSnapshot.__read_records(block_db_file):
+                    batch.Put(key, value)
+                    batch_count += 1
+                    if batch_count >= ChainSnapshot.__IMPORT_BATCH_COUNT:
+                        block_db.Write(batch)
+                        batch = block_db.WriteBatch()
+                        batch_count = 0
+                block_db.Write(batch, sync=True)
+
+                for name, file_path in score_files:
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    with snapshot.extractfile(name) as member_file, open(file_path, 'wb') as score_file:
+                        for chunk in iter(lambda: member_file.read(1024 * 1024), b''):
+                            score_file.write(chunk)
+        except (tarfile.TarError, OSError, struct.error, ValueError) as e:
+            raise SnapshotError(f"fail to read snapshot({snapshot_path}): {e}")
+
+        logging.info(f"import snapshot({snapshot_path}) height({manifest['height']})")
+        return manifest
+
+    @staticmethod
+    def read_manifest(snapshot_path):
+        """snapshot 의 manifest 만 읽는다. (검증하지 않음)
+
+        :return: manifest (dict) 의 channel, height, block_hash, block_count, members
+        """
+        try:
+            with tarfile.open(snapshot_path, 'r') as snapshot:
+                return ChainSnapshot.__read_manifest(snapshot)
+        except (tarfile.TarError, OSError, ValueError) as e:
+            raise SnapshotError(f"fail to read snapshot({snapshot_path}): {e}")
+
+    @staticmethod
+    def __read_manifest(snapshot):
+        try:
+            manifest = json.loads(snapshot.extractfile(ChainSnapshot.MANIFEST_NAME).read()
+                                  .decode(encoding=conf.PEER_DATA_ENCODING))
+        except KeyError:
+            raise SnapshotError("There is no manifest in snapshot")
+
+        if manifest.get('version') != ChainSnapshot.VERSION:
+            raise SnapshotError(f"unknown snapshot version({manifest.get('version')})")
+
+        return manifest
+
+    @staticmethod
+    def __verify(snapshot):
+        """snapshot 의 manifest 를 읽고 manifest 에 기록된 sha256 으로 모든 파일을 검증한다.
+
+        :return: manifest (dict)
+        """
+        manifest = ChainSnapshot.__read_manifest(snapshot)
+
+        members = manifest['members']
+        names = [member.name for member in snapshot.getmembers() if member.isfile()]
+        if sorted(names) != sorted(list(members) + [ChainSnapshot.MANIFEST_NAME]):
+            raise SnapshotError("files of snapshot do not match with manifest")
+
+        for name, member_digest in members.items():
+            digest = hashlib.sha256()
+            member_file = snapshot.extractfile(name)
+            for chunk in iter(lambda: member_file.read(1024 * 1024), b''):
+                digest.update(chunk)
+            if digest.hexdigest() != member_digest:
+                raise SnapshotError(f"checksum of {name} does not match")
+
+        return manifest
+
+    @staticmethod
+    def __read_records(block_db_file):
+        header_size = ChainSnapshot.__RECORD_HEADER.size
+        while True:
+            header = block_db_file.read(header_size)
+            if not header:
+                return
+            key_length, value_length = ChainSnapshot.__RECORD_HEADER.unpack(header)
+            key = block_db_file.read(key_length)
+            value = block_db_file.read(value_length)
+            if len(key) != key_length or len(value) != value_length:
+                raise SnapshotError("block db of snapshot is truncated")
+            yield key, value
+
+    @staticmethod
+    def __score_files(manifest, score_storage_path):
+        """snapshot 의 score state db 파일을 풀어 놓을 위치를 구한다.
+        block db 에 기록하기 전에 이미 있는 score state 를 덮어 쓰지 않는지 확인한다.
+
+        :return: [(name in snapshot, file path)]
+        """
+        if score_storage_path is None:
+            return []
+
+        score_files = []
+        score_prefix = ChainSnapshot.SCORE_DIR_NAME + '/'
+        for name in manifest['members']:
+            if not name.startswith(score_prefix):
+                continue
+
+            file_path = os.path.abspath(os.path.join(score_storage_path, name[len(score_prefix):]))
+            if not file_path.startswith(os.path.abspath(score_storage_path) + os.sep):
+                raise SnapshotError(f"wrong score file path in snapshot({name})")
+            if os.path.exists(file_path):
+                raise SnapshotError(f"score state already exists({file_path})")
+            score_files.append((name, file_path))
+
+        return score_files
+
+    @staticmethod
+    def __file_digest(file_path):
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
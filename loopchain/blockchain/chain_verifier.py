@@ -0,0 +1,294 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Offline integrity verifier of a stored chain"""
+
+import collections
+import logging
+import os
+import time
+from concurrent import futures
+
+from loopchain import configure as conf
+from loopchain.blockchain.block import Block
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.blockchain.block_archive import BlockArchive
+from loopchain.blockchain.exception import BlockchainError, BlockError
+from loopchain.blockchain.tx_verifier import TxVerifier
+from loopchain.tools import PublicVerifierContainer
+
+
+def _verify_shard(shard, leader_public_keys, tx_verifier=None):
+    """process pool 의 worker 에서 연속된 block 들을 검증한다.
+
+    :param shard: height 순서대로의 [(height, block_hash, header, body)], body 가 None 이면 header 만 검증한다.
+    :param leader_public_keys: block signature 를 검증할 leader 의 public key (der) 목록, 비어 있으면 검증하지 않는다.
+    :param tx_verifier: block 의 tx 들을 검증할 TxVerifier, None 이면 worker 안에서 tx 를 순서대로 검증한다.
+    :return: dict of first_prev_hash, last_hash, block_count, tx_count, header_only_count, invalid_height, error
+    """
+    result = {'first_prev_hash': None, 'last_hash': None, 'block_count': 0, 'tx_count': 0, 'header_only_count': 0,
+              'invalid_height': None, 'error': None}
+    prev_hash = None
+    # shard 는 이미 process 마다 나누어 검증하므로 worker 안에서 다시 pool 을 만들지 않는다.
+    tx_verifier = (tx_verifier, TxVerifier(worker_count=1))[tx_verifier is None]
+
+    for height, block_hash, header, body in shard:
+        try:
+            block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            if header[:len(Block.ENCODING_MAGIC)] != Block.ENCODING_MAGIC:
+                # 이전 버전에서 block 전체를 pickle 로 저장한 경우
+                block.deserialize_block(header)
+            else:
+                block.deserialize_block_header(header)
+                if body is not None:
+                    block.deserialize_block_body(body)
+
+            if block.height != height:
+                raise BlockError(f"block height({block.height}) is not same with height index")
+            if block.block_hash != block_hash:
+                raise BlockError(f"block hash({block.block_hash}) is not same with height index({block_hash})")
+            if prev_hash is not None and block.prev_block_hash != prev_hash:
+                raise BlockError(f"prev block hash({block.prev_block_hash}) is not same with "
+                                 f"block hash({prev_hash}) of height({height - 1})")
+
+            block.verify_integrity(tx_verifier=tx_verifier)
+            if leader_public_keys and height > 0 and not _verify_block_signature(block, leader_public_keys):
+                raise BlockError("block signature is not signed by leaders")
+        except Exception as e:
+            result['invalid_height'] = height
+            result['error'] = f"{type(e).__name__}: {e}"
+            break
+
+        if result['first_prev_hash'] is None:
+            result['first_prev_hash'] = block.prev_block_hash
+        prev_hash = result['last_hash'] = block.block_hash
+        result['block_count'] += 1
+        result['tx_count'] += len(block.confirmed_transaction_list)
+        if body is None and header[:len(Block.ENCODING_MAGIC)] == Block.ENCODING_MAGIC:
+            result['header_only_count'] += 1
+
+    return result
+
+
+def _verify_block_signature(block, leader_public_keys):
+    for public_key in leader_public_keys:
+        try:
+            if PublicVerifierContainer.get_public_verifier(public_key).verify_hash(block.block_hash, block.signature):
+                return True
+        except Exception as e:
+            logging.debug(f"fail to verify block signature: {e}")
+    return False
+
+
+class ChainVerifier:
+    """block db 에 저장된 chain 을 peer 없이 검증한다.
+    height 범위를 shard 로 나누어 process pool 에서 tx hash, tx signature, merkle tree root hash, block hash,
+    prev block hash 의 연결을 다시 계산하여 비교하고, 처음으로 일치하지 않는 block 의 height 를 구한다.
+    LevelDB 는 한 process 에서만 열 수 있으므로 block db 는 이 process 에서만 읽고, worker 에는 읽은 bytes 를 보낸다.
+    block db 에는 기록하지 않는다.
+    """
+
+    def __init__(self, block_db, archive_path=None, process_count=None, shard_size=None, leader_public_keys=None):
+        """
+        :param block_db: KeyValueStore, 사용하고 있는 peer 가 없는 block db
+        :param archive_path: block archive 의 path, None 이거나 없으면 archive 된 block 은 header 만 검증한다.
+        :param process_count: worker process 의 갯수, None 이면 conf.CHAIN_VERIFIER_PROCESS_COUNT (0 이면 cpu 갯수)
+        1 이면 process pool 을 사용하지 않는다.
+        :param shard_size: 한 worker 가 한 번에 검증하는 block 의 갯수, None 이면 conf.CHAIN_VERIFIER_SHARD_SIZE
+        :param leader_public_keys: block signature 를 검증할 leader 의 public key (der) 목록,
+        None 이면 block signature 는 검증하지 않는다.
+        """
+        self.__block_db = block_db
+        self.__block_archive = None
+        if archive_path is not None and os.path.isdir(archive_path):
+            self.__block_archive = BlockArchive(archive_path)
+
+        process_count = (process_count, conf.CHAIN_VERIFIER_PROCESS_COUNT)[process_count is None]
+        self.__process_count = process_count or os.cpu_count() or 1
+        self.__shard_size = (shard_size, conf.CHAIN_VERIFIER_SHARD_SIZE)[shard_size is None]
+        self.__leader_public_keys = list(leader_public_keys or [])
+
+    @property
+    def last_height(self):
+        """
+        :return: block db 의 마지막 block 의 height
+        :raise BlockchainError: block db 가 아닌 경우
+        """
+        try:
+            last_block_hash = self.__block_db.Get(BlockChain.LAST_BLOCK_KEY)
+            header = self.__block_db.Get(bytes(last_block_hash))
+        except KeyError:
+            raise BlockchainError("there is no last block in block db")
+
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        if header[:len(Block.ENCODING_MAGIC)] != Block.ENCODING_MAGIC:
+            block.deserialize_block(header)
+        else:
+            block.deserialize_block_header(header)
+        return block.height
+
+    def verify(self, start_height=0, end_height=None):
+        """start_height 부터 end_height 까지의 block 을 검증한다.
+
+        :param start_height: 처음 검증할 block 의 height
+        :param end_height: 마지막 검증할 block 의 height (포함), None 이면 마지막 block
+        :return: dict of start_height, end_height, verified_height, block_count, tx_count, header_only_count,
+        invalid_height (None 이면 모두 정상), error, block_signature, process_count, elapsed,
+        blocks_per_second, txs_per_second
+        """
+        end_height = (end_height, self.last_height)[end_height is None]
+        report = {'start_height': start_height, 'end_height': end_height, 'verified_height': start_height - 1,
+                  'block_count': 0, 'tx_count': 0, 'header_only_count': 0, 'invalid_height': None, 'error': None,
+                  'block_signature': len(self.__leader_public_keys) > 0, 'process_count': self.__process_count}
+
+        begin_time = time.monotonic()
+        prev_hash = None
+        if start_height > 0:
+            prev_hash = self.__read_block_hash(start_height - 1)
+
+        for shard_start, result in self.__verify_shards(start_height, end_height):
+            if prev_hash is not None and result['first_prev_hash'] is not None \
+                    and result['first_prev_hash'] != prev_hash:
+                report['invalid_height'] = shard_start
+                report['error'] = f"BlockError: prev block hash({result['first_prev_hash']}) is not same with " \
+                                  f"block hash({prev_hash}) of height({shard_start - 1})"
+                break
+
+            report['block_count'] += result['block_count']
+            report['tx_count'] += result['tx_count']
+            report['header_only_count'] += result['header_only_count']
+            report['verified_height'] += result['block_count']
+            prev_hash = result['last_hash'] or prev_hash
+
+            if result['invalid_height'] is not None:
+                report['invalid_height'] = result['invalid_height']
+                report['error'] = result['error']
+                break
+
+        elapsed = time.monotonic() - begin_time
+        report['elapsed'] = elapsed
+        report['blocks_per_second'] = report['block_count'] / elapsed if elapsed > 0 else 0.0
+        report['txs_per_second'] = report['tx_count'] / elapsed if elapsed > 0 else 0.0
+
+        if report['invalid_height'] is None:
+            logging.info(f"verified chain from height({start_height}) to ({end_height}), "
+                         f"blocks({report['block_count']}) txs({report['tx_count']}) elapsed({elapsed:.3f}s)")
+        else:
+            logging.warning(f"chain is invalid at height({report['invalid_height']}): {report['error']}")
+        return report
+
+    def __verify_shards(self, start_height, end_height):
+        """shard 들을 process pool 에서 검증하고 height 순서대로 결과를 구한다.
+        한 번에 process_count 의 2배 만큼의 shard 만 읽어 두므로 chain 이 커도 memory 를 많이 쓰지 않는다.
+
+        :return: generator of (shard 의 처음 height, _verify_shard 의 결과)
+        """
+        shards = self.__read_shards(start_height, end_height)
+        if self.__process_count == 1:
+            for shard_start, shard in shards:
+                yield shard_start, self.__verify_read_shard(shard)
+            return
+
+        with futures.ProcessPoolExecutor(max_workers=self.__process_count) as executor:
+            pending = collections.deque()
+            try:
+                for shard_start, shard in shards:
+                    pending.append((shard_start, self.__submit_shard(executor, shard)))
+                    if len(pending) >= self.__process_count * 2:
+                        shard_start, future = pending.popleft()
+                        yield shard_start, future.result()
+
+                while pending:
+                    shard_start, future = pending.popleft()
+                    yield shard_start, future.result()
+            finally:
+                for shard_start, future in pending:
+                    future.cancel()
+
+    def __verify_read_shard(self, shard):
+        if isinstance(shard, dict):
+            return shard
+        # process pool 을 쓰지 않으면 block 안의 tx 들을 Block.tx_verifier 의 worker pool 에서 검증한다.
+        return _verify_shard(shard, self.__leader_public_keys, Block.tx_verifier)
+
+    def __submit_shard(self, executor, shard):
+        if isinstance(shard, dict):
+            # 읽는 중에 발견한 오류
+            future = futures.Future()
+            future.set_result(shard)
+            return future
+        return executor.submit(_verify_shard, shard, self.__leader_public_keys)
+
+    def __read_shards(self, start_height, end_height):
+        """block db 에서 shard_size 개씩 block 을 읽는다.
+        height index 가 비어 있으면 그 height 에서 오류 결과 (dict) 를 만들고 멈춘다.
+
+        :return: generator of (shard 의 처음 height, [(height, block_hash, header, body)] or 오류 결과)
+        """
+        block_height_keys = self.__block_db.RangeIter(
+            key_from=BlockChain.BLOCK_HEIGHT_KEY + start_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+            key_to=BlockChain.BLOCK_HEIGHT_KEY + end_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
+            fill_cache=False)
+
+        expected_height = start_height
+        shard = []
+        error = None
+        for block_height_key, block_hash in block_height_keys:
+            height = int.from_bytes(bytes(block_height_key[len(BlockChain.BLOCK_HEIGHT_KEY):]), byteorder='big')
+            if height != expected_height:
+                break
+
+            block_hash = bytes(block_hash)
+            try:
+                header = bytes(self.__block_db.Get(block_hash, fill_cache=False))
+            except KeyError:
+                error = f"there is no block header of height({height})"
+                break
+            shard.append((height, block_hash.decode(conf.HASH_KEY_ENCODING), header, self.__read_body(block_hash)))
+            expected_height += 1
+
+            if len(shard) >= self.__shard_size:
+                yield shard[0][0], shard
+                shard = []
+
+        if shard:
+            yield shard[0][0], shard
+
+        if expected_height <= end_height:
+            yield expected_height, {
+                'first_prev_hash': None, 'last_hash': None, 'block_count': 0, 'tx_count': 0,
+                'header_only_count': 0, 'invalid_height': expected_height,
+                'error': "BlockError: " + (error or f"there is no block of height({expected_height})")}
+
+    def __read_body(self, block_hash):
+        try:
+            return bytes(self.__block_db.Get(BlockChain.BLOCK_BODY_KEY + block_hash, fill_cache=False))
+        except KeyError:
+            pass
+
+        if self.__block_archive is not None:
+            try:
+                pointer = self.__block_db.Get(BlockChain.BLOCK_ARCHIVE_KEY + block_hash, fill_cache=False)
+                return bytes(self.__block_archive.read(*BlockArchive.unpack_pointer(pointer)))
+            except KeyError:
+                pass
+
+        # snapshot 으로 만든 chain 의 오래된 block 이나 archive 가 없는 경우
+        return None
+
+    def __read_block_hash(self, height):
+        try:
+            return bytes(self.__block_db.Get(BlockChain.BLOCK_HEIGHT_KEY + height.to_bytes(
+                conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))).decode(conf.HASH_KEY_ENCODING)
+        except KeyError:
+            raise BlockchainError(f"there is no block of height({height})")
@@ -41,6 +41,12 @@ class BlockchainError(Exception):
     pass
 
 
+class SnapshotError(Exception):
+    """chain snapshot 이 손상되었거나 snapshot 으로 blockchain 을 만들 수 없을 때 발생
+    """
+    pass
+
+
 class ScoreInvokeError(Exception):
     """Error While Invoke Score
     """
@@ -0,0 +1,195 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A store of invoke results compressed per block"""
+
+import json
+import logging
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+
+from loopchain import configure as conf
+
+
+class InvokeResultStore:
+    """tx 의 invoke result 를 block 단위로 압축하여 block db 에 저장한다.
+    대부분의 invoke result 는 {'code': 0} 처럼 같은 값이므로 서로 다른 result 마다 id 를 붙여 dictionary 에 한 번만 저장하고,
+    block 에는 tx 순서대로 result id 의 배열을 zlib 으로 압축하여 저장한다.
+    dictionary 가 conf.INVOKE_RESULT_DICT_MAX_COUNT 만큼 차면 새로운 result 는 block 의 record 에 그대로 (inline) 저장한다.
+
+    block db has [ RESULT_DICT_KEY + result id - result (json) |
+                   BLOCK_RESULTS_KEY + block height - zlib(tx count | result ids | inline results (json)) ]
+    """
+
+    RESULT_DICT_KEY = b'invoke_result_dict_key'
+    BLOCK_RESULTS_KEY = b'invoke_results_key'
+    __ID_STRUCT = struct.Struct('>I')
+    # dictionary 에 없는 result 의 id
+    __INLINE_ID = 0xFFFFFFFF
+
+    def __init__(self, block_db, dict_max_count=None, cache_count=None):
+        """
+        :param block_db: KeyValueStore
+        :param dict_max_count: dictionary 에 저장하는 result 의 최대 갯수, None 이면 conf.INVOKE_RESULT_DICT_MAX_COUNT
+        :param cache_count: 풀어 놓은 block 의 result 목록을 cache 하는 block 의 갯수, None 이면 conf.INVOKE_RESULT_CACHE_COUNT
+        """
+        self.__block_db = block_db
+        self.__dict_max_count = (dict_max_count, conf.INVOKE_RESULT_DICT_MAX_COUNT)[dict_max_count is None]
+        self.__cache_count = (cache_count, conf.INVOKE_RESULT_CACHE_COUNT)[cache_count is None]
+        # result id - result
+        self.__results = []
+        # result (json) - result id
+        self.__result_ids = {}
+        # put_block 으로 batch 에 추가했지만 아직 commit 되지 않은 result (json) - result id
+        self.__pending_result_ids = {}
+        # block height - [result]
+        self.__block_results_cache = OrderedDict()
+        self.__lock = threading.Lock()
+
+        self.__load_dict()
+
+    def __load_dict(self):
+        dict_items = self.__block_db.RangeIter(
+            key_from=InvokeResultStore.RESULT_DICT_KEY,
+            key_to=InvokeResultStore.RESULT_DICT_KEY + b'\xff' * InvokeResultStore.__ID_STRUCT.size)
+
+        for result_id_key, result_dumps in dict_items:
+            result_id, = InvokeResultStore.__ID_STRUCT.unpack(bytes(result_id_key[-InvokeResultStore.__ID_STRUCT.size:]))
+            if result_id != len(self.__results):
+                logging.warning(f"invoke result dictionary is broken at id({result_id})")
+                break
+            result_dumps = bytes(result_dumps)
+            self.__results.append(json.loads(result_dumps.decode(conf.PEER_DATA_ENCODING)))
+            self.__result_ids[result_dumps] = result_id
+
+    @property
+    def dict_count(self):
+        return len(self.__results)
+
+    @staticmethod
+    def dumps_result(invoke_result):
+        """같은 result 가 항상 같은 bytes 가 되도록 key 를 정렬하여 json 으로 만든다.
+        """
+        return json.dumps(invoke_result, sort_keys=True, separators=(',', ':')).encode(conf.PEER_DATA_ENCODING)
+
+    @staticmethod
+    def block_results_key(height):
+        return InvokeResultStore.BLOCK_RESULTS_KEY + height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+
+    def put_block(self, batch, height, invoke_results):
+        """block 의 invoke result 들을 batch 에 추가한다.
+        batch 를 기록한 다음 commit 을 호출해야 새로 추가된 result 가 dictionary 에 반영된다.
+        commit 하지 않고 다시 put_block 을 호출하면 이전 put_block 의 새 result 는 버린다. (batch 기록에 실패한 경우)
+
+        :param batch: block db 의 WriteBatch
+        :param height: block height
+        :param invoke_results: tx 순서대로의 invoke result 목록
+        """
+        with self.__lock:
+            self.__pending_result_ids.clear()
+            self.__block_results_cache.pop(height, None)
+            batch.Put(InvokeResultStore.block_results_key(height), self.__encode_block(invoke_results, batch))
+
+    def commit(self):
+        """put_block 으로 batch 에 추가한 새 result 들을 dictionary 에 반영한다.
+        """
+        with self.__lock:
+            for result_dumps, result_id in sorted(self.__pending_result_ids.items(), key=lambda item: item[1]):
+                self.__results.append(json.loads(result_dumps.decode(conf.PEER_DATA_ENCODING)))
+                self.__result_ids[result_dumps] = result_id
+            self.__pending_result_ids.clear()
+
+    def encode_block(self, invoke_results):
+        """dictionary 를 바꾸지 않고 block 의 record 를 만든다. dictionary 에 없는 result 는 inline 으로 저장한다.
+
+        :return: BLOCK_RESULTS_KEY 에 저장할 record
+        """
+        with self.__lock:
+            return self.__encode_block(invoke_results, None)
+
+    def __encode_block(self, invoke_results, batch):
+        result_ids = []
+        inline_results = []
+        for invoke_result in invoke_results:
+            result_dumps = InvokeResultStore.dumps_result(invoke_result)
+            result_id = self.__result_ids.get(result_dumps)
+            if result_id is None:
+                result_id = self.__pending_result_ids.get(result_dumps)
+            if result_id is None:
+                result_id = InvokeResultStore.__INLINE_ID
+                next_id = len(self.__results) + len(self.__pending_result_ids)
+                if batch is not None and next_id < self.__dict_max_count:
+                    result_id = next_id
+                    self.__pending_result_ids[result_dumps] = result_id
+                    batch.Put(InvokeResultStore.RESULT_DICT_KEY + InvokeResultStore.__ID_STRUCT.pack(result_id),
+                              result_dumps)
+                else:
+                    inline_results.append(result_dumps)
+            result_ids.append(result_id)
+
+        record = struct.pack(f'>I{len(result_ids)}I', len(result_ids), *result_ids)
+        if inline_results:
+            record += b'[' + b','.join(inline_results) + b']'
+        return zlib.compress(record)
+
+    def get(self, height, tx_index):
+        """
+        :return: invoke result (dict), height 의 result 가 없으면 None
+        """
+        block_results = self.get_block(height)
+        if block_results is None or tx_index >= len(block_results):
+            return None
+        return dict(block_results[tx_index])
+
+    def get_block(self, height):
+        """height 의 block 에 담긴 tx 들의 invoke result 목록을 구한다.
+        풀어 놓은 목록은 cache 하며, 목록의 result 는 dictionary 와 공유하므로 바꾸지 않아야 한다.
+
+        :return: [invoke result], height 의 result 가 없으면 None
+        """
+        with self.__lock:
+            block_results = self.__block_results_cache.get(height)
+            if block_results is not None:
+                self.__block_results_cache.move_to_end(height)
+                return block_results
+
+        try:
+            record = zlib.decompress(self.__block_db.Get(InvokeResultStore.block_results_key(height)))
+        except KeyError:
+            return None
+
+        tx_count, = InvokeResultStore.__ID_STRUCT.unpack_from(record)
+        ids_end = InvokeResultStore.__ID_STRUCT.size * (tx_count + 1)
+        result_ids = struct.unpack_from(f'>{tx_count}I', record, InvokeResultStore.__ID_STRUCT.size)
+        inline_results = iter(())
+        if len(record) > ids_end:
+            inline_results = iter(json.loads(record[ids_end:].decode(conf.PEER_DATA_ENCODING)))
+
+        block_results = [self.__results[result_id] if result_id != InvokeResultStore.__INLINE_ID
+                         else next(inline_results)
+                         for result_id in result_ids]
+
+        with self.__lock:
+            self.__block_results_cache[height] = block_results
+            if len(self.__block_results_cache) > self.__cache_count:
+                self.__block_results_cache.popitem(last=False)
+        return block_results
+
+    def dict_items(self):
+        """snapshot 으로 내보내기 위한 dictionary 의 (key, value)
+        """
+        for result_id, invoke_result in enumerate(list(self.__results)):
+            yield InvokeResultStore.RESULT_DICT_KEY + InvokeResultStore.__ID_STRUCT.pack(result_id), \
+                InvokeResultStore.dumps_result(invoke_result)
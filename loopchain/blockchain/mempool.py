@@ -0,0 +1,197 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A pool of txs waiting to be put in a block"""
+
+import collections
+import logging
+import threading
+import time
+from enum import IntEnum
+
+from loopchain import configure as conf
+from loopchain.blockchain.transaction import TransactionType
+
+
+class MempoolPutResult(IntEnum):
+    added = 0
+    duplicate = 1
+    full = 2
+
+
+class Mempool:
+    """block 에 담기를 기다리는 tx 들을 받은 순서대로 보관한다.
+    tx_hash 를 key 로 하는 OrderedDict 에 load 된 tx 를 보관하므로 중복된 tx 는 담지 않으며
+    confirm 된 block 에 담긴 tx 는 tx 마다 O(1) 로 제거한다.
+
+    tx 갯수 (conf.MEMPOOL_MAX_TX_COUNT) 또는 serialize 크기의 합 (conf.MEMPOOL_MAX_BYTES) 을 넘으면
+    conf.MEMPOOL_DROP_OLDEST 에 따라 새 tx 를 거절하거나 가장 오래된 tx 를 제거한다.
+    peer list tx 등 general 이 아닌 tx 는 제한과 상관없이 담으며 제거하지 않는다.
+    """
+
+    def __init__(self, max_count=None, max_bytes=None):
+        """
+        :param max_count: 보관하는 tx 의 최대 갯수, None 이면 conf.MEMPOOL_MAX_TX_COUNT
+        :param max_bytes: 보관하는 tx 의 serialize 크기 합의 최대값, None 이면 conf.MEMPOOL_MAX_BYTES
+        """
+        self.__max_count = max_count
+        self.__max_bytes = max_bytes
+        self.__txs = collections.OrderedDict()  # tx_hash : (tx, size, put_time)
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+        self.__put_count = 0
+        self.__duplicate_count = 0
+        self.__full_count = 0
+        self.__eviction = 0
+        self.__pop_count = 0
+        self.__remove_count = 0
+        self.__total_wait = 0.0
+
+    @property
+    def max_count(self):
+        return conf.MEMPOOL_MAX_TX_COUNT if self.__max_count is None else self.__max_count
+
+    @property
+    def max_bytes(self):
+        return conf.MEMPOOL_MAX_BYTES if self.__max_bytes is None else self.__max_bytes
+
+    def __len__(self):
+        return len(self.__txs)
+
+    def empty(self):
+        return len(self.__txs) == 0
+
+    def contains(self, tx_hash):
+        return tx_hash in self.__txs
+
+    def put(self, tx):
+        """tx 를 mempool 에 담는다.
+
+        :param tx: load 된 transaction
+        :return: MempoolPutResult
+        """
+        tx_hash = tx.tx_hash
+        size = tx.serialized_size()
+        is_general = tx.type is TransactionType.general
+
+        with self.__lock:
+            if tx_hash in self.__txs:
+                self.__duplicate_count += 1
+                return MempoolPutResult.duplicate
+
+            if is_general and self.__is_over_limit(1, size):
+                if not conf.MEMPOOL_DROP_OLDEST or not self.__evict(size):
+                    self.__full_count += 1
+                    return MempoolPutResult.full
+
+            self.__txs[tx_hash] = (tx, size, time.monotonic())
+            self.__bytes += size
+            self.__put_count += 1
+            return MempoolPutResult.added
+
+    def pop(self):
+        """가장 먼저 담은 tx 를 꺼낸다.
+
+        :return: transaction, 비어 있으면 None
+        """
+        with self.__lock:
+            if not self.__txs:
+                return None
+
+            tx_hash, (tx, size, put_time) = self.__txs.popitem(last=False)
+            self.__bytes -= size
+            self.__pop_count += 1
+            self.__total_wait += time.monotonic() - put_time
+            return tx
+
+    def remove(self, tx_hashes):
+        """block 에 담긴 tx 들을 제거한다.
+
+        :param tx_hashes: 제거할 tx 의 hash 목록
+        :return: 제거한 tx 의 갯수
+        """
+        remove_count = 0
+        with self.__lock:
+            for tx_hash in tx_hashes:
+                item = self.__txs.pop(tx_hash, None)
+                if item is not None:
+                    self.__bytes -= item[1]
+                    remove_count += 1
+            self.__remove_count += remove_count
+        return remove_count
+
+    def clear(self):
+        with self.__lock:
+            self.__txs.clear()
+            self.__bytes = 0
+
+    def get_status(self):
+        """mempool 의 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of count, bytes, max_count, max_bytes, oldest_age, put, duplicate, full, eviction,
+        pop, remove, average_wait
+        """
+        with self.__lock:
+            oldest_age = 0.0
+            if self.__txs:
+                tx, size, put_time = next(iter(self.__txs.values()))
+                oldest_age = time.monotonic() - put_time
+
+            return {
+                'count': len(self.__txs),
+                'bytes': self.__bytes,
+                'max_count': self.max_count,
+                'max_bytes': self.max_bytes,
+                'oldest_age': oldest_age,
+                'put': self.__put_count,
+                'duplicate': self.__duplicate_count,
+                'full': self.__full_count,
+                'eviction': self.__eviction,
+                'pop': self.__pop_count,
+                'remove': self.__remove_count,
+                'average_wait': (self.__total_wait / self.__pop_count) if self.__pop_count > 0 else 0.0
+            }
+
+    def __is_over_limit(self, count, size):
+        return len(self.__txs) + count > self.max_count or self.__bytes + size > self.max_bytes
+
+    def __evict(self, size):
+        """새 tx 를 담을 수 있을 때까지 오래된 general tx 부터 제거한다.
+
+        :param size: 담으려는 tx 의 크기
+        :return: 담을 수 있으면 True
+        """
+        if size > self.max_bytes or self.max_count <= 0:
+            return False
+
+        evict_hashes = []
+        evict_count = 0
+        evict_bytes = 0
+        for tx_hash, (tx, tx_size, put_time) in self.__txs.items():
+            if not self.__is_over_limit(1 - evict_count, size - evict_bytes):
+                break
+            if tx.type is TransactionType.general:
+                evict_hashes.append(tx_hash)
+                evict_count += 1
+                evict_bytes += tx_size
+
+        if self.__is_over_limit(1 - evict_count, size - evict_bytes):
+            return False
+
+        for tx_hash in evict_hashes:
+            del self.__txs[tx_hash]
+        self.__bytes -= evict_bytes
+        self.__eviction += evict_count
+        logging.warning(f"mempool is full, evict old tx({evict_count})")
+        return True
@@ -0,0 +1,265 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Merkle tree of tx hashes which keeps its levels for proofs"""
+
+import hashlib
+
+
+class MerkleTree:
+    """block 에 담긴 tx hash 들의 merkle tree
+    한 번 만든 level 들을 보관하므로 root 를 구한 다음의 proof 는 level 마다 sibling 하나만 찾으면 된다. (O(log n))
+    level 의 node 갯수가 홀수이면 마지막 node 를 복사하여 짝을 맞춘다.
+
+    append 로 tx hash 를 하나씩 더할 수 있다. (incremental merkle accumulator)
+    level 에는 두 child 가 모두 있는 node 만 보관하므로 append 마다 평균 한 번의 hash 만 계산한다.
+    마지막 node 를 복사하여 만드는 오른쪽 끝의 node (edge) 들은 root 나 proof 를 구할 때 O(log n) 으로 계산하여
+    다음 append 까지 보관한다.
+
+    version
+      HEX: 이전 버전과 같은 root 를 만든다. node 는 hex string 이며 두 node 의 hex string 을 이어 붙여 hash 한다.
+      RAW: node 는 32 bytes 의 sha256 digest 이며 두 digest 를 이어 붙여 hash 한다. root 는 digest 의 hex string 이다.
+    """
+
+    HEX = 0
+    RAW = 1
+
+    def __init__(self, tx_hashes=(), version=HEX):
+        """
+        :param tx_hashes: block 에 담긴 순서대로의 tx hash (hex string) 목록
+        :param version: MerkleTree.HEX or MerkleTree.RAW
+        """
+        if version not in (MerkleTree.HEX, MerkleTree.RAW):
+            raise ValueError(f"unknown merkle tree version({version})")
+
+        self.__version = version
+        self.__levels = [MerkleTree.__leaves(tx_hashes, version)]
+        self.__edges = None
+
+        level = self.__levels[0]
+        while len(level) > 1:
+            level = MerkleTree.__parent_level(level, version)
+            self.__levels.append(level)
+
+    @property
+    def version(self):
+        return self.__version
+
+    @property
+    def leaf_count(self):
+        return len(self.__levels[0])
+
+    @property
+    def root(self):
+        """
+        :return: merkle tree root hash (hex string), tx 가 없으면 ""
+        """
+        if not self.__levels[0]:
+            return ""
+        edges = self.__get_edges()
+        return MerkleTree.__to_hex(self.__node(len(edges) - 1, 0, edges), self.__version)
+
+    def append(self, tx_hash):
+        """tx hash 를 마지막 leaf 로 더한다.
+        두 child 가 모두 채워진 parent 만 계산하므로 append 마다 평균 한 번의 hash 를 계산한다.
+
+        :param tx_hash: tx hash (hex string)
+        """
+        levels = self.__levels
+        levels[0].append(MerkleTree.__from_hex(tx_hash, self.__version))
+        self.__edges = None
+
+        level_index = 0
+        while len(levels[level_index]) % 2 == 0:
+            level = levels[level_index]
+            level_index += 1
+            if level_index == len(levels):
+                levels.append([])
+            levels[level_index].append(MerkleTree.__hash_pair(level[-2], level[-1], self.__version))
+
+    def proof(self, index):
+        """index 번째 tx 로부터 root 를 다시 계산하는데 필요한 sibling node 들을 구한다.
+
+        :param index: block 안에서의 tx index
+        :return: leaf 쪽부터 root 쪽 순서대로의 sibling (hex string) 목록
+        """
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"tx index({index}) is out of merkle tree leaves({self.leaf_count})")
+
+        edges = self.__get_edges()
+        siblings = []
+        length = self.leaf_count
+        for level_index in range(len(edges) - 1):
+            sibling_index = index ^ 1
+            siblings.append(MerkleTree.__to_hex(
+                self.__node(level_index, (sibling_index, index)[sibling_index >= length], edges), self.__version))
+            index >>= 1
+            length = (length + 1) // 2
+        return siblings
+
+    @staticmethod
+    def verify_proof(tx_hash, index, siblings, root, version=HEX):
+        """proof 로 구한 sibling 들로 tx_hash 가 root 의 merkle tree 에 index 번째로 담겨 있는지 검증한다.
+
+        :return: 검증 결과 (True/False)
+        """
+        node = MerkleTree.__from_hex(tx_hash, version)
+        for sibling in siblings:
+            sibling = MerkleTree.__from_hex(sibling, version)
+            # index 가 홀수이면 sibling 이 왼쪽이다.
+            node = MerkleTree.__hash_pair(*((node, sibling), (sibling, node))[index & 1], version)
+            index >>= 1
+        return MerkleTree.__to_hex(node, version) == root
+
+    def multi_proof(self, indices):
+        """여러 tx 로부터 root 를 다시 계산하는데 필요한 node 들을 한 번에 구한다.
+        tx 들이 함께 쓰는 node 와 tx 들로 계산할 수 있는 node 는 담지 않으므로 tx 마다 proof 를 만드는 것보다 작다.
+
+        :param indices: block 안에서의 tx index 목록 (순서와 중복은 상관 없다.)
+        :return: leaf 쪽 level 부터, level 안에서는 왼쪽부터의 node (hex string) 목록
+        """
+        positions = sorted(set(indices))
+        for index in positions[:1] + positions[-1:]:
+            if not 0 <= index < self.leaf_count:
+                raise IndexError(f"tx index({index}) is out of merkle tree leaves({self.leaf_count})")
+
+        edges = self.__get_edges()
+        nodes = []
+        length = self.leaf_count
+        for level_index in range(len(edges) - 1):
+            known = set(positions)
+            for position in positions:
+                sibling = position ^ 1
+                if sibling < length and sibling not in known:
+                    nodes.append(MerkleTree.__to_hex(self.__node(level_index, sibling, edges), self.__version))
+            positions = sorted({position >> 1 for position in positions})
+            length = (length + 1) // 2
+        return nodes
+
+    @staticmethod
+    def verify_multi_proof(indices, tx_hashes, leaf_count, nodes, root, version=HEX):
+        """multi_proof 로 구한 node 들로 tx 들이 root 의 merkle tree 에 각각의 index 번째로 담겨 있는지 한 번에 검증한다.
+
+        :param indices: 검증할 tx 들의 index 목록
+        :param tx_hashes: indices 와 같은 순서의 tx hash 목록
+        :param leaf_count: block 에 담긴 tx 의 갯수
+        :param nodes: multi_proof 의 결과
+        :return: 검증 결과 (True/False)
+        """
+        if len(indices) != len(tx_hashes) or len(indices) == 0:
+            return False
+
+        known = {}
+        for index, tx_hash in sorted(zip(indices, tx_hashes)):
+            if not 0 <= index < leaf_count or known.setdefault(index, tx_hash) != tx_hash:
+                return False
+        known = {index: MerkleTree.__from_hex(tx_hash, version) for index, tx_hash in known.items()}
+
+        nodes = iter(nodes)
+        level_length = leaf_count
+        try:
+            while level_length > 1:
+                parents = {}
+                for position, node in known.items():
+                    if position >> 1 in parents:
+                        continue
+                    sibling = position ^ 1
+                    if sibling >= level_length:
+                        sibling_node = node
+                    elif sibling in known:
+                        sibling_node = known[sibling]
+                    else:
+                        sibling_node = MerkleTree.__from_hex(next(nodes), version)
+                    parents[position >> 1] = \
+                        MerkleTree.__hash_pair(*((node, sibling_node), (sibling_node, node))[position & 1], version)
+                known = parents
+                level_length = (level_length + 1) // 2
+        except (StopIteration, ValueError):
+            return False
+
+        # 쓰지 않은 node 가 남아 있으면 잘못된 proof 이다.
+        if next(nodes, None) is not None:
+            return False
+        return MerkleTree.__to_hex(known[0], version) == root
+
+    def __get_edges(self):
+        """level 마다 보관하지 않은 오른쪽 끝의 node 를 구한다.
+        level 의 node 갯수가 홀수이면 마지막 node 를 복사하여 짝을 맞추므로 parent level 의 마지막 node 는
+        보관한 level 에 없을 수 있다.
+
+        :return: level 별 edge node 목록 (edge 가 없는 level 은 None), 마지막 level 이 root 의 level 이다.
+        """
+        if self.__edges is not None:
+            return self.__edges
+
+        edges = [None]
+        length = self.leaf_count
+        level_index = 0
+        while length > 1:
+            parent_length = (length + 1) // 2
+            parent_index = len(self.__levels[level_index]) // 2
+            if parent_index < parent_length:
+                left = self.__node(level_index, parent_index * 2, edges)
+                if parent_index * 2 + 1 < length:
+                    right = self.__node(level_index, parent_index * 2 + 1, edges)
+                else:
+                    right = left
+                edges.append(MerkleTree.__hash_pair(left, right, self.__version))
+            else:
+                edges.append(None)
+            length = parent_length
+            level_index += 1
+
+        self.__edges = edges
+        return edges
+
+    def __node(self, level_index, position, edges):
+        level = self.__levels[level_index] if level_index < len(self.__levels) else ()
+        if position < len(level):
+            return level[position]
+        return edges[level_index]
+
+    @staticmethod
+    def __leaves(tx_hashes, version):
+        if version == MerkleTree.RAW:
+            return [bytes.fromhex(tx_hash) for tx_hash in tx_hashes]
+        return [tx_hash.encode(encoding='UTF-8') for tx_hash in tx_hashes]
+
+    @staticmethod
+    def __parent_level(level, version):
+        """두 child 가 모두 있는 parent 만 만든다. (홀수이면 마지막 node 의 parent 는 edge 로 계산한다.)"""
+        sha256 = hashlib.sha256
+        pairs = iter(level)
+
+        # 두 번의 update 보다 64 (or 128) bytes 를 이어 붙여 한 번에 hash 하는 것이 빠르다.
+        if version == MerkleTree.RAW:
+            return [sha256(left + right).digest() for left, right in zip(pairs, pairs)]
+        return [sha256(left + right).hexdigest().encode(encoding='UTF-8') for left, right in zip(pairs, pairs)]
+
+    @staticmethod
+    def __hash_pair(left, right, version):
+        if version == MerkleTree.RAW:
+            return hashlib.sha256(left + right).digest()
+        return hashlib.sha256(left + right).hexdigest().encode(encoding='UTF-8')
+
+    @staticmethod
+    def __to_hex(node, version):
+        if version == MerkleTree.RAW:
+            return node.hex()
+        return node.decode(encoding='UTF-8')
+
+    @staticmethod
+    def __from_hex(node_hex, version):
+        if version == MerkleTree.RAW:
+            return bytes.fromhex(node_hex)
+        return node_hex.encode(encoding='UTF-8')
@@ -14,13 +14,16 @@
 """A module about Transaction object"""
 
 import hashlib
-import collections
+import json
 import logging
 import struct
 import time
 import loopchain.utils as util
 from enum import Enum
+from types import MappingProxyType
 from loopchain import configure as conf
+from loopchain.blockchain.exception import TransactionInValidError
+from loopchain.blockchain.verified_tx_cache import VerifiedTxCache
 from loopchain.tools import PublicVerifierContainer
 
 
@@ -38,23 +41,59 @@ class Transaction:
     """Transaction 거래 내용
     Peer에서 데이터를 받으면 새로운 트랜잭션을 생성하며, 생성된 트랜잭션은
     바로 BlockGenerator 에게 전달 된다
+
+    mempool 에 많은 tx 를 담을 수 있도록 __slots__ 로 attribute 만 가진다. (instance __dict__ 가 없다.)
+    meta 는 put_meta 마다 새 dict 로 바꾸므로 meta property 는 copy 없이 읽기 전용 view 를 돌려준다.
+    data 는 bytes 로 가지며, deserialize_tx 로 읽은 tx 는 block dump 의 memoryview 를 그대로 가진다. (zero copy)
     """
+    __slots__ = ('__transaction_status', '__transaction_type', '__meta', '__data', '__time_stamp',
+                 '__transaction_hash', '__public_key', '__signature')
+
     PEER_ID_KEY = 'peer_id'
     SCORE_ID_KEY = 'score_id'
     SCORE_VERSION_KEY = 'score_version'
     CHANNEL_KEY = 'channel_name'
 
+    # binary encoding of tx (see serialize_tx), version is increased when the layout is changed.
+    ENCODING_VERSION = 1
+    # version(B), status(B), type(B), time_stamp(Q),
+    # length of tx_hash, meta, data, public_key, signature (I * 5)
+    __ENCODING_HEADER = struct.Struct('>BBBQIIIII')
+    __META_DECODER = json.JSONDecoder()
+
+    # signature 검증을 통과한 tx 의 cache, validate 에서 같은 tx 의 signature 를 다시 검증하지 않는다.
+    verified_tx_cache = VerifiedTxCache()
+
     def __init__(self):
         # TODO Client 의 Sign이나 인증에 대한 내용을 트랜잭션에 넣어야 하지 않을까?
         self.__transaction_status = TransactionStatus.unconfirmed
         self.__transaction_type = TransactionType.general
-        self.__meta = collections.OrderedDict()  # peer_id, score_id, score_ver ...
-        self.__data = []
+        self.__meta = {}  # peer_id, score_id, score_ver ... (put_meta 외에는 바꾸지 않는다.)
+        self.__data = b""
         self.__time_stamp = 0
         self.__transaction_hash = ""
         self.__public_key = b""
         self.__signature = b""
 
+    def __getstate__(self):
+        # memoryview 는 pickle 할 수 없으므로 data 는 bytes 로 담는다.
+        return {'_Transaction__transaction_status': self.__transaction_status,
+                '_Transaction__transaction_type': self.__transaction_type,
+                '_Transaction__meta': self.__meta,
+                '_Transaction__data': self.get_data(),
+                '_Transaction__time_stamp': self.__time_stamp,
+                '_Transaction__transaction_hash': self.__transaction_hash,
+                '_Transaction__public_key': self.__public_key,
+                '_Transaction__signature': self.__signature}
+
+    def __setstate__(self, state):
+        """pickle 을 복원한다. __slots__ 이전 버전의 tx (OrderedDict meta, bytearray data) 도 읽을 수 있다.
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self.__meta = dict(self.__meta)
+        self.__data = bytes(self.__data)
+
     @property
     def tx_hash(self):
         return self.__transaction_hash
@@ -85,7 +124,10 @@ class Transaction:
 
     @property
     def meta(self):
-        return self.__meta.copy()
+        """
+        :return: meta 의 읽기 전용 view (put_meta 이후의 변경은 보이지 않는다.)
+        """
+        return MappingProxyType(self.__meta)
 
     def put_meta(self, key, value):
         """Tx 의 meta 정보를 구성한다.
@@ -97,7 +139,10 @@ class Transaction:
         :param value:
         :return:
         """
-        self.__meta[key] = value
+        # meta property 로 내어준 view 가 바뀌지 않도록 새 dict 로 바꾼다.
+        meta = dict(self.__meta)
+        meta[key] = value
+        self.__meta = meta
 
     def init_meta(self, peer_id, score_id, score_ver, channel_name: str):
         """Tx 의 meta 정보 중 Peer 에 의해서 초기화되는 부분을 집약하였댜.
@@ -118,26 +163,38 @@ class Transaction:
 
     def get_data(self):
         """트랜잭션 데이터를 리턴합니다.
+        deserialize_tx 로 읽은 data (memoryview) 는 처음 읽을 때 bytes 로 바꾸어 둔다.
 
-        :return 트랜잭션 데이터:
+        :return 트랜잭션 데이터 (bytes):
         """
+        if type(self.__data) is memoryview:
+            self.__data = self.__data.tobytes()
         return self.__data
 
+    @property
+    def data_view(self):
+        """data 를 copy 하지 않고 읽을 때 사용한다. (hash 계산, serialize)
+
+        :return: data 의 memoryview
+        """
+        return memoryview(self.__data)
+
     def get_data_string(self):
-        return self.__data.decode(conf.PEER_DATA_ENCODING)
+        return str(self.__data, conf.PEER_DATA_ENCODING)
 
     def put_data(self, data, time_stamp=None):
         """데이터 입력
         data를 받으면 해당 시간의 Time stamp와 data를 가지고 Hash를 생성해서 기록한다.
 
-        :param data: Transaction에 넣고 싶은 data. data가 스트링인 경우 bytearray로 변환한다.
+        :param data: Transaction에 넣고 싶은 data. data가 스트링인 경우 bytes로 변환한다.
         :param time_stamp:
         :return Transaction의 data를 가지고 만든 Hash값:
         """
         if isinstance(data, str):
-            self.__data = bytearray(data, 'utf-8')
+            self.__data = data.encode('utf-8')
         else:
-            self.__data = data
+            # bytearray 등 바뀔 수 있는 data 는 tx 가 가진 뒤에 바뀌지 않도록 bytes 로 copy 한다.
+            self.__data = bytes(data)
 
         if time_stamp is None:
             self.__time_stamp = int(time.time()*1000000)
@@ -158,12 +215,7 @@ class Transaction:
 
         :return Transaction의 data를 가지고 만든 Hash값:
         """
-        # self.__transaction_hash = Transaction.generate_transaction_hash(self)
-
-        _meta_byte = util.dict_to_binary(self.__meta)
-        _time_byte = struct.pack('Q', self.__time_stamp)
-        _txByte = b''.join([_meta_byte, self.__data, _time_byte])
-        self.__transaction_hash = hashlib.sha256(_txByte).hexdigest()
+        self.__transaction_hash = Transaction.generate_transaction_hash(self)
 
         # logging.debug("__generate_hash \ntx hash : " + self.__transaction_hash +
         #               "\ntx meta : " + str(self.__meta) +
@@ -186,8 +238,8 @@ class Transaction:
         :param tx: 트랜잭션
         :return: 트랜잭션 Hash
         """
-        _meta_byte = util.dict_to_binary(tx.meta)
-        _data_byte = tx.get_data()
+        _meta_byte = util.dict_to_binary(tx.__meta)
+        _data_byte = tx.data_view
         _time_byte = struct.pack('Q', tx.get_timestamp())
         _txByte = b''.join([_meta_byte, _data_byte, _time_byte])
         _txhash = hashlib.sha256(_txByte).hexdigest()
@@ -197,6 +249,73 @@ class Transaction:
 
         return _txhash
 
+    def serialize_tx(self) -> bytes:
+        """Transaction 을 binary 로 serialize 한다.
+        고정 길이 header(각 가변 field 의 길이 포함) 뒤에 가변 field 들이 이어진다.
+        (tx_hash, meta(json), data, public_key, signature)
+
+        :return: serialize 결과
+        """
+        tx_hash = self.__transaction_hash.encode(conf.HASH_KEY_ENCODING)
+        meta = json.dumps(self.__meta).encode(conf.PEER_DATA_ENCODING)
+        data = self.data_view
+
+        return b''.join([Transaction.__ENCODING_HEADER.pack(Transaction.ENCODING_VERSION,
+                                                             self.__transaction_status.value,
+                                                             self.__transaction_type.value,
+                                                             self.__time_stamp,
+                                                             len(tx_hash),
+                                                             len(meta),
+                                                             len(data),
+                                                             len(self.__public_key),
+                                                             len(self.__signature)),
+                         tx_hash, meta, data, self.__public_key, self.__signature])
+
+    def serialized_size(self) -> int:
+        """serialize_tx 결과의 크기를 serialize 하지 않고 계산한다. (block 에 담을 tx 의 크기를 셀 때 사용)
+
+        :return: serialize 결과의 크기 (bytes)
+        """
+        return Transaction.__ENCODING_HEADER.size + \
+            len(self.__transaction_hash.encode(conf.HASH_KEY_ENCODING)) + \
+            len(json.dumps(self.__meta).encode(conf.PEER_DATA_ENCODING)) + \
+            len(self.__data) + len(self.__public_key) + len(self.__signature)
+
+    def deserialize_tx(self, tx_dumps, offset=0) -> int:
+        """serialize_tx 의 결과로 자기 자신을 복원한다.
+
+        :param tx_dumps: serialize 된 tx 를 담고 있는 bytes (or memoryview)
+        memoryview 를 넘기면 data 는 copy 하지 않고 tx_dumps 의 memoryview 를 가진다.
+        (이 경우 tx_dumps 의 내용을 바꾸지 말 것)
+        :param offset: tx_dumps 안에서 tx 가 시작하는 위치
+        :return: tx 다음 위치 (offset)
+        """
+        version, status, tx_type, self.__time_stamp, \
+            hash_len, meta_len, data_len, public_key_len, signature_len = \
+            Transaction.__ENCODING_HEADER.unpack_from(tx_dumps, offset)
+        if version != Transaction.ENCODING_VERSION:
+            raise TransactionInValidError(f"unknown tx encoding version({version})")
+        offset += Transaction.__ENCODING_HEADER.size
+
+        self.__transaction_hash = str(tx_dumps[offset:offset + hash_len], conf.HASH_KEY_ENCODING)
+        offset += hash_len
+        self.__meta = Transaction.__META_DECODER.decode(
+            str(tx_dumps[offset:offset + meta_len], conf.PEER_DATA_ENCODING))
+        offset += meta_len
+        self.__data = tx_dumps[offset:offset + data_len]
+        if type(self.__data) is not memoryview:
+            self.__data = bytes(self.__data)
+        offset += data_len
+        self.__public_key = bytes(tx_dumps[offset:offset + public_key_len])
+        offset += public_key_len
+        self.__signature = bytes(tx_dumps[offset:offset + signature_len])
+        offset += signature_len
+
+        self.__transaction_status = TransactionStatus(status)
+        self.__transaction_type = TransactionType(tx_type)
+
+        return offset
+
     def sign_hash(self, peer_authorization) -> bool:
         """sign to signature hash
 
@@ -227,11 +346,16 @@ class Transaction:
                 Transaction.__logging_tx_validate("hash validate fail", tx)
                 return False
 
+            # hash 는 tx 내용으로 다시 계산하였으므로 같은 public key, signature 로 검증한 적이 있으면 통과한다.
+            if Transaction.verified_tx_cache.contains(tx.get_tx_hash(), tx.public_key, tx.signature):
+                return True
+
             # Get Cert Verifier for signature verify
             public_verifier = PublicVerifierContainer.get_public_verifier(tx.public_key)
 
             # Signature Validate
             if public_verifier.verify_hash(tx.get_tx_hash(), tx.signature):
+                Transaction.verified_tx_cache.put(tx.get_tx_hash(), tx.public_key, tx.signature)
                 return True
             else:
                 if is_exception_log:
@@ -0,0 +1,134 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A bloom filter of confirmed tx hashes to skip lookups of unknown txs"""
+
+import hashlib
+import math
+import threading
+
+
+class _BloomFilter:
+    """capacity 개의 item 을 false_positive_rate 로 구분하는 고정 크기 bloom filter
+    """
+
+    def __init__(self, capacity, false_positive_rate):
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(8, int(math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.bit_count / capacity * math.log(2))))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def positions(self, h1, h2):
+        # double hashing: h1 + i * h2
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
+
+    def add(self, h1, h2):
+        for position in self.positions(h1, h2):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, hashes):
+        h1, h2 = hashes
+        bits = self.bits
+        bit_count = self.bit_count
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class TxBloomFilter:
+    """confirmed tx hash 의 scalable bloom filter
+    might_contain 이 False 이면 block db 에 없는 tx 이므로 block db 를 읽지 않고 바로 NOT_INVOKED 로 응답할 수 있다.
+    filter 가 capacity 만큼 차면 capacity 를 2배로, false positive rate 를 절반으로 한 filter 를 추가하므로
+    tx 가 계속 늘어나도 전체 false positive rate 는 false_positive_rate 의 2배를 넘지 않는다.
+    block db 를 순회하여 다시 만들 수 있으므로 memory 에만 보관한다.
+    block db 를 순회하여 채우는 동안에는 false negative 가 있을 수 있으므로 set_ready 이후에만 might_contain 을 사용해야 한다.
+    """
+
+    def __init__(self, capacity, false_positive_rate):
+        """
+        :param capacity: 처음 filter 에 넣을 수 있는 tx 의 갯수
+        :param false_positive_rate: 처음 filter 의 false positive rate
+        """
+        self.__filters = [_BloomFilter(capacity, false_positive_rate)]
+        self.__lock = threading.Lock()
+        self.__ready = threading.Event()
+
+        self.__negative = 0
+        self.__false_positive = 0
+
+    @property
+    def ready(self):
+        return self.__ready.is_set()
+
+    def set_ready(self):
+        self.__ready.set()
+
+    def wait_ready(self, timeout=None):
+        return self.__ready.wait(timeout)
+
+    @staticmethod
+    def __hashes(tx_hash):
+        digest = hashlib.blake2b(tx_hash.encode(encoding='UTF-8'), digest_size=16).digest()
+        # h2 가 0 이면 모든 position 이 같아지므로 홀수로 만든다.
+        return int.from_bytes(digest[:8], 'big'), int.from_bytes(digest[8:], 'big') | 1
+
+    def add(self, tx_hash):
+        hashes = TxBloomFilter.__hashes(tx_hash)
+        with self.__lock:
+            bloom_filter = self.__filters[-1]
+            if bloom_filter.count >= bloom_filter.capacity:
+                bloom_filter = _BloomFilter(bloom_filter.capacity * 2, bloom_filter.false_positive_rate / 2)
+                self.__filters.append(bloom_filter)
+            bloom_filter.add(*hashes)
+
+    def might_contain(self, tx_hash):
+        """
+        :return: False 이면 filter 에 추가된 적이 없는 tx_hash, True 이면 추가되었을 수 있다.
+        """
+        hashes = TxBloomFilter.__hashes(tx_hash)
+        for bloom_filter in self.__filters:
+            if hashes in bloom_filter:
+                return True
+
+        with self.__lock:
+            self.__negative += 1
+        return False
+
+    def record_false_positive(self):
+        """might_contain 이 True 였지만 block db 에 없었던 경우 호출하여 실제 false positive rate 를 집계한다.
+        """
+        with self.__lock:
+            self.__false_positive += 1
+
+    def get_status(self):
+        """filter 의 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of ready, count, bytes, filters, negative, false_positive, false_positive_rate
+        false_positive_rate 는 filter 에 없는 tx 의 조회 중 filter 가 걸러내지 못한 비율
+        """
+        with self.__lock:
+            absent_count = self.__negative + self.__false_positive
+            return {
+                'ready': self.ready,
+                'count': sum(bloom_filter.count for bloom_filter in self.__filters),
+                'bytes': sum(len(bloom_filter.bits) for bloom_filter in self.__filters),
+                'filters': len(self.__filters),
+                'negative': self.__negative,
+                'false_positive': self.__false_positive,
+                'false_positive_rate': (self.__false_positive / absent_count) if absent_count > 0 else 0.0
+            }
@@ -0,0 +1,179 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A verifier which checks tx hashes and signatures of a block on a worker pool"""
+
+import logging
+import os
+import threading
+import time
+from concurrent import futures
+
+from loopchain import configure as conf
+from loopchain.blockchain.transaction import Transaction
+
+
+def _verify_txs(txs, verify_signature, failed=None):
+    """worker 에서 tx 들을 순서대로 검증한다.
+
+    :param txs: 검증할 tx 목록 (block 의 일부)
+    :param verify_signature: False 이면 tx hash 만 검증한다.
+    :param failed: threading.Event, 다른 worker 가 실패한 tx 를 찾으면 set 되며 검증을 멈춘다. (thread pool)
+    :return: txs 안에서 처음으로 검증에 실패한 tx 의 index, 모두 통과하면 None
+    """
+    for index, tx in enumerate(txs):
+        if failed is not None and failed.is_set():
+            return None
+
+        if verify_signature:
+            is_valid = Transaction.validate(tx, is_exception_log=False)
+        else:
+            is_valid = Transaction.generate_transaction_hash(tx) == tx.get_tx_hash()
+
+        if not is_valid:
+            if failed is not None:
+                failed.set()
+            return index
+    return None
+
+
+class TxVerifier:
+    """block 에 담긴 tx 들의 hash 와 signature 를 worker pool 에 나누어 검증한다.
+    signature 검증 (cryptography) 은 GIL 을 놓으므로 thread pool 을 기본으로 쓰며,
+    data 가 커서 hash 계산이 많은 경우에는 process pool 을 쓸 수 있다.
+    실패한 tx 를 찾으면 남은 검증은 하지 않는다.
+
+    tx 가 적은 block 은 pool 을 쓰는 비용이 더 크므로 호출한 thread 에서 검증한다.
+    """
+
+    # 이보다 tx 가 적으면 pool 을 쓰지 않는다.
+    MIN_PARALLEL_TX_COUNT = 64
+    # worker 마다 나누어 주는 chunk 의 갯수 (실패한 경우 빨리 멈추고 worker 간 부하를 맞추기 위해 여러 개로 나눈다.)
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, worker_count=None, use_process=None):
+        """
+        :param worker_count: worker 갯수, None 이면 conf.TX_VERIFIER_WORKER_COUNT (0 이면 cpu 갯수)
+        1 이면 pool 을 사용하지 않는다.
+        :param use_process: True 이면 process pool 을 사용한다. None 이면 conf.TX_VERIFIER_USE_PROCESS
+        (None 인 값은 처음 검증할 때 conf 에서 읽으므로 json 으로 바꾼 설정도 따른다.)
+        """
+        self.__worker_count = worker_count
+        self.__use_process = use_process
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+        self.__verify_count = 0
+        self.__tx_count = 0
+        self.__fail_count = 0
+        self.__last_elapsed = 0.0
+        self.__total_elapsed = 0.0
+
+    @property
+    def worker_count(self):
+        if self.__worker_count is None:
+            self.__worker_count = conf.TX_VERIFIER_WORKER_COUNT
+        return self.__worker_count or os.cpu_count() or 1
+
+    @property
+    def use_process(self):
+        if self.__use_process is None:
+            self.__use_process = conf.TX_VERIFIER_USE_PROCESS
+        return self.__use_process
+
+    def verify(self, txs, verify_signature=True):
+        """tx 들의 hash (와 signature) 를 검증한다.
+
+        :param txs: block 의 tx 목록
+        :param verify_signature: False 이면 tx hash 만 검증한다.
+        :return: 검증에 실패한 tx, 모두 통과하면 None
+        (여러 tx 가 실패한 경우 먼저 찾은 tx 이므로 가장 앞의 tx 가 아닐 수 있다.)
+        """
+        begin_time = time.perf_counter()
+        if self.worker_count <= 1 or len(txs) < TxVerifier.MIN_PARALLEL_TX_COUNT:
+            invalid_index = _verify_txs(txs, verify_signature)
+        else:
+            invalid_index = self.__verify_on_pool(txs, verify_signature)
+        elapsed = time.perf_counter() - begin_time
+        logging.debug(f"verify txs({len(txs)}) signature({verify_signature}) workers({self.worker_count}) "
+                      f"result({invalid_index is None}) elapsed({elapsed:.4f}s)")
+
+        with self.__lock:
+            self.__verify_count += 1
+            self.__tx_count += len(txs)
+            self.__fail_count += invalid_index is not None
+            self.__last_elapsed = elapsed
+            self.__total_elapsed += elapsed
+
+        return None if invalid_index is None else txs[invalid_index]
+
+    def shutdown(self):
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_status(self):
+        """검증 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of worker_count, use_process, verify_count, tx_count, fail_count, last_elapsed, average_elapsed
+        """
+        with self.__lock:
+            return {
+                'worker_count': self.worker_count,
+                'use_process': self.use_process,
+                'verify_count': self.__verify_count,
+                'tx_count': self.__tx_count,
+                'fail_count': self.__fail_count,
+                'last_elapsed': self.__last_elapsed,
+                'average_elapsed': (self.__total_elapsed / self.__verify_count) if self.__verify_count > 0 else 0.0
+            }
+
+    def __verify_on_pool(self, txs, verify_signature):
+        executor = self.__get_executor()
+        chunk_count = self.worker_count * TxVerifier.CHUNKS_PER_WORKER
+        chunk_size = (len(txs) + chunk_count - 1) // chunk_count
+
+        # process 간에는 Event 를 나눌 수 없으므로 process pool 은 chunk 단위로만 멈춘다.
+        failed = None if self.use_process else threading.Event()
+        pending = {}
+        for offset in range(0, len(txs), chunk_size):
+            future = executor.submit(_verify_txs, txs[offset:offset + chunk_size], verify_signature, failed)
+            pending[future] = offset
+
+        invalid_index = None
+        try:
+            for future in futures.as_completed(pending):
+                index = future.result()
+                if index is not None:
+                    invalid_index = pending[future] + index
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if invalid_index is None and self.use_process and verify_signature:
+            # worker process 의 verified tx cache 는 이 process 에서 쓸 수 없으므로 여기에 남긴다.
+            for tx in txs:
+                Transaction.verified_tx_cache.put(tx.get_tx_hash(), tx.public_key, tx.signature)
+
+        return invalid_index
+
+    def __get_executor(self):
+        with self.__lock:
+            if self.__executor is None:
+                if self.use_process:
+                    self.__executor = futures.ProcessPoolExecutor(max_workers=self.worker_count)
+                else:
+                    self.__executor = futures.ThreadPoolExecutor(max_workers=self.worker_count)
+            return self.__executor
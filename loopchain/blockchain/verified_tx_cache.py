@@ -0,0 +1,108 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A LRU cache of txs whose signature is already verified"""
+
+import collections
+import hashlib
+import threading
+
+from loopchain import configure as conf
+
+
+class VerifiedTxCache:
+    """signature 검증을 통과한 tx 를 기억하는 LRU cache.
+    tx 는 AddTx 로 받을 때, leader 가 block 에 담을 때, peer 가 block 을 검증할 때 매번 검증되므로
+    한 번 검증한 tx 는 다음 단계에서 signature 검증 (ECDSA) 을 하지 않는다.
+
+    (tx_hash, public_key 와 signature 의 digest) 를 key 로 사용하므로 같은 tx_hash 라도 public key 나 signature 가
+    다르면 다시 검증한다. tx_hash 는 tx 의 내용으로 다시 계산해서 비교한 뒤에 cache 를 찾아야 한다.
+    """
+
+    def __init__(self, max_count=None):
+        """
+        :param max_count: 보관하는 tx 의 최대 갯수, None 이면 conf.VERIFIED_TX_CACHE_MAX_COUNT 를 따른다.
+        0 이면 cache 를 사용하지 않는다.
+        """
+        self.__max_count = max_count
+        self.__txs = collections.OrderedDict()  # (tx_hash, digest) : None
+        self.__lock = threading.Lock()
+
+        self.__hit = 0
+        self.__miss = 0
+        self.__eviction = 0
+
+    @property
+    def max_count(self):
+        return conf.VERIFIED_TX_CACHE_MAX_COUNT if self.__max_count is None else self.__max_count
+
+    @property
+    def is_enabled(self):
+        return self.max_count > 0
+
+    def contains(self, tx_hash, public_key, signature):
+        """signature 검증을 통과한 tx 인지 확인한다.
+
+        :return: True 이면 signature 검증을 하지 않아도 된다.
+        """
+        if not self.is_enabled:
+            return False
+
+        key = VerifiedTxCache.__key(tx_hash, public_key, signature)
+        with self.__lock:
+            if key in self.__txs:
+                self.__txs.move_to_end(key)
+                self.__hit += 1
+                return True
+
+            self.__miss += 1
+            return False
+
+    def put(self, tx_hash, public_key, signature):
+        """signature 검증을 통과한 tx 를 기억한다.
+        """
+        max_count = self.max_count
+        if max_count <= 0:
+            return
+
+        key = VerifiedTxCache.__key(tx_hash, public_key, signature)
+        with self.__lock:
+            self.__txs[key] = None
+            self.__txs.move_to_end(key)
+
+            while len(self.__txs) > max_count:
+                self.__txs.popitem(last=False)
+                self.__eviction += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__txs.clear()
+
+    def get_status(self):
+        """cache 의 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of count, hit, miss, eviction, hit_rate
+        """
+        with self.__lock:
+            request_count = self.__hit + self.__miss
+            return {
+                'count': len(self.__txs),
+                'hit': self.__hit,
+                'miss': self.__miss,
+                'eviction': self.__eviction,
+                'hit_rate': (self.__hit / request_count) if request_count > 0 else 0.0
+            }
+
+    @staticmethod
+    def __key(tx_hash, public_key, signature):
+        return tx_hash, hashlib.sha256(public_key + signature).digest()
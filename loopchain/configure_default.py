@@ -108,6 +108,12 @@ class ConsensusAlgorithm(IntEnum):
     lft = 3
 
 
+class KeyValueStoreType(IntEnum):
+    leveldb = 0
+    memory = 1
+    sqlite3 = 2
+
+
 # 블록 생성 간격, tx 가 없을 경우 다음 간격까지 건너 뛴다.
 INTERVAL_BLOCKGENERATION = 1
 # Interval for Wait peer's vote
@@ -116,6 +122,9 @@ INTERVAL_WAIT_PEER_VOTE = 0.1  # 0.05
 MAX_RETRY_CREATE_DB = 10
 # default level db path
 DEFAULT_LEVEL_DB_PATH = "./db"
+# block db 로 사용할 key value store 의 종류 (KeyValueStoreType 의 이름)
+# memory 는 process 가 끝나면 사라지므로 test, benchmark 에서만 사용한다.
+BLOCK_DB_STORE_TYPE = KeyValueStoreType.leveldb.name
 # peer_id (UUID) 는 최초 1회 생성하여 level db에 저장한다.
 LEVEL_DB_KEY_FOR_PEER_ID = str.encode("peer_id_key")
 # String Peer Data Encoding
@@ -126,6 +135,8 @@ HASH_KEY_ENCODING = 'UTF-8'
 CONSENSUS_ALGORITHM = ConsensusAlgorithm.siever
 # 블럭의 최대 크기 (kbytes), gRPC 최대 메시지는 4MB (4096) 이므로 그보다 작게 설정할 것
 MAX_BLOCK_KBYTES = 3000  # default: 3000
+# 블럭을 나눌 때 block header (hash, signature, peer id 등) 를 위해 남겨 두는 크기 (bytes)
+BLOCK_HEADER_RESERVED_BYTES = 1024
 # 블럭의 담기는 트랜잭션의 최대 갯수, 메시지 크기를 계속 dump 로 비교하는 것은 성능에 부담이 되므로 tx 추가시에는 갯수로만 방지한다.
 # tx -> block 상황을 체크하는 것이므로 (블럭 나누기의 기준은 아니므로) 실제 블럭에는 설정값 이상의 tx 가 블럭에 담길 수 있다.
 # 실제 블럭에 담기는 tx 를 이 값으로 제어하려면 코드가 추가 되어야 한다. (이 경우 성능 저하 요인이 될 수 있다.)
@@ -138,6 +149,63 @@ BLOCK_HEIGHT_BYTES_LEN = 12
 LEADER_BLOCK_CREATION_LIMIT = 20000000
 # Block vote timeout
 BLOCK_VOTE_TIMEOUT = 60 * 10  # seconds
+# BlockChain 이 deserialize 된 block 을 보관하는 LRU cache 의 최대 block 갯수, 0 이면 cache 를 사용하지 않는다.
+BLOCK_CACHE_MAX_COUNT = 256
+# BlockChain 의 block cache 가 보관하는 block 의 serialize 크기 합의 최대값 (bytes)
+BLOCK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+# signature 검증을 통과한 tx 를 기억하는 cache 의 최대 tx 갯수, 0 이면 cache 를 사용하지 않는다. (tx 당 약 350 bytes)
+VERIFIED_TX_CACHE_MAX_COUNT = 100000
+# block 의 tx hash, signature 를 검증하는 worker 갯수, 0 이면 cpu 갯수, 1 이면 block 을 검증하는 thread 에서 검증한다.
+TX_VERIFIER_WORKER_COUNT = 0
+# True 이면 thread pool 대신 process pool 에서 검증한다. (tx data 가 커서 hash 계산이 많은 경우)
+TX_VERIFIER_USE_PROCESS = False
+# DER 을 parse 한 public key 를 보관하는 cache 의 최대 갯수 (peer cert 는 제외), 0 이면 보관하지 않는다.
+PUBLIC_VERIFIER_CACHE_MAX_COUNT = 10000
+# block 에 담기를 기다리는 tx 를 보관하는 mempool 의 최대 tx 갯수
+MEMPOOL_MAX_TX_COUNT = 100000
+# mempool 이 보관하는 tx 의 serialize 크기 합의 최대값 (bytes)
+MEMPOOL_MAX_BYTES = 256 * 1024 * 1024
+# mempool 이 가득 찼을 때 True 이면 가장 오래된 tx 를 제거하고, False 이면 새 tx 를 거절한다.
+MEMPOOL_DROP_OLDEST = False
+# AddTx 의 처리 시간 percentile 을 계산하는 최근 tx 의 갯수
+TX_ADMISSION_LATENCY_WINDOW = 10000
+# 시작시 chain meta (total_tx, block type 별 갯수) 를 전체 블럭을 순회하여 다시 만든다. (peer.py --rebuild)
+REBUILD_CHAIN_META = False
+# block db 를 disk 에 sync 하는 주기 (ms), 0 이면 block 을 추가할 때마다 sync 한다.
+# 0 보다 크면 주기 안에 추가된 block 들은 sync 없이 기록하고 주기마다 한 번에 sync 한다. (group commit)
+BLOCK_DB_SYNC_INTERVAL = 0
+# archive mode, 마지막 block 으로부터 BLOCK_ARCHIVE_DEPTH 이상 지난 block 의 body 를 LevelDB 에서 segment file 로 옮긴다.
+ENABLE_BLOCK_ARCHIVE = False
+BLOCK_ARCHIVE_DEPTH = 1000
+BLOCK_ARCHIVE_INTERVAL = 60  # seconds, archive 할 block 을 찾는 주기
+BLOCK_ARCHIVE_BATCH_COUNT = 100  # 한 번에 archive 하는 block 의 최대 갯수
+BLOCK_ARCHIVE_SEGMENT_MAX_BYTES = 256 * 1024 * 1024
+BLOCK_ARCHIVE_PATH_SUFFIX = "_archive"  # segment file 은 block db 의 path 에 suffix 를 붙인 directory 에 저장된다.
+# chain snapshot 에 body(tx 목록)를 포함하는 마지막 block 의 갯수, 그 이전 block 은 header 와 tx index 만 포함한다.
+SNAPSHOT_BLOCK_COUNT = 100
+# peer 를 시작할 때 block db 가 비어 있으면 이 snapshot 으로 blockchain 을 만든다. (peer.py --snapshot)
+BOOTSTRAP_SNAPSHOT_PATH = ""
+# invoke result 의 dictionary 에 저장하는 서로 다른 result 의 최대 갯수, 넘으면 block 마다 result 를 그대로 저장한다.
+INVOKE_RESULT_DICT_MAX_COUNT = 10000
+# 풀어 놓은 invoke result 목록을 cache 하는 block 의 갯수
+INVOKE_RESULT_CACHE_COUNT = 256
+# confirmed tx hash 의 bloom filter, filter 에 없는 tx 의 GetTx, GetInvokeResult 는 block db 를 읽지 않는다.
+ENABLE_TX_BLOOM_FILTER = True
+# 처음 filter 의 크기 (tx 갯수), 시작할 때 total_tx 의 2배보다 작으면 total_tx 의 2배로 만든다.
+TX_BLOOM_FILTER_CAPACITY = 1000000
+TX_BLOOM_FILTER_FALSE_POSITIVE_RATE = 0.001
+# block body 의 압축 codec (none, zlib, lzma), block 마다 codec 이 기록되므로 바꾸어도 이전 block 을 읽을 수 있다.
+# block db 에 압축하여 저장하면 disk 는 줄지만 tx 하나를 조회할 때 (find_tx_by_key) tx index 의 offset 으로
+# 그 tx 만 읽지 못하고 block body 전체를 읽어 압축을 풀어야 한다. tx 조회가 많으면 none 을 사용할 것
+BLOCK_DB_CODEC = 'none'  # block db, archive, snapshot 에 저장하는 block body
+BLOCK_WIRE_CODEC = 'zlib'  # gRPC 로 주고 받는 block (AnnounceConfirmedBlock, BlockSync 등) 의 body
+# 새로 만드는 block 의 merkle tree version, 0: HEX (이전 버전과 같은 root), 1: RAW (32 bytes digest 로 hash)
+# block 마다 version 이 기록되므로 바꾸어도 이전 block 을 검증할 수 있지만 모든 peer 가 RAW 를 지원해야 한다.
+MERKLE_TREE_VERSION = 0
+# offline chain verifier (verifytool.py) 의 worker process 갯수, 0 이면 cpu 갯수
+CHAIN_VERIFIER_PROCESS_COUNT = 0
+# chain verifier 의 worker 가 한 번에 검증하는 block 의 갯수
+CHAIN_VERIFIER_SHARD_SIZE = 100
 # default storage path
 DEFAULT_STORAGE_PATH = os.getenv('DEFAULT_STORAGE_PATH', os.path.join(LOOPCHAIN_ROOT_PATH, '.storage'))
 
@@ -182,6 +250,9 @@ DEFAULT_SSL_CERT_PATH = 'resources/ssl_test_cert/cert.pem'
 DEFAULT_SSL_KEY_PATH = 'resources/ssl_test_cert/key.pem'
 DEFAULT_SSL_TRUST_CERT_PATH = 'resources/ssl_test_ca/cert.pem'
 REST_ADDITIONAL_TIMEOUT = 30  # seconds
+REST_BLOCK_RANGE_PAGE_SIZE = 20  # /api/v1/blocks/range 에서 count 를 지정하지 않았을 때 한 번에 조회하는 block 의 수
+REST_BLOCK_RANGE_MAX_PAGE_SIZE = 100  # /api/v1/blocks/range 에서 한 번에 조회할 수 있는 최대 block 의 수
+REST_MERKLE_PROOF_MAX_TX_COUNT = 1000  # /api/v1/blocks/merkle_proof 에서 한 번에 조회할 수 있는 최대 tx 의 수
 REST_PROXY_DEFAULT_PORT = 5000
 USE_GUNICORN_HA_SERVER = False   # Use high aviability gunicorn web server.
 
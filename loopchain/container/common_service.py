@@ -23,7 +23,9 @@ import grpc
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import BroadcastProcess, CommonThread, ObjectManager
+from loopchain.blockchain import Block, Transaction
 from loopchain.protos import loopchain_pb2, message_code
+from loopchain.tools import PublicVerifierContainer
 
 # loopchain_pb2 를 아래와 같이 import 하지 않으면 broadcast 시도시 pickle 오류가 발생함
 import loopchain_pb2
@@ -83,6 +85,13 @@ class CommonService(CommonThread):
                 logging.debug("getstatus block height: " + str(block_height))
                 # Score와 상관없이 TransactionTx는 블럭매니저가 관리 합니다.
                 total_tx = block_manager.get_total_tx()
+                status_data["block_cache"] = block_manager.get_blockchain().get_block_cache_status()
+                status_data["tx_filter"] = block_manager.get_blockchain().get_tx_filter_status()
+                status_data["verified_tx_cache"] = Transaction.verified_tx_cache.get_status()
+                status_data["tx_verifier"] = Block.tx_verifier.get_status()
+                status_data["public_verifier_cache"] = PublicVerifierContainer.get_status()
+                status_data["mempool"] = block_manager.get_mempool().get_status()
+                status_data["tx_admission"] = block_manager.get_tx_admission().get_status()
 
             status_data["status"] = "Service is online: " + str(block_manager.peer_type)
             status_data["peer_type"] = str(block_manager.peer_type)
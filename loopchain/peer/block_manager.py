@@ -13,6 +13,7 @@
 # limitations under the License.
 """A management class for blockchain."""
 
+import os
 import queue
 import shutil
 import uuid
@@ -26,6 +27,7 @@ from loopchain.peer.consensus_default import ConsensusDefault
 from loopchain.peer.consensus_lft import ConsensusLFT
 from loopchain.peer.consensus_none import ConsensusNone
 from loopchain.peer.consensus_siever import ConsensusSiever
+from loopchain.peer.tx_admission import TxAdmission
 from loopchain.protos import loopchain_pb2_grpc
 
 import loopchain_pb2
@@ -42,14 +44,23 @@ class BlockManager(CommonThread):
         self.__level_db = None
         self.__level_db_path = ""
         self.__level_db, self.__level_db_path = util.init_level_db(f"{level_db_identity}_{channel_name}")
-        self.__txQueue = queue.Queue()
+        self.__mempool = Mempool()
         self.__unconfirmedBlockQueue = queue.Queue()
         self.__candidate_blocks = None
         if ObjectManager().peer_service is not None:
             self.__candidate_blocks = CandidateBlocks(ObjectManager().peer_service.peer_id, channel_name)
         self.__common_service = common_service
-        self.__blockchain = BlockChain(self.__level_db, channel_name)
-        self.__total_tx = self.__blockchain.rebuild_blocks()
+        if conf.BOOTSTRAP_SNAPSHOT_PATH:
+            self.__bootstrap_from_snapshot(peer_id, conf.BOOTSTRAP_SNAPSHOT_PATH)
+
+        self.__archive_compactor = None
+        if conf.ENABLE_BLOCK_ARCHIVE:
+            self.__blockchain = BlockChain(self.__level_db, channel_name,
+                                           self.__level_db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX)
+            self.__archive_compactor = BlockArchiveCompactor(self.__blockchain)
+        else:
+            self.__blockchain = BlockChain(self.__level_db, channel_name)
+        self.__tx_admission = TxAdmission(self.__mempool, self.__blockchain)
         self.__peer_type = None
         self.__block_type = BlockType.general
         self.__consensus = None
@@ -80,9 +91,43 @@ class BlockManager(CommonThread):
     def get_level_db(self):
         return self.__level_db
 
+    def __bootstrap_from_snapshot(self, peer_id, snapshot_path):
+        """block db 가 비어 있으면 snapshot 으로 blockchain 과 score state 를 만든다.
+        snapshot 이후의 block 은 block_height_sync 로 다른 peer 에게서 받는다.
+
+        :param peer_id: score state 를 풀어 놓을 peer 의 id
+        :param snapshot_path: ChainSnapshot.export_snapshot 으로 만든 snapshot
+        """
+        try:
+            self.__level_db.Get(BlockChain.LAST_BLOCK_KEY)
+            logging.info(f"channel({self.__channel_name}) block db is not empty, skip bootstrap from snapshot")
+            return
+        except KeyError:
+            pass
+
+        try:
+            manifest = ChainSnapshot.read_manifest(snapshot_path)
+            if manifest['channel'] != self.__channel_name:
+                logging.info(f"snapshot({snapshot_path}) is not for channel({self.__channel_name})")
+                return
+
+            score_storage_path = None
+            if peer_id is not None:
+                score_storage_path = os.path.join(conf.DEFAULT_SCORE_STORAGE_PATH, peer_id)
+            ChainSnapshot.import_snapshot(snapshot_path, self.__level_db, score_storage_path)
+        except SnapshotError as e:
+            util.exit_and_msg(f"fail to bootstrap from snapshot({snapshot_path}): {e}")
+
+        logging.info(f"channel({self.__channel_name}) bootstrap from snapshot({snapshot_path}) "
+                     f"height({manifest['height']})")
+
     def clear_all_blocks(self):
         logging.debug(f"clear level db({self.__level_db_path})")
-        shutil.rmtree(self.__level_db_path)
+        if os.path.exists(self.__level_db_path):
+            # memory store 는 path 가 없다.
+            shutil.rmtree(self.__level_db_path)
+        if self.__archive_compactor is not None:
+            shutil.rmtree(self.__level_db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX, ignore_errors=True)
 
     def set_peer_type(self, peer_type):
         self.__peer_type = peer_type
@@ -106,7 +151,7 @@ class BlockManager(CommonThread):
 
         :return: 블럭체인안의 transaction total count
         """
-        return self.__total_tx
+        return self.__blockchain.total_tx
 
     def get_blockchain(self):
         return self.__blockchain
@@ -129,7 +174,7 @@ class BlockManager(CommonThread):
                       str(ObjectManager().peer_service.channel_manager.get_peer_manager(
                           self.__channel_name).get_peer_count()))
 
-        dump = pickle.dumps(block)
+        dump = block.serialize_block()
         if len(block.confirmed_transaction_list) > 0:
             self.__blockchain.increase_made_block_count()
         if self.__common_service is not None:
@@ -144,7 +189,7 @@ class BlockManager(CommonThread):
         logging.info("BroadCast AnnounceConfirmedBlock....")
         if self.__common_service is not None:
             if block is not None:
-                dump = pickle.dumps(block)
+                dump = block.serialize_block()
                 self.__common_service.broadcast("AnnounceConfirmedBlock",
                                                 (loopchain_pb2.BlockAnnounce(
                                                     block_hash=block_hash,
@@ -163,20 +208,26 @@ class BlockManager(CommonThread):
         self.__common_service.broadcast_audience_set()
 
     def add_tx(self, tx):
-        """전송 받은 tx 를 Block 생성을 위해서 큐에 입력한다. txQueue 는 unloaded(dump) object 를 처리하므로
-        tx object 는 dumps 하여 입력한다.
+        """전송 받은 tx 를 Block 생성을 위해서 mempool 에 입력한다.
 
         :param tx: transaction object
+        :return: MempoolPutResult
         """
-        tx_unloaded = pickle.dumps(tx)
-        self.__txQueue.put(tx_unloaded)
+        result = self.__mempool.put(tx)
+        if result is MempoolPutResult.full:
+            logging.warning(f"mempool is full, drop tx({tx.tx_hash})")
+        return result
 
-    def add_tx_unloaded(self, tx):
-        """전송 받은 tx 를 Block 생성을 위해서 큐에 입력한다. load 하지 않은 채 입력한다.
+    def admit_tx(self, tx_dump):
+        """AddTx 로 받은 tx 를 검증하여 mempool 에 입력한다.
 
-        :param tx: transaction object
+        :param tx_dump: pickle dump 된 transaction
+        :return: (message_code.Response, message, tx_hash), tx 를 load 할 수 없으면 tx_hash 는 None
         """
-        self.__txQueue.put(tx)
+        return self.__tx_admission.admit(tx_dump)
+
+    def get_tx_admission(self):
+        return self.__tx_admission
 
     def get_tx(self, tx_hash):
         """tx_hash 로 저장된 tx 를 구한다.
@@ -194,19 +245,19 @@ class BlockManager(CommonThread):
         """
         return self.__blockchain.find_invoke_result_by_tx_hash(tx_hash)
 
-    def get_tx_queue(self):
-        return self.__txQueue
+    def get_mempool(self):
+        return self.__mempool
 
     def get_count_of_unconfirmed_tx(self):
         """BlockManager 의 상태를 확인하기 위하여 현재 입력된 unconfirmed_tx 의 카운트를 구한다.
 
         :return: 현재 입력된 unconfirmed tx 의 갯수
         """
-        return self.__txQueue.qsize()
+        return len(self.__mempool)
 
     def confirm_block(self, block_hash):
         try:
-            self.__total_tx += self.__blockchain.confirm_block(block_hash)
+            self.__blockchain.confirm_block(block_hash)
         except BlockchainError as e:
             logging.warning("BlockchainError, retry block_height_sync")
             self.block_height_sync()
@@ -250,7 +301,6 @@ class BlockManager(CommonThread):
         self.__unconfirmedBlockQueue.put(unconfirmed_block)
 
     def add_block(self, block):
-        self.__total_tx += block.confirmed_transaction_list.__len__()
         self.__blockchain.add_block(block)
 
     def block_height_sync(self, target_peer_stub=None):
@@ -339,7 +389,8 @@ class BlockManager(CommonThread):
                     if response is not None and response.response_code == message_code.Response.success:
                         util.logger.spam(f"response block_height({response.block_height})")
                         dump = response.block
-                        block = pickle.loads(dump)
+                        block = Block(channel_name=self.__channel_name)
+                        block.deserialize_block(dump)
 
                         # 마지막 블럭에서 역순으로 블럭을 구한다.
                         request_hash = block.prev_block_hash
@@ -385,6 +436,16 @@ class BlockManager(CommonThread):
 
         self.__block_height_sync_lock = False
 
+    def start(self):
+        CommonThread.start(self)
+        if self.__archive_compactor is not None:
+            self.__archive_compactor.start()
+
+    def stop(self):
+        if self.__archive_compactor is not None:
+            self.__archive_compactor.stop()
+        CommonThread.stop(self)
+
     def run(self):
         """Block Manager Thread Loop
         PEER 의 type 에 따라 Block Generator 또는 Peer 로 동작한다.
@@ -421,7 +482,7 @@ class BlockManager(CommonThread):
             # block 검증
             block_is_validated = False
             try:
-                block_is_validated = Block.validate(unconfirmed_block, self.__txQueue)
+                block_is_validated = Block.validate(unconfirmed_block, self.__mempool)
             except Exception as e:
                 logging.error(e)
 
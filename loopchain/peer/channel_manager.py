@@ -13,7 +13,6 @@
 # limitations under the License.
 """ A class for Manage Channels """
 import json
-import leveldb
 import logging
 import pickle
 
@@ -25,6 +24,7 @@ from loopchain.baseservice import PeerManager, StubManager, ObjectManager
 from loopchain.container import CommonService, ScoreService
 from loopchain.peer import BlockManager
 from loopchain.protos import loopchain_pb2_grpc, message_code, loopchain_pb2
+from loopchain.storage import KeyValueStoreError
 
 
 class ChannelManager:
@@ -55,8 +55,8 @@ class ChannelManager:
                 channel_name=channel,
                 level_db_identity=self.__level_db_identity
             )
-        except leveldb.LevelDBError as e:
-            util.exit_and_msg("LevelDBError(" + str(e) + ")")
+        except KeyValueStoreError as e:
+            util.exit_and_msg("KeyValueStoreError(" + str(e) + ")")
 
     def get_channel_list(self) -> list:
         return list(self.__peer_managers)
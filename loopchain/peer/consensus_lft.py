@@ -137,7 +137,7 @@ class ConsensusLFT(ConsensusBase):
                 self._blockmanager.broadcast_send_unconfirmed_block(self._block)
 
                 # 전송한 빈블럭을 대체한다.
-                if self.made_block_count < conf.LEADER_BLOCK_CREATION_LIMIT:  # or not self._txQueue.empty():
+                if self.made_block_count < conf.LEADER_BLOCK_CREATION_LIMIT:  # or not self._mempool.empty():
                     self._gen_block()
                 else:
                     # TODO LEADER_BLOCK_CREATION_LIMIT 에서 무조건 리더가 변경된다. 잔여 tx 처리가 필요하다.
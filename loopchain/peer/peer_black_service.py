@@ -199,9 +199,10 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
                 response_code=message_code.Response.fail_made_block_count_limited,
                 message="this leader can't make more block")
 
-        block_manager.add_tx_unloaded(request.tx)
-
-        return loopchain_pb2.CommonReply(response_code=message_code.Response.success, message="success")
+        # tx 를 한 번만 load 하여 hash, signature 를 검증하고 mempool 과 block db 에 있는 tx 는 거절한다.
+        # 검증한 tx 는 Transaction.verified_tx_cache 에 남으므로 block 을 검증할 때 signature 를 다시 검증하지 않는다.
+        response_code, message, tx_hash = block_manager.admit_tx(request.tx)
+        return loopchain_pb2.CommonReply(response_code=response_code, message=message)
 
     def GetTx(self, request, context):
         """get transaction
@@ -267,7 +268,7 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
          request.block_hash: 조회할 block 의 hash 값, "" 로 조회하면 마지막 block 의 hash 값을 리턴한다.
          request.block_data_filter: block 정보 중 조회하고 싶은 key 값 목록 "key1, key2, key3" 형식의 string
          request.tx_data_filter: block 에 포함된 transaction(tx) 중 조회하고 싶은 key 값 목록
-        "key1, key2, key3" 형식의 string
+        "key1, key2, key3" 형식의 string, "" 로 조회하면 block header 만 읽으며 tx 정보는 리턴하지 않는다.
         :param context:
         :return: loopchain.proto 의 GetBlockReply 참고,
         block_hash, block 정보 json, block 에 포함된 tx 정보의 json 리스트를 받는다.
@@ -289,11 +290,13 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         logging.debug("tx_filter: " + str(tx_filter))
 
         block_data_json = json.loads("{}")
+        # tx 정보를 요청하지 않으면 block body 는 읽지 않는다.
+        headers_only = tx_filter == ['']
 
         if block_hash != "":
-            block = block_manager.get_blockchain().find_block_by_hash(block_hash)
+            block = block_manager.get_blockchain().find_block_by_hash(block_hash, headers_only)
         elif request.block_height != -1:
-            block = block_manager.get_blockchain().find_block_by_height(request.block_height)
+            block = block_manager.get_blockchain().find_block_by_height(request.block_height, headers_only)
 
         if block is None:
             return loopchain_pb2.GetBlockReply(response_code=message_code.Response.fail_wrong_block_hash,
@@ -312,7 +315,7 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
                     block_data_json[key] = ""
 
         tx_data_json_list = []
-        for tx in block.confirmed_transaction_list:
+        for tx in ([], block.confirmed_transaction_list)[not headers_only]:
             tx_data_json = json.loads("{}")
             for key in tx_filter:
                 try:
@@ -399,7 +402,8 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         """
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
         logging.debug(f"peer_outer_service::AnnounceUnconfirmedBlock channel({channel_name})")
-        unconfirmed_block = pickle.loads(request.block)
+        unconfirmed_block = Block(channel_name=channel_name)
+        unconfirmed_block.deserialize_block(request.block)
 
         logging.warning("Black Peer makes Fail validate Message by intention!")
         vote_code, message = message_code.get_response(message_code.Response.fail_validate_block)
@@ -429,7 +433,8 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         logging.debug("AnnounceConfirmedBlock block hash: " + request.block_hash)
         response_code, response_msg = message_code.get_response(message_code.Response.fail_announce_block)
 
-        confirmed_block = pickle.loads(request.block)
+        confirmed_block = Block(channel_name=channel_name)
+        confirmed_block.deserialize_block(request.block)
 
         logging.debug(f"block \n"
                       f"peer_id({confirmed_block.peer_id})\n"
@@ -463,7 +468,7 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
                 max_block_height=block_manager.get_blockchain().block_height,
                 block=b"")
 
-        dump = pickle.dumps(block)
+        dump = block.serialize_block()
 
         return loopchain_pb2.BlockSyncReply(
             response_code=message_code.Response.success,
@@ -565,7 +570,7 @@ class BlackOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         if self.peer_service.channel_manager.get_block_manager(channel_name).consensus.block is None:
             logging.debug("this leader can't make more block")
 
-        self.peer_service.channel_manager.get_block_manager(channel_name).add_tx_unloaded(pickle.dumps(tx))
+        self.peer_service.channel_manager.get_block_manager(channel_name).add_tx(tx)
 
     def AnnounceDeletePeer(self, request, context):
         """delete peer by radio station heartbeat, It delete peer info over whole channels.
@@ -141,7 +141,7 @@ class InnerService(loopchain_pb2_grpc.InnerServiceServicer):
          request.block_hash: 조회할 block 의 hash 값, "" 로 조회하면 마지막 block 의 hash 값을 리턴한다.
          request.block_data_filter: block 정보 중 조회하고 싶은 key 값 목록 "key1, key2, key3" 형식의 string
          request.tx_data_filter: block 에 포함된 transaction(tx) 중 조회하고 싶은 key 값 목록
-        "key1, key2, key3" 형식의 string
+        "key1, key2, key3" 형식의 string, "" 로 조회하면 block header 만 읽으며 tx 정보는 리턴하지 않는다.
         :param context:
         :return: loopchain.proto 의 GetBlockReply 참고,
         block_hash, block 정보 json, block 에 포함된 tx 정보의 json 리스트를 받는다.
@@ -163,11 +163,13 @@ class InnerService(loopchain_pb2_grpc.InnerServiceServicer):
         logging.debug("tx_filter: " + str(tx_filter))
 
         block_data_json = json.loads("{}")
+        # tx 정보를 요청하지 않으면 block body 는 읽지 않는다.
+        headers_only = tx_filter == ['']
 
         if block_hash != "":
-            block = block_manager.get_blockchain().find_block_by_hash(block_hash)
+            block = block_manager.get_blockchain().find_block_by_hash(block_hash, headers_only)
         elif request.block_height != -1:
-            block = block_manager.get_blockchain().find_block_by_height(request.block_height)
+            block = block_manager.get_blockchain().find_block_by_height(request.block_height, headers_only)
 
         if block is None:
             return loopchain_pb2.GetBlockReply(response_code=message_code.Response.fail_wrong_block_hash,
@@ -186,7 +188,7 @@ class InnerService(loopchain_pb2_grpc.InnerServiceServicer):
                     block_data_json[key] = ""
 
         tx_data_json_list = []
-        for tx in block.confirmed_transaction_list:
+        for tx in ([], block.confirmed_transaction_list)[not headers_only]:
             tx_data_json = json.loads("{}")
             for key in tx_filter:
                 try:
@@ -219,11 +219,13 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
                 response_code=message_code.Response.fail_made_block_count_limited,
                 message="this leader can't make more block")
 
-        block_manager.add_tx_unloaded(request.tx)
-
         # TODO AddTx 는 성능에 민감한 구간으로 이곳에 기능과 무관한 코드를 삽입하면 성능에 영향을 줍니다.
         # 이 곳에서 tx_hash 를 로그로 남겨야 하면 request 에 tx_hash 를 포함해서 보내도록 코드를 수정해야 합니다.
-        tx = pickle.loads(request.tx)
+        # tx 를 한 번만 load 하여 hash, signature 를 검증하고 mempool 과 block db 에 있는 tx 는 거절한다.
+        # 검증한 tx 는 Transaction.verified_tx_cache 에 남으므로 block 을 검증할 때 signature 를 다시 검증하지 않는다.
+        response_code, message, tx_hash = block_manager.admit_tx(request.tx)
+        if response_code != message_code.Response.success:
+            return loopchain_pb2.CommonReply(response_code=response_code, message=message)
 
         # logger = sender.FluentSender('app', host=conf.MONITOR_LOG_HOST, port=conf.MONITOR_LOG_PORT)
         # logger.emit('follow', {'from': 'userA', 'to': 'userB'})
@@ -240,7 +242,7 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
             'event_type': 'AddTx',
             'peer_id': self.peer_service.peer_id,
             'data': {
-                'tx_hash': tx.tx_hash,
+                'tx_hash': tx_hash,
                 'total_tx': block_manager.get_total_tx()}})
 
         return loopchain_pb2.CommonReply(response_code=message_code.Response.success, message="success")
@@ -309,7 +311,7 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
          request.block_hash: 조회할 block 의 hash 값, "" 로 조회하면 마지막 block 의 hash 값을 리턴한다.
          request.block_data_filter: block 정보 중 조회하고 싶은 key 값 목록 "key1, key2, key3" 형식의 string
          request.tx_data_filter: block 에 포함된 transaction(tx) 중 조회하고 싶은 key 값 목록
-        "key1, key2, key3" 형식의 string
+        "key1, key2, key3" 형식의 string, "" 로 조회하면 block header 만 읽으며 tx 정보는 리턴하지 않는다.
         :param context:
         :return: loopchain.proto 의 GetBlockReply 참고,
         block_hash, block 정보 json, block 에 포함된 tx 정보의 json 리스트를 받는다.
@@ -330,12 +332,13 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
         logging.debug("block_filter: " + str(block_filter))
         logging.debug("tx_filter: " + str(tx_filter))
 
-        block_data_json = json.loads("{}")
+        # tx 정보를 요청하지 않으면 block body 는 읽지 않는다.
+        headers_only = tx_filter == ['']
 
         if block_hash != "":
-            block = block_manager.get_blockchain().find_block_by_hash(block_hash)
+            block = block_manager.get_blockchain().find_block_by_hash(block_hash, headers_only)
         elif request.block_height != -1:
-            block = block_manager.get_blockchain().find_block_by_height(request.block_height)
+            block = block_manager.get_blockchain().find_block_by_height(request.block_height, headers_only)
 
         if block is None:
             return loopchain_pb2.GetBlockReply(response_code=message_code.Response.fail_wrong_block_hash,
@@ -343,6 +346,32 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
                                                block_data_json="",
                                                tx_data_json="")
 
+        return self.__make_block_reply(block, block_filter, tx_filter, headers_only)
+
+    def GetBlockRange(self, request, context):
+        """start_height 부터 end_height 까지의 Block 정보를 height 순서대로 stream 으로 보낸다.
+
+        :param request: loopchain.proto 의 GetBlockRangeRequest 참고
+         request.start_height: 조회할 처음 block 의 height
+         request.end_height: 조회할 마지막 block 의 height (포함), -1 이면 마지막 block 까지 조회한다.
+         request.block_data_filter, request.tx_data_filter: GetBlock 과 같다.
+        :param context:
+        :return: block 마다 loopchain.proto 의 GetBlockReply 를 보낸다.
+        """
+        channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
+        blockchain = self.peer_service.channel_manager.get_block_manager(channel_name).get_blockchain()
+
+        block_filter = re.sub(r'\s', '', request.block_data_filter).split(",")
+        tx_filter = re.sub(r'\s', '', request.tx_data_filter).split(",")
+        headers_only = tx_filter == ['']
+        end_height = (request.end_height, None)[request.end_height == -1]
+
+        for block in blockchain.iter_blocks(request.start_height, end_height, headers_only):
+            yield self.__make_block_reply(block, block_filter, tx_filter, headers_only)
+
+    def __make_block_reply(self, block, block_filter, tx_filter, headers_only):
+        block_data_json = json.loads("{}")
+
         for key in block_filter:
             try:
                 block_data_json[key] = str(getattr(block, key))
@@ -354,7 +383,7 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
                     block_data_json[key] = ""
 
         tx_data_json_list = []
-        for tx in block.confirmed_transaction_list:
+        for tx in ([], block.confirmed_transaction_list)[not headers_only]:
             tx_data_json = json.loads("{}")
             for key in tx_filter:
                 try:
@@ -418,6 +447,45 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
 
         return loopchain_pb2.QueryReply(response_code=response_code, response=response)
 
+    def GetMerkleProof(self, request, context):
+        """한 block 에 담긴 여러 tx 의 merkle proof 를 한 번에 조회한다.
+        tx 들이 함께 쓰는 node 는 한 번만 보내므로 MerkleTree.verify_multi_proof 로 모든 tx 를 한 번에 검증할 수 있다.
+
+        :param request: loopchain.proto 의 GetMerkleProofRequest 참고
+         request.block_hash: 조회할 block 의 hash 값, "" 이면 request.block_height 로 조회한다.
+         request.tx_indices: block 안에서의 tx index 목록
+        :param context:
+        :return: loopchain.proto 의 GetMerkleProofReply 참고
+        """
+        channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
+        blockchain = self.peer_service.channel_manager.get_block_manager(channel_name).get_blockchain()
+
+        block = None
+        if request.block_hash != "":
+            block = blockchain.find_block_by_hash(request.block_hash)
+        elif request.block_height != -1:
+            block = blockchain.find_block_by_height(request.block_height)
+
+        if block is None:
+            return loopchain_pb2.GetMerkleProofReply(response_code=message_code.Response.fail_wrong_block_hash,
+                                                     block_hash=request.block_hash)
+
+        try:
+            proofs = block.mk_merkle_proofs(request.tx_indices)
+        except IndexError as e:
+            logging.warning(f"peer_outer_service:GetMerkleProof fail : {e}")
+            return loopchain_pb2.GetMerkleProofReply(response_code=message_code.Response.fail,
+                                                     block_hash=block.block_hash)
+
+        return loopchain_pb2.GetMerkleProofReply(response_code=message_code.Response.success,
+                                                 block_hash=block.block_hash,
+                                                 merkle_tree_root_hash=block.merkle_tree_root_hash,
+                                                 merkle_version=block.merkle_version,
+                                                 tx_count=proofs['tx_count'],
+                                                 tx_indices=proofs['indices'],
+                                                 tx_hashes=proofs['transactions'],
+                                                 nodes=proofs['nodes'])
+
     def GetInvokeResult(self, request, context):
         """get invoke result by tx_hash
 
@@ -460,7 +528,8 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
         """
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
         logging.debug(f"peer_outer_service::AnnounceUnconfirmedBlock channel({channel_name})")
-        unconfirmed_block = pickle.loads(request.block)
+        unconfirmed_block = Block(channel_name=channel_name)
+        unconfirmed_block.deserialize_block(request.block)
 
         # logging.debug(f"#block \n"
         #               f"peer_id({unconfirmed_block.peer_id})\n"
@@ -497,7 +566,8 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
         logging.debug("AnnounceConfirmedBlock block hash: " + request.block_hash)
         response_code, response_msg = message_code.get_response(message_code.Response.fail_announce_block)
 
-        confirmed_block = pickle.loads(request.block)
+        confirmed_block = Block(channel_name=channel_name)
+        confirmed_block.deserialize_block(request.block)
 
         logging.debug(f"block \n"
                       f"peer_id({confirmed_block.peer_id})\n"
@@ -531,7 +601,7 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
                 max_block_height=block_manager.get_blockchain().block_height,
                 block=b"")
 
-        dump = pickle.dumps(block)
+        dump = block.serialize_block()
 
         return loopchain_pb2.BlockSyncReply(
             response_code=message_code.Response.success,
@@ -636,7 +706,7 @@ class OuterService(loopchain_pb2_grpc.PeerServiceServicer):
         if self.peer_service.channel_manager.get_block_manager(channel_name).consensus.block is None:
             logging.debug("this leader can't make more block")
 
-        self.peer_service.channel_manager.get_block_manager(channel_name).add_tx_unloaded(pickle.dumps(tx))
+        self.peer_service.channel_manager.get_block_manager(channel_name).add_tx(tx)
 
     def AnnounceDeletePeer(self, request, context):
         """delete peer by radio station heartbeat, It delete peer info over whole channels.
@@ -283,7 +283,8 @@ class PeerService:
         self.__common_service.stop()
 
     def score_invoke(self, block, channel) -> dict:
-        block_object = pickle.dumps(block)
+        # 같은 host 의 score container 로 보내므로 압축하지 않는다.
+        block_object = block.serialize_block(BlockCodec.none)
         response = self.channel_manager.get_score_container_stub(channel).call(
             method_name="Request",
             message=loopchain_pb2.Message(code=message_code.Request.score_invoke, object=block_object),
@@ -388,7 +389,8 @@ class PeerService:
         if channel_name is None:
             channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL
 
-        block = pickle.loads(block_unloaded)
+        block = Block(channel_name=channel_name)
+        block.deserialize_block(block_unloaded)
         block_hash = block.block_hash
 
         response_code, response_msg = message_code.get_response(message_code.Response.fail_validate_block)
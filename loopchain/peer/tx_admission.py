@@ -0,0 +1,128 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Admission of txs received by AddTx into the mempool"""
+
+import collections
+import logging
+import math
+import pickle
+import threading
+import time
+
+from loopchain import configure as conf
+from loopchain.blockchain import MempoolPutResult, Transaction, TransactionStatus, TransactionType
+from loopchain.protos import message_code
+
+
+class TxAdmission:
+    """AddTx 로 받은 tx 를 검증한 뒤 mempool 에 넣는다.
+
+    pickle 을 한 번만 load 하고 mempool 과 block db 에 이미 있는 tx 는 signature 를 검증하기 전에 거절한다.
+    tx hash 와 signature 를 검증한 general tx 는 confirmed 상태로 mempool 에 넣으므로
+    leader 는 block 을 만들 때 (Block.put_transaction) tx 를 다시 검증하지 않는다.
+    받은 tx 의 status 는 믿지 않으며 general tx 는 항상 검증한다.
+    """
+
+    def __init__(self, mempool, blockchain, latency_window=None):
+        """
+        :param mempool: 검증한 tx 를 넣을 Mempool
+        :param blockchain: confirm 된 tx 인지 확인할 BlockChain (contains_tx)
+        :param latency_window: latency percentile 을 계산할 최근 tx 의 갯수, None 이면 conf.TX_ADMISSION_LATENCY_WINDOW
+        """
+        self.__mempool = mempool
+        self.__blockchain = blockchain
+        latency_window = conf.TX_ADMISSION_LATENCY_WINDOW if latency_window is None else latency_window
+        self.__latencies = collections.deque(maxlen=max(latency_window, 1))
+        self.__lock = threading.Lock()
+
+        self.__results = collections.Counter()  # message_code.Response : count
+
+    def admit(self, tx_dump):
+        """pickle dump 된 tx 를 검증하여 mempool 에 넣는다.
+
+        :param tx_dump: AddTx 로 받은 tx (pickle dump)
+        :return: (message_code.Response, message, tx_hash), tx 를 load 할 수 없으면 tx_hash 는 None
+        """
+        begin_time = time.perf_counter()
+        response_code, message, tx_hash = self.__admit(tx_dump)
+        elapsed = time.perf_counter() - begin_time
+
+        with self.__lock:
+            self.__latencies.append(elapsed)
+            self.__results[response_code] += 1
+
+        return response_code, message, tx_hash
+
+    def __admit(self, tx_dump):
+        try:
+            tx = pickle.loads(tx_dump)
+        except Exception as e:
+            logging.warning(f"fail to load tx: {e}")
+            return message_code.Response.fail_validate_params, "invalid tx", None
+
+        if not isinstance(tx, Transaction):
+            logging.warning(f"received tx is not Transaction: {type(tx)}")
+            return message_code.Response.fail_validate_params, "invalid tx", None
+
+        tx_hash = tx.tx_hash
+        if self.__mempool.contains(tx_hash) or \
+                (self.__blockchain is not None and self.__blockchain.contains_tx(tx_hash)):
+            return (*message_code.get_response(message_code.Response.fail_duplicate_tx), tx_hash)
+
+        # peer list tx 는 서명하지 않으므로 검증하지 않는다.
+        if tx.type is TransactionType.general:
+            if not Transaction.validate(tx, is_exception_log=False):
+                logging.debug(f"reject invalid tx({tx_hash})")
+                return message_code.Response.fail_validate_params, "invalid tx", tx_hash
+            tx.status = TransactionStatus.confirmed
+
+        result = self.__mempool.put(tx)
+        if result is MempoolPutResult.duplicate:
+            return (*message_code.get_response(message_code.Response.fail_duplicate_tx), tx_hash)
+        if result is MempoolPutResult.full:
+            logging.warning(f"mempool is full, drop tx({tx_hash})")
+            return (*message_code.get_response(message_code.Response.fail_mempool_full), tx_hash)
+
+        return (*message_code.get_response(message_code.Response.success), tx_hash)
+
+    def get_status(self):
+        """tx admission 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of count, accepted, invalid, duplicate, full, latency (p50, p90, p99, max in ms)
+        """
+        with self.__lock:
+            latencies = sorted(self.__latencies)
+            results = self.__results.copy()
+
+        return {
+            'count': sum(results.values()),
+            'accepted': results[message_code.Response.success],
+            'invalid': results[message_code.Response.fail_validate_params],
+            'duplicate': results[message_code.Response.fail_duplicate_tx],
+            'full': results[message_code.Response.fail_mempool_full],
+            'latency': {
+                'p50': TxAdmission.__percentile(latencies, 50),
+                'p90': TxAdmission.__percentile(latencies, 90),
+                'p99': TxAdmission.__percentile(latencies, 99),
+                'max': TxAdmission.__percentile(latencies, 100)
+            }
+        }
+
+    @staticmethod
+    def __percentile(sorted_latencies, percent):
+        """nearest rank percentile (ms)"""
+        if not sorted_latencies:
+            return 0.0
+        rank = max(math.ceil(len(sorted_latencies) * percent / 100), 1)
+        return sorted_latencies[min(rank, len(sorted_latencies)) - 1] * 1000
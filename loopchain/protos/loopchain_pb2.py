@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='loopchain.proto',
   package='',
   syntax='proto2',
-  serialized_pb=_b('\n\x0floopchain.proto\"W\n\x07Message\x12\x0c\n\x04\x63ode\x18\x01 \x02(\x05\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0c\n\x04meta\x18\x04 \x01(\t\x12\x0e\n\x06object\x18\x05 \x01(\x0c\"n\n\x15\x43omplainLeaderRequest\x12\x1c\n\x14\x63omplained_leader_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x15\n\rnew_leader_id\x18\x03 \x02(\t\x12\x0f\n\x07message\x18\x04 \x02(\t\"\x1d\n\x08PeerList\x12\x11\n\tpeer_list\x18\x01 \x02(\x0c\"0\n\x0f\x43reateTxRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"J\n\rCreateTxReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07tx_hash\x18\x02 \x02(\t\x12\x11\n\tmore_info\x18\x03 \x02(\t\"%\n\x06TxSend\x12\n\n\x02tx\x18\x01 \x02(\x0c\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"\x83\x01\n\x0fGetBlockRequest\x12\x12\n\nblock_hash\x18\x01 \x01(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x18\n\x0c\x62lock_height\x18\x03 \x01(\x05:\x02-1\x12\x19\n\x11\x62lock_data_filter\x18\x04 \x02(\t\x12\x16\n\x0etx_data_filter\x18\x05 \x02(\t\"i\n\rGetBlockReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x12\n\nblock_hash\x18\x02 \x02(\t\x12\x17\n\x0f\x62lock_data_json\x18\x03 \x02(\t\x12\x14\n\x0ctx_data_json\x18\x04 \x03(\t\"/\n\x0cQueryRequest\x12\x0e\n\x06params\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"5\n\nQueryReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x10\n\x08response\x18\x02 \x02(\t\"0\n\x0cGetTxRequest\x12\x0f\n\x07tx_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"y\n\nGetTxReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0c\n\x04meta\x18\x02 \x02(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x02(\t\x12\x11\n\tmore_info\x18\x04 \x02(\t\x12\x11\n\tsignature\x18\x05 \x02(\x0c\x12\x12\n\npublic_key\x18\x06 \x02(\x0c\":\n\x16GetInvokeResultRequest\x12\x0f\n\x07tx_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"=\n\x14GetInvokeResultReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0e\n\x06result\x18\x02 \x01(\t\"7\n\x10\x42lockSyncRequest\x12\x12\n\nblock_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"f\n\x0e\x42lockSyncReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x14\n\x0c\x62lock_height\x18\x02 \x02(\x05\x12\x18\n\x10max_block_height\x18\x03 \x02(\x05\x12\r\n\x05\x62lock\x18\x04 \x02(\x0c\"+\n\tBlockSend\x12\r\n\x05\x62lock\x18\x01 \x02(\x0c\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"H\n\nBlockReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07message\x18\x02 \x02(\t\x12\x12\n\nblock_hash\x18\x03 \x02(\t\"w\n\tBlockVote\x12\x11\n\tvote_code\x18\x01 \x02(\x05\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x02(\t\x12\x12\n\nblock_hash\x18\x04 \x02(\t\x12\x0f\n\x07peer_id\x18\x05 \x02(\t\x12\x10\n\x08group_id\x18\x06 \x02(\t\"C\n\rBlockAnnounce\x12\x12\n\nblock_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\r\n\x05\x62lock\x18\x03 \x01(\x0c\"C\n\rCommonRequest\x12\x0f\n\x07request\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x10\n\x08group_id\x18\x03 \x01(\t\"5\n\x0b\x43ommonReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07message\x18\x02 \x02(\t\"1\n\rStatusRequest\x12\x0f\n\x07request\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"d\n\x0bStatusReply\x12\x0e\n\x06status\x18\x01 \x02(\t\x12\x14\n\x0c\x62lock_height\x18\x02 \x02(\x05\x12\x10\n\x08total_tx\x18\x03 \x02(\x05\x12\x1d\n\x15is_leader_complaining\x18\x04 \x01(\x05\"\x1d\n\x0bStopRequest\x12\x0e\n\x06reason\x18\x01 \x02(\t\"\x1b\n\tStopReply\x12\x0e\n\x06status\x18\x01 \x02(\t\"\xab\x01\n\x0bPeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x13\n\x0bpeer_target\x18\x03 \x02(\t\x12\x10\n\x08group_id\x18\x04 \x02(\t\x12\x1c\n\tpeer_type\x18\x05 \x02(\x0e\x32\t.PeerType\x12\x0c\n\x04\x63\x65rt\x18\x06 \x01(\x0c\x12\x12\n\npeer_order\x18\x07 \x01(\x05\x12\x13\n\x0bpeer_object\x18\x08 \x01(\x0c\"\x94\x01\n\x12\x43onnectPeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x13\n\x0bpeer_target\x18\x03 \x02(\t\x12\x10\n\x08group_id\x18\x04 \x02(\t\x12\x0c\n\x04\x63\x65rt\x18\x05 \x01(\x0c\x12\x12\n\npeer_order\x18\x06 \x01(\x05\x12\x13\n\x0bpeer_object\x18\x07 \x01(\x0c\"Z\n\x10\x43onnectPeerReply\x12\x0e\n\x06status\x18\x01 \x02(\x05\x12\x11\n\tpeer_list\x18\x02 \x02(\x0c\x12\x10\n\x08\x63hannels\x18\x03 \x03(\t\x12\x11\n\tmore_info\x18\x04 \x01(\t\"^\n\x16GetChannelInfosRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x13\n\x0bpeer_target\x18\x02 \x02(\t\x12\x10\n\x08group_id\x18\x03 \x02(\t\x12\x0c\n\x04\x63\x65rt\x18\x04 \x01(\x0c\"D\n\x14GetChannelInfosReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x15\n\rchannel_infos\x18\x02 \x02(\t\"<\n\x06PeerID\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x10\n\x08group_id\x18\x03 \x02(\t*<\n\x08PeerType\x12\x08\n\x04PEER\x10\x00\x12\x13\n\x0f\x42LOCK_GENERATOR\x10\x01\x12\x11\n\rRADIO_STATION\x10\x02\x32\xf5\x03\n\x0cInnerService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\x30\n\x0eGetScoreStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12&\n\x04\x45\x63ho\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12.\n\x08GetBlock\x12\x10.GetBlockRequest\x1a\x0e.GetBlockReply\"\x00\x12%\n\x05Query\x12\r.QueryRequest\x1a\x0b.QueryReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12\x34\n\x12NotifyLeaderBroken\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12\x34\n\x12NotifyProcessError\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x32\xa9\x08\n\x0bPeerService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\x30\n\x0eGetScoreStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12.\n\x08\x43reateTx\x12\x10.CreateTxRequest\x1a\x0e.CreateTxReply\"\x00\x12%\n\x05GetTx\x12\r.GetTxRequest\x1a\x0b.GetTxReply\"\x00\x12.\n\x08GetBlock\x12\x10.GetBlockRequest\x1a\x0e.GetBlockReply\"\x00\x12%\n\x05Query\x12\r.QueryRequest\x1a\x0b.QueryReply\"\x00\x12\x43\n\x0fGetInvokeResult\x12\x17.GetInvokeResultRequest\x1a\x15.GetInvokeResultReply\"\x00\x12\x31\n\tBlockSync\x12\x11.BlockSyncRequest\x1a\x0f.BlockSyncReply\"\x00\x12\x36\n\x18\x41nnounceUnconfirmedBlock\x12\n.BlockSend\x1a\x0c.CommonReply\"\x00\x12\x38\n\x16\x41nnounceConfirmedBlock\x12\x0e.BlockAnnounce\x1a\x0c.CommonReply\"\x00\x12/\n\x0f\x41nnounceNewPeer\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12-\n\x12\x41nnounceDeletePeer\x12\x07.PeerID\x1a\x0c.CommonReply\"\x00\x12&\n\x04\x45\x63ho\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12\x38\n\x0e\x43omplainLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12;\n\x11\x41nnounceNewLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12\x31\n\x10GetLastBlockHash\x12\x0e.CommonRequest\x1a\x0b.BlockReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12 \n\x05\x41\x64\x64Tx\x12\x07.TxSend\x1a\x0c.CommonReply\"\x00\x12\x32\n\x14VoteUnconfirmedBlock\x12\n.BlockVote\x1a\x0c.CommonReply\"\x00\x32\x9b\x04\n\x0cRadioStation\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12\x43\n\x0fGetChannelInfos\x12\x17.GetChannelInfosRequest\x1a\x15.GetChannelInfosReply\"\x00\x12\x37\n\x0b\x43onnectPeer\x12\x13.ConnectPeerRequest\x1a\x11.ConnectPeerReply\"\x00\x12*\n\x0bGetPeerList\x12\x0e.CommonRequest\x1a\t.PeerList\"\x00\x12(\n\rGetPeerStatus\x12\x07.PeerID\x1a\x0c.StatusReply\"\x00\x12;\n\x11\x41nnounceNewLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12\x30\n\x0eGetRandomTable\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x32/\n\x0c\x41\x64minService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x32,\n\tContainer\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00')
+  serialized_pb=_b('\n\x0floopchain.proto\"W\n\x07Message\x12\x0c\n\x04\x63ode\x18\x01 \x02(\x05\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0c\n\x04meta\x18\x04 \x01(\t\x12\x0e\n\x06object\x18\x05 \x01(\x0c\"n\n\x15\x43omplainLeaderRequest\x12\x1c\n\x14\x63omplained_leader_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x15\n\rnew_leader_id\x18\x03 \x02(\t\x12\x0f\n\x07message\x18\x04 \x02(\t\"\x1d\n\x08PeerList\x12\x11\n\tpeer_list\x18\x01 \x02(\x0c\"0\n\x0f\x43reateTxRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"J\n\rCreateTxReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07tx_hash\x18\x02 \x02(\t\x12\x11\n\tmore_info\x18\x03 \x02(\t\"%\n\x06TxSend\x12\n\n\x02tx\x18\x01 \x02(\x0c\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"\x83\x01\n\x0fGetBlockRequest\x12\x12\n\nblock_hash\x18\x01 \x01(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x18\n\x0c\x62lock_height\x18\x03 \x01(\x05:\x02-1\x12\x19\n\x11\x62lock_data_filter\x18\x04 \x02(\t\x12\x16\n\x0etx_data_filter\x18\x05 \x02(\t\"i\n\rGetBlockReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x12\n\nblock_hash\x18\x02 \x02(\t\x12\x17\n\x0f\x62lock_data_json\x18\x03 \x02(\t\x12\x14\n\x0ctx_data_json\x18\x04 \x03(\t\"\x88\x01\n\x14GetBlockRangeRequest\x12\x14\n\x0cstart_height\x18\x01 \x02(\x05\x12\x16\n\nend_height\x18\x02 \x01(\x05:\x02-1\x12\x0f\n\x07\x63hannel\x18\x03 \x01(\t\x12\x19\n\x11\x62lock_data_filter\x18\x04 \x02(\t\x12\x16\n\x0etx_data_filter\x18\x05 \x02(\t\"/\n\x0cQueryRequest\x12\x0e\n\x06params\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"5\n\nQueryReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x10\n\x08response\x18\x02 \x02(\t\"0\n\x0cGetTxRequest\x12\x0f\n\x07tx_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"y\n\nGetTxReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0c\n\x04meta\x18\x02 \x02(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x02(\t\x12\x11\n\tmore_info\x18\x04 \x02(\t\x12\x11\n\tsignature\x18\x05 \x02(\x0c\x12\x12\n\npublic_key\x18\x06 \x02(\x0c\":\n\x16GetInvokeResultRequest\x12\x0f\n\x07tx_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"=\n\x14GetInvokeResultReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0e\n\x06result\x18\x02 \x01(\t\"j\n\x15GetMerkleProofRequest\x12\x12\n\nblock_hash\x18\x01 \x01(\t\x12\x18\n\x0c\x62lock_height\x18\x02 \x01(\x05:\x02-1\x12\x12\n\ntx_indices\x18\x03 \x03(\x05\x12\x0f\n\x07\x63hannel\x18\x04 \x01(\t\"\xbf\x01\n\x13GetMerkleProofReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x12\n\nblock_hash\x18\x02 \x01(\t\x12\x1d\n\x15merkle_tree_root_hash\x18\x03 \x01(\t\x12\x16\n\x0emerkle_version\x18\x04 \x01(\x05\x12\x10\n\x08tx_count\x18\x05 \x01(\x05\x12\x12\n\ntx_indices\x18\x06 \x03(\x05\x12\x11\n\ttx_hashes\x18\x07 \x03(\t\x12\r\n\x05nodes\x18\x08 \x03(\t\"7\n\x10\x42lockSyncRequest\x12\x12\n\nblock_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"f\n\x0e\x42lockSyncReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x14\n\x0c\x62lock_height\x18\x02 \x02(\x05\x12\x18\n\x10max_block_height\x18\x03 \x02(\x05\x12\r\n\x05\x62lock\x18\x04 \x02(\x0c\"+\n\tBlockSend\x12\r\n\x05\x62lock\x18\x01 \x02(\x0c\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"H\n\nBlockReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07message\x18\x02 \x02(\t\x12\x12\n\nblock_hash\x18\x03 \x02(\t\"w\n\tBlockVote\x12\x11\n\tvote_code\x18\x01 \x02(\x05\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x02(\t\x12\x12\n\nblock_hash\x18\x04 \x02(\t\x12\x0f\n\x07peer_id\x18\x05 \x02(\t\x12\x10\n\x08group_id\x18\x06 \x02(\t\"C\n\rBlockAnnounce\x12\x12\n\nblock_hash\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\r\n\x05\x62lock\x18\x03 \x01(\x0c\"C\n\rCommonRequest\x12\x0f\n\x07request\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x10\n\x08group_id\x18\x03 \x01(\t\"5\n\x0b\x43ommonReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x0f\n\x07message\x18\x02 \x02(\t\"1\n\rStatusRequest\x12\x0f\n\x07request\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\"d\n\x0bStatusReply\x12\x0e\n\x06status\x18\x01 \x02(\t\x12\x14\n\x0c\x62lock_height\x18\x02 \x02(\x05\x12\x10\n\x08total_tx\x18\x03 \x02(\x05\x12\x1d\n\x15is_leader_complaining\x18\x04 \x01(\x05\"\x1d\n\x0bStopRequest\x12\x0e\n\x06reason\x18\x01 \x02(\t\"\x1b\n\tStopReply\x12\x0e\n\x06status\x18\x01 \x02(\t\"\xab\x01\n\x0bPeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x13\n\x0bpeer_target\x18\x03 \x02(\t\x12\x10\n\x08group_id\x18\x04 \x02(\t\x12\x1c\n\tpeer_type\x18\x05 \x02(\x0e\x32\t.PeerType\x12\x0c\n\x04\x63\x65rt\x18\x06 \x01(\x0c\x12\x12\n\npeer_order\x18\x07 \x01(\x05\x12\x13\n\x0bpeer_object\x18\x08 \x01(\x0c\"\x94\x01\n\x12\x43onnectPeerRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x13\n\x0bpeer_target\x18\x03 \x02(\t\x12\x10\n\x08group_id\x18\x04 \x02(\t\x12\x0c\n\x04\x63\x65rt\x18\x05 \x01(\x0c\x12\x12\n\npeer_order\x18\x06 \x01(\x05\x12\x13\n\x0bpeer_object\x18\x07 \x01(\x0c\"Z\n\x10\x43onnectPeerReply\x12\x0e\n\x06status\x18\x01 \x02(\x05\x12\x11\n\tpeer_list\x18\x02 \x02(\x0c\x12\x10\n\x08\x63hannels\x18\x03 \x03(\t\x12\x11\n\tmore_info\x18\x04 \x01(\t\"^\n\x16GetChannelInfosRequest\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x13\n\x0bpeer_target\x18\x02 \x02(\t\x12\x10\n\x08group_id\x18\x03 \x02(\t\x12\x0c\n\x04\x63\x65rt\x18\x04 \x01(\x0c\"D\n\x14GetChannelInfosReply\x12\x15\n\rresponse_code\x18\x01 \x02(\x05\x12\x15\n\rchannel_infos\x18\x02 \x02(\t\"<\n\x06PeerID\x12\x0f\n\x07peer_id\x18\x01 \x02(\t\x12\x0f\n\x07\x63hannel\x18\x02 \x01(\t\x12\x10\n\x08group_id\x18\x03 \x02(\t*<\n\x08PeerType\x12\x08\n\x04PEER\x10\x00\x12\x13\n\x0f\x42LOCK_GENERATOR\x10\x01\x12\x11\n\rRADIO_STATION\x10\x02\x32\xf5\x03\n\x0cInnerService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\x30\n\x0eGetScoreStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12&\n\x04\x45\x63ho\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12.\n\x08GetBlock\x12\x10.GetBlockRequest\x1a\x0e.GetBlockReply\"\x00\x12%\n\x05Query\x12\r.QueryRequest\x1a\x0b.QueryReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12\x34\n\x12NotifyLeaderBroken\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12\x34\n\x12NotifyProcessError\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x32\xa7\t\n\x0bPeerService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\x30\n\x0eGetScoreStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12.\n\x08\x43reateTx\x12\x10.CreateTxRequest\x1a\x0e.CreateTxReply\"\x00\x12%\n\x05GetTx\x12\r.GetTxRequest\x1a\x0b.GetTxReply\"\x00\x12.\n\x08GetBlock\x12\x10.GetBlockRequest\x1a\x0e.GetBlockReply\"\x00\x12:\n\rGetBlockRange\x12\x15.GetBlockRangeRequest\x1a\x0e.GetBlockReply\"\x00\x30\x01\x12%\n\x05Query\x12\r.QueryRequest\x1a\x0b.QueryReply\"\x00\x12\x43\n\x0fGetInvokeResult\x12\x17.GetInvokeResultRequest\x1a\x15.GetInvokeResultReply\"\x00\x12@\n\x0eGetMerkleProof\x12\x16.GetMerkleProofRequest\x1a\x14.GetMerkleProofReply\"\x00\x12\x31\n\tBlockSync\x12\x11.BlockSyncRequest\x1a\x0f.BlockSyncReply\"\x00\x12\x36\n\x18\x41nnounceUnconfirmedBlock\x12\n.BlockSend\x1a\x0c.CommonReply\"\x00\x12\x38\n\x16\x41nnounceConfirmedBlock\x12\x0e.BlockAnnounce\x1a\x0c.CommonReply\"\x00\x12/\n\x0f\x41nnounceNewPeer\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12-\n\x12\x41nnounceDeletePeer\x12\x07.PeerID\x1a\x0c.CommonReply\"\x00\x12&\n\x04\x45\x63ho\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12\x38\n\x0e\x43omplainLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12;\n\x11\x41nnounceNewLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12\x31\n\x10GetLastBlockHash\x12\x0e.CommonRequest\x1a\x0b.BlockReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12 \n\x05\x41\x64\x64Tx\x12\x07.TxSend\x1a\x0c.CommonReply\"\x00\x12\x32\n\x14VoteUnconfirmedBlock\x12\n.BlockVote\x1a\x0c.CommonReply\"\x00\x32\x9b\x04\n\x0cRadioStation\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x12+\n\tGetStatus\x12\x0e.StatusRequest\x1a\x0c.StatusReply\"\x00\x12\"\n\x04Stop\x12\x0c.StopRequest\x1a\n.StopReply\"\x00\x12\x43\n\x0fGetChannelInfos\x12\x17.GetChannelInfosRequest\x1a\x15.GetChannelInfosReply\"\x00\x12\x37\n\x0b\x43onnectPeer\x12\x13.ConnectPeerRequest\x1a\x11.ConnectPeerReply\"\x00\x12*\n\x0bGetPeerList\x12\x0e.CommonRequest\x1a\t.PeerList\"\x00\x12(\n\rGetPeerStatus\x12\x07.PeerID\x1a\x0c.StatusReply\"\x00\x12;\n\x11\x41nnounceNewLeader\x12\x16.ComplainLeaderRequest\x1a\x0c.CommonReply\"\x00\x12\x30\n\x0eGetRandomTable\x12\x0e.CommonRequest\x1a\x0c.CommonReply\"\x00\x12)\n\tSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x12+\n\x0bUnSubscribe\x12\x0c.PeerRequest\x1a\x0c.CommonReply\"\x00\x32/\n\x0c\x41\x64minService\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00\x32,\n\tContainer\x12\x1f\n\x07Request\x12\x08.Message\x1a\x08.Message\"\x00')
 )
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -45,8 +45,8 @@ _PEERTYPE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   options=None,
-  serialized_start=2509,
-  serialized_end=2569,
+  serialized_start=2950,
+  serialized_end=3010,
 )
 _sym_db.RegisterEnumDescriptor(_PEERTYPE)
 
@@ -431,6 +431,65 @@ _GETBLOCKREPLY = _descriptor.Descriptor(
 )
 
 
+_GETBLOCKRANGEREQUEST = _descriptor.Descriptor(
+  name='GetBlockRangeRequest',
+  full_name='GetBlockRangeRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='start_height', full_name='GetBlockRangeRequest.start_height', index=0,
+      number=1, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='end_height', full_name='GetBlockRangeRequest.end_height', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=True, default_value=-1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='channel', full_name='GetBlockRangeRequest.channel', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='block_data_filter', full_name='GetBlockRangeRequest.block_data_filter', index=3,
+      number=4, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='tx_data_filter', full_name='GetBlockRangeRequest.tx_data_filter', index=4,
+      number=5, type=9, cpp_type=9, label=2,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=658,
+  serialized_end=794,
+)
+
+
 _QUERYREQUEST = _descriptor.Descriptor(
   name='QueryRequest',
   full_name='QueryRequest',
@@ -464,8 +523,8 @@ _QUERYREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=657,
-  serialized_end=704,
+  serialized_start=796,
+  serialized_end=843,
 )
 
 
@@ -502,8 +561,8 @@ _QUERYREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=706,
-  serialized_end=759,
+  serialized_start=845,
+  serialized_end=898,
 )
 
 
@@ -540,8 +599,8 @@ _GETTXREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=761,
-  serialized_end=809,
+  serialized_start=900,
+  serialized_end=948,
 )
 
 
@@ -606,8 +665,8 @@ _GETTXREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=811,
-  serialized_end=932,
+  serialized_start=950,
+  serialized_end=1071,
 )
 
 
@@ -644,8 +703,8 @@ _GETINVOKERESULTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=934,
-  serialized_end=992,
+  serialized_start=1073,
+  serialized_end=1131,
 )
 
 
@@ -682,8 +741,140 @@ _GETINVOKERESULTREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=994,
-  serialized_end=1055,
+  serialized_start=1133,
+  serialized_end=1194,
+)
+
+
+_GETMERKLEPROOFREQUEST = _descriptor.Descriptor(
+  name='GetMerkleProofRequest',
+  full_name='GetMerkleProofRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='block_hash', full_name='GetMerkleProofRequest.block_hash', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='block_height', full_name='GetMerkleProofRequest.block_height', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=True, default_value=-1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='tx_indices', full_name='GetMerkleProofRequest.tx_indices', index=2,
+      number=3, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='channel', full_name='GetMerkleProofRequest.channel', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1196,
+  serialized_end=1302,
+)
+
+
+_GETMERKLEPROOFREPLY = _descriptor.Descriptor(
+  name='GetMerkleProofReply',
+  full_name='GetMerkleProofReply',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='response_code', full_name='GetMerkleProofReply.response_code', index=0,
+      number=1, type=5, cpp_type=1, label=2,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='block_hash', full_name='GetMerkleProofReply.block_hash', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='merkle_tree_root_hash', full_name='GetMerkleProofReply.merkle_tree_root_hash', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='merkle_version', full_name='GetMerkleProofReply.merkle_version', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='tx_count', full_name='GetMerkleProofReply.tx_count', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='tx_indices', full_name='GetMerkleProofReply.tx_indices', index=5,
+      number=6, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='tx_hashes', full_name='GetMerkleProofReply.tx_hashes', index=6,
+      number=7, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+    _descriptor.FieldDescriptor(
+      name='nodes', full_name='GetMerkleProofReply.nodes', index=7,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1305,
+  serialized_end=1496,
 )
 
 
@@ -720,8 +911,8 @@ _BLOCKSYNCREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1057,
-  serialized_end=1112,
+  serialized_start=1498,
+  serialized_end=1553,
 )
 
 
@@ -772,8 +963,8 @@ _BLOCKSYNCREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1114,
-  serialized_end=1216,
+  serialized_start=1555,
+  serialized_end=1657,
 )
 
 
@@ -810,8 +1001,8 @@ _BLOCKSEND = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1218,
-  serialized_end=1261,
+  serialized_start=1659,
+  serialized_end=1702,
 )
 
 
@@ -855,8 +1046,8 @@ _BLOCKREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1263,
-  serialized_end=1335,
+  serialized_start=1704,
+  serialized_end=1776,
 )
 
 
@@ -921,8 +1112,8 @@ _BLOCKVOTE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1337,
-  serialized_end=1456,
+  serialized_start=1778,
+  serialized_end=1897,
 )
 
 
@@ -966,8 +1157,8 @@ _BLOCKANNOUNCE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1458,
-  serialized_end=1525,
+  serialized_start=1899,
+  serialized_end=1966,
 )
 
 
@@ -1011,8 +1202,8 @@ _COMMONREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1527,
-  serialized_end=1594,
+  serialized_start=1968,
+  serialized_end=2035,
 )
 
 
@@ -1049,8 +1240,8 @@ _COMMONREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1596,
-  serialized_end=1649,
+  serialized_start=2037,
+  serialized_end=2090,
 )
 
 
@@ -1087,8 +1278,8 @@ _STATUSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1651,
-  serialized_end=1700,
+  serialized_start=2092,
+  serialized_end=2141,
 )
 
 
@@ -1139,8 +1330,8 @@ _STATUSREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1702,
-  serialized_end=1802,
+  serialized_start=2143,
+  serialized_end=2243,
 )
 
 
@@ -1170,8 +1361,8 @@ _STOPREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1804,
-  serialized_end=1833,
+  serialized_start=2245,
+  serialized_end=2274,
 )
 
 
@@ -1201,8 +1392,8 @@ _STOPREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1835,
-  serialized_end=1862,
+  serialized_start=2276,
+  serialized_end=2303,
 )
 
 
@@ -1281,8 +1472,8 @@ _PEERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1865,
-  serialized_end=2036,
+  serialized_start=2306,
+  serialized_end=2477,
 )
 
 
@@ -1354,8 +1545,8 @@ _CONNECTPEERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2039,
-  serialized_end=2187,
+  serialized_start=2480,
+  serialized_end=2628,
 )
 
 
@@ -1406,8 +1597,8 @@ _CONNECTPEERREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2189,
-  serialized_end=2279,
+  serialized_start=2630,
+  serialized_end=2720,
 )
 
 
@@ -1458,8 +1649,8 @@ _GETCHANNELINFOSREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2281,
-  serialized_end=2375,
+  serialized_start=2722,
+  serialized_end=2816,
 )
 
 
@@ -1496,8 +1687,8 @@ _GETCHANNELINFOSREPLY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2377,
-  serialized_end=2445,
+  serialized_start=2818,
+  serialized_end=2886,
 )
 
 
@@ -1541,8 +1732,8 @@ _PEERID = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2447,
-  serialized_end=2507,
+  serialized_start=2888,
+  serialized_end=2948,
 )
 
 _PEERREQUEST.fields_by_name['peer_type'].enum_type = _PEERTYPE
@@ -1554,12 +1745,15 @@ DESCRIPTOR.message_types_by_name['CreateTxReply'] = _CREATETXREPLY
 DESCRIPTOR.message_types_by_name['TxSend'] = _TXSEND
 DESCRIPTOR.message_types_by_name['GetBlockRequest'] = _GETBLOCKREQUEST
 DESCRIPTOR.message_types_by_name['GetBlockReply'] = _GETBLOCKREPLY
+DESCRIPTOR.message_types_by_name['GetBlockRangeRequest'] = _GETBLOCKRANGEREQUEST
 DESCRIPTOR.message_types_by_name['QueryRequest'] = _QUERYREQUEST
 DESCRIPTOR.message_types_by_name['QueryReply'] = _QUERYREPLY
 DESCRIPTOR.message_types_by_name['GetTxRequest'] = _GETTXREQUEST
 DESCRIPTOR.message_types_by_name['GetTxReply'] = _GETTXREPLY
 DESCRIPTOR.message_types_by_name['GetInvokeResultRequest'] = _GETINVOKERESULTREQUEST
 DESCRIPTOR.message_types_by_name['GetInvokeResultReply'] = _GETINVOKERESULTREPLY
+DESCRIPTOR.message_types_by_name['GetMerkleProofRequest'] = _GETMERKLEPROOFREQUEST
+DESCRIPTOR.message_types_by_name['GetMerkleProofReply'] = _GETMERKLEPROOFREPLY
 DESCRIPTOR.message_types_by_name['BlockSyncRequest'] = _BLOCKSYNCREQUEST
 DESCRIPTOR.message_types_by_name['BlockSyncReply'] = _BLOCKSYNCREPLY
 DESCRIPTOR.message_types_by_name['BlockSend'] = _BLOCKSEND
@@ -1636,6 +1830,13 @@ GetBlockReply = _reflection.GeneratedProtocolMessageType('GetBlockReply', (_mess
   ))
 _sym_db.RegisterMessage(GetBlockReply)
 
+GetBlockRangeRequest = _reflection.GeneratedProtocolMessageType('GetBlockRangeRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETBLOCKRANGEREQUEST,
+  __module__ = 'loopchain_pb2'
+  # @@protoc_insertion_point(class_scope:GetBlockRangeRequest)
+  ))
+_sym_db.RegisterMessage(GetBlockRangeRequest)
+
 QueryRequest = _reflection.GeneratedProtocolMessageType('QueryRequest', (_message.Message,), dict(
   DESCRIPTOR = _QUERYREQUEST,
   __module__ = 'loopchain_pb2'
@@ -1678,6 +1879,20 @@ GetInvokeResultReply = _reflection.GeneratedProtocolMessageType('GetInvokeResult
   ))
 _sym_db.RegisterMessage(GetInvokeResultReply)
 
+GetMerkleProofRequest = _reflection.GeneratedProtocolMessageType('GetMerkleProofRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GETMERKLEPROOFREQUEST,
+  __module__ = 'loopchain_pb2'
+  # @@protoc_insertion_point(class_scope:GetMerkleProofRequest)
+  ))
+_sym_db.RegisterMessage(GetMerkleProofRequest)
+
+GetMerkleProofReply = _reflection.GeneratedProtocolMessageType('GetMerkleProofReply', (_message.Message,), dict(
+  DESCRIPTOR = _GETMERKLEPROOFREPLY,
+  __module__ = 'loopchain_pb2'
+  # @@protoc_insertion_point(class_scope:GetMerkleProofReply)
+  ))
+_sym_db.RegisterMessage(GetMerkleProofReply)
+
 BlockSyncRequest = _reflection.GeneratedProtocolMessageType('BlockSyncRequest', (_message.Message,), dict(
   DESCRIPTOR = _BLOCKSYNCREQUEST,
   __module__ = 'loopchain_pb2'
@@ -2058,6 +2273,11 @@ try:
           request_serializer=GetBlockRequest.SerializeToString,
           response_deserializer=GetBlockReply.FromString,
           )
+      self.GetBlockRange = channel.unary_stream(
+          '/PeerService/GetBlockRange',
+          request_serializer=GetBlockRangeRequest.SerializeToString,
+          response_deserializer=GetBlockReply.FromString,
+          )
       self.Query = channel.unary_unary(
           '/PeerService/Query',
           request_serializer=QueryRequest.SerializeToString,
@@ -2068,6 +2288,11 @@ try:
           request_serializer=GetInvokeResultRequest.SerializeToString,
           response_deserializer=GetInvokeResultReply.FromString,
           )
+      self.GetMerkleProof = channel.unary_unary(
+          '/PeerService/GetMerkleProof',
+          request_serializer=GetMerkleProofRequest.SerializeToString,
+          response_deserializer=GetMerkleProofReply.FromString,
+          )
       self.BlockSync = channel.unary_unary(
           '/PeerService/BlockSync',
           request_serializer=BlockSyncRequest.SerializeToString,
@@ -2174,6 +2399,11 @@ try:
       context.set_details('Method not implemented!')
       raise NotImplementedError('Method not implemented!')
 
+    def GetBlockRange(self, request, context):
+      context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+      context.set_details('Method not implemented!')
+      raise NotImplementedError('Method not implemented!')
+
     def Query(self, request, context):
       context.set_code(grpc.StatusCode.UNIMPLEMENTED)
       context.set_details('Method not implemented!')
@@ -2184,6 +2414,11 @@ try:
       context.set_details('Method not implemented!')
       raise NotImplementedError('Method not implemented!')
 
+    def GetMerkleProof(self, request, context):
+      context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+      context.set_details('Method not implemented!')
+      raise NotImplementedError('Method not implemented!')
+
     def BlockSync(self, request, context):
       """Peer 의 Block Height 보정용 interface
       """
@@ -2302,6 +2537,11 @@ try:
             request_deserializer=GetBlockRequest.FromString,
             response_serializer=GetBlockReply.SerializeToString,
         ),
+        'GetBlockRange': grpc.unary_stream_rpc_method_handler(
+            servicer.GetBlockRange,
+            request_deserializer=GetBlockRangeRequest.FromString,
+            response_serializer=GetBlockReply.SerializeToString,
+        ),
         'Query': grpc.unary_unary_rpc_method_handler(
             servicer.Query,
             request_deserializer=QueryRequest.FromString,
@@ -2312,6 +2552,11 @@ try:
             request_deserializer=GetInvokeResultRequest.FromString,
             response_serializer=GetInvokeResultReply.SerializeToString,
         ),
+        'GetMerkleProof': grpc.unary_unary_rpc_method_handler(
+            servicer.GetMerkleProof,
+            request_deserializer=GetMerkleProofRequest.FromString,
+            response_serializer=GetMerkleProofReply.SerializeToString,
+        ),
         'BlockSync': grpc.unary_unary_rpc_method_handler(
             servicer.BlockSync,
             request_deserializer=BlockSyncRequest.FromString,
@@ -2874,10 +3119,14 @@ try:
       context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
     def GetBlock(self, request, context):
       context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
+    def GetBlockRange(self, request, context):
+      context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
     def Query(self, request, context):
       context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
     def GetInvokeResult(self, request, context):
       context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
+    def GetMerkleProof(self, request, context):
+      context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
     def BlockSync(self, request, context):
       """Peer 의 Block Height 보정용 interface
       """
@@ -2950,12 +3199,17 @@ try:
     def GetBlock(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
       raise NotImplementedError()
     GetBlock.future = None
+    def GetBlockRange(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
+      raise NotImplementedError()
     def Query(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
       raise NotImplementedError()
     Query.future = None
     def GetInvokeResult(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
       raise NotImplementedError()
     GetInvokeResult.future = None
+    def GetMerkleProof(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
+      raise NotImplementedError()
+    GetMerkleProof.future = None
     def BlockSync(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
       """Peer 의 Block Height 보정용 interface
       """
@@ -3030,8 +3284,10 @@ try:
       ('PeerService', 'CreateTx'): CreateTxRequest.FromString,
       ('PeerService', 'Echo'): CommonRequest.FromString,
       ('PeerService', 'GetBlock'): GetBlockRequest.FromString,
+      ('PeerService', 'GetBlockRange'): GetBlockRangeRequest.FromString,
       ('PeerService', 'GetInvokeResult'): GetInvokeResultRequest.FromString,
       ('PeerService', 'GetLastBlockHash'): CommonRequest.FromString,
+      ('PeerService', 'GetMerkleProof'): GetMerkleProofRequest.FromString,
       ('PeerService', 'GetScoreStatus'): StatusRequest.FromString,
       ('PeerService', 'GetStatus'): StatusRequest.FromString,
       ('PeerService', 'GetTx'): GetTxRequest.FromString,
@@ -3054,8 +3310,10 @@ try:
       ('PeerService', 'CreateTx'): CreateTxReply.SerializeToString,
       ('PeerService', 'Echo'): CommonReply.SerializeToString,
       ('PeerService', 'GetBlock'): GetBlockReply.SerializeToString,
+      ('PeerService', 'GetBlockRange'): GetBlockReply.SerializeToString,
       ('PeerService', 'GetInvokeResult'): GetInvokeResultReply.SerializeToString,
       ('PeerService', 'GetLastBlockHash'): BlockReply.SerializeToString,
+      ('PeerService', 'GetMerkleProof'): GetMerkleProofReply.SerializeToString,
       ('PeerService', 'GetScoreStatus'): StatusReply.SerializeToString,
       ('PeerService', 'GetStatus'): StatusReply.SerializeToString,
       ('PeerService', 'GetTx'): GetTxReply.SerializeToString,
@@ -3078,8 +3336,10 @@ try:
       ('PeerService', 'CreateTx'): face_utilities.unary_unary_inline(servicer.CreateTx),
       ('PeerService', 'Echo'): face_utilities.unary_unary_inline(servicer.Echo),
       ('PeerService', 'GetBlock'): face_utilities.unary_unary_inline(servicer.GetBlock),
+      ('PeerService', 'GetBlockRange'): face_utilities.unary_stream_inline(servicer.GetBlockRange),
       ('PeerService', 'GetInvokeResult'): face_utilities.unary_unary_inline(servicer.GetInvokeResult),
       ('PeerService', 'GetLastBlockHash'): face_utilities.unary_unary_inline(servicer.GetLastBlockHash),
+      ('PeerService', 'GetMerkleProof'): face_utilities.unary_unary_inline(servicer.GetMerkleProof),
       ('PeerService', 'GetScoreStatus'): face_utilities.unary_unary_inline(servicer.GetScoreStatus),
       ('PeerService', 'GetStatus'): face_utilities.unary_unary_inline(servicer.GetStatus),
       ('PeerService', 'GetTx'): face_utilities.unary_unary_inline(servicer.GetTx),
@@ -3112,8 +3372,10 @@ try:
       ('PeerService', 'CreateTx'): CreateTxRequest.SerializeToString,
       ('PeerService', 'Echo'): CommonRequest.SerializeToString,
       ('PeerService', 'GetBlock'): GetBlockRequest.SerializeToString,
+      ('PeerService', 'GetBlockRange'): GetBlockRangeRequest.SerializeToString,
       ('PeerService', 'GetInvokeResult'): GetInvokeResultRequest.SerializeToString,
       ('PeerService', 'GetLastBlockHash'): CommonRequest.SerializeToString,
+      ('PeerService', 'GetMerkleProof'): GetMerkleProofRequest.SerializeToString,
       ('PeerService', 'GetScoreStatus'): StatusRequest.SerializeToString,
       ('PeerService', 'GetStatus'): StatusRequest.SerializeToString,
       ('PeerService', 'GetTx'): GetTxRequest.SerializeToString,
@@ -3136,8 +3398,10 @@ try:
       ('PeerService', 'CreateTx'): CreateTxReply.FromString,
       ('PeerService', 'Echo'): CommonReply.FromString,
       ('PeerService', 'GetBlock'): GetBlockReply.FromString,
+      ('PeerService', 'GetBlockRange'): GetBlockReply.FromString,
       ('PeerService', 'GetInvokeResult'): GetInvokeResultReply.FromString,
       ('PeerService', 'GetLastBlockHash'): BlockReply.FromString,
+      ('PeerService', 'GetMerkleProof'): GetMerkleProofReply.FromString,
       ('PeerService', 'GetScoreStatus'): StatusReply.FromString,
       ('PeerService', 'GetStatus'): StatusReply.FromString,
       ('PeerService', 'GetTx'): GetTxReply.FromString,
@@ -3160,8 +3424,10 @@ try:
       'CreateTx': cardinality.Cardinality.UNARY_UNARY,
       'Echo': cardinality.Cardinality.UNARY_UNARY,
       'GetBlock': cardinality.Cardinality.UNARY_UNARY,
+      'GetBlockRange': cardinality.Cardinality.UNARY_STREAM,
       'GetInvokeResult': cardinality.Cardinality.UNARY_UNARY,
       'GetLastBlockHash': cardinality.Cardinality.UNARY_UNARY,
+      'GetMerkleProof': cardinality.Cardinality.UNARY_UNARY,
       'GetScoreStatus': cardinality.Cardinality.UNARY_UNARY,
       'GetStatus': cardinality.Cardinality.UNARY_UNARY,
       'GetTx': cardinality.Cardinality.UNARY_UNARY,
@@ -247,6 +247,11 @@ class PeerServiceStub(object):
         request_serializer=loopchain__pb2.GetBlockRequest.SerializeToString,
         response_deserializer=loopchain__pb2.GetBlockReply.FromString,
         )
+    self.GetBlockRange = channel.unary_stream(
+        '/PeerService/GetBlockRange',
+        request_serializer=loopchain__pb2.GetBlockRangeRequest.SerializeToString,
+        response_deserializer=loopchain__pb2.GetBlockReply.FromString,
+        )
     self.Query = channel.unary_unary(
         '/PeerService/Query',
         request_serializer=loopchain__pb2.QueryRequest.SerializeToString,
@@ -257,6 +262,11 @@ class PeerServiceStub(object):
         request_serializer=loopchain__pb2.GetInvokeResultRequest.SerializeToString,
         response_deserializer=loopchain__pb2.GetInvokeResultReply.FromString,
         )
+    self.GetMerkleProof = channel.unary_unary(
+        '/PeerService/GetMerkleProof',
+        request_serializer=loopchain__pb2.GetMerkleProofRequest.SerializeToString,
+        response_deserializer=loopchain__pb2.GetMerkleProofReply.FromString,
+        )
     self.BlockSync = channel.unary_unary(
         '/PeerService/BlockSync',
         request_serializer=loopchain__pb2.BlockSyncRequest.SerializeToString,
@@ -363,6 +373,11 @@ class PeerServiceServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetBlockRange(self, request, context):
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def Query(self, request, context):
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
     context.set_details('Method not implemented!')
@@ -373,6 +388,11 @@ class PeerServiceServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GetMerkleProof(self, request, context):
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def BlockSync(self, request, context):
     """Peer 의 Block Height 보정용 interface
     """
@@ -491,6 +511,11 @@ def add_PeerServiceServicer_to_server(servicer, server):
           request_deserializer=loopchain__pb2.GetBlockRequest.FromString,
           response_serializer=loopchain__pb2.GetBlockReply.SerializeToString,
       ),
+      'GetBlockRange': grpc.unary_stream_rpc_method_handler(
+          servicer.GetBlockRange,
+          request_deserializer=loopchain__pb2.GetBlockRangeRequest.FromString,
+          response_serializer=loopchain__pb2.GetBlockReply.SerializeToString,
+      ),
       'Query': grpc.unary_unary_rpc_method_handler(
           servicer.Query,
           request_deserializer=loopchain__pb2.QueryRequest.FromString,
@@ -501,6 +526,11 @@ def add_PeerServiceServicer_to_server(servicer, server):
           request_deserializer=loopchain__pb2.GetInvokeResultRequest.FromString,
           response_serializer=loopchain__pb2.GetInvokeResultReply.SerializeToString,
       ),
+      'GetMerkleProof': grpc.unary_unary_rpc_method_handler(
+          servicer.GetMerkleProof,
+          request_deserializer=loopchain__pb2.GetMerkleProofRequest.FromString,
+          response_serializer=loopchain__pb2.GetMerkleProofReply.SerializeToString,
+      ),
       'BlockSync': grpc.unary_unary_rpc_method_handler(
           servicer.BlockSync,
           request_deserializer=loopchain__pb2.BlockSyncRequest.FromString,
@@ -78,6 +78,8 @@ class Response(IntEnum):
     fail_wrong_subscribe_info = -8
     fail_connect_to_leader = -9
     fail_add_tx_to_leader = -10
+    fail_mempool_full = -11
+    fail_duplicate_tx = -12
     fail_no_peer_info_in_rs = -800
     timeout_exceed = -900
     not_treat_message_code = -999
@@ -96,6 +98,8 @@ responseCodeMap = {
     Response.fail_wrong_subscribe_info: (Response.fail_wrong_subscribe_info,    "fail wrong subscribe info"),
     Response.fail_connect_to_leader:    (Response.fail_connect_to_leader,       "fail connect to leader"),
     Response.fail_add_tx_to_leader:     (Response.fail_add_tx_to_leader,        "fail add tx to leader"),
+    Response.fail_mempool_full:         (Response.fail_mempool_full,            "fail mempool is full"),
+    Response.fail_duplicate_tx:         (Response.fail_duplicate_tx,            "fail duplicate tx"),
     Response.fail_no_peer_info_in_rs:   (Response.fail_no_peer_info_in_rs,      "fail no peer info in radio station"),
     Response.timeout_exceed:            (Response.timeout_exceed,               "timeout exceed")
 }
@@ -83,6 +83,9 @@ class ServerComponents(metaclass=SingletonMetaClass):
     def set_argument(self):
         self.__parser.add_argument('hash')
         self.__parser.add_argument('channel')
+        self.__parser.add_argument('height', type=int)
+        self.__parser.add_argument('count', type=int)
+        self.__parser.add_argument('index', type=int, action='append')
 
     def set_resource(self):
         self.__api.add_resource(Query, '/api/v1/query')
@@ -90,6 +93,8 @@ class ServerComponents(metaclass=SingletonMetaClass):
         self.__api.add_resource(Status, '/api/v1/status/peer')
         self.__api.add_resource(ScoreStatus, '/api/v1/status/score')
         self.__api.add_resource(Blocks, '/api/v1/blocks')
+        self.__api.add_resource(BlockRange, '/api/v1/blocks/range')
+        self.__api.add_resource(MerkleProof, '/api/v1/blocks/merkle_proof')
         self.__api.add_resource(InvokeResult, '/api/v1/transactions/result')
 
     def query(self, data, channel):
@@ -133,6 +138,32 @@ class ServerComponents(metaclass=SingletonMetaClass):
 
         return response
 
+    def get_block_range(self, start_height, end_height=-1,
+                        block_data_filter="prev_block_hash, height, block_hash",
+                        tx_data_filter="tx_hash",
+                        channel=conf.LOOPCHAIN_DEFAULT_CHANNEL):
+
+        return self.__stub_to_peer_service.GetBlockRange(
+            loopchain_pb2.GetBlockRangeRequest(
+                start_height=start_height,
+                end_height=end_height,
+                block_data_filter=block_data_filter,
+                tx_data_filter=tx_data_filter,
+                channel=channel),
+                self.REST_GRPC_TIMEOUT
+            )
+
+    def get_merkle_proof(self, tx_indices, block_hash="", block_height=-1,
+                         channel=conf.LOOPCHAIN_DEFAULT_CHANNEL):
+        return self.__stub_to_peer_service.GetMerkleProof(
+            loopchain_pb2.GetMerkleProofRequest(
+                block_hash=block_hash,
+                block_height=block_height,
+                tx_indices=tx_indices,
+                channel=channel),
+                self.REST_GRPC_TIMEOUT
+            )
+
     def get_last_block_hash(self, channel):
         response = self.__stub_to_peer_service.GetLastBlockHash(
             loopchain_pb2.CommonRequest(request="", channel=channel), self.REST_GRPC_TIMEOUT)
@@ -318,6 +349,75 @@ class Blocks(Resource):
         return block_data
 
 
+class BlockRange(Resource):
+    def get(self):
+        """height 부터 count 개의 block 을 조회한다.
+        응답의 next_height 로 다음 page 를 조회할 수 있으며 마지막 page 이면 next_height 는 -1 이다.
+        """
+        args = ServerComponents().parser.parse_args()
+        channel = get_channel_name_from_args(args)
+        start_height = (args['height'], 0)[args['height'] is None]
+        count = (args['count'], conf.REST_BLOCK_RANGE_PAGE_SIZE)[args['count'] is None]
+        count = min(max(count, 1), conf.REST_BLOCK_RANGE_MAX_PAGE_SIZE)
+
+        # 다음 page 가 있는지 알기 위해 한 개의 block 을 더 조회한다.
+        responses = ServerComponents().get_block_range(start_height=start_height,
+                                                       end_height=start_height + count,
+                                                       block_data_filter="prev_block_hash, merkle_tree_root_hash, \
+                                                       time_stamp, height, peer_id",
+                                                       tx_data_filter="",
+                                                       channel=channel)
+        blocks = []
+        next_height = -1
+        for response in responses:
+            if len(blocks) == count:
+                next_height = start_height + count
+                responses.cancel()
+                break
+
+            block_data = json.loads('{}')
+            block_data['block_hash'] = response.block_hash
+            block_data['block_data_json'] = json.loads(response.block_data_json)
+            blocks.append(block_data)
+
+        block_range_data = json.loads('{}')
+        block_range_data['response_code'] = message_code.Response.success
+        block_range_data['blocks'] = blocks
+        block_range_data['next_height'] = next_height
+
+        return block_range_data
+
+
+class MerkleProof(Resource):
+    def get(self):
+        """hash (or height) 의 block 에서 index 로 지정한 tx 들의 merkle proof 를 한 번에 조회한다.
+        index 는 여러 번 지정할 수 있다. (?height=10&index=0&index=3)
+        """
+        args = ServerComponents().parser.parse_args()
+        channel = get_channel_name_from_args(args)
+        tx_indices = (args['index'], [])[args['index'] is None]
+        if len(tx_indices) == 0 or len(tx_indices) > conf.REST_MERKLE_PROOF_MAX_TX_COUNT:
+            return {'response_code': message_code.Response.fail,
+                    'message': f"count of index should be 1 ~ {conf.REST_MERKLE_PROOF_MAX_TX_COUNT}"}
+
+        response = ServerComponents().get_merkle_proof(tx_indices,
+                                                       block_hash=(args['hash'], "")[args['hash'] is None],
+                                                       block_height=(args['height'], -1)[args['height'] is None],
+                                                       channel=channel)
+
+        proof_data = json.loads('{}')
+        proof_data['response_code'] = response.response_code
+        proof_data['block_hash'] = response.block_hash
+        if response.response_code == message_code.Response.success:
+            proof_data['merkle_tree_root_hash'] = response.merkle_tree_root_hash
+            proof_data['merkle_version'] = response.merkle_version
+            proof_data['tx_count'] = response.tx_count
+            proof_data['tx_indices'] = list(response.tx_indices)
+            proof_data['tx_hashes'] = list(response.tx_hashes)
+            proof_data['nodes'] = list(response.nodes)
+
+        return proof_data
+
 
 class RestServer(CommonThread):
     def __init__(self, peer_port, peer_ip_address=None):
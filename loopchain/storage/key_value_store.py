@@ -0,0 +1,126 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A base class of key value store for the block db"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class KeyValueStoreError(Exception):
+    """key value store 를 열거나 만들 수 없는 경우
+    """
+    pass
+
+
+class KeyValueWriteBatch:
+    """여러 Put, Delete 를 모아서 KeyValueStore.Write 로 한 번에 기록한다.
+    leveldb.WriteBatch 와 같은 method 를 가진다.
+    """
+
+    def __init__(self):
+        # [(key, value)], value 가 None 이면 Delete
+        self.__operations = []
+
+    def Put(self, key, value):
+        self.__operations.append((bytes(key), bytes(value)))
+
+    def Delete(self, key):
+        self.__operations.append((bytes(key), None))
+
+    @property
+    def operations(self):
+        return self.__operations
+
+
+class KeyValueSnapshot(metaclass=ABCMeta):
+    """KeyValueStore.CreateSnapshot 을 호출한 시점의 읽기 전용 view
+    """
+
+    @abstractmethod
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        pass
+
+    @abstractmethod
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        pass
+
+    def Release(self):
+        """snapshot 이 잡고 있는 자원을 돌려준다.
+        """
+        pass
+
+
+class KeyValueStore(metaclass=ABCMeta):
+    """block db 로 사용하는 key value store
+    기존 코드가 leveldb.LevelDB 를 그대로 사용하던 것과 호환되도록 py-leveldb 와 같은 method 이름과 동작을 따른다.
+    Get 은 key 가 없으면 KeyError 를 내고, RangeIter 는 key_from, key_to 를 모두 포함하여 key 순서대로 돌려준다.
+    """
+
+    @abstractmethod
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        """key 의 value 를 구한다.
+
+        :param key: bytes
+        :param verify_checksums: 지원하는 store 에서만 사용한다.
+        :param fill_cache: False 이면 읽은 값을 store 의 cache 에 남기지 않는다. (지원하는 store 에서만)
+        :return: value (bytes-like), key 가 없으면 KeyError
+        """
+        pass
+
+    @abstractmethod
+    def Put(self, key, value, sync=False):
+        pass
+
+    @abstractmethod
+    def Delete(self, key, sync=False):
+        pass
+
+    def WriteBatch(self):
+        """이 store 의 Write 에 넘길 batch 를 만든다.
+
+        :return: Put, Delete 를 가진 batch
+        """
+        return KeyValueWriteBatch()
+
+    @abstractmethod
+    def Write(self, batch, sync=False):
+        """batch 의 Put, Delete 를 모두 기록하거나 하나도 기록하지 않는다.
+
+        :param batch: WriteBatch() 로 만든 batch
+        :param sync: True 이면 기록한 내용이 disk 에 반영된 다음 return 한다.
+        """
+        pass
+
+    @abstractmethod
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        """key_from 부터 key_to 까지 key 순서대로 돌려준다.
+
+        :return: generator of (key, value) 또는 include_value 가 False 이면 key
+        """
+        pass
+
+    @abstractmethod
+    def CreateSnapshot(self):
+        """지금 시점의 읽기 전용 snapshot 을 만든다. 이후의 기록은 snapshot 에 보이지 않는다.
+
+        :return: KeyValueSnapshot
+        """
+        pass
+
+    def CompactRange(self, start=None, end=None):
+        """지운 key 가 차지하는 공간을 정리한다.
+        """
+        pass
+
+    def Close(self):
+        pass
@@ -0,0 +1,81 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A key value store on LevelDB"""
+
+import leveldb
+
+from loopchain.storage.key_value_store import KeyValueSnapshot, KeyValueStore, KeyValueStoreError
+
+
+class LevelDBSnapshot(KeyValueSnapshot):
+
+    def __init__(self, snapshot):
+        self.__snapshot = snapshot
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        return self.__snapshot.Get(key, verify_checksums, fill_cache)
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        return self.__snapshot.RangeIter(key_from=key_from, key_to=key_to, include_value=include_value,
+                                         fill_cache=fill_cache, reverse=reverse)
+
+    def Release(self):
+        self.__snapshot = None
+
+
+class LevelDBStore(KeyValueStore):
+    """leveldb.LevelDB 를 KeyValueStore 로 사용한다.
+    """
+
+    def __init__(self, level_db):
+        """
+        :param level_db: leveldb.LevelDB
+        """
+        self.__level_db = level_db
+
+    @staticmethod
+    def open(db_path, create_if_missing=True):
+        try:
+            return LevelDBStore(leveldb.LevelDB(db_path, create_if_missing=create_if_missing))
+        except leveldb.LevelDBError as e:
+            raise KeyValueStoreError(f"Fail To Create Level DB(path): {db_path}, {e}")
+
+    @property
+    def level_db(self):
+        return self.__level_db
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        return self.__level_db.Get(key, verify_checksums, fill_cache)
+
+    def Put(self, key, value, sync=False):
+        self.__level_db.Put(key, value, sync=sync)
+
+    def Delete(self, key, sync=False):
+        self.__level_db.Delete(key, sync=sync)
+
+    def WriteBatch(self):
+        return leveldb.WriteBatch()
+
+    def Write(self, batch, sync=False):
+        self.__level_db.Write(batch, sync=sync)
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        return self.__level_db.RangeIter(key_from=key_from, key_to=key_to, include_value=include_value,
+                                         fill_cache=fill_cache, reverse=reverse)
+
+    def CreateSnapshot(self):
+        return LevelDBSnapshot(self.__level_db.CreateSnapshot())
+
+    def CompactRange(self, start=None, end=None):
+        self.__level_db.CompactRange(start=start, end=end)
@@ -0,0 +1,99 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A key value store in memory for tests and benchmarks"""
+
+import bisect
+import threading
+
+from loopchain.storage.key_value_store import KeyValueSnapshot, KeyValueStore
+
+
+def _range_keys(keys, key_from, key_to, reverse):
+    """정렬된 keys 에서 key_from 부터 key_to 까지 (양쪽 포함) 의 key 목록을 구한다.
+    """
+    start = 0 if key_from is None else bisect.bisect_left(keys, bytes(key_from))
+    end = len(keys) if key_to is None else bisect.bisect_right(keys, bytes(key_to))
+    range_keys = keys[start:end]
+    if reverse:
+        range_keys.reverse()
+    return range_keys
+
+
+class MemorySnapshot(KeyValueSnapshot):
+
+    def __init__(self, values, keys):
+        self.__values = values
+        self.__keys = keys
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        return self.__values[bytes(key)]
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        for key in _range_keys(self.__keys, key_from, key_to, reverse):
+            yield (key, (key, self.__values[key]))[include_value]
+
+
+class MemoryStore(KeyValueStore):
+    """dict 와 정렬된 key 목록으로 만든 key value store
+    process 가 끝나면 사라지므로 test, benchmark, consensus 시험에서 disk I/O 없이 blockchain 을 사용하기 위한 것이다.
+    """
+
+    def __init__(self):
+        self.__values = {}
+        # RangeIter 를 위해 key 를 정렬된 상태로 유지한다.
+        self.__keys = []
+        self.__lock = threading.Lock()
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        return self.__values[bytes(key)]
+
+    def Put(self, key, value, sync=False):
+        with self.__lock:
+            self.__put(bytes(key), bytes(value))
+
+    def Delete(self, key, sync=False):
+        with self.__lock:
+            self.__delete(bytes(key))
+
+    def Write(self, batch, sync=False):
+        with self.__lock:
+            for key, value in batch.operations:
+                if value is None:
+                    self.__delete(key)
+                else:
+                    self.__put(key, value)
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        with self.__lock:
+            range_keys = _range_keys(self.__keys, key_from, key_to, reverse)
+
+        for key in range_keys:
+            try:
+                yield (key, (key, self.__values[key]))[include_value]
+            except KeyError:
+                # 순회하는 중에 지워진 key
+                continue
+
+    def CreateSnapshot(self):
+        with self.__lock:
+            return MemorySnapshot(dict(self.__values), list(self.__keys))
+
+    def __put(self, key, value):
+        if key not in self.__values:
+            bisect.insort(self.__keys, key)
+        self.__values[key] = value
+
+    def __delete(self, key):
+        if self.__values.pop(key, None) is not None:
+            del self.__keys[bisect.bisect_left(self.__keys, key)]
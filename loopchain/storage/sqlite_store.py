@@ -0,0 +1,187 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A key value store on sqlite3 with write-ahead logging"""
+
+import os
+import sqlite3
+import threading
+
+from loopchain.storage.key_value_store import KeyValueSnapshot, KeyValueStore, KeyValueStoreError
+
+
+def _range_query(connection, key_from, key_to, include_value, reverse, fetch_count, lock=None):
+    """key_from 부터 key_to 까지 (양쪽 포함) fetch_count 개씩 나누어 읽는다.
+    한 번에 읽은 다음 lock 을 놓으므로 순회하는 동안 다른 thread 의 기록을 막지 않는다.
+    """
+    columns = ("key", "key, value")[include_value]
+    order, next_condition = (("ASC", "key > ?"), ("DESC", "key < ?"))[reverse]
+    conditions = []
+    params = []
+    if key_from is not None:
+        conditions.append("key >= ?")
+        params.append(bytes(key_from))
+    if key_to is not None:
+        conditions.append("key <= ?")
+        params.append(bytes(key_to))
+
+    last_key = None
+    while True:
+        query_conditions = list(conditions)
+        query_params = list(params)
+        if last_key is not None:
+            query_conditions.append(next_condition)
+            query_params.append(last_key)
+        where = ("", " WHERE " + " AND ".join(query_conditions))[len(query_conditions) > 0]
+        query = f"SELECT {columns} FROM kv{where} ORDER BY key {order} LIMIT {fetch_count}"
+
+        if lock is None:
+            rows = connection.execute(query, query_params).fetchall()
+        else:
+            with lock:
+                rows = connection.execute(query, query_params).fetchall()
+
+        for row in rows:
+            yield (row[0], row)[include_value]
+
+        if len(rows) < fetch_count:
+            return
+        last_key = rows[-1][0]
+
+
+class SqliteSnapshot(KeyValueSnapshot):
+    """읽기 transaction 을 열어 둔 별도의 connection, WAL mode 에서는 이후의 commit 이 보이지 않는다.
+    """
+
+    def __init__(self, connection, fetch_count):
+        self.__connection = connection
+        self.__fetch_count = fetch_count
+        self.__lock = threading.Lock()
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        with self.__lock:
+            row = self.__connection.execute("SELECT value FROM kv WHERE key = ?", (bytes(key), )).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        return _range_query(self.__connection, key_from, key_to, include_value, reverse, self.__fetch_count,
+                            self.__lock)
+
+    def Release(self):
+        if self.__connection is not None:
+            self.__connection.execute("COMMIT")
+            self.__connection.close()
+            self.__connection = None
+
+    def __del__(self):
+        try:
+            self.Release()
+        except sqlite3.Error:
+            pass
+
+
+class SqliteStore(KeyValueStore):
+    """sqlite3 의 (key, value) table 을 key value store 로 사용한다.
+    journal_mode 를 WAL 로 하여 읽기가 기록을 기다리지 않게 하고,
+    sync 가 아닌 기록은 synchronous=NORMAL 로 commit 하여 매번 fsync 하지 않는다.
+    """
+
+    DB_FILE_NAME = "kv.sqlite3"
+    # RangeIter 에서 한 번에 읽는 row 의 갯수
+    FETCH_COUNT = 256
+
+    def __init__(self, db_path, create_if_missing=True):
+        """
+        :param db_path: sqlite3 파일을 둘 directory
+        :param create_if_missing: False 이면 이미 있는 db 만 연다.
+        """
+        self.__db_file = os.path.join(db_path, SqliteStore.DB_FILE_NAME)
+        if not os.path.exists(self.__db_file):
+            if not create_if_missing:
+                raise KeyValueStoreError(f"There is no sqlite db(path): {db_path}")
+            os.makedirs(db_path, exist_ok=True)
+
+        self.__lock = threading.Lock()
+        try:
+            self.__connection = self.__connect()
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS kv (key BLOB PRIMARY KEY, value BLOB NOT NULL) "
+                                      "WITHOUT ROWID")
+        except sqlite3.Error as e:
+            raise KeyValueStoreError(f"Fail To Create sqlite db(path): {db_path}, {e}")
+
+    def __connect(self):
+        # isolation_level None: BEGIN, COMMIT 을 직접 관리한다.
+        connection = sqlite3.connect(self.__db_file, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        with self.__lock:
+            row = self.__connection.execute("SELECT value FROM kv WHERE key = ?", (bytes(key), )).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def Put(self, key, value, sync=False):
+        batch = self.WriteBatch()
+        batch.Put(key, value)
+        self.Write(batch, sync)
+
+    def Delete(self, key, sync=False):
+        batch = self.WriteBatch()
+        batch.Delete(key)
+        self.Write(batch, sync)
+
+    def Write(self, batch, sync=False):
+        with self.__lock:
+            if sync:
+                self.__connection.execute("PRAGMA synchronous=FULL")
+            try:
+                self.__connection.execute("BEGIN IMMEDIATE")
+                try:
+                    for key, value in batch.operations:
+                        if value is None:
+                            self.__connection.execute("DELETE FROM kv WHERE key = ?", (key, ))
+                        else:
+                            self.__connection.execute("INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)",
+                                                      (key, value))
+                    self.__connection.execute("COMMIT")
+                except BaseException:
+                    self.__connection.execute("ROLLBACK")
+                    raise
+            finally:
+                if sync:
+                    self.__connection.execute("PRAGMA synchronous=NORMAL")
+
+    def RangeIter(self, key_from=None, key_to=None, include_value=True, fill_cache=True, reverse=False):
+        return _range_query(self.__connection, key_from, key_to, include_value, reverse, SqliteStore.FETCH_COUNT,
+                            self.__lock)
+
+    def CreateSnapshot(self):
+        connection = self.__connect()
+        # 첫 SELECT 에서 읽기 transaction 이 시작되며 이 시점의 WAL 까지만 보인다.
+        connection.execute("BEGIN")
+        connection.execute("SELECT 1 FROM kv LIMIT 1").fetchall()
+        return SqliteSnapshot(connection, SqliteStore.FETCH_COUNT)
+
+    def CompactRange(self, start=None, end=None):
+        with self.__lock:
+            self.__connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.__connection.execute("VACUUM")
+
+    def Close(self):
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,51 @@
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Open a key value store by the configured type"""
+
+from loopchain import configure as conf
+from loopchain.storage.key_value_store import KeyValueStore, KeyValueStoreError
+from loopchain.storage.leveldb_store import LevelDBStore
+from loopchain.storage.memory_store import MemoryStore
+from loopchain.storage.sqlite_store import SqliteStore
+
+
+def open_key_value_store(db_path, store_type=None, create_if_missing=True):
+    """store_type 의 key value store 를 연다.
+
+    :param db_path: db 의 path (memory 인 경우 사용하지 않는다.)
+    :param store_type: conf.KeyValueStoreType 의 이름, None 이면 conf.BLOCK_DB_STORE_TYPE
+    :param create_if_missing: False 이면 이미 있는 db 만 연다.
+    :return: KeyValueStore
+    """
+    store_type = (store_type, conf.BLOCK_DB_STORE_TYPE)[store_type is None]
+
+    if store_type == conf.KeyValueStoreType.leveldb.name:
+        return LevelDBStore.open(db_path, create_if_missing)
+    elif store_type == conf.KeyValueStoreType.memory.name:
+        return MemoryStore()
+    elif store_type == conf.KeyValueStoreType.sqlite3.name:
+        return SqliteStore(db_path, create_if_missing)
+
+    raise KeyValueStoreError(f"unknown key value store type({store_type})")
+
+
+def as_key_value_store(db):
+    """leveldb.LevelDB 를 그대로 넘기던 기존 코드를 위해 KeyValueStore 가 아니면 LevelDBStore 로 감싼다.
+
+    :param db: KeyValueStore or leveldb.LevelDB
+    :return: KeyValueStore
+    """
+    if isinstance(db, KeyValueStore):
+        return db
+    return LevelDBStore(db)
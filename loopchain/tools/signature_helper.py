@@ -13,7 +13,10 @@
 # limitations under the License.
 """Signature Helper for Tx, Vote, Block Signature verify"""
 
+import collections
 import logging
+import threading
+import time
 
 import binascii
 from cryptography import x509
@@ -24,6 +27,8 @@ from cryptography.hazmat.primitives.asymmetric import ec, utils, rsa, padding
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 from cryptography.x509 import Certificate
 
+from loopchain import configure as conf
+
 
 class PublicVerifier:
     """ provide singnature verify function using public key"""
@@ -122,22 +127,114 @@ class PublicVerifier:
 
 
 class PublicVerifierContainer:
-    """ PublicVerifier Container for many usaged """
+    """ PublicVerifier Container for many usaged
+    DER 을 parse 한 PublicVerifier 를 public key 별로 보관하는 LRU cache.
+    client 의 public key 는 계속 늘어나므로 conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT 개까지만 보관하며,
+    peer 의 cert 는 warm_up 으로 미리 만들어 두고 LRU 에서 제거하지 않는다.
+    gRPC worker thread 들이 함께 사용하므로 lock 으로 보호한다.
+    """
 
-    __public_verifier = {}
+    __public_verifier = collections.OrderedDict()  # serialized_public : PublicVerifier (LRU)
+    __pinned_public_verifier = {}  # serialized_public : PublicVerifier (peer cert)
+    __lock = threading.Lock()
 
-    # TODO Private BlockChain은 public key가 제한적이라 다 보관, 그러나 다른경우는 어떻게 해야할지 고민 필요
-    # TODO 많이 쓰는 것만 남기는 로직을 추가하면 그 때 그떄 생성하는 것보다 더 느릴 수 있음
+    __hit = 0
+    __miss = 0
+    __eviction = 0
+    __parse_count = 0
+    __parse_fail = 0
+    __parse_time = 0.0
 
     @classmethod
     def get_public_verifier(cls, serialized_public: bytes) -> PublicVerifier:
-        try:
-            public_verifier = cls.__public_verifier[serialized_public]
-        except KeyError as e:
-            public_verifier = cls.__create_public_verifier(serialized_public)
+        with cls.__lock:
+            public_verifier = cls.__pinned_public_verifier.get(serialized_public)
+            if public_verifier is None:
+                public_verifier = cls.__public_verifier.get(serialized_public)
+                if public_verifier is not None:
+                    cls.__public_verifier.move_to_end(serialized_public)
+
+            if public_verifier is not None:
+                cls.__hit += 1
+                return public_verifier
+            cls.__miss += 1
+
+        # DER parse 는 lock 밖에서 한다. (같은 key 를 동시에 parse 하면 먼저 넣은 것을 쓴다.)
+        public_verifier = cls.__create_public_verifier(serialized_public)
+
+        max_count = conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT
+        if max_count <= 0:
+            return public_verifier
+
+        with cls.__lock:
+            public_verifier = cls.__public_verifier.setdefault(serialized_public, public_verifier)
+            cls.__public_verifier.move_to_end(serialized_public)
+
+            while len(cls.__public_verifier) > max_count:
+                cls.__public_verifier.popitem(last=False)
+                cls.__eviction += 1
 
         return public_verifier
 
+    @classmethod
+    def warm_up(cls, serialized_publics):
+        """peer 의 cert 로 PublicVerifier 를 미리 만들어 둔다. (LRU 에서 제거되지 않는다.)
+
+        :param serialized_publics: der public key 목록, 비어 있거나 parse 할 수 없는 key 는 건너뛴다.
+        :return: 새로 만든 PublicVerifier 의 갯수
+        """
+        created_count = 0
+        for serialized_public in serialized_publics:
+            if not serialized_public or not isinstance(serialized_public, bytes):
+                continue
+
+            with cls.__lock:
+                if serialized_public in cls.__pinned_public_verifier:
+                    continue
+                public_verifier = cls.__public_verifier.pop(serialized_public, None)
+
+            if public_verifier is None:
+                try:
+                    public_verifier = cls.__create_public_verifier(serialized_public)
+                except Exception as e:
+                    logging.warning(f"fail to warm up public verifier : {e}")
+                    continue
+                created_count += 1
+
+            with cls.__lock:
+                cls.__pinned_public_verifier[serialized_public] = public_verifier
+
+        return created_count
+
+    @classmethod
+    def clear(cls):
+        """보관한 PublicVerifier 를 모두 지운다. (counter 는 유지한다.)
+        """
+        with cls.__lock:
+            cls.__public_verifier.clear()
+            cls.__pinned_public_verifier.clear()
+
+    @classmethod
+    def get_status(cls):
+        """cache 의 상태 (GetStatus 에 포함된다.)
+
+        :return: dict of count, pinned_count, hit, miss, eviction, hit_rate, parse_count, parse_fail,
+        average_parse_time
+        """
+        with cls.__lock:
+            request_count = cls.__hit + cls.__miss
+            return {
+                'count': len(cls.__public_verifier),
+                'pinned_count': len(cls.__pinned_public_verifier),
+                'hit': cls.__hit,
+                'miss': cls.__miss,
+                'eviction': cls.__eviction,
+                'hit_rate': (cls.__hit / request_count) if request_count > 0 else 0.0,
+                'parse_count': cls.__parse_count,
+                'parse_fail': cls.__parse_fail,
+                'average_parse_time': (cls.__parse_time / cls.__parse_count) if cls.__parse_count > 0 else 0.0
+            }
+
     @classmethod
     def __create_public_verifier(cls, serialized_public: bytes) -> PublicVerifier:
         """ create Public Verifier use serialized_public
@@ -145,8 +242,17 @@ class PublicVerifierContainer:
         :param serialized_public: der public key
         :return: PublicVerifier
         """
+        begin_time = time.perf_counter()
+        try:
+            public_verifier = PublicVerifier(serialized_public)
+        except Exception:
+            with cls.__lock:
+                cls.__parse_fail += 1
+            raise
+        elapsed = time.perf_counter() - begin_time
 
-        public_verifier = PublicVerifier(serialized_public)
-        cls.__public_verifier[serialized_public] = public_verifier
+        with cls.__lock:
+            cls.__parse_count += 1
+            cls.__parse_time += elapsed
 
         return public_verifier
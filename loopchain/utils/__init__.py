@@ -16,7 +16,6 @@
 import datetime
 import importlib.machinery
 import json
-import leveldb
 import logging
 import os.path as osp
 import re
@@ -37,6 +36,7 @@ from fluent import sender
 
 from loopchain import configure as conf
 from loopchain.protos import loopchain_pb2, message_code
+from loopchain.storage import KeyValueStoreError, open_key_value_store
 
 # for verbose logs
 logger = verboselogs.VerboseLogger("dev")
@@ -399,11 +399,12 @@ def parse_target_list(targets: str) -> list:
     return target_list
 
 
-def init_level_db(level_db_identity):
+def init_level_db(level_db_identity, store_type=None):
     """init Level Db
 
     :param level_db_identity: identity for leveldb
-    :return: level_db, level_db_path
+    :param store_type: conf.KeyValueStoreType 의 이름, None 이면 conf.BLOCK_DB_STORE_TYPE
+    :return: level_db (KeyValueStore), level_db_path
     """
     level_db = None
 
@@ -414,14 +415,14 @@ def init_level_db(level_db_identity):
     retry_count = 0
     while level_db is None and retry_count < conf.MAX_RETRY_CREATE_DB:
         try:
-            level_db = leveldb.LevelDB(db_path, create_if_missing=True)
-        except leveldb.LevelDBError:
+            level_db = open_key_value_store(db_path, store_type)
+        except KeyValueStoreError:
             db_path = db_default_path + str(retry_count)
         retry_count += 1
 
     if level_db is None:
         logging.error("Fail! Create LevelDB")
-        raise leveldb.LevelDBError("Fail To Create Level DB(path): " + db_path)
+        raise KeyValueStoreError("Fail To Create Level DB(path): " + db_path)
 
     return level_db, db_path
 
@@ -38,7 +38,9 @@ def main(argv):
                                     "public=",
                                     "private=",
                                     "password=",
-                                    "configure_file_path="
+                                    "configure_file_path=",
+                                    "rebuild",
+                                    "snapshot="
                                     ])
     except getopt.GetoptError as e:
         logging.error(e)
@@ -97,6 +99,10 @@ def main(argv):
             private = arg
         elif opt == "-d":
             util.set_log_level_debug()
+        elif opt == "--rebuild":
+            conf.REBUILD_CHAIN_META = True
+        elif opt == "--snapshot":
+            conf.BOOTSTRAP_SNAPSHOT_PATH = arg
         elif (opt == "-h") or (opt == "--help"):
             usage()
             return
@@ -141,6 +147,8 @@ def usage():
     print("--public : public file path")
     print("--private : private key file path")
     print("-d : Display colored log.")
+    print("--rebuild : rebuild chain meta (total tx, block counts) by reading all blocks")
+    print("--snapshot : chain snapshot file path, bootstrap an empty block db from it and sync only later blocks")
 
 
 # Run grpc server as a Peer
@@ -0,0 +1,4 @@
+#!/usr/bin/env bash
+# 성능 비교 (이전 구현과의 비교 포함) 는 시간이 오래 걸리고 실행 환경에 따라 결과가 달라지므로 unittest 와 따로 실행한다.
+python3 -m unittest discover testcase/benchmark/ -p "bench_*.py" || exit -1
+#python3 -m unittest -q testcase.benchmark.bench_block.BenchBlock.test_serialize_block_performance
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Export a chain snapshot from a block db to bootstrap new peers"""
+
+import getopt
+import logging
+import os
+import sys
+
+sys.path.append("loopchain/protos")
+import loopchain.utils as util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain, BlockchainError, ChainSnapshot, SnapshotError
+from loopchain.storage import KeyValueStoreError, open_key_value_store
+
+
+def main(argv):
+    try:
+        opts, args = getopt.getopt(argv, "dho:", ["help", "height=", "blocks=", "score=", "configure_file_path="])
+    except getopt.GetoptError as e:
+        logging.error(e)
+        usage()
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if (opt == "-o") or (opt == "--configure_file_path"):
+            conf.Configure().load_configure_json(arg)
+
+    height = None
+    block_count = conf.SNAPSHOT_BLOCK_COUNT
+    score_storage_path = None
+    for opt, arg in opts:
+        if opt == "--height":
+            height = int(arg)
+        elif opt == "--blocks":
+            block_count = int(arg)
+        elif opt == "--score":
+            score_storage_path = arg
+        elif opt == "-d":
+            util.set_log_level_debug()
+        elif (opt == "-h") or (opt == "--help"):
+            usage()
+            return
+
+    if len(args) != 2:
+        usage()
+        sys.exit(1)
+
+    db_path, snapshot_path = args
+    archive_path = db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX
+    try:
+        block_db = open_key_value_store(db_path, create_if_missing=False)
+        block_db.Get(BlockChain.LAST_BLOCK_KEY)
+        blockchain = BlockChain(block_db, archive_path=(None, archive_path)[os.path.isdir(archive_path)])
+        manifest = ChainSnapshot.export_snapshot(blockchain, snapshot_path, height, block_count, score_storage_path)
+    except KeyError:
+        util.exit_and_msg(f"fail to export snapshot: {db_path} is not a block db")
+    except (KeyValueStoreError, BlockchainError, SnapshotError) as e:
+        util.exit_and_msg(f"fail to export snapshot: {e}")
+
+    print(f"{snapshot_path}: channel({manifest['channel']}) height({manifest['height']}) "
+          f"block_hash({manifest['block_hash']}) files({len(manifest['members'])})")
+
+
+def usage():
+    print("USAGE: LoopChain Chain Snapshot Tool")
+    print("python3 snapshottool.py [option] [value] ... [block db path] [snapshot file path]")
+    print("export a chain snapshot of the block db (.storage/db_*).")
+    print("stop the peer before exporting, and start a new peer with 'peer.py --snapshot [snapshot file path]'.")
+    print("-------------------------------")
+    print("option list")
+    print("-------------------------------")
+    print("-o or --configure_file_path : json configure file path")
+    print("-h or --help : print this usage")
+    print("-d : Display colored log.")
+    print("--height : height of the last block in snapshot (default last block)")
+    print("--blocks : count of the last blocks whose transactions are included (default SNAPSHOT_BLOCK_COUNT)")
+    print("--score : score state db directory of the peer (.storage/score/[peer id]), "
+          "only with the snapshot of the last block")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
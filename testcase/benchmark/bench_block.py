@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Block functions"""
+
+import logging
+import pickle
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block
+
+util.set_log_level_debug()
+
+
+class BenchBlock(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def test_put_transaction_performance(self):
+        """ 1000, 10000, 50000 개의 tx 를 block 에 담는 시간을 재고 list 검색으로 중복을 확인하는 경우와 비교한다.
+        (tx 서명 검증 시간은 빼기 위해 confirmed 상태의 tx 를 담는다.)
+        """
+        for tx_count in (1000, 10000, 50000):
+            # GIVEN
+            tx_list = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, tx_count)
+
+            # WHEN
+            block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            put_time = timeit.timeit(lambda: [block.put_transaction(tx) for tx in tx_list], number=1)
+
+            # list 검색은 50000 개에서 수십초가 걸리므로 10000 개까지만 비교한다.
+            legacy_message = ""
+            if tx_count <= 10000:
+                legacy_list = []
+                legacy_put_time = timeit.timeit(
+                    lambda: [legacy_list.append(tx) for tx in tx_list if tx not in legacy_list], number=1)
+                legacy_message = f" (duplicate check by list: {legacy_put_time:.4f}s)"
+
+            # THEN
+            self.assertEqual(len(block.confirmed_transaction_list), tx_count)
+            self.assertEqual(block.find_transaction_index(tx_list[-1].tx_hash), tx_count - 1)
+            logging.debug(f"put {tx_count} tx to block: {put_time:.4f}s{legacy_message}")
+
+    def test_serialize_block_performance(self):
+        """ 10000 개의 tx 를 담은 block 의 serialize 크기와 속도를 pickle 과 비교한다.
+        """
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block.confirmed_transaction_list.extend(test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 10000))
+        block.generate_block()
+
+        # WHEN
+        pickle_dump = pickle.dumps(block, pickle.DEFAULT_PROTOCOL)
+        block_dump = block.serialize_block()
+        pickle_dumps_time = timeit.timeit(lambda: pickle.dumps(block, pickle.DEFAULT_PROTOCOL), number=3) / 3
+        dumps_time = timeit.timeit(block.serialize_block, number=3) / 3
+        pickle_loads_time = timeit.timeit(lambda: pickle.loads(pickle_dump), number=3) / 3
+        loads_time = timeit.timeit(
+            lambda: Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL).deserialize_block(block_dump), number=3) / 3
+
+        # THEN
+        logging.debug(f"block of 10000 tx size pickle({len(pickle_dump)}) binary({len(block_dump)})")
+        logging.debug(f"encode time pickle({pickle_dumps_time:.4f}s) binary({dumps_time:.4f}s)")
+        logging.debug(f"decode time pickle({pickle_loads_time:.4f}s) binary({loads_time:.4f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
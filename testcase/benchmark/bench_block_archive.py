@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Block Archive"""
+
+import logging
+import os
+import shutil
+import tempfile
+import timeit
+import unittest
+
+import leveldb
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+
+util.set_log_level_debug()
+
+
+class BenchBlockArchive(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+        self.__archive_path = os.path.join(self.__test_path, 'db_test' + conf.BLOCK_ARCHIVE_PATH_SUFFIX)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def test_archive_read_performance(self):
+        """ LevelDB 에 저장된 block body 와 archive 된 block body 를 읽는 시간을 비교한다.
+        """
+        # GIVEN
+        block_db = leveldb.LevelDB(os.path.join(self.__test_path, 'db_test'), create_if_missing=True)
+        chain = BlockChain(block_db, archive_path=self.__archive_path)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 50)
+        block_hashes = [block.block_hash for block in chain.iter_blocks(1, headers_only=True)]
+
+        def find_blocks():
+            chain._BlockChain__block_cache.clear()
+            for block_hash in block_hashes:
+                chain.find_block_by_hash(block_hash)
+
+        # WHEN
+        leveldb_time = timeit.timeit(find_blocks, number=10) / 10
+        chain.archive_blocks(depth=0, batch_count=100)
+        archive_time = timeit.timeit(find_blocks, number=10) / 10
+
+        # THEN
+        logging.debug(f"find 50 blocks from leveldb({leveldb_time:.6f}s) archive({archive_time:.6f}s)")
+        self.assertEqual(chain.archived_height, chain.block_height)
+
+
+if __name__ == '__main__':
+    unittest.main()
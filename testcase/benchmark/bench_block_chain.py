@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark block chain class"""
+
+import leveldb
+import logging
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+
+util.set_log_level_debug()
+
+
+class BenchBlockChain(unittest.TestCase):
+    chain = None
+    db_name = 'blockchain_bench_db'
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.chain = BlockChain(test_util.make_level_db(self.db_name))
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        leveldb.DestroyDB(self.db_name)
+
+    def test_chain_meta_startup_performance(self):
+        """ chain meta 를 사용한 blockchain 시작 시간과 전체 블럭을 순회하는 rebuild_blocks 시간을 비교한다.
+        """
+        # GIVEN
+        test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 100)
+        block_db = self.chain._BlockChain__confirmed_block_db
+
+        # WHEN
+        startup_time = timeit.timeit(lambda: BlockChain(block_db), number=10) / 10
+        rebuild_time = timeit.timeit(self.chain.rebuild_blocks, number=10) / 10
+
+        # THEN
+        logging.debug(f"blockchain startup with chain meta({startup_time:.6f}s) rebuild_blocks({rebuild_time:.6f}s)")
+
+    def test_iter_blocks_performance(self):
+        """ iter_blocks 와 height 마다 find_block_by_height 로 조회하는 시간을 비교한다.
+        """
+        # GIVEN
+        test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 100)
+        end_height = self.chain.block_height
+        start_height = end_height - 99
+
+        def find_blocks_by_height():
+            self.chain._BlockChain__block_cache.clear()
+            return [self.chain.find_block_by_height(height, headers_only=True)
+                    for height in range(start_height, end_height + 1)]
+
+        def iter_blocks():
+            self.chain._BlockChain__block_cache.clear()
+            return list(self.chain.iter_blocks(start_height, end_height, headers_only=True))
+
+        # WHEN
+        find_time = timeit.timeit(find_blocks_by_height, number=10) / 10
+        iter_time = timeit.timeit(iter_blocks, number=10) / 10
+
+        # THEN
+        logging.debug(f"100 block headers by find_block_by_height({find_time:.6f}s) iter_blocks({iter_time:.6f}s)")
+
+    def test_add_block_performance(self):
+        """ block 마다 sync 하는 경우와 group commit 하는 경우의 add_block 처리량을 비교한다.
+        """
+        block_count = 20
+        tx_count = 200
+        origin_sync_interval = conf.BLOCK_DB_SYNC_INTERVAL
+
+        for sync_interval in (0, 100):
+            # GIVEN
+            conf.BLOCK_DB_SYNC_INTERVAL = sync_interval
+            blocks = []
+            last_block = self.chain.last_block
+            for x in range(block_count):
+                block = test_util.create_confirmed_block(
+                    last_block, test_util.create_basic_txs(self.__peer_id, self.__peer_auth, tx_count))
+                blocks.append(block)
+                last_block = block
+
+            # WHEN
+            start_time = timeit.default_timer()
+            for block in blocks:
+                self.chain.add_block(block)
+            self.chain.sync_block_db()
+            elapsed_time = timeit.default_timer() - start_time
+
+            # THEN
+            logging.debug(f"add_block sync interval({sync_interval}ms): {block_count / elapsed_time:.2f} blocks/s, "
+                          f"{block_count * tx_count / elapsed_time:.2f} tx/s")
+            self.assertEqual(self.chain.last_block.block_hash, blocks[-1].block_hash)
+
+        conf.BLOCK_DB_SYNC_INTERVAL = origin_sync_interval
+
+
+if __name__ == '__main__':
+    unittest.main()
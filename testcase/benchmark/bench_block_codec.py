@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Block Codec"""
+
+import logging
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockCodec
+
+util.set_log_level_debug()
+
+
+class BenchBlockCodec(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def test_codec_performance(self):
+        """ conf.MAX_BLOCK_KBYTES 크기의 block body 를 codec 마다 압축하여 크기와 압축, 해제 시간을 비교한다.
+        """
+        # GIVEN
+        txs = test_util.create_icx_txs(
+            self.__peer_id, self.__peer_auth, conf.MAX_BLOCK_TX_NUM, max_bytes=conf.MAX_BLOCK_KBYTES * 1024)
+        block = test_util.create_confirmed_block(None, txs)
+        body = block.serialize_block_body()
+
+        for codec_name in BlockCodec.names():
+            # WHEN
+            encode_time = timeit.timeit(lambda: BlockCodec.encode(body, codec_name), number=3) / 3
+            encoded_body = BlockCodec.encode(body, codec_name)
+            decode_time = timeit.timeit(lambda: BlockCodec.decode(encoded_body), number=3) / 3
+
+            # THEN
+            logging.debug(f"{codec_name}: {len(block.confirmed_transaction_list)} txs "
+                          f"{len(body)} -> {len(encoded_body)} bytes ({len(encoded_body) / len(body):.3f}) "
+                          f"encode({encode_time:.6f}s) decode({decode_time:.6f}s)")
+            self.assertEqual(BlockCodec.decode(encoded_body), body)
+
+
+if __name__ == '__main__':
+    unittest.main()
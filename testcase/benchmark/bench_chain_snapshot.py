@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Chain Snapshot"""
+
+import logging
+import os
+import shutil
+import tempfile
+import timeit
+import unittest
+
+import leveldb
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block, BlockChain, BlockStatus, ChainSnapshot
+
+util.set_log_level_debug()
+
+
+class BenchChainSnapshot(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+        self.__snapshot_path = os.path.join(self.__test_path, 'snapshot.tar')
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def test_bootstrap_performance(self):
+        """ snapshot 을 가져오는 시간과 block 을 하나씩 add_block 하는 시간을 비교한다.
+        """
+        # GIVEN
+        chain = BlockChain(leveldb.LevelDB(os.path.join(self.__test_path, 'db_source'), create_if_missing=True))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 50)
+        block_dumps = [block.serialize_block() for block in chain.iter_blocks(1)]
+        ChainSnapshot.export_snapshot(chain, self.__snapshot_path, block_count=10)
+
+        def replay_blocks():
+            replay_path = os.path.join(self.__test_path, 'db_replay')
+            replay_chain = BlockChain(leveldb.LevelDB(replay_path, create_if_missing=True))
+            for block_dump in block_dumps:
+                block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+                block.deserialize_block(block_dump)
+                block.block_status = BlockStatus.confirmed
+                replay_chain.add_block(block)
+            return replay_chain
+
+        def import_snapshot():
+            import_path = os.path.join(self.__test_path, 'db_import')
+            import_db = leveldb.LevelDB(import_path, create_if_missing=True)
+            ChainSnapshot.import_snapshot(self.__snapshot_path, import_db)
+            return BlockChain(import_db)
+
+        # WHEN
+        replay_time = timeit.timeit(replay_blocks, number=1)
+        import_time = timeit.timeit(import_snapshot, number=1)
+
+        # THEN
+        logging.debug(f"bootstrap 50 blocks by add_block({replay_time:.6f}s) snapshot({import_time:.6f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Chain Verifier"""
+
+import logging
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain, ChainVerifier
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class BenchChainVerifier(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def test_verify_performance(self):
+        """ process 갯수에 따른 chain 검증 throughput 을 비교한다.
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 40, 50, is_signed=True)
+
+        for process_count in (1, 2, 4):
+            # WHEN
+            report = ChainVerifier(block_db, process_count=process_count, shard_size=5).verify()
+
+            # THEN
+            logging.debug(f"verify {report['block_count']} blocks, {report['tx_count']} txs "
+                          f"with {process_count} processes: elapsed({report['elapsed']:.3f}s) "
+                          f"{report['blocks_per_second']:.1f} blocks/s {report['txs_per_second']:.1f} txs/s")
+            self.assertIsNone(report['invalid_height'], report['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
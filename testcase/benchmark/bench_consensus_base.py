@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark making up blocks from the mempool in ConsensusBase"""
+
+import logging
+import pickle
+import time
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, TransactionStatus
+from testcase.unittest.test_consensus_base import make_consensus
+
+util.set_log_level_debug()
+
+
+def legacy_makeup_block(consensus):
+    """이전 버전의 _makeup_block (block 을 다 담은 뒤 pickle 로 크기를 재고 pop(0) 으로 나눈다.)"""
+    while not consensus._mempool.empty():
+        consensus._block.put_transaction(consensus._mempool.pop())
+
+    if len(pickle.dumps(consensus._block)) > (conf.MAX_BLOCK_KBYTES * 1024):
+        divided_block = Block(channel_name=consensus._channel_name, is_divided_block=True)
+        expected_block_size = len(pickle.dumps(divided_block))
+        while len(consensus._block.confirmed_transaction_list) > 0:
+            next_tx = consensus._block.confirmed_transaction_list.pop(0)
+            expected_block_size += len(pickle.dumps(next_tx))
+            if expected_block_size >= (conf.MAX_BLOCK_KBYTES * 1024):
+                divided_block.generate_block(consensus._candidate_blocks.get_last_block())
+                consensus._candidate_blocks.add_unconfirmed_block(divided_block)
+                divided_block = Block(channel_name=consensus._channel_name, is_divided_block=True)
+                expected_block_size = len(pickle.dumps(divided_block)) + len(pickle.dumps(next_tx))
+            divided_block.put_transaction(next_tx)
+        divided_block.generate_block(consensus._candidate_blocks.get_last_block())
+        consensus._candidate_blocks.add_unconfirmed_block(divided_block)
+
+
+class BenchConsensusBase(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        self.__max_block_kbytes = conf.MAX_BLOCK_KBYTES
+        self.__max_block_tx_num = conf.MAX_BLOCK_TX_NUM
+
+    def tearDown(self):
+        conf.MAX_BLOCK_KBYTES = self.__max_block_kbytes
+        conf.MAX_BLOCK_TX_NUM = self.__max_block_tx_num
+
+    def test_makeup_divided_blocks_performance(self):
+        # GIVEN
+        conf.MAX_BLOCK_KBYTES = 256
+        conf.MAX_BLOCK_TX_NUM = 100000
+        tx_count = 10000
+
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, tx_count)
+        for tx in txs:
+            tx.status = TransactionStatus.confirmed
+
+        # WHEN tx 서명 검증 시간은 빼고 block 에 담아 나누는 시간만 비교한다.
+        consensus = make_consensus(txs)
+        start = time.perf_counter()
+        consensus.consensus()
+        makeup_time = time.perf_counter() - start
+
+        legacy_consensus = make_consensus(txs)
+        start = time.perf_counter()
+        legacy_makeup_block(legacy_consensus)
+        legacy_makeup_time = time.perf_counter() - start
+
+        # THEN
+        divided_blocks = consensus._candidate_blocks.unconfirmed_blocks
+        self.assertEqual(sum(len(block.confirmed_transaction_list) for block in divided_blocks), tx_count)
+        logging.debug(f"makeup {tx_count} txs to {len(divided_blocks)} blocks: "
+                      f"{makeup_time * 1000:.1f}ms "
+                      f"(pickle & pop(0): {legacy_makeup_time * 1000:.1f}ms, "
+                      f"{len(legacy_consensus._candidate_blocks.unconfirmed_blocks)} blocks)")
+
+
+if __name__ == '__main__':
+    unittest.main()
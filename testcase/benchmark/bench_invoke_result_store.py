@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Invoke Result Store"""
+
+import json
+import logging
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain, InvokeResultStore
+from loopchain.protos import message_code
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class BenchInvokeResultStore(unittest.TestCase):
+    __peer_id = 'aaa'
+    __success = {'code': int(message_code.Response.success)}
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_db_size_and_lookup_performance(self):
+        """ 성공 result 만 있는 chain 에서 이전 tx_info (json) 와 tx index + 압축된 invoke result 의 크기와 조회 시간을 비교한다.
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        peer_auth = test_util.create_peer_auth()
+        tx_hashes = []
+        legacy_tx_infos = {}
+        for block in test_util.add_confirmed_blocks(chain, self.__peer_id, peer_auth, 10, 100):
+            tx_offsets = []
+            block.serialize_block_body(tx_offsets)
+            for tx_index, tx in enumerate(block.confirmed_transaction_list):
+                tx_hashes.append(tx.get_tx_hash())
+                legacy_tx_infos[tx.get_tx_hash()] = json.dumps({
+                    'block_hash': block.block_hash, 'block_height': block.height, 'tx_index': tx_index,
+                    'offset': tx_offsets[tx_index], 'result': self.__success}).encode()
+
+        # WHEN
+        legacy_size = sum(len(tx_info) for tx_info in legacy_tx_infos.values())
+        tx_index_size = sum(len(block_db.Get(tx_hash.encode())) for tx_hash in tx_hashes)
+        result_size = sum(len(value) for key, value in block_db.RangeIter(
+            key_from=InvokeResultStore.BLOCK_RESULTS_KEY, key_to=InvokeResultStore.BLOCK_RESULTS_KEY + b'\xff'))
+        result_size += sum(len(value) for key, value in block_db.RangeIter(
+            key_from=InvokeResultStore.RESULT_DICT_KEY, key_to=InvokeResultStore.RESULT_DICT_KEY + b'\xff'))
+
+        def find_legacy_results():
+            for tx_hash in tx_hashes:
+                json.loads(legacy_tx_infos[tx_hash].decode())['result']
+
+        def find_results():
+            for tx_hash in tx_hashes:
+                chain.find_invoke_result_by_tx_hash(tx_hash)
+
+        legacy_time = timeit.timeit(find_legacy_results, number=5) / 5
+        result_time = timeit.timeit(find_results, number=5) / 5
+
+        # THEN
+        logging.debug(f"{len(tx_hashes)} tx_info: json({legacy_size} bytes) "
+                      f"tx index({tx_index_size} bytes) + invoke results({result_size} bytes)")
+        logging.debug(f"find {len(tx_hashes)} invoke results: json({legacy_time:.6f}s) store({result_time:.6f}s)")
+        self.assertLess((tx_index_size + result_size) * 4, legacy_size)
+        for tx_hash in tx_hashes:
+            self.assertEqual(chain.find_invoke_result_by_tx_hash(tx_hash), self.__success)
+
+
+if __name__ == '__main__':
+    unittest.main()
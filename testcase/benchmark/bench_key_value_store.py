@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Key Value Store"""
+
+import logging
+import shutil
+import tempfile
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+from loopchain.storage import open_key_value_store
+
+util.set_log_level_debug()
+
+
+class BenchKeyValueStore(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def test_storage_performance(self):
+        """ 같은 workload (add_block, find_block_by_hash, find_tx_by_key, iter_blocks) 를 각 store 에서 실행하여 비교한다.
+        """
+        # GIVEN
+        block_count = 20
+        tx_count = 100
+        source_chain = BlockChain(open_key_value_store(None, conf.KeyValueStoreType.memory.name))
+        blocks = test_util.add_confirmed_blocks(
+            source_chain, self.__peer_id, test_util.create_peer_auth(), block_count, tx_count)
+        tx_hashes = [tx.get_tx_hash() for block in blocks for tx in block.confirmed_transaction_list]
+
+        for store_type, store in test_util.open_key_value_stores(self.__test_path, "_performance"):
+            chain = BlockChain(store)
+
+            def add_blocks():
+                for block in blocks:
+                    chain.add_block(block)
+
+            # WHEN
+            add_time = timeit.timeit(add_blocks, number=1)
+
+            def find_blocks():
+                chain._BlockChain__block_cache.clear()
+                for block in blocks:
+                    chain.find_block_by_hash(block.block_hash)
+
+            def find_txs():
+                chain._BlockChain__block_cache.clear()
+                for tx_hash in tx_hashes:
+                    chain.find_tx_by_key(tx_hash)
+
+            find_block_time = timeit.timeit(find_blocks, number=5) / 5
+            find_tx_time = timeit.timeit(find_txs, number=5) / 5
+            iter_time = timeit.timeit(lambda: list(chain.iter_blocks(1, headers_only=True)), number=5) / 5
+
+            # THEN
+            logging.debug(f"{store_type}: add {block_count} blocks({add_time:.6f}s) "
+                          f"find {block_count} blocks({find_block_time:.6f}s) "
+                          f"find {len(tx_hashes)} txs({find_tx_time:.6f}s) "
+                          f"iter {block_count} headers({iter_time:.6f}s)")
+            self.assertEqual(chain.block_height, block_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Mempool"""
+
+import logging
+import pickle
+import queue
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Mempool, TransactionType
+
+util.set_log_level_debug()
+
+
+def legacy_remove_block_txs(tx_queue, confirmed_tx_list):
+    """이전 버전의 Block.__tx_validate_with_queue (queue 를 모두 꺼내어 load 하고 block 에 없는 tx 를 다시 넣는다.)"""
+    remain_tx = []
+
+    while not tx_queue.empty():
+        tx_unloaded = tx_queue.get()
+        tx = pickle.loads(tx_unloaded)
+
+        if tx.tx_hash not in confirmed_tx_list:
+            if tx.type == TransactionType.general:
+                remain_tx.append(tx_unloaded)
+
+    for tx_unloaded in remain_tx:
+        tx_queue.put(tx_unloaded)
+
+
+class BenchMempool(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def test_remove_block_txs_performance(self):
+        """ 20000 개의 tx 가 쌓인 상태에서 1000 개의 tx 를 담은 block 을 받았을 때
+        block 에 담긴 tx 를 제거하는 시간을 이전 queue 와 비교한다.
+        """
+        # GIVEN
+        txs = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 20000)
+        block_tx_hashes = [tx.tx_hash for tx in txs[:1000]]
+
+        mempool = Mempool()
+        tx_queue = queue.Queue()
+        for tx in txs:
+            mempool.put(tx)
+            tx_queue.put(pickle.dumps(tx))
+
+        # WHEN
+        remove_time = timeit.timeit(lambda: mempool.remove(block_tx_hashes), number=1)
+        legacy_remove_time = timeit.timeit(lambda: legacy_remove_block_txs(tx_queue, block_tx_hashes), number=1)
+
+        # THEN
+        self.assertEqual(len(mempool), 19000)
+        self.assertEqual(tx_queue.qsize(), 19000)
+        logging.debug(f"remove 1000 block txs from 20000 txs: mempool({remove_time:.4f}s) "
+                      f"queue({legacy_remove_time:.4f}s)")
+        logging.debug(f"mempool status: {mempool.get_status()}")
+
+
+if __name__ == '__main__':
+    unittest.main()
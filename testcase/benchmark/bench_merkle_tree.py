@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Merkle Tree"""
+
+import logging
+import random
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block, MerkleTree
+from testcase.unittest.test_merkle_tree import legacy_merkle_proof, legacy_merkle_tree_root, random_tx_hashes
+
+util.set_log_level_debug()
+
+
+class BenchMerkleTree(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_merkle_tree_performance(self):
+        """ tx 갯수마다 이전 버전과 HEX, RAW merkle tree 를 만드는 시간과
+        proof 마다 tree 를 다시 만드는 이전 버전과 보관한 tree 로 proof 를 만드는 시간을 비교한다.
+        """
+        for count in (1000, 10000, 100000):
+            # GIVEN
+            tx_hashes = random_tx_hashes(count)
+            number = max(1, 10000 // count)
+
+            # WHEN
+            legacy_time = timeit.timeit(lambda: legacy_merkle_tree_root(tx_hashes), number=number) / number
+            hex_time = timeit.timeit(lambda: MerkleTree(tx_hashes, MerkleTree.HEX), number=number) / number
+            raw_time = timeit.timeit(lambda: MerkleTree(tx_hashes, MerkleTree.RAW), number=number) / number
+
+            merkle_tree = MerkleTree(tx_hashes, MerkleTree.HEX)
+            legacy_proof_time = timeit.timeit(lambda: legacy_merkle_proof(tx_hashes, count // 2), number=1)
+            proof_time = timeit.timeit(lambda: merkle_tree.proof(count // 2), number=100) / 100
+
+            # THEN
+            logging.debug(f"{count} txs build: legacy({legacy_time:.6f}s) hex({hex_time:.6f}s) "
+                          f"raw({raw_time:.6f}s) proof: legacy({legacy_proof_time:.6f}s) "
+                          f"cached({proof_time:.6f}s)")
+            self.assertEqual(merkle_tree.root, legacy_merkle_tree_root(tx_hashes))
+            self.assertEqual(merkle_tree.proof(count // 2), legacy_merkle_proof(tx_hashes, count // 2))
+
+    def test_put_to_broadcast_latency(self):
+        """ leader 가 마지막 tx 를 block 에 담은 다음 block 을 broadcast 할 수 있을 때까지 (generate, sign, serialize)
+        걸리는 시간을 generate_block 에서 merkle tree 를 다시 만드는 경우 (이전 버전) 와 비교한다.
+        """
+        peer_auth = test_util.create_peer_auth()
+        txs = test_util.create_basic_txs(self.__peer_id, peer_auth, 10000)
+
+        for count in (1000, 10000):
+            # GIVEN
+            block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            put_start = timeit.default_timer()
+            for tx in txs[:count]:
+                block.put_transaction(tx)
+            put_time = timeit.default_timer() - put_start
+
+            # 이전 버전처럼 merkle tree 를 다시 만들도록 tx 목록만 복사한 block
+            rebuild_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            rebuild_block.deserialize_block_body(block.serialize_block_body())
+
+            # WHEN
+            generate_times = []
+            latencies = []
+            for target_block in (block, rebuild_block):
+                start = timeit.default_timer()
+                target_block.generate_block(None)
+                generate_times.append(timeit.default_timer() - start)
+                target_block.sign(peer_auth)
+                target_block.serialize_block()
+                latencies.append(timeit.default_timer() - start)
+
+            # THEN
+            logging.debug(f"{count} txs put({put_time:.6f}s) "
+                          f"generate: incremental({generate_times[0]:.6f}s) rebuild({generate_times[1]:.6f}s) "
+                          f"put to broadcast: incremental({latencies[0]:.6f}s) rebuild({latencies[1]:.6f}s)")
+            self.assertEqual(block.merkle_tree_root_hash, rebuild_block.merkle_tree_root_hash)
+            self.assertEqual(block.merkle_tree_root_hash,
+                             legacy_merkle_tree_root([tx.get_tx_hash() for tx in txs[:count]]))
+
+    def test_multi_proof_performance(self):
+        """ 한 block 에서 여러 tx 를 검증할 때 tx 마다 proof 를 받는 경우와 multi proof 를 받는 경우의
+        node 갯수와 검증 시간을 비교한다.
+        """
+        # GIVEN
+        count = 10000
+        tx_hashes = random_tx_hashes(count)
+        merkle_tree = MerkleTree(tx_hashes, MerkleTree.HEX)
+
+        for proof_count in (10, 100, 1000):
+            indices = random.sample(range(count), proof_count)
+            indices_hashes = [tx_hashes[index] for index in indices]
+
+            # WHEN
+            proofs = [merkle_tree.proof(index) for index in indices]
+            nodes = merkle_tree.multi_proof(indices)
+            single_time = timeit.timeit(
+                lambda: all(MerkleTree.verify_proof(tx_hashes[index], index, proof, merkle_tree.root)
+                            for index, proof in zip(indices, proofs)), number=3) / 3
+            multi_time = timeit.timeit(
+                lambda: MerkleTree.verify_multi_proof(indices, indices_hashes, count, nodes, merkle_tree.root),
+                number=3) / 3
+
+            # THEN
+            logging.debug(f"{proof_count} of {count} txs: single proofs({sum(len(proof) for proof in proofs)} nodes, "
+                          f"{single_time:.6f}s) multi proof({len(nodes)} nodes, {multi_time:.6f}s)")
+            self.assertTrue(MerkleTree.verify_multi_proof(indices, indices_hashes, count, nodes, merkle_tree.root))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Public Verifier Container"""
+
+import logging
+import random
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.tools import PublicVerifier, PublicVerifierContainer
+from testcase.unittest.test_public_verifier_container import create_public_ders
+
+util.set_log_level_debug()
+
+
+class LegacyPublicVerifierContainer:
+    """제한 없이 dict 에 보관하던 이전 PublicVerifierContainer (성능 비교용)"""
+
+    __public_verifier = {}
+
+    @classmethod
+    def get_public_verifier(cls, serialized_public: bytes) -> PublicVerifier:
+        try:
+            public_verifier = cls.__public_verifier[serialized_public]
+        except KeyError as e:
+            public_verifier = PublicVerifier(serialized_public)
+            cls.__public_verifier[serialized_public] = public_verifier
+
+        return public_verifier
+
+    @classmethod
+    def clear(cls):
+        cls.__public_verifier.clear()
+
+
+class BenchPublicVerifierContainer(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__max_count = conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT
+        PublicVerifierContainer.clear()
+
+    def tearDown(self):
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = self.__max_count
+        PublicVerifierContainer.clear()
+
+    def test_high_cardinality_performance(self):
+        """ 20000 개의 client key 로 100000 번 public verifier 를 찾는 경우
+        (80% 는 1000 개의 자주 쓰는 key, 20% 는 한두 번 쓰고 마는 key)
+        이전 dict container 와 LRU container 의 시간과 보관하는 key 의 갯수를 비교한다.
+        """
+        # GIVEN
+        key_count = 20000
+        request_count = 100000
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = 5000
+        publics = create_public_ders(key_count)
+        random.seed(0)
+        workload = [publics[random.randrange(1000) if random.random() < 0.8 else random.randrange(key_count)]
+                    for x in range(request_count)]
+
+        # WHEN
+        LegacyPublicVerifierContainer.clear()
+        dict_time = timeit.timeit(
+            lambda: [LegacyPublicVerifierContainer.get_public_verifier(public) for public in workload], number=1)
+        dict_count = len(LegacyPublicVerifierContainer._LegacyPublicVerifierContainer__public_verifier)
+        LegacyPublicVerifierContainer.clear()
+
+        status = PublicVerifierContainer.get_status()
+        lru_time = timeit.timeit(
+            lambda: [PublicVerifierContainer.get_public_verifier(public) for public in workload], number=1)
+        new_status = PublicVerifierContainer.get_status()
+
+        # THEN
+        logging.debug(f"{request_count} requests of {len(set(workload))} keys: "
+                      f"dict({dict_time:.4f}s, {dict_count} keys) "
+                      f"lru({lru_time:.4f}s, {new_status['count']} keys, "
+                      f"{new_status['parse_count'] - status['parse_count']} parse, "
+                      f"{new_status['eviction'] - status['eviction']} eviction)")
+        logging.debug(f"public verifier cache status: {new_status}")
+        self.assertLessEqual(new_status['count'], conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Transaction functions"""
+
+import logging
+import pickle
+import tracemalloc
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from testcase.unittest.test_transaction import LegacyTransaction
+
+util.set_log_level_debug()
+
+
+class BenchTransaction(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_mempool_memory(self):
+        """ mempool 에 담긴 tx 하나의 memory 를 __slots__ 이전 버전의 tx 와 비교한다.
+        (1M 개를 tracemalloc 으로 재면 수 분이 걸리므로 100k 개를 재어 1M 개의 크기를 계산한다.)
+        """
+        # GIVEN mempool 의 tx 는 queue 에서 pickle.loads 로 만든다.
+        peer_auth = test_util.create_peer_auth()
+        tx = test_util.create_basic_tx("aaa", peer_auth)
+        tx_dump = pickle.dumps(tx)
+        legacy_tx_dump = pickle.dumps(LegacyTransaction(tx))
+        tx_count = 100000
+
+        # WHEN
+        memory = {}
+        for name, dump in (("slots", tx_dump), ("legacy", legacy_tx_dump)):
+            tracemalloc.start()
+            mempool = [pickle.loads(dump) for x in range(tx_count)]
+            memory[name], peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del mempool
+
+        # THEN
+        logging.debug(f"memory of a tx: slots({memory['slots'] / tx_count:.0f} bytes) "
+                      f"legacy({memory['legacy'] / tx_count:.0f} bytes)")
+        logging.debug(f"memory of 1M tx mempool: slots({memory['slots'] * 10 / 1024 / 1024:.0f}MB) "
+                      f"legacy({memory['legacy'] * 10 / 1024 / 1024:.0f}MB)")
+
+
+if __name__ == '__main__':
+    unittest.main()
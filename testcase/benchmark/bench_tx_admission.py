@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Tx Admission"""
+
+import logging
+import pickle
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, Mempool, Transaction
+from loopchain.peer.tx_admission import TxAdmission
+from testcase.unittest.test_tx_admission import BlockChainForTest
+
+util.set_log_level_debug()
+
+
+class BenchTxAdmission(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+
+    def test_admission_performance(self):
+        """ 2000 개의 tx 를 받는 시간의 percentile 과
+        받은 tx 로 block 을 만드는 시간을 tx 를 다시 검증하는 경우 (이전 AddTx) 와 비교한다.
+        """
+        # GIVEN
+        tx_dumps = [pickle.dumps(tx) for tx in test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 2000)]
+
+        # WHEN
+        mempool = Mempool()
+        tx_admission = TxAdmission(mempool, BlockChainForTest())
+        admission_time = timeit.timeit(lambda: [tx_admission.admit(tx_dump) for tx_dump in tx_dumps], number=1)
+
+        admitted_txs = [mempool.pop() for x in range(len(mempool))]
+        unconfirmed_txs = [pickle.loads(tx_dump) for tx_dump in tx_dumps]
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        makeup_time = timeit.timeit(lambda: block.put_transaction(admitted_txs), number=1)
+        legacy_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        legacy_makeup_time = timeit.timeit(lambda: legacy_block.put_transaction(unconfirmed_txs), number=1)
+
+        # THEN
+        status = tx_admission.get_status()
+        self.assertEqual(status['accepted'], 2000)
+        self.assertEqual(len(block.confirmed_transaction_list), 2000)
+        self.assertEqual(len(legacy_block.confirmed_transaction_list), 2000)
+        logging.debug(f"admit 2000 txs: {admission_time:.4f}s latency(ms) "
+                      + ", ".join(f"{name}({latency:.3f})" for name, latency in status['latency'].items()))
+        logging.debug(f"put 2000 txs to block: admitted({makeup_time:.4f}s) "
+                      f"validate again with warm verified tx cache({legacy_makeup_time:.4f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
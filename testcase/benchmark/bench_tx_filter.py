@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Tx Bloom Filter"""
+
+import logging
+import shutil
+import tempfile
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+from loopchain.storage import open_key_value_store
+from testcase.unittest.test_tx_filter import make_hashes
+
+util.set_log_level_debug()
+
+
+class BenchTxFilter(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_unknown_tx_lookup_performance(self):
+        """ 아직 block 에 담기지 않은 tx 의 invoke result 를 polling 하는 경우 filter 유무에 따른 조회 시간을 비교한다.
+        """
+        # GIVEN
+        enable_tx_bloom_filter = conf.ENABLE_TX_BLOOM_FILTER
+        db_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, db_path)
+        block_db = open_key_value_store(db_path, conf.KeyValueStoreType.leveldb.name)
+        test_util.add_confirmed_blocks(BlockChain(block_db), self.__peer_id, test_util.create_peer_auth(), 5, 100)
+        unknown_hashes = make_hashes('unknown', 10000)
+
+        try:
+            conf.ENABLE_TX_BLOOM_FILTER = False
+            chain_without_filter = BlockChain(block_db)
+        finally:
+            conf.ENABLE_TX_BLOOM_FILTER = enable_tx_bloom_filter
+        chain = BlockChain(block_db)
+        chain.wait_tx_filter_ready()
+
+        def find_results(target_chain):
+            for tx_hash in unknown_hashes:
+                target_chain.find_invoke_result_by_tx_hash(tx_hash)
+
+        # WHEN
+        logging.disable(logging.WARNING)
+        try:
+            without_filter_time = timeit.timeit(lambda: find_results(chain_without_filter), number=1)
+            with_filter_time = timeit.timeit(lambda: find_results(chain), number=1)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        # THEN
+        logging.debug(f"find {len(unknown_hashes)} unknown invoke results: "
+                      f"without filter({without_filter_time:.6f}s) with filter({with_filter_time:.6f}s) "
+                      f"status({chain.get_tx_filter_status()})")
+        self.assertEqual(chain.get_tx_filter_status()['negative'], len(unknown_hashes))
+
+
+if __name__ == '__main__':
+    unittest.main()
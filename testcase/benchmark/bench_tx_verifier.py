@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Tx Verifier"""
+
+import logging
+import os
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Transaction, TxVerifier
+
+util.set_log_level_debug()
+
+
+class BenchTxVerifier(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+
+    def test_verify_performance(self):
+        """ 2000 개의 tx 를 담은 block 의 검증 시간을 순서대로 검증한 경우와 thread pool 에서 검증한 경우로 비교한다.
+        """
+        # GIVEN
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 2000)
+        worker_count = max(os.cpu_count() or 1, 2)
+
+        # WHEN
+        results = {}
+        for name, tx_verifier in (("serial", TxVerifier(worker_count=1)),
+                                  ("thread pool", TxVerifier(worker_count=worker_count, use_process=False))):
+            block_txs = test_util.copy_txs(txs)
+            Transaction.verified_tx_cache.clear()
+            results[name] = timeit.timeit(lambda: self.assertIsNone(tx_verifier.verify(block_txs)), number=1)
+            tx_verifier.shutdown()
+
+        # THEN
+        logging.debug(f"verify 2000 txs (cpu count: {os.cpu_count()}, workers: {worker_count}): " +
+                      ", ".join(f"{name}({elapsed:.4f}s)" for name, elapsed in results.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark Verified Tx Cache"""
+
+import logging
+import timeit
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, Transaction
+
+util.set_log_level_debug()
+
+
+class BenchVerifiedTxCache(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+
+    def test_validate_block_performance(self):
+        """ 1000 개의 tx 를 담은 block 을 검증하는 시간을 cache 가 비어 있을 때와 tx 를 받을 때 검증해 둔 경우로 비교한다.
+        """
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block.put_transaction(test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 1000))
+        block.generate_block()
+        block_dump = block.serialize_block()
+
+        # WHEN
+        Transaction.verified_tx_cache.clear()
+        received_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        received_block.deserialize_block(block_dump)
+        cold_time = timeit.timeit(received_block.verify_integrity, number=1)
+
+        received_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        received_block.deserialize_block(block_dump)
+        warm_time = timeit.timeit(received_block.verify_integrity, number=1)
+
+        # THEN
+        status = Transaction.verified_tx_cache.get_status()
+        self.assertEqual(status['count'], 1000)
+        logging.debug(f"validate block of 1000 tx: cold cache({cold_time:.4f}s) warm cache({warm_time:.4f}s)")
+        logging.debug(f"verified tx cache status: {status}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@
 """Test Block functions"""
 
 import logging
+import pickle
 import sys
 import unittest
 
@@ -101,6 +102,37 @@ class TestBlock(unittest.TestCase):
         self.assertTrue(block.put_transaction(tx_list), "Block에 여러 트랜잭션 추가 실패")
         self.assertEqual(len(block.confirmed_transaction_list), tx_size*2, "트랜잭션 사이즈 확인 실패")
 
+    def test_put_duplicate_transaction(self):
+        """ GIVEN block with 10 tx
+        WHEN put same tx and the copy of tx (same tx hash) again
+        THEN block does not have duplicate tx and find_transaction_index returns the first index
+        """
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        tx_list = [test_util.create_basic_tx(self.__peer_id, self.__peer_auth) for x in range(0, 10)]
+        block.put_transaction(tx_list)
+
+        # WHEN
+        self.assertTrue(block.put_transaction(tx_list[3]))
+        self.assertTrue(block.put_transaction(pickle.loads(pickle.dumps(tx_list[5]))))
+
+        # THEN
+        self.assertEqual(block.confirmed_transaction_list, tx_list)
+        for index, tx in enumerate(tx_list):
+            self.assertEqual(block.find_transaction_index(tx.tx_hash), index)
+        self.assertEqual(block.find_transaction_index("not exist tx hash"), -1)
+
+        # confirmed_transaction_list 를 직접 바꾼 경우에도 index 를 다시 만든다.
+        block.confirmed_transaction_list.append(test_util.create_basic_tx(self.__peer_id, self.__peer_auth))
+        self.assertEqual(block.find_transaction_index(block.confirmed_transaction_list[-1].tx_hash), 10)
+
+        block_dump = block.serialize_block()
+        block2 = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block2.deserialize_block(block_dump)
+        self.assertEqual(block2.find_transaction_index(tx_list[7].tx_hash), 7)
+        self.assertTrue(block2.put_transaction(tx_list[7]))
+        self.assertEqual(len(block2.confirmed_transaction_list), 11)
+
     # TODO block validate 에 peer_service 정보가 필요해짐, 테스트 수정 필요
     @unittest.skip
     def test_validate_block(self):
@@ -148,6 +180,33 @@ class TestBlock(unittest.TestCase):
         block2.deserialize_block(test_dmp)
         logging.debug("serialize block hash : %s , deserialize block hash %s", block.merkle_tree_root_hash, block2.merkle_tree_root_hash)
         self.assertEqual(block.merkle_tree_root_hash, block2.merkle_tree_root_hash, "블럭이 같지 않습니다 ")
+        self.assertEqual(block.block_hash, block2.block_hash)
+        self.assertEqual(block.signature, block2.signature)
+        self.assertEqual(block.made_block_count, block2.made_block_count)
+        self.assertEqual([tx.tx_hash for tx in block.confirmed_transaction_list],
+                         [tx.tx_hash for tx in block2.confirmed_transaction_list])
+        self.assertEqual(block.confirmed_transaction_list[0].meta, block2.confirmed_transaction_list[0].meta)
+        self.assertEqual(block.confirmed_transaction_list[0].signature,
+                         block2.confirmed_transaction_list[0].signature)
+        # binary encoding 은 pickle 보다 작다.
+        self.assertLess(len(test_dmp), len(pickle.dumps(block, pickle.DEFAULT_PROTOCOL)))
+
+    def test_deserialize_pickled_block(self):
+        """ GIVEN block pickled by previous version
+        WHEN deserialize_block
+        THEN block is restored
+        """
+        # GIVEN
+        block = self.__generate_block()
+        pickled_dump = pickle.dumps(block, pickle.DEFAULT_PROTOCOL)
+
+        # WHEN
+        block2 = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block2.deserialize_block(pickled_dump)
+
+        # THEN
+        self.assertEqual(block.block_hash, block2.block_hash)
+        self.assertEqual(len(block.confirmed_transaction_list), len(block2.confirmed_transaction_list))
 
 
 class Mock:
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Block Archive"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import leveldb
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import BlockChain, BlockArchive, BlockArchiveCompactor, BlockError
+
+util.set_log_level_debug()
+
+
+class TestBlockArchive(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+        self.__archive_path = os.path.join(self.__test_path, 'db_test' + conf.BLOCK_ARCHIVE_PATH_SUFFIX)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def test_append_and_read(self):
+        # GIVEN
+        block_archive = BlockArchive(self.__archive_path)
+        records = [os.urandom(x * 10 + 1) for x in range(10)]
+
+        # WHEN
+        pointers = [block_archive.append(record) for record in records]
+        block_archive.sync()
+
+        # THEN
+        for record, pointer in zip(records, pointers):
+            data = block_archive.read(*BlockArchive.unpack_pointer(BlockArchive.pack_pointer(*pointer)))
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(data, record)
+
+    def test_segment_rollover(self):
+        """ GIVEN archive with small segment size
+        WHEN append records larger than the segment size and reopen the archive
+        THEN records are split into segments and the reopened archive appends to the last segment
+        """
+        # GIVEN
+        block_archive = BlockArchive(self.__archive_path, segment_max_bytes=100)
+
+        # WHEN
+        pointers = [block_archive.append(bytes([x]) * 60) for x in range(3)]
+        block_archive.close()
+        reopened_archive = BlockArchive(self.__archive_path, segment_max_bytes=100)
+        pointers.append(reopened_archive.append(b'last'))
+
+        # THEN
+        self.assertEqual([pointer[0] for pointer in pointers], [0, 1, 2, 2])
+        self.assertEqual(len(os.listdir(self.__archive_path)), 3)
+        # record header (length, crc32) 8 bytes
+        self.assertEqual(pointers[3][1], pointers[2][1] + 60 + 8)
+        for x, pointer in enumerate(pointers[:3]):
+            self.assertEqual(reopened_archive.read(*pointer), bytes([x]) * 60)
+        self.assertEqual(reopened_archive.read(*pointers[3]), b'last')
+
+    def test_read_broken_record(self):
+        # GIVEN
+        block_archive = BlockArchive(self.__archive_path)
+        segment, offset, length = block_archive.append(b'block body')
+        block_archive.sync()
+
+        # WHEN
+        with open(os.path.join(self.__archive_path, BlockArchive.SEGMENT_FILE_NAME.format(segment)), 'r+b') as f:
+            f.seek(offset)
+            f.write(b'B')
+
+        # THEN
+        self.assertRaises(BlockError, block_archive.read, segment, offset, length)
+        self.assertRaises(BlockError, block_archive.read, segment, offset, length + 100)
+
+    def test_archive_blocks(self):
+        """ GIVEN blockchain with some blocks
+        WHEN archive blocks older than depth
+        THEN bodies of old blocks are moved to archive and blocks and txs are found as before
+        """
+        # GIVEN
+        block_db = leveldb.LevelDB(os.path.join(self.__test_path, 'db_test'), create_if_missing=True)
+        chain = BlockChain(block_db, archive_path=self.__archive_path)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 10)
+        blocks = list(chain.iter_blocks(0))
+
+        # WHEN
+        archived_count = chain.archive_blocks(depth=3)
+
+        # THEN
+        self.assertEqual(archived_count, chain.block_height - 3 + 1)
+        self.assertEqual(chain.archived_height, chain.block_height - 3)
+        self.assertEqual(chain.archive_blocks(depth=3), 0)
+
+        reopened_chain = BlockChain(block_db, archive_path=self.__archive_path)
+        for block in blocks:
+            block_hash_encoded = block.block_hash.encode(encoding='UTF-8')
+            is_archived = block.height <= chain.archived_height
+            self.assertEqual(self.__has_key(block_db, BlockChain.BLOCK_BODY_KEY + block_hash_encoded), not is_archived)
+            self.assertEqual(self.__has_key(block_db, BlockChain.BLOCK_ARCHIVE_KEY + block_hash_encoded), is_archived)
+
+            found_block = reopened_chain.find_block_by_hash(block.block_hash)
+            self.assertEqual(len(found_block.confirmed_transaction_list), len(block.confirmed_transaction_list))
+            for tx in block.confirmed_transaction_list:
+                self.assertEqual(reopened_chain.find_tx_by_key(tx.get_tx_hash()).get_tx_hash(), tx.get_tx_hash())
+
+    def test_archive_compactor(self):
+        # GIVEN
+        block_db = leveldb.LevelDB(os.path.join(self.__test_path, 'db_test'), create_if_missing=True)
+        chain = BlockChain(block_db, archive_path=self.__archive_path)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 5)
+        compactor = BlockArchiveCompactor(chain, depth=2, interval=0.1)
+
+        # WHEN
+        compactor.start()
+        deadline = time.time() + 5
+        while chain.archived_height < chain.block_height - 2 and time.time() < deadline:
+            time.sleep(0.05)
+        compactor.stop()
+        compactor.wait()
+
+        # THEN
+        self.assertEqual(chain.archived_height, chain.block_height - 2)
+
+    @staticmethod
+    def __has_key(block_db, key):
+        try:
+            block_db.Get(key)
+            return True
+        except KeyError:
+            return False
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Block Cache"""
+
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import Block, BlockCache
+
+util.set_log_level_debug()
+
+
+class TestBlockCache(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def __create_blocks(self, size):
+        blocks = []
+        prev_block = None
+        for x in range(size):
+            block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            block.generate_block(prev_block)
+            block.block_hash = f"{x}_{block.block_hash}"
+            block.height = x
+            blocks.append(block)
+            prev_block = block
+        return blocks
+
+    def test_get_by_hash_and_height(self):
+        # GIVEN
+        block_cache = BlockCache(max_count=10, max_bytes=1000)
+        block = self.__create_blocks(1)[0]
+
+        # WHEN
+        block_cache.put(block, 10)
+
+        # THEN
+        self.assertIs(block_cache.get(block.block_hash), block)
+        self.assertIs(block_cache.get_by_height(block.height), block)
+        self.assertIsNone(block_cache.get("not_cached_hash"))
+        self.assertIsNone(block_cache.get_by_height(100))
+
+        status = block_cache.get_status()
+        self.assertEqual(status['hit'], 2)
+        self.assertEqual(status['miss'], 2)
+        self.assertEqual(status['hit_rate'], 0.5)
+
+    def test_evict_by_count(self):
+        # GIVEN
+        block_cache = BlockCache(max_count=3, max_bytes=1000)
+        blocks = self.__create_blocks(4)
+
+        # WHEN
+        for block in blocks[:3]:
+            block_cache.put(block, 10)
+        block_cache.get(blocks[0].block_hash)  # blocks[1] becomes least recently used
+        block_cache.put(blocks[3], 10)
+
+        # THEN
+        self.assertIsNotNone(block_cache.get(blocks[0].block_hash))
+        self.assertIsNone(block_cache.get(blocks[1].block_hash))
+        self.assertIsNone(block_cache.get_by_height(blocks[1].height))
+        self.assertEqual(block_cache.get_status()['count'], 3)
+        self.assertEqual(block_cache.get_status()['eviction'], 1)
+
+    def test_evict_by_bytes(self):
+        # GIVEN
+        block_cache = BlockCache(max_count=10, max_bytes=100)
+        blocks = self.__create_blocks(3)
+
+        # WHEN
+        block_cache.put(blocks[0], 40)
+        block_cache.put(blocks[1], 40)
+        block_cache.put(blocks[2], 40)
+
+        # THEN
+        self.assertIsNone(block_cache.get(blocks[0].block_hash))
+        self.assertEqual(block_cache.get_status()['bytes'], 80)
+
+    def test_disabled_cache(self):
+        # GIVEN
+        block_cache = BlockCache(max_count=0, max_bytes=100)
+        block = self.__create_blocks(1)[0]
+
+        # WHEN
+        block_cache.put(block, 10)
+
+        # THEN
+        self.assertIsNone(block_cache.get(block.block_hash))
+
+
+if __name__ == '__main__':
+    unittest.main()
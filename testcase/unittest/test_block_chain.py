@@ -16,8 +16,10 @@
 # limitations under the License.
 """Test block chain class"""
 
+import json
 import leveldb
 import logging
+import pickle
 import random
 import unittest
 
@@ -108,6 +110,183 @@ class TestBlockChain(unittest.TestCase):
         # THEN
         self.assertEqual(find_block_by_hash.block_hash, find_block_by_height.block_hash)
 
+    def test_find_block_header_only(self):
+        """ GIVEN block with txs in blockchain
+        WHEN find block with headers_only
+        THEN header of block is found without txs
+        """
+        # GIVEN
+        last_block = self.chain.last_block
+        block = self.generate_test_block()
+        block.generate_block(last_block)
+        block.block_status = BlockStatus.confirmed
+        self.chain.add_block(block)
+        self.chain._BlockChain__block_cache.clear()
+
+        # WHEN
+        header = self.chain.find_block_by_hash(block.block_hash, headers_only=True)
+        header_by_height = self.chain.find_block_by_height(block.height, headers_only=True)
+        full_block = self.chain.find_block_by_hash(block.block_hash)
+
+        # THEN
+        self.assertEqual(header.block_hash, block.block_hash)
+        self.assertEqual(header.prev_block_hash, block.prev_block_hash)
+        self.assertEqual(header_by_height.height, block.height)
+        self.assertEqual(len(header.confirmed_transaction_list), 0)
+        self.assertEqual(len(full_block.confirmed_transaction_list), len(block.confirmed_transaction_list))
+
+    def test_find_pickled_block(self):
+        """ GIVEN block saved by previous version (whole block pickled under block hash)
+        WHEN find block
+        THEN block is restored
+        """
+        # GIVEN
+        block = self.generate_test_block()
+        block.generate_block(self.chain.last_block)
+        self.chain._BlockChain__confirmed_block_db.Put(block.block_hash.encode(encoding='UTF-8'), pickle.dumps(block))
+
+        # WHEN
+        found_block = self.chain.find_block_by_hash(block.block_hash)
+
+        # THEN
+        self.assertEqual(found_block.block_hash, block.block_hash)
+        self.assertEqual(len(found_block.confirmed_transaction_list), len(block.confirmed_transaction_list))
+
+    def test_chain_meta_restore(self):
+        """ GIVEN blockchain with some blocks
+        WHEN open blockchain again with same db (with and without chain meta)
+        THEN total_tx and block count are restored
+        """
+        # GIVEN
+        total_tx = self.chain.total_tx
+        general_block_count = self.chain.block_type_count['general']
+        test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 5)
+        block_db = self.chain._BlockChain__confirmed_block_db
+
+        # WHEN
+        restored_chain = BlockChain(block_db)
+        block_db.Delete(BlockChain.CHAIN_META_KEY)
+        rebuilt_chain = BlockChain(block_db)
+
+        # THEN
+        self.assertEqual(self.chain.total_tx, total_tx + 50)
+        self.assertEqual(self.chain.block_type_count['general'], general_block_count + 5)
+        for chain in (restored_chain, rebuilt_chain):
+            self.assertEqual(chain.total_tx, self.chain.total_tx)
+            self.assertEqual(chain.block_height, self.chain.block_height)
+            self.assertEqual(chain.block_type_count, self.chain.block_type_count)
+
+    def test_block_cache_hit(self):
+        """ GIVEN block added to blockchain
+        WHEN find block by hash and height
+        THEN block is found in block cache
+        """
+        # GIVEN
+        test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 1)
+        last_block = self.chain.last_block
+        hit_count = self.chain.get_block_cache_status()['hit']
+
+        # WHEN
+        block_by_hash = self.chain.find_block_by_hash(last_block.block_hash)
+        block_by_height = self.chain.find_block_by_height(last_block.height)
+
+        # THEN
+        self.assertIs(block_by_hash, last_block)
+        self.assertIs(block_by_height, last_block)
+        self.assertEqual(self.chain.get_block_cache_status()['hit'], hit_count + 2)
+
+    def test_iter_blocks(self):
+        """ GIVEN blockchain with some blocks
+        WHEN iterate blocks by height range
+        THEN blocks are same as blocks found by height, in height order
+        """
+        # GIVEN
+        test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 10)
+        end_height = self.chain.block_height
+        start_height = end_height - 9
+        self.chain._BlockChain__block_cache.clear()
+
+        # WHEN
+        blocks = list(self.chain.iter_blocks(start_height, end_height))
+        headers = list(self.chain.iter_blocks(start_height, end_height, headers_only=True))
+
+        # THEN
+        self.assertEqual([block.height for block in blocks], list(range(start_height, end_height + 1)))
+        self.assertEqual(self.chain.get_block_cache_status()['count'], 0)
+        for block, header in zip(blocks, headers):
+            self.assertEqual(block.block_hash, self.chain.find_block_by_height(block.height).block_hash)
+            self.assertEqual(len(block.confirmed_transaction_list), 10)
+            self.assertEqual(header.block_hash, block.block_hash)
+            self.assertEqual(len(header.confirmed_transaction_list), 0)
+
+        self.assertEqual(len(list(self.chain.iter_blocks(end_height - 2))), 3)
+        self.assertEqual(list(self.chain.iter_blocks(end_height + 1)), [])
+
+    def test_add_block_batch_is_atomic(self):
+        """ GIVEN block db which fails to write
+        WHEN add block
+        THEN neither block nor tx_info is saved
+        """
+        # GIVEN
+        block = self.generate_test_block()
+        block.generate_block(self.chain.last_block)
+        block.block_status = BlockStatus.confirmed
+        block_db = self.chain._BlockChain__confirmed_block_db
+
+        class FailToWriteDB:
+            def __getattr__(self, name):
+                return getattr(block_db, name)
+
+            def Write(self, batch, sync=False):
+                raise leveldb.LevelDBError("fail to write")
+
+        self.chain._BlockChain__confirmed_block_db = FailToWriteDB()
+
+        # WHEN
+        self.assertRaises(leveldb.LevelDBError, self.chain.add_block, block)
+        self.chain._BlockChain__confirmed_block_db = block_db
+
+        # THEN
+        self.assertIsNone(self.chain.find_block_by_hash(block.block_hash))
+        for tx in block.confirmed_transaction_list:
+            self.assertIsNone(self.chain.find_tx_by_key(tx.get_tx_hash()))
+
+    def test_add_block_group_commit(self):
+        """ GIVEN block db sync interval
+        WHEN add some blocks within the interval
+        THEN blocks are written without sync until the interval passes or sync_block_db is called
+        """
+        # GIVEN
+        origin_sync_interval = conf.BLOCK_DB_SYNC_INTERVAL
+        conf.BLOCK_DB_SYNC_INTERVAL = 60000
+        block_db = self.chain._BlockChain__confirmed_block_db
+        syncs = []
+
+        class SyncRecordDB:
+            def __getattr__(self, name):
+                return getattr(block_db, name)
+
+            def Write(self, batch, sync=False):
+                syncs.append(sync)
+                block_db.Write(batch, sync=sync)
+
+        self.chain._BlockChain__confirmed_block_db = SyncRecordDB()
+        self.chain.sync_block_db()
+
+        try:
+            # WHEN
+            test_util.add_confirmed_blocks(self.chain, self.__peer_id, self.__peer_auth, 3)
+            sync_timer = self.chain._BlockChain__sync_timer
+            self.chain.sync_block_db()
+        finally:
+            conf.BLOCK_DB_SYNC_INTERVAL = origin_sync_interval
+            self.chain._BlockChain__confirmed_block_db = block_db
+
+        # THEN
+        self.assertEqual(syncs, [True, False, False, False, True])
+        self.assertIsNotNone(sync_timer)
+        self.assertIsNone(self.chain._BlockChain__sync_timer)
+
     def test_add_some_block_and_find_by_key(self):
         """몇개의 블럭을 추가한 후 임의의 블럭을 찾는다
         """
@@ -147,6 +326,106 @@ class TestBlockChain(unittest.TestCase):
 
         self.assertEqual(tx.get_tx_hash(), saved_tx.get_tx_hash(), "Fail Find Transaction")
 
+    def test_contains_tx(self):
+        """ GIVEN blockchain with a tx
+        WHEN contains_tx with the tx hash and unknown tx hash
+        THEN only the tx in block db is found
+        """
+        # GIVEN
+        tx = self.__add_single_tx_block_blockchain_return_tx()
+        self.chain.wait_tx_filter_ready()
+
+        # WHEN THEN
+        self.assertTrue(self.chain.contains_tx(tx.get_tx_hash()))
+        self.assertFalse(self.chain.contains_tx(test_util.create_basic_tx(self.__peer_id, self.__peer_auth).tx_hash))
+
+    def test_find_tx_by_position(self):
+        """ GIVEN block added to blockchain without compression
+        WHEN find tx by tx_hash without cached block
+        THEN tx is read from the block body by its offset
+        """
+        # GIVEN
+        origin_block_db_codec = conf.BLOCK_DB_CODEC
+        conf.BLOCK_DB_CODEC = 'none'
+        block = self.generate_test_block()
+        block.generate_block(self.chain.last_block)
+        block.block_status = BlockStatus.confirmed
+        self.chain.add_block(block)
+        self.chain._BlockChain__block_cache.clear()
+        conf.BLOCK_DB_CODEC = origin_block_db_codec
+
+        for tx_index, tx in enumerate(block.confirmed_transaction_list):
+            # WHEN
+            tx_info = self.chain._BlockChain__find_tx_info(tx.get_tx_hash())
+            saved_tx = self.chain.find_tx_by_key(tx.get_tx_hash())
+
+            # THEN
+            self.assertEqual(tx_info['block_height'], block.height)
+            self.assertEqual(tx_info['tx_index'], tx_index)
+            self.assertEqual(saved_tx.get_tx_hash(), tx.get_tx_hash())
+            self.assertEqual(saved_tx.get_data(), tx.get_data())
+            self.assertEqual(saved_tx.signature, tx.signature)
+        self.assertEqual(self.chain.get_block_cache_status()['count'], 0)
+
+    def test_find_tx_in_compressed_block(self):
+        """ GIVEN block added to blockchain with compression
+        WHEN find tx by tx_hash without cached block
+        THEN whole block is read once and cached
+        """
+        # GIVEN
+        origin_block_db_codec = conf.BLOCK_DB_CODEC
+        conf.BLOCK_DB_CODEC = 'zlib'
+        block = self.generate_test_block()
+        block.generate_block(self.chain.last_block)
+        block.block_status = BlockStatus.confirmed
+        self.chain.add_block(block)
+        self.chain._BlockChain__block_cache.clear()
+        conf.BLOCK_DB_CODEC = origin_block_db_codec
+
+        for tx in block.confirmed_transaction_list:
+            # WHEN
+            saved_tx = self.chain.find_tx_by_key(tx.get_tx_hash())
+
+            # THEN
+            self.assertEqual(saved_tx.get_tx_hash(), tx.get_tx_hash())
+            self.assertEqual(saved_tx.get_data(), tx.get_data())
+        self.assertEqual(self.chain.get_block_cache_status()['count'], 1)
+
+    def test_migrate_tx_info(self):
+        """ GIVEN block and tx_info saved by previous version (pickled block, json tx_info without tx position)
+        WHEN rebuild blockchain
+        THEN block and tx_info are migrated and tx and invoke result are found by its position
+        """
+        # GIVEN
+        block = self.generate_test_block()
+        block.generate_block(self.chain.last_block)
+        block.block_status = BlockStatus.confirmed
+        self.chain.add_block(block)
+        block_db = self.chain._BlockChain__confirmed_block_db
+        block_hash_encoded = block.block_hash.encode(encoding='UTF-8')
+
+        block_db.Put(block_hash_encoded, pickle.dumps(block))
+        block_db.Delete(BlockChain.BLOCK_BODY_KEY + block_hash_encoded)
+        for tx in block.confirmed_transaction_list:
+            block_db.Put(tx.get_tx_hash().encode(encoding=conf.HASH_KEY_ENCODING),
+                         json.dumps({'block_hash': block.block_hash,
+                                     'result': {'code': message_code.Response.success}}).encode())
+        block_db.Delete(BlockChain.CHAIN_META_KEY)
+
+        # WHEN
+        rebuilt_chain = BlockChain(block_db)
+
+        # THEN
+        self.assertEqual(block_db.Get(block_hash_encoded)[:len(Block.ENCODING_MAGIC)], Block.ENCODING_MAGIC)
+        rebuilt_chain._BlockChain__block_cache.clear()
+        for tx_index, tx in enumerate(block.confirmed_transaction_list):
+            tx_info = rebuilt_chain._BlockChain__find_tx_info(tx.get_tx_hash())
+            self.assertEqual(tx_info['tx_index'], tx_index)
+            self.assertNotIn('result', tx_info)
+            self.assertEqual(rebuilt_chain.find_invoke_result_by_tx_hash(tx.get_tx_hash())['code'],
+                             message_code.Response.success)
+            self.assertEqual(rebuilt_chain.find_tx_by_key(tx.get_tx_hash()).get_tx_hash(), tx.get_tx_hash())
+
     def test_add_and_verify_results(self):
         """invoke_result = "{"code" : "invoke_result_code" , "error_message": "message" }"
 
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Block Codec"""
+
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block, BlockChain, BlockCodec, BlockError
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class TestBlockCodec(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        self.__block_db_codec = conf.BLOCK_DB_CODEC
+
+    def tearDown(self):
+        conf.BLOCK_DB_CODEC = self.__block_db_codec
+
+    def test_encode_decode(self):
+        # GIVEN
+        block = test_util.create_confirmed_block(None, test_util.create_icx_txs(self.__peer_id, self.__peer_auth, 10))
+        body = block.serialize_block_body()
+
+        for codec_name in BlockCodec.names():
+            # WHEN
+            encoded_body = BlockCodec.encode(body, codec_name)
+
+            # THEN
+            self.assertEqual(BlockCodec.codec_name(encoded_body), codec_name)
+            self.assertEqual(BlockCodec.decode(encoded_body), body)
+            self.assertEqual(BlockCodec.decode(memoryview(encoded_body)), body)
+
+        self.assertIs(BlockCodec.encode(body, BlockCodec.none), body)
+        self.assertRaises(BlockError, BlockCodec.encode, body, 'unknown')
+        self.assertRaises(BlockError, BlockCodec.decode, BlockCodec.MAGIC + bytes([255]) + body)
+        self.assertRaises(ValueError, BlockCodec.register, 'other', 1, bytes, bytes)
+
+    def test_decode_over_max_size(self):
+        """ GIVEN bodies compressed to a small size but larger than the max block size when decompressed
+        WHEN decode them
+        THEN BlockError is raised without decompressing the whole body
+        """
+        # GIVEN
+        max_size = BlockCodec.max_body_size()
+        block = test_util.create_confirmed_block(None, test_util.create_icx_txs(self.__peer_id, self.__peer_auth, 10))
+
+        for codec_name in BlockCodec.names()[1:]:
+            fit_body = BlockCodec.encode(b'\0' * max_size, codec_name)
+            bomb_body = BlockCodec.encode(b'\0' * max_size * 10, codec_name)
+            truncated_body = BlockCodec.encode(block.serialize_block_body(), codec_name)[:-4]
+
+            # WHEN THEN
+            self.assertEqual(len(BlockCodec.decode(fit_body)), max_size)
+            self.assertRaises(BlockError, BlockCodec.decode, BlockCodec.encode(b'\0' * (max_size + 1), codec_name))
+            self.assertRaises(BlockError, BlockCodec.decode, bomb_body)
+            self.assertRaises(BlockError, BlockCodec.decode, truncated_body)
+            self.assertRaises(BlockError, BlockCodec.decode, bomb_body[:8] + b'broken' + bomb_body[14:])
+
+    def test_serialize_block_with_codec(self):
+        """ GIVEN block
+        WHEN serialize block with each codec
+        THEN deserialized blocks are same
+        """
+        # GIVEN
+        block = test_util.create_confirmed_block(None, test_util.create_icx_txs(self.__peer_id, self.__peer_auth, 10))
+
+        for codec_name in BlockCodec.names():
+            # WHEN
+            block_dumps = block.serialize_block(codec_name)
+            deserialized_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+            deserialized_block.deserialize_block(block_dumps)
+
+            # THEN
+            self.assertEqual(deserialized_block.block_hash, block.block_hash)
+            self.assertEqual([tx.get_tx_hash() for tx in deserialized_block.confirmed_transaction_list],
+                             [tx.get_tx_hash() for tx in block.confirmed_transaction_list])
+
+    def test_mixed_codec_chain(self):
+        """ GIVEN blockchain with blocks saved by different codecs
+        WHEN find blocks and txs
+        THEN all blocks are readable
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        blocks = []
+        for codec_name in BlockCodec.names():
+            conf.BLOCK_DB_CODEC = codec_name
+            block = test_util.create_confirmed_block(
+                chain.last_block, test_util.create_icx_txs(self.__peer_id, self.__peer_auth, 10))
+            chain.add_block(block)
+            blocks.append(block)
+
+        # WHEN
+        chain = BlockChain(block_db)
+
+        # THEN
+        for codec_name, block in zip(BlockCodec.names(), blocks):
+            body = block_db.Get(BlockChain.BLOCK_BODY_KEY + block.block_hash.encode())
+            self.assertEqual(BlockCodec.codec_name(body), codec_name)
+            self.assertEqual(len(chain.find_block_by_height(block.height).confirmed_transaction_list),
+                             len(block.confirmed_transaction_list))
+            for tx in block.confirmed_transaction_list:
+                self.assertEqual(chain.find_tx_by_key(tx.get_tx_hash()).get_tx_hash(), tx.get_tx_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
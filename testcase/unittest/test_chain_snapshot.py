@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Chain Snapshot"""
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+import leveldb
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import BlockChain, BlockchainError, BlockStatus, ChainSnapshot, SnapshotError
+from loopchain.protos import message_code
+
+util.set_log_level_debug()
+
+
+class TestChainSnapshot(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+        self.__snapshot_path = os.path.join(self.__test_path, 'snapshot.tar')
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def __make_level_db(self, name):
+        return leveldb.LevelDB(os.path.join(self.__test_path, name), create_if_missing=True)
+
+    def __create_score_storage(self):
+        score_storage_path = os.path.join(self.__test_path, 'score_source')
+        os.makedirs(os.path.join(score_storage_path, 'score_leveldb'))
+        with open(os.path.join(score_storage_path, 'score_sqlite'), 'wb') as f:
+            f.write(b'score state')
+        with open(os.path.join(score_storage_path, 'score_leveldb', 'CURRENT'), 'wb') as f:
+            f.write(b'MANIFEST-000001')
+        return score_storage_path
+
+    def test_export_and_import(self):
+        """ GIVEN blockchain and score state
+        WHEN export snapshot and import it into an empty block db
+        THEN blockchain is restored with header of all blocks and body of the last blocks
+        """
+        # GIVEN
+        chain = BlockChain(self.__make_level_db('db_source'))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 10)
+        score_storage_path = self.__create_score_storage()
+        blocks = list(chain.iter_blocks(0))
+
+        # WHEN
+        manifest = ChainSnapshot.export_snapshot(chain, self.__snapshot_path, block_count=3,
+                                                 score_storage_path=score_storage_path)
+        imported_score_path = os.path.join(self.__test_path, 'score_imported')
+        imported_db = self.__make_level_db('db_imported')
+        ChainSnapshot.import_snapshot(self.__snapshot_path, imported_db, imported_score_path)
+        imported_chain = BlockChain(imported_db)
+
+        # THEN
+        self.assertEqual(manifest['height'], chain.block_height)
+        self.assertEqual(imported_chain.block_height, chain.block_height)
+        self.assertEqual(imported_chain.last_block.block_hash, chain.last_block.block_hash)
+        self.assertEqual(imported_chain.total_tx, chain.total_tx)
+        self.assertEqual(imported_chain.block_type_count, chain.block_type_count)
+
+        for block in blocks:
+            is_pruned = block.height <= chain.block_height - 3
+            self.assertEqual(imported_chain.find_block_by_height(block.height, headers_only=True).block_hash,
+                             block.block_hash)
+            self.assertEqual(imported_chain.find_block_by_hash(block.block_hash) is None, is_pruned)
+            for tx in block.confirmed_transaction_list:
+                invoke_result = imported_chain.find_invoke_result_by_tx_hash(tx.get_tx_hash())
+                self.assertEqual(invoke_result['code'], message_code.Response.success)
+                self.assertEqual(imported_chain.find_tx_by_key(tx.get_tx_hash()) is None, is_pruned)
+
+        with open(os.path.join(imported_score_path, 'score_sqlite'), 'rb') as f:
+            self.assertEqual(f.read(), b'score state')
+        with open(os.path.join(imported_score_path, 'score_leveldb', 'CURRENT'), 'rb') as f:
+            self.assertEqual(f.read(), b'MANIFEST-000001')
+
+    def test_add_block_after_import(self):
+        """ GIVEN blockchain imported from snapshot of a lower height
+        WHEN add the following blocks
+        THEN imported blockchain has same last block as source blockchain
+        """
+        # GIVEN
+        chain = BlockChain(self.__make_level_db('db_source'))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 5)
+        ChainSnapshot.export_snapshot(chain, self.__snapshot_path, height=chain.block_height - 2)
+        imported_db = self.__make_level_db('db_imported')
+        ChainSnapshot.import_snapshot(self.__snapshot_path, imported_db)
+        imported_chain = BlockChain(imported_db)
+
+        # WHEN
+        for block in chain.iter_blocks(imported_chain.block_height + 1):
+            block.block_status = BlockStatus.confirmed
+            imported_chain.add_block(block)
+
+        # THEN
+        self.assertEqual(imported_chain.last_block.block_hash, chain.last_block.block_hash)
+        self.assertEqual(imported_chain.total_tx, chain.total_tx)
+
+    def test_rebuild_imported_chain(self):
+        """ GIVEN blockchain imported from snapshot without body of the first blocks
+        WHEN rebuild chain meta (--rebuild)
+        THEN chain meta is rebuilt from the pruned block
+        """
+        # GIVEN
+        chain = BlockChain(self.__make_level_db('db_source'))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 6)
+        ChainSnapshot.export_snapshot(chain, self.__snapshot_path, block_count=2)
+        imported_db = self.__make_level_db('db_imported')
+        ChainSnapshot.import_snapshot(self.__snapshot_path, imported_db)
+        imported_chain = BlockChain(imported_db)
+        self.assertEqual(imported_chain.pruned_height, chain.block_height - 2)
+
+        # WHEN
+        rebuild_chain_meta = conf.REBUILD_CHAIN_META
+        conf.REBUILD_CHAIN_META = True
+        try:
+            del imported_chain
+            imported_chain = BlockChain(imported_db)
+        finally:
+            conf.REBUILD_CHAIN_META = rebuild_chain_meta
+
+        # THEN
+        self.assertEqual(imported_chain.total_tx, chain.total_tx)
+        self.assertEqual(imported_chain.block_type_count, chain.block_type_count)
+        self.assertEqual(imported_chain.pruned_height, chain.block_height - 2)
+
+        # chain meta 가 없으면 body 가 없는 block 을 셀 수 없으므로 rebuild 하지 않는다.
+        imported_db.Delete(BlockChain.CHAIN_META_KEY)
+        self.assertRaises(BlockchainError, BlockChain, imported_db)
+
+    def test_export_imported_chain(self):
+        """ GIVEN blockchain imported from snapshot without body of the first blocks
+        WHEN export snapshot of the imported blockchain and import it again
+        THEN blockchain is restored with header of all blocks and tx index of the pruned blocks
+        """
+        # GIVEN
+        chain = BlockChain(self.__make_level_db('db_source'))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 6)
+        blocks = list(chain.iter_blocks(0))
+        ChainSnapshot.export_snapshot(chain, self.__snapshot_path, block_count=3)
+        imported_db = self.__make_level_db('db_imported')
+        ChainSnapshot.import_snapshot(self.__snapshot_path, imported_db)
+        imported_chain = BlockChain(imported_db)
+
+        # WHEN
+        re_exported_snapshot_path = os.path.join(self.__test_path, 're_exported_snapshot.tar')
+        ChainSnapshot.export_snapshot(imported_chain, re_exported_snapshot_path, block_count=2)
+        re_imported_db = self.__make_level_db('db_re_imported')
+        ChainSnapshot.import_snapshot(re_exported_snapshot_path, re_imported_db)
+        re_imported_chain = BlockChain(re_imported_db)
+
+        # THEN
+        self.assertEqual(re_imported_chain.last_block.block_hash, chain.last_block.block_hash)
+        self.assertEqual(re_imported_chain.total_tx, chain.total_tx)
+        self.assertEqual(re_imported_chain.block_type_count, chain.block_type_count)
+        self.assertEqual(re_imported_chain.pruned_height, chain.block_height - 2)
+
+        for block in blocks:
+            self.assertEqual(re_imported_chain.find_block_by_height(block.height, headers_only=True).block_hash,
+                             block.block_hash)
+            self.assertEqual(re_imported_chain.find_block_by_hash(block.block_hash) is None,
+                             block.height <= chain.block_height - 2)
+            for tx in block.confirmed_transaction_list:
+                self.assertTrue(re_imported_chain.contains_tx(tx.get_tx_hash()))
+                invoke_result = re_imported_chain.find_invoke_result_by_tx_hash(tx.get_tx_hash())
+                self.assertEqual(invoke_result['code'], message_code.Response.success)
+
+        # body 가 없는 block 까지의 snapshot 은 만들 수 없다.
+        self.assertRaises(BlockchainError, lambda: list(imported_chain.snapshot_items(chain.block_height - 3)))
+
+    def test_import_broken_snapshot(self):
+        # GIVEN
+        chain = BlockChain(self.__make_level_db('db_source'))
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 2)
+        ChainSnapshot.export_snapshot(chain, self.__snapshot_path)
+
+        broken_snapshot_path = os.path.join(self.__test_path, 'broken_snapshot.tar')
+        with tarfile.open(self.__snapshot_path, 'r') as snapshot, tarfile.open(broken_snapshot_path, 'w') as broken:
+            for member in snapshot.getmembers():
+                data = bytearray(snapshot.extractfile(member).read())
+                if member.name == ChainSnapshot.BLOCK_DB_NAME:
+                    data[len(data) // 2] ^= 0xff
+                broken.addfile(member, io.BytesIO(data))
+
+        # WHEN THEN
+        imported_db = self.__make_level_db('db_imported')
+        self.assertRaises(SnapshotError, ChainSnapshot.import_snapshot, broken_snapshot_path, imported_db)
+        self.assertRaises(KeyError, imported_db.Get, BlockChain.LAST_BLOCK_KEY)
+
+        self.assertRaises(SnapshotError, ChainSnapshot.import_snapshot, self.__snapshot_path,
+                          chain._BlockChain__confirmed_block_db)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Chain Verifier"""
+
+import unittest
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain, BlockCodec, ChainVerifier
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class TestChainVerifier(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+
+    def tearDown(self):
+        pass
+
+    def __tamper_tx_signature(self, block_db, chain, height):
+        """height 의 block 에 담긴 마지막 tx 의 signature 를 바꾼다."""
+        body_key = BlockChain.BLOCK_BODY_KEY + chain.find_block_by_height(height).block_hash.encode()
+        body = bytearray(BlockCodec.decode(block_db.Get(body_key)))
+        body[-1] ^= 0xFF
+        block_db.Put(body_key, bytes(body))
+
+    def test_verify_valid_chain(self):
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 10, 5, is_signed=True)
+
+        for process_count in (1, 2):
+            # WHEN
+            report = ChainVerifier(block_db, process_count=process_count, shard_size=3,
+                                   leader_public_keys=[self.__peer_auth.get_public_der()]).verify()
+
+            # THEN
+            self.assertIsNone(report['invalid_height'], report['error'])
+            self.assertEqual(report['block_count'], 11)
+            self.assertEqual(report['tx_count'], 50)
+            self.assertEqual(report['verified_height'], chain.block_height)
+            self.assertTrue(report['block_signature'])
+
+        report = ChainVerifier(block_db, process_count=2, shard_size=3).verify(4, 8)
+        self.assertIsNone(report['invalid_height'], report['error'])
+        self.assertEqual(report['block_count'], 5)
+
+    def test_first_invalid_height(self):
+        """ GIVEN chain with invalid tx signatures at height 4 and 8
+        WHEN verify chain
+        THEN the first inconsistent height is 4
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 10, 5, is_signed=True)
+        self.__tamper_tx_signature(block_db, chain, 8)
+        self.__tamper_tx_signature(block_db, chain, 4)
+
+        # WHEN
+        report = ChainVerifier(block_db, process_count=2, shard_size=3).verify()
+
+        # THEN
+        self.assertEqual(report['invalid_height'], 4)
+        self.assertEqual(report['verified_height'], 3)
+        self.assertIn("signature", report['error'])
+
+    def test_broken_link_and_missing_block(self):
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 10, 1, is_signed=True)
+
+        def height_key(height):
+            return BlockChain.BLOCK_HEIGHT_KEY + height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+
+        # WHEN
+        block_db.Put(height_key(6), block_db.Get(height_key(7)))
+        report = ChainVerifier(block_db, process_count=2, shard_size=3).verify()
+
+        # THEN
+        self.assertEqual(report['invalid_height'], 6)
+
+        # WHEN
+        block_db.Delete(height_key(6))
+        block_db.Delete(height_key(3))
+        report = ChainVerifier(block_db, process_count=2, shard_size=3).verify()
+
+        # THEN
+        self.assertEqual(report['invalid_height'], 3)
+        self.assertIn("no block", report['error'])
+
+    def test_verify_block_signature(self):
+        # GIVEN
+        block_db = MemoryStore()
+        chain = BlockChain(block_db)
+        test_util.add_confirmed_blocks(chain, self.__peer_id, self.__peer_auth, 3, 1, is_signed=True)
+        other_public_key = ec.generate_private_key(ec.SECP256K1(), default_backend()).public_key().public_bytes(
+            encoding=serialization.Encoding.DER, format=serialization.PublicFormat.SubjectPublicKeyInfo)
+
+        # WHEN
+        report = ChainVerifier(block_db, process_count=1, leader_public_keys=[other_public_key]).verify()
+
+        # THEN
+        self.assertEqual(report['invalid_height'], 1)
+        self.assertIn("block signature", report['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test making up blocks from the mempool in ConsensusBase"""
+
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, Mempool
+from loopchain.peer.consensus_base import ConsensusBase
+
+util.set_log_level_debug()
+
+
+class CandidateBlocksForTest:
+    """add_unconfirmed_block 으로 등록된 block 만 모아 두는 candidate blocks"""
+
+    def __init__(self, last_block):
+        self.last_block = last_block
+        self.unconfirmed_blocks = []
+
+    def get_last_block(self, blockchain=None):
+        if self.unconfirmed_blocks:
+            return self.unconfirmed_blocks[-1]
+        return self.last_block
+
+    def add_unconfirmed_block(self, block):
+        self.unconfirmed_blocks.append(block)
+
+
+class BlockManagerForTest:
+    def __init__(self, candidate_blocks):
+        self.channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL
+        self.__mempool = Mempool()
+        self.__candidate_blocks = candidate_blocks
+
+    def get_blockchain(self):
+        return None
+
+    def get_mempool(self):
+        return self.__mempool
+
+    def get_candidate_blocks(self):
+        return self.__candidate_blocks
+
+
+class ConsensusForTest(ConsensusBase):
+    def consensus(self):
+        self._makeup_block()
+
+
+def make_consensus(txs):
+    """txs 를 mempool 에 담은 ConsensusForTest 를 만든다."""
+    last_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+    last_block.generate_block()
+    consensus = ConsensusForTest(BlockManagerForTest(CandidateBlocksForTest(last_block)))
+    for tx in txs:
+        consensus._mempool.put(tx)
+    return consensus
+
+
+class TestConsensusBase(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        self.__max_block_kbytes = conf.MAX_BLOCK_KBYTES
+        self.__max_block_tx_num = conf.MAX_BLOCK_TX_NUM
+
+    def tearDown(self):
+        conf.MAX_BLOCK_KBYTES = self.__max_block_kbytes
+        conf.MAX_BLOCK_TX_NUM = self.__max_block_tx_num
+
+    def test_body_size(self):
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        self.assertEqual(block.body_size, len(block.serialize_block_body()))
+
+        # WHEN
+        for i in range(10):
+            tx = test_util.create_basic_tx(self.__peer_id, self.__peer_auth)
+            self.assertEqual(tx.serialized_size(), len(tx.serialize_tx()))
+            block.put_transaction(tx)
+
+        # THEN
+        self.assertEqual(block.body_size, len(block.serialize_block_body()))
+        divided_block = block.divide()
+        self.assertTrue(divided_block.is_divided_block)
+        self.assertEqual(len(divided_block.confirmed_transaction_list), 10)
+        self.assertEqual(divided_block.body_size, len(divided_block.serialize_block_body()))
+        self.assertEqual(len(block.confirmed_transaction_list), 0)
+        self.assertEqual(block.body_size, len(block.serialize_block_body()))
+
+    def test_makeup_block_without_divide(self):
+        # GIVEN
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 100)
+        tx_hashes = [tx.get_tx_hash() for tx in txs]
+        consensus = make_consensus(txs)
+
+        # WHEN
+        consensus.consensus()
+
+        # THEN
+        self.assertEqual([tx.get_tx_hash() for tx in consensus.block.confirmed_transaction_list], tx_hashes)
+        self.assertEqual(consensus._candidate_blocks.unconfirmed_blocks, [])
+
+    def test_makeup_divided_blocks(self):
+        # GIVEN
+        conf.MAX_BLOCK_KBYTES = 8
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 300)
+        tx_hashes = [tx.get_tx_hash() for tx in txs]
+        consensus = make_consensus(txs)
+
+        # WHEN
+        consensus.consensus()
+
+        # THEN 모든 tx 가 순서대로 크기 제한 안의 나누어진 block 들에 담긴다.
+        divided_blocks = consensus._candidate_blocks.unconfirmed_blocks
+        self.assertGreater(len(divided_blocks), 1)
+        self.assertEqual(len(consensus.block.confirmed_transaction_list), 0)
+
+        divided_tx_hashes = []
+        prev_block_hash = None
+        for block in divided_blocks:
+            self.assertTrue(block.is_divided_block)
+            self.assertEqual(block.body_size, len(block.serialize_block_body()))
+            self.assertLessEqual(len(block.serialize_block_body()),
+                                 conf.MAX_BLOCK_KBYTES * 1024 - conf.BLOCK_HEADER_RESERVED_BYTES)
+            block.verify_integrity(verify_tx_signature=False)
+            if prev_block_hash is not None:
+                self.assertEqual(block.prev_block_hash, prev_block_hash)
+            prev_block_hash = block.block_hash
+            divided_tx_hashes.extend(tx.get_tx_hash() for tx in block.confirmed_transaction_list)
+        self.assertEqual(divided_tx_hashes, tx_hashes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Invoke Result Store"""
+
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block, BlockChain, BlockStatus, InvokeResultStore
+from loopchain.protos import message_code
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class TestInvokeResultStore(unittest.TestCase):
+    __peer_id = 'aaa'
+    __success = {'code': int(message_code.Response.success)}
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def __put_block(self, store, block_db, height, invoke_results):
+        batch = block_db.WriteBatch()
+        store.put_block(batch, height, invoke_results)
+        block_db.Write(batch)
+        store.commit()
+
+    def test_dictionary_encoding(self):
+        """ GIVEN block with same results and a fail result
+        WHEN put results of the block
+        THEN each distinct result is saved once in dictionary and results are found by tx index
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        store = InvokeResultStore(block_db)
+        fail_result = {'code': message_code.Response.fail, 'message': 'fail'}
+        invoke_results = [self.__success] * 99 + [fail_result]
+
+        # WHEN
+        self.__put_block(store, block_db, 1, invoke_results)
+        self.__put_block(store, block_db, 2, [self.__success])
+
+        # THEN
+        self.assertEqual(store.dict_count, 2)
+        reloaded_store = InvokeResultStore(block_db)
+        self.assertEqual(reloaded_store.dict_count, 2)
+        for tx_index, invoke_result in enumerate(invoke_results):
+            self.assertEqual(reloaded_store.get(1, tx_index), invoke_result)
+        self.assertEqual(reloaded_store.get(2, 0), self.__success)
+        self.assertIsNone(reloaded_store.get(1, len(invoke_results)))
+        self.assertIsNone(reloaded_store.get(3, 0))
+
+    def test_discard_uncommitted_results(self):
+        # GIVEN
+        block_db = MemoryStore()
+        store = InvokeResultStore(block_db)
+        store.put_block(block_db.WriteBatch(), 1, [{'code': 1}])
+
+        # WHEN
+        self.__put_block(store, block_db, 1, [{'code': 2}, self.__success])
+
+        # THEN
+        self.assertEqual(store.dict_count, 2)
+        self.assertEqual(InvokeResultStore(block_db).get(1, 0), {'code': 2})
+        self.assertEqual(InvokeResultStore(block_db).get(1, 1), self.__success)
+
+    def test_inline_results(self):
+        """ GIVEN full dictionary
+        WHEN put results which are not in dictionary
+        THEN results are saved in the record of block
+        """
+        # GIVEN
+        block_db = MemoryStore()
+        store = InvokeResultStore(block_db, dict_max_count=1)
+        invoke_results = [self.__success] + [{'code': 1, 'message': f'error {x}'} for x in range(5)]
+
+        # WHEN
+        self.__put_block(store, block_db, 1, invoke_results)
+
+        # THEN
+        self.assertEqual(store.dict_count, 1)
+        self.assertEqual([InvokeResultStore(block_db).get(1, x) for x in range(len(invoke_results))], invoke_results)
+
+
+if __name__ == '__main__':
+    unittest.main()
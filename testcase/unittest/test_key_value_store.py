@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Key Value Store"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain
+from loopchain.storage import KeyValueStoreError, open_key_value_store
+
+util.set_log_level_debug()
+
+
+class TestKeyValueStore(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__test_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.__test_path)
+
+    def test_get_put_delete(self):
+        for store_type, store in test_util.open_key_value_stores(self.__test_path):
+            # WHEN
+            store.Put(b'key', b'value')
+            store.Put(b'key_to_delete', b'value', sync=True)
+            store.Delete(b'key_to_delete')
+
+            # THEN
+            self.assertEqual(bytes(store.Get(b'key')), b'value', store_type)
+            self.assertRaises(KeyError, store.Get, b'key_to_delete')
+            self.assertRaises(KeyError, store.Get, b'not_exist_key')
+
+    def test_write_batch(self):
+        for store_type, store in test_util.open_key_value_stores(self.__test_path):
+            # GIVEN
+            store.Put(b'a', b'old')
+            batch = store.WriteBatch()
+            batch.Put(b'a', b'new')
+            batch.Put(b'b', b'b')
+            batch.Delete(b'b')
+            batch.Put(b'c', b'c')
+
+            # WHEN
+            store.Write(batch, sync=True)
+
+            # THEN
+            self.assertEqual(bytes(store.Get(b'a')), b'new', store_type)
+            self.assertRaises(KeyError, store.Get, b'b')
+            self.assertEqual(bytes(store.Get(b'c')), b'c', store_type)
+
+    def test_range_iter(self):
+        for store_type, store in test_util.open_key_value_stores(self.__test_path):
+            # GIVEN
+            for x in range(10):
+                store.Put(b'key' + bytes([x]), bytes([x]))
+            store.Put(b'other', b'other')
+
+            # WHEN
+            items = [(bytes(key), bytes(value))
+                     for key, value in store.RangeIter(key_from=b'key' + bytes([2]), key_to=b'key' + bytes([5]))]
+            keys = [bytes(key) for key in store.RangeIter(key_from=b'key', key_to=b'key' + bytes([255]),
+                                                          include_value=False, reverse=True)]
+
+            # THEN
+            self.assertEqual(items, [(b'key' + bytes([x]), bytes([x])) for x in range(2, 6)], store_type)
+            self.assertEqual(keys, [b'key' + bytes([x]) for x in reversed(range(10))], store_type)
+            self.assertEqual(len(list(store.RangeIter())), 11, store_type)
+
+    def test_snapshot(self):
+        for store_type, store in test_util.open_key_value_stores(self.__test_path):
+            # GIVEN
+            store.Put(b'a', b'a')
+            snapshot = store.CreateSnapshot()
+
+            # WHEN
+            store.Put(b'a', b'changed')
+            store.Put(b'b', b'b')
+
+            # THEN
+            self.assertEqual(bytes(snapshot.Get(b'a')), b'a', store_type)
+            self.assertRaises(KeyError, snapshot.Get, b'b')
+            self.assertEqual([bytes(key) for key in snapshot.RangeIter(include_value=False)], [b'a'], store_type)
+            snapshot.Release()
+
+    def test_reopen(self):
+        for store_type in (conf.KeyValueStoreType.leveldb.name, conf.KeyValueStoreType.sqlite3.name):
+            # GIVEN
+            db_path = os.path.join(self.__test_path, store_type)
+            self.assertRaises(KeyValueStoreError, open_key_value_store, db_path, store_type, False)
+            store = open_key_value_store(db_path, store_type)
+            store.Put(b'key', b'value', sync=True)
+            store.Close()
+            del store
+
+            # WHEN
+            store = open_key_value_store(db_path, store_type, create_if_missing=False)
+
+            # THEN
+            self.assertEqual(bytes(store.Get(b'key')), b'value', store_type)
+
+    def test_blockchain_on_stores(self):
+        """ GIVEN blockchain on each key value store
+        WHEN add blocks
+        THEN blocks and txs are found from each store
+        """
+        peer_auth = test_util.create_peer_auth()
+        for store_type, store in test_util.open_key_value_stores(self.__test_path):
+            # GIVEN
+            chain = BlockChain(store)
+
+            # WHEN
+            blocks = test_util.add_confirmed_blocks(chain, self.__peer_id, peer_auth, 3, 5)
+
+            # THEN
+            self.assertEqual(chain.block_height, 3, store_type)
+            self.assertEqual([block.block_hash for block in chain.iter_blocks(1)],
+                             [block.block_hash for block in blocks], store_type)
+            for block in blocks:
+                self.assertEqual(chain.find_block_by_hash(block.block_hash).height, block.height, store_type)
+                for tx in block.confirmed_transaction_list:
+                    self.assertEqual(chain.find_tx_by_key(tx.get_tx_hash()).get_tx_hash(), tx.get_tx_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
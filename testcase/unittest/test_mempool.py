@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Mempool"""
+
+import pickle
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Mempool, MempoolPutResult, Transaction, TransactionType
+
+util.set_log_level_debug()
+
+
+class TestMempool(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        self.__drop_oldest = conf.MEMPOOL_DROP_OLDEST
+
+    def tearDown(self):
+        conf.MEMPOOL_DROP_OLDEST = self.__drop_oldest
+
+    @staticmethod
+    def __create_peer_list_tx():
+        tx = Transaction()
+        tx.type = TransactionType.peer_list
+        tx.put_data(b'peer list dump')
+        return tx
+
+    def test_put_and_pop(self):
+        # GIVEN
+        mempool = Mempool()
+        txs = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 10)
+
+        # WHEN
+        for tx in txs:
+            self.assertEqual(mempool.put(tx), MempoolPutResult.added)
+        self.assertEqual(mempool.put(txs[3]), MempoolPutResult.duplicate)
+        self.assertEqual(mempool.put(pickle.loads(pickle.dumps(txs[5]))), MempoolPutResult.duplicate)
+
+        # THEN 받은 순서대로 꺼낸다.
+        self.assertEqual(len(mempool), 10)
+        self.assertTrue(mempool.contains(txs[9].tx_hash))
+        self.assertEqual(mempool.get_status()['bytes'], sum(tx.serialized_size() for tx in txs))
+        self.assertEqual([mempool.pop() for x in range(10)], txs)
+        self.assertIsNone(mempool.pop())
+        self.assertTrue(mempool.empty())
+
+        status = mempool.get_status()
+        self.assertEqual(status['bytes'], 0)
+        self.assertEqual(status['put'], 10)
+        self.assertEqual(status['duplicate'], 2)
+        self.assertEqual(status['pop'], 10)
+
+    def test_remove_block_txs(self):
+        # GIVEN
+        mempool = Mempool()
+        txs = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 10)
+        for tx in txs:
+            mempool.put(tx)
+
+        # WHEN block 에 담긴 tx 와 mempool 에 없는 tx 를 제거한다.
+        remove_count = mempool.remove([tx.tx_hash for tx in txs[2:8]] + ["not exist tx hash"])
+
+        # THEN
+        self.assertEqual(remove_count, 6)
+        self.assertEqual(len(mempool), 4)
+        self.assertEqual([mempool.pop() for x in range(len(mempool))], txs[:2] + txs[8:])
+        self.assertEqual(mempool.get_status()['remove'], 6)
+
+    def test_reject_when_full(self):
+        # GIVEN
+        conf.MEMPOOL_DROP_OLDEST = False
+        txs = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 5)
+        count_limited = Mempool(max_count=3)
+        bytes_limited = Mempool(max_bytes=sum(tx.serialized_size() for tx in txs[:2]))
+
+        # WHEN THEN
+        for mempool, accepted_count in ((count_limited, 3), (bytes_limited, 2)):
+            results = [mempool.put(tx) for tx in txs]
+            self.assertEqual(results.count(MempoolPutResult.added), accepted_count)
+            self.assertEqual(results[accepted_count:], [MempoolPutResult.full] * (5 - accepted_count))
+            # peer list tx 는 가득 차도 담는다.
+            self.assertEqual(mempool.put(self.__create_peer_list_tx()), MempoolPutResult.added)
+            self.assertEqual(mempool.pop(), txs[0])
+            self.assertEqual(mempool.get_status()['full'], 5 - accepted_count)
+
+    def test_drop_oldest_when_full(self):
+        # GIVEN
+        conf.MEMPOOL_DROP_OLDEST = True
+        txs = test_util.create_confirmed_txs(self.__peer_id, self.__peer_auth, 5)
+        peer_list_tx = self.__create_peer_list_tx()
+        mempool = Mempool(max_count=3)
+        mempool.put(peer_list_tx)
+
+        # WHEN
+        results = [mempool.put(tx) for tx in txs]
+
+        # THEN peer list tx 를 남기고 오래된 general tx 부터 제거한다.
+        self.assertEqual(results, [MempoolPutResult.added] * 5)
+        self.assertEqual([mempool.pop() for x in range(len(mempool))], [peer_list_tx, txs[3], txs[4]])
+        self.assertEqual(mempool.get_status()['eviction'], 3)
+
+        # 하나의 tx 가 최대 크기보다 크면 담지 않는다.
+        self.assertEqual(Mempool(max_bytes=10).put(txs[0]), MempoolPutResult.full)
+
+
+if __name__ == '__main__':
+    unittest.main()
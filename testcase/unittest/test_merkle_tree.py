@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Merkle Tree"""
+
+import hashlib
+import os
+import random
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import Block, BlockStatus, MerkleTree
+
+util.set_log_level_debug()
+
+
+def legacy_merkle_tree_root(tx_hashes):
+    """이전 버전의 Block 이 merkle tree root hash 를 계산하던 방법"""
+    mt_list = list(tx_hashes)
+    while len(mt_list) > 1:
+        if len(mt_list) % 2 == 1:
+            mt_list.append(mt_list[-1])
+        mt_list = [hashlib.sha256(b''.join([mt_list[idx].encode(encoding='UTF-8'),
+                                             mt_list[idx + 1].encode(encoding='UTF-8')])).hexdigest()
+                   for idx in range(0, len(mt_list), 2)]
+    return mt_list[0]
+
+
+def legacy_merkle_proof(tx_hashes, index):
+    """이전 버전의 Block.mk_merkle_proof 처럼 proof 마다 모든 level 을 다시 만든다."""
+    nodes = [tx_hash.encode(encoding='UTF-8') for tx_hash in tx_hashes]
+    if len(nodes) % 2 and len(nodes) > 2:
+        nodes.append(nodes[-1])
+    layers = [nodes]
+    while len(nodes) > 1:
+        new_nodes = []
+        for i in range(0, len(nodes) - 1, 2):
+            new_nodes.append(hashlib.sha256(b''.join([nodes[i], nodes[i + 1]])).hexdigest().encode(encoding='UTF-8'))
+        if len(new_nodes) % 2 and len(new_nodes) > 2:
+            new_nodes.append(new_nodes[-1])
+        nodes = new_nodes
+        layers.append(nodes)
+    return [layers[i][(index >> i) ^ 1].decode('utf-8') for i in range(len(layers) - 1)]
+
+
+def random_tx_hashes(count):
+    return [os.urandom(32).hex() for _ in range(count)]
+
+
+class TestMerkleTree(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__merkle_tree_version = conf.MERKLE_TREE_VERSION
+
+    def tearDown(self):
+        conf.MERKLE_TREE_VERSION = self.__merkle_tree_version
+
+    def test_hex_root_is_same_as_legacy(self):
+        for count in range(1, 18):
+            # GIVEN
+            tx_hashes = random_tx_hashes(count)
+
+            # WHEN
+            merkle_tree = MerkleTree(tx_hashes, MerkleTree.HEX)
+
+            # THEN
+            self.assertEqual(merkle_tree.root, legacy_merkle_tree_root(tx_hashes))
+            self.assertEqual(merkle_tree.leaf_count, count)
+
+        self.assertEqual(MerkleTree([]).root, "")
+        self.assertRaises(ValueError, MerkleTree, [], 2)
+
+    def test_proof(self):
+        """ GIVEN merkle trees of odd and even tx counts in each version
+        WHEN make proof of every tx
+        THEN all proofs are verified and a proof of other tx is not verified
+        """
+        for version in (MerkleTree.HEX, MerkleTree.RAW):
+            for count in (1, 2, 3, 5, 8, 13):
+                # GIVEN
+                tx_hashes = random_tx_hashes(count)
+                merkle_tree = MerkleTree(tx_hashes, version)
+
+                for index, tx_hash in enumerate(tx_hashes):
+                    # WHEN
+                    siblings = merkle_tree.proof(index)
+
+                    # THEN
+                    self.assertTrue(MerkleTree.verify_proof(tx_hash, index, siblings, merkle_tree.root, version))
+                    self.assertFalse(MerkleTree.verify_proof(random_tx_hashes(1)[0], index, siblings,
+                                                             merkle_tree.root, version))
+                    if version == MerkleTree.HEX:
+                        self.assertEqual(siblings, legacy_merkle_proof(tx_hashes, index))
+
+                self.assertRaises(IndexError, merkle_tree.proof, count)
+
+    def test_append(self):
+        """ GIVEN tx hashes
+        WHEN append tx hashes one by one
+        THEN root and proofs are same as the merkle tree made at once
+        """
+        for version in (MerkleTree.HEX, MerkleTree.RAW):
+            # GIVEN
+            tx_hashes = random_tx_hashes(37)
+            merkle_tree = MerkleTree(version=version)
+
+            for count, tx_hash in enumerate(tx_hashes, 1):
+                # WHEN
+                merkle_tree.append(tx_hash)
+
+                # THEN
+                batch_merkle_tree = MerkleTree(tx_hashes[:count], version)
+                self.assertEqual(merkle_tree.root, batch_merkle_tree.root)
+                self.assertEqual(merkle_tree.proof(count // 2), batch_merkle_tree.proof(count // 2))
+
+    def test_multi_proof(self):
+        """ GIVEN merkle trees of odd and even tx counts in each version
+        WHEN make multi proof of several txs
+        THEN all txs are verified at once with less nodes than proofs of each tx
+        """
+        for version in (MerkleTree.HEX, MerkleTree.RAW):
+            for count in (1, 2, 3, 7, 13, 100):
+                # GIVEN
+                tx_hashes = random_tx_hashes(count)
+                merkle_tree = MerkleTree(tx_hashes, version)
+                indices = random.sample(range(count), max(1, count // 3)) + [count - 1, count - 1]
+
+                # WHEN
+                nodes = merkle_tree.multi_proof(indices)
+
+                # THEN
+                indices_hashes = [tx_hashes[index] for index in indices]
+                self.assertTrue(MerkleTree.verify_multi_proof(indices, indices_hashes, count, nodes,
+                                                              merkle_tree.root, version))
+                self.assertLessEqual(len(nodes), sum(len(merkle_tree.proof(index)) for index in set(indices)))
+
+                self.assertFalse(MerkleTree.verify_multi_proof(indices, indices_hashes[:-1] + random_tx_hashes(1),
+                                                               count, nodes, merkle_tree.root, version))
+                self.assertFalse(MerkleTree.verify_multi_proof(indices, indices_hashes, count + 1, nodes,
+                                                               merkle_tree.root, version))
+                self.assertFalse(MerkleTree.verify_multi_proof(indices, indices_hashes, count,
+                                                               nodes + random_tx_hashes(1), merkle_tree.root, version))
+                if nodes:
+                    self.assertFalse(MerkleTree.verify_multi_proof(indices, indices_hashes, count, nodes[:-1],
+                                                                   merkle_tree.root, version))
+
+                self.assertRaises(IndexError, merkle_tree.multi_proof, [0, count])
+
+    def test_block_merkle_proofs(self):
+        """ GIVEN block with txs
+        WHEN make merkle proofs of every other tx at once
+        THEN the proofs are verified and have less nodes than proofs of each tx
+        """
+        # GIVEN
+        peer_auth = test_util.create_peer_auth()
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        for x in range(11):
+            block.put_transaction(test_util.create_basic_tx(self.__peer_id, peer_auth))
+        block.generate_block(None)
+        indices = list(range(0, 11, 2))
+
+        # WHEN
+        proofs = block.mk_merkle_proofs(indices)
+
+        # THEN
+        self.assertEqual(proofs['indices'], indices)
+        self.assertEqual(proofs['transactions'],
+                         [block.confirmed_transaction_list[index].get_tx_hash() for index in indices])
+        self.assertEqual(proofs['tx_count'], 11)
+        self.assertTrue(Block.merkle_paths(block, indices))
+        self.assertLess(len(proofs['nodes']), sum(len(block.mk_merkle_proof(index)['siblings']) for index in indices))
+
+    def test_raw_merkle_block(self):
+        """ GIVEN block with RAW merkle tree
+        WHEN serialize and deserialize block
+        THEN the merkle tree version is kept and the block is verified
+        """
+        # GIVEN
+        peer_auth = test_util.create_peer_auth()
+        conf.MERKLE_TREE_VERSION = MerkleTree.RAW
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        for x in range(7):
+            block.put_transaction(test_util.create_basic_tx(self.__peer_id, peer_auth))
+        block.generate_block(None)
+        block.block_status = BlockStatus.confirmed
+        hex_root = legacy_merkle_tree_root([tx.get_tx_hash() for tx in block.confirmed_transaction_list])
+        self.assertNotEqual(block.merkle_tree_root_hash, hex_root)
+
+        # WHEN
+        conf.MERKLE_TREE_VERSION = MerkleTree.HEX
+        deserialized_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        deserialized_block.deserialize_block(block.serialize_block())
+
+        # THEN
+        self.assertEqual(deserialized_block.merkle_version, MerkleTree.RAW)
+        self.assertEqual(deserialized_block.merkle_tree_root_hash, block.merkle_tree_root_hash)
+        deserialized_block.verify_integrity()
+        for index in range(7):
+            self.assertTrue(Block.merkle_path(deserialized_block, index))
+
+    def test_incremental_block_merkle_tree(self):
+        """ GIVEN block which txs are put one by one
+        WHEN generate block
+        THEN merkle tree root is same as the root rebuilt from the tx list
+        """
+        # GIVEN
+        peer_auth = test_util.create_peer_auth()
+        txs = test_util.create_basic_txs(self.__peer_id, peer_auth, 101)
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        for tx in txs:
+            block.put_transaction(tx)
+
+        # merkle tree 를 다시 만들도록 tx 목록만 복사한 block
+        rebuild_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        rebuild_block.deserialize_block_body(block.serialize_block_body())
+
+        # WHEN
+        block.generate_block(None)
+        rebuild_block.generate_block(None)
+
+        # THEN
+        self.assertEqual(block.merkle_tree_root_hash, rebuild_block.merkle_tree_root_hash)
+        self.assertEqual(block.merkle_tree_root_hash, legacy_merkle_tree_root([tx.get_tx_hash() for tx in txs]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Public Verifier Container"""
+
+import threading
+import unittest
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager, PeerInfo, PeerManager, PeerStatus
+from loopchain.tools import PublicVerifierContainer
+
+util.set_log_level_debug()
+
+
+def create_public_ders(count):
+    """client 들의 public key (der) 를 만든다."""
+    return [ec.generate_private_key(ec.SECP256K1(), default_backend()).public_key().public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo) for x in range(count)]
+
+
+class TestPublicVerifierContainer(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__max_count = conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT
+        PublicVerifierContainer.clear()
+
+    def tearDown(self):
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = self.__max_count
+        PublicVerifierContainer.clear()
+        ObjectManager().peer_service = None
+
+    def test_lru_eviction_and_status(self):
+        # GIVEN
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = 2
+        publics = create_public_ders(3)
+        status = PublicVerifierContainer.get_status()
+
+        # WHEN
+        verifier0 = PublicVerifierContainer.get_public_verifier(publics[0])
+        PublicVerifierContainer.get_public_verifier(publics[1])
+        self.assertIs(PublicVerifierContainer.get_public_verifier(publics[0]), verifier0)
+        PublicVerifierContainer.get_public_verifier(publics[2])
+
+        # THEN publics[1] 이 가장 오래 쓰이지 않았으므로 제거된다.
+        self.assertIs(PublicVerifierContainer.get_public_verifier(publics[0]), verifier0)
+        PublicVerifierContainer.get_public_verifier(publics[1])
+
+        new_status = PublicVerifierContainer.get_status()
+        self.assertEqual(new_status['count'], 2)
+        self.assertEqual(new_status['hit'] - status['hit'], 2)
+        self.assertEqual(new_status['miss'] - status['miss'], 4)
+        self.assertEqual(new_status['eviction'] - status['eviction'], 2)
+        self.assertEqual(new_status['parse_count'] - status['parse_count'], 4)
+
+        # parse 할 수 없는 key 는 보관하지 않는다.
+        with self.assertRaises(ValueError):
+            PublicVerifierContainer.get_public_verifier(b'invalid public key')
+        self.assertEqual(PublicVerifierContainer.get_status()['parse_fail'], status['parse_fail'] + 1)
+
+    def test_warm_up_peer_cert(self):
+        # GIVEN
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = 10
+        peer_auth = test_util.create_peer_auth()
+        peer_manager = PeerManager()
+
+        # WHEN peer 를 추가하고 많은 client key 로 LRU 를 채운다.
+        peer_manager.add_peer(PeerInfo(peer_id='aaa', group_id='a', target="192.0.0.1:1234",
+                                       status=PeerStatus.unknown, cert=peer_auth.get_public_der(), order=0))
+        peer_manager.add_peer(PeerInfo(peer_id='bbb', group_id='a', target="192.0.0.1:1235",
+                                       status=PeerStatus.unknown, order=0))
+        for public in create_public_ders(20):
+            PublicVerifierContainer.get_public_verifier(public)
+
+        # THEN peer 의 cert 는 제거되지 않고 PeerObject 와 같은 PublicVerifier 를 쓴다.
+        status = PublicVerifierContainer.get_status()
+        self.assertEqual(status['pinned_count'], 1)
+        self.assertEqual(status['count'], 10)
+        self.assertIs(PublicVerifierContainer.get_public_verifier(peer_auth.get_public_der()),
+                      peer_manager.peer_object_list['a']['aaa'].cert_verifier)
+        self.assertEqual(PublicVerifierContainer.get_status()['hit'], status['hit'] + 1)
+
+        # DB 에서 peer list 를 다시 읽은 경우에도 cert 를 미리 parse 한다.
+        PublicVerifierContainer.clear()
+        PeerManager().load(peer_manager.peer_list_data)
+        self.assertEqual(PublicVerifierContainer.get_status()['pinned_count'], 1)
+
+    def test_get_from_threads(self):
+        # GIVEN
+        conf.PUBLIC_VERIFIER_CACHE_MAX_COUNT = 50
+        publics = create_public_ders(100)
+        status = PublicVerifierContainer.get_status()
+
+        def get_public_verifiers(thread_index):
+            for public in publics[thread_index::2] * 3:
+                self.assertIsNotNone(PublicVerifierContainer.get_public_verifier(public))
+
+        # WHEN
+        threads = [threading.Thread(target=get_public_verifiers, args=(x % 2,)) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # THEN
+        new_status = PublicVerifierContainer.get_status()
+        self.assertEqual(new_status['count'], 50)
+        self.assertEqual((new_status['hit'] + new_status['miss']) - (status['hit'] + status['miss']), 600)
+
+
+if __name__ == '__main__':
+    unittest.main()
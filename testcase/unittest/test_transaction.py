@@ -16,6 +16,7 @@
 # limitations under the License.
 """Test Transaction Functions"""
 
+import collections
 import logging
 import time
 import unittest
@@ -39,6 +40,16 @@ class TransactionDataOnly:
         self.__transaction_hash = ""
 
 
+class LegacyTransaction:
+    """__slots__ 이전 버전의 tx 와 같은 모양의 object (instance __dict__, OrderedDict meta, bytearray data)"""
+
+    def __init__(self, tx):
+        state = tx.__getstate__()
+        state['_Transaction__meta'] = collections.OrderedDict(state['_Transaction__meta'])
+        state['_Transaction__data'] = bytearray(state['_Transaction__data'])
+        self.__dict__.update(state)
+
+
 class TestTransaction(unittest.TestCase):
 
     def setUp(self):
@@ -62,6 +73,65 @@ class TestTransaction(unittest.TestCase):
 
         self.assertNotEqual(meta_data["peer_id"], tx.meta["peer_id"])
 
+    def test_meta_is_read_only(self):
+        # GIVEN
+        tx = Transaction()
+        tx.init_meta("AAAAA", "BBBBB", "CCCCC", conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        tx_hash = tx.put_data("TEST DATA")
+
+        # WHEN THEN
+        with self.assertRaises(TypeError):
+            tx.meta[Transaction.PEER_ID_KEY] = "ABCDE"
+        with self.assertRaises(AttributeError):
+            tx.undefined_attribute = "ABCDE"
+        self.assertEqual(tx.meta[Transaction.PEER_ID_KEY], "AAAAA")
+        self.assertEqual(list(tx.meta), [Transaction.PEER_ID_KEY, Transaction.SCORE_ID_KEY,
+                                         Transaction.SCORE_VERSION_KEY, Transaction.CHANNEL_KEY])
+        self.assertEqual(Transaction.generate_transaction_hash(tx), tx_hash)
+
+    def test_deserialize_tx_without_data_copy(self):
+        # GIVEN
+        tx = Transaction()
+        tx.put_meta("peer_id", "12345")
+        tx.put_data("TEST DATA")
+        tx_dump = tx.serialize_tx()
+
+        # WHEN
+        tx2 = Transaction()
+        tx2.deserialize_tx(memoryview(tx_dump))
+
+        # THEN data 는 tx_dump 를 그대로 보며 get_data 와 pickle 은 bytes 를 쓴다.
+        self.assertIs(tx2.data_view.obj, tx_dump)
+        self.assertEqual(tx2.get_data_string(), "TEST DATA")
+        self.assertEqual(Transaction.generate_transaction_hash(tx2), tx.tx_hash)
+        self.assertEqual(tx2.serialize_tx(), tx_dump)
+
+        tx3 = pickle.loads(pickle.dumps(tx2))
+        self.assertEqual(tx3.get_data(), b"TEST DATA")
+        self.assertEqual(tx3.meta, tx.meta)
+
+    def test_load_legacy_pickled_tx(self):
+        """ GIVEN pickle state of the tx before __slots__ (OrderedDict meta, bytearray data)
+        WHEN load the state
+        THEN tx has same hash and dict meta, bytes data
+        """
+        # GIVEN
+        tx = Transaction()
+        tx.init_meta("AAAAA", "BBBBB", "CCCCC", conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        tx.put_data("TEST DATA")
+        legacy_state = LegacyTransaction(tx).__dict__
+
+        # WHEN pickle.loads 는 __setstate__ 로 state 를 복원한다.
+        tx2 = Transaction.__new__(Transaction)
+        tx2.__setstate__(legacy_state)
+
+        # THEN
+        self.assertEqual(tx2.tx_hash, tx.tx_hash)
+        self.assertEqual(Transaction.generate_transaction_hash(tx2), tx.tx_hash)
+        self.assertIs(type(tx2.get_data()), bytes)
+        self.assertEqual(tx2.meta, tx.meta)
+        self.assertFalse(hasattr(tx2, '__dict__'))
+
     def test_put_data(self):
         """트랜잭션 생성확인
         해쉬값의 존재여부
@@ -151,7 +221,7 @@ class TestTransaction(unittest.TestCase):
         # GIVEN
         tx = Transaction()
         tx.put_data("TEST")
-        tx.transaction_type = TransactionStatus.confirmed
+        tx.status = TransactionStatus.confirmed
 
         tx_only_data = TransactionDataOnly()
         tx_only_data.data = "TEST"
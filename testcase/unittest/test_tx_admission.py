@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Tx Admission"""
+
+import pickle
+import unittest
+from unittest.mock import Mock, patch
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, Mempool, Transaction, TransactionStatus
+from loopchain.peer import BlockManager, OuterService
+from loopchain.peer.tx_admission import TxAdmission
+from loopchain.protos import loopchain_pb2, message_code
+from testcase.unittest.test_consensus_base import BlockManagerForTest, CandidateBlocksForTest, ConsensusForTest
+
+util.set_log_level_debug()
+
+
+class BlockChainForTest:
+    """block db 대신 confirm 된 tx hash 만 보관하는 blockchain"""
+
+    def __init__(self):
+        self.tx_hashes = set()
+
+    def contains_tx(self, tx_hash):
+        return tx_hash in self.tx_hashes
+
+
+class TestTxAdmission(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+        ObjectManager().peer_service = None
+
+    def test_admit_tx(self):
+        # GIVEN
+        mempool = Mempool()
+        blockchain = BlockChainForTest()
+        tx_admission = TxAdmission(mempool, blockchain)
+        tx_dumps = [pickle.dumps(tx) for tx in test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 3)]
+        blockchain.tx_hashes.add(pickle.loads(tx_dumps[2]).tx_hash)
+
+        # WHEN
+        results = [tx_admission.admit(tx_dump) for tx_dump in tx_dumps + tx_dumps[:1]]
+
+        # THEN mempool 이나 block db 에 있는 tx 는 거절한다.
+        self.assertEqual([response_code for response_code, message, tx_hash in results], [
+            message_code.Response.success,
+            message_code.Response.success,
+            message_code.Response.fail_duplicate_tx,
+            message_code.Response.fail_duplicate_tx])
+        self.assertEqual([tx_hash for response_code, message, tx_hash in results],
+                         [pickle.loads(tx_dump).tx_hash for tx_dump in tx_dumps + tx_dumps[:1]])
+
+        # 검증한 tx 는 confirmed 상태로 mempool 에 들어간다.
+        tx = mempool.pop()
+        self.assertEqual(tx.tx_hash, pickle.loads(tx_dumps[0]).tx_hash)
+        self.assertEqual(tx.status, TransactionStatus.confirmed)
+
+        status = tx_admission.get_status()
+        self.assertEqual(status['count'], 4)
+        self.assertEqual(status['accepted'], 2)
+        self.assertEqual(status['duplicate'], 2)
+        self.assertGreater(status['latency']['max'], 0)
+
+    def test_reject_invalid_tx(self):
+        # GIVEN
+        mempool = Mempool()
+        tx_admission = TxAdmission(mempool, BlockChainForTest())
+        tx = test_util.create_basic_tx(self.__peer_id, self.__peer_auth)
+
+        invalid_sign_tx = pickle.loads(pickle.dumps(tx))
+        invalid_sign_tx._Transaction__signature = b'invalid_sign'
+        # 받은 tx 의 status 는 믿지 않는다.
+        invalid_sign_tx.status = TransactionStatus.confirmed
+        invalid_data_tx = pickle.loads(pickle.dumps(tx))
+        invalid_data_tx._Transaction__data = b'invalid data'
+
+        # WHEN
+        tx_dumps = [pickle.dumps(invalid_sign_tx), pickle.dumps(invalid_data_tx), b'invalid dump',
+                    pickle.dumps("not tx")]
+        results = [tx_admission.admit(tx_dump) for tx_dump in tx_dumps]
+
+        # THEN
+        for response_code, message, tx_hash in results:
+            self.assertEqual(response_code, message_code.Response.fail_validate_params)
+        # load 할 수 없는 tx 는 tx_hash 를 알 수 없다.
+        self.assertEqual([tx_hash for response_code, message, tx_hash in results],
+                         [tx.tx_hash, invalid_data_tx.tx_hash, None, None])
+        self.assertTrue(mempool.empty())
+        self.assertEqual(tx_admission.get_status()['invalid'], 4)
+
+    def test_reject_when_mempool_full(self):
+        # GIVEN
+        tx_admission = TxAdmission(Mempool(max_count=1), BlockChainForTest())
+        tx_dumps = [pickle.dumps(tx) for tx in test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 2)]
+
+        # WHEN
+        results = [tx_admission.admit(tx_dump) for tx_dump in tx_dumps]
+
+        # THEN
+        self.assertEqual(results[0][0], message_code.Response.success)
+        self.assertEqual(results[1][0], message_code.Response.fail_mempool_full)
+        self.assertEqual(tx_admission.get_status()['full'], 1)
+
+    def test_makeup_block_without_tx_validation(self):
+        # GIVEN
+        last_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        last_block.generate_block()
+        block_manager = BlockManagerForTest(CandidateBlocksForTest(last_block))
+        consensus = ConsensusForTest(block_manager)
+        tx_admission = TxAdmission(block_manager.get_mempool(), BlockChainForTest())
+        for tx in test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 10):
+            tx_admission.admit(pickle.dumps(tx))
+        cache_status = Transaction.verified_tx_cache.get_status()
+
+        # WHEN
+        consensus.consensus()
+
+        # THEN leader 는 tx 를 다시 검증하지 않는다. (verified tx cache 도 찾지 않는다.)
+        new_cache_status = Transaction.verified_tx_cache.get_status()
+        self.assertEqual(len(consensus.block.confirmed_transaction_list), 10)
+        self.assertEqual(new_cache_status['hit'] + new_cache_status['miss'],
+                         cache_status['hit'] + cache_status['miss'])
+
+
+    def test_add_tx_by_outer_service(self):
+        """ GIVEN peer with block manager of memory block db
+        WHEN send tx by AddTx of OuterService
+        THEN tx is admitted into the mempool and apm event has the tx hash
+        """
+        # GIVEN
+        block_db_store_type = conf.BLOCK_DB_STORE_TYPE
+        conf.BLOCK_DB_STORE_TYPE = conf.KeyValueStoreType.memory.name
+        peer_service_mock = Mock()
+        peer_service_mock.peer_id = self.__peer_id
+        ObjectManager().peer_service = peer_service_mock
+        try:
+            block_manager = BlockManager(None, self.__peer_id, conf.LOOPCHAIN_DEFAULT_CHANNEL, 'test_add_tx')
+        finally:
+            conf.BLOCK_DB_STORE_TYPE = block_db_store_type
+        peer_service_mock.channel_manager.get_block_manager.return_value = block_manager
+        tx_dumps = [pickle.dumps(tx) for tx in test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 1)]
+        outer_service = OuterService()
+
+        # WHEN
+        with patch.object(util, 'apm_event') as apm_event:
+            reply = outer_service.AddTx(loopchain_pb2.TxSend(tx=tx_dumps[0]), None)
+            duplicate_reply = outer_service.AddTx(loopchain_pb2.TxSend(tx=tx_dumps[0]), None)
+
+        # THEN
+        tx_hash = pickle.loads(tx_dumps[0]).tx_hash
+        self.assertEqual(reply.response_code, message_code.Response.success)
+        self.assertEqual(duplicate_reply.response_code, message_code.Response.fail_duplicate_tx)
+        self.assertEqual(block_manager.get_mempool().pop().tx_hash, tx_hash)
+        apm_event.assert_called_once()
+        self.assertEqual(apm_event.call_args[0][1]['data']['tx_hash'], tx_hash)
+
+if __name__ == '__main__':
+    unittest.main()
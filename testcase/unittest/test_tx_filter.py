@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Tx Bloom Filter"""
+
+import hashlib
+import logging
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockChain, TxBloomFilter
+from loopchain.scoreservice import ScoreResponse
+from loopchain.storage import MemoryStore
+
+util.set_log_level_debug()
+
+
+class CountGetDB(MemoryStore):
+    """Get 호출 횟수를 세는 block db"""
+
+    def __init__(self):
+        super().__init__()
+        self.get_count = 0
+
+    def Get(self, key, verify_checksums=False, fill_cache=True):
+        self.get_count += 1
+        return super().Get(key, verify_checksums, fill_cache)
+
+
+def make_hashes(prefix, count):
+    return [hashlib.sha256(f'{prefix}{x}'.encode()).hexdigest() for x in range(count)]
+
+
+class TestTxFilter(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def test_no_false_negative(self):
+        # GIVEN
+        tx_filter = TxBloomFilter(10000, 0.001)
+        tx_hashes = make_hashes('tx', 10000)
+
+        # WHEN
+        for tx_hash in tx_hashes:
+            tx_filter.add(tx_hash)
+
+        # THEN
+        self.assertTrue(all(tx_filter.might_contain(tx_hash) for tx_hash in tx_hashes))
+        self.assertEqual(tx_filter.get_status()['count'], 10000)
+        self.assertEqual(tx_filter.get_status()['negative'], 0)
+
+    def test_false_positive_rate(self):
+        """ GIVEN filter which has more txs than capacity
+        WHEN lookup unknown txs
+        THEN measured false positive rate is bounded
+        """
+        for tx_count in (10000, 50000):
+            # GIVEN
+            false_positive_rate = 0.001
+            tx_filter = TxBloomFilter(10000, false_positive_rate)
+            for tx_hash in make_hashes('tx', tx_count):
+                tx_filter.add(tx_hash)
+
+            # WHEN
+            unknown_hashes = make_hashes('unknown', 100000)
+            false_positive = sum(1 for tx_hash in unknown_hashes if tx_filter.might_contain(tx_hash))
+
+            # THEN
+            status = tx_filter.get_status()
+            measured_rate = false_positive / len(unknown_hashes)
+            logging.debug(f"{tx_count} txs: filters({status['filters']}) bytes({status['bytes']}) "
+                          f"false positive rate({measured_rate:.5f})")
+            self.assertLessEqual(measured_rate, false_positive_rate * 3)
+            self.assertEqual(status['negative'], len(unknown_hashes) - false_positive)
+
+    def test_blockchain_skips_db_for_unknown_tx(self):
+        """ GIVEN blockchain with txs
+        WHEN find unknown tx and its invoke result
+        THEN blockchain answers without reading block db
+        """
+        # GIVEN
+        block_db = CountGetDB()
+        chain = BlockChain(block_db)
+        blocks = test_util.add_confirmed_blocks(chain, self.__peer_id, test_util.create_peer_auth(), 2, 10)
+        tx_hashes = [tx.get_tx_hash() for block in blocks for tx in block.confirmed_transaction_list]
+        unknown_hash = make_hashes('unknown', 1)[0]
+
+        # WHEN
+        chain.wait_tx_filter_ready()
+        block_db.get_count = 0
+        tx = chain.find_tx_by_key(unknown_hash)
+        invoke_result = chain.find_invoke_result_by_tx_hash(unknown_hash)
+
+        # THEN
+        self.assertIsNone(tx)
+        self.assertEqual(invoke_result, {'code': ScoreResponse.NOT_INVOKED})
+        self.assertEqual(block_db.get_count, 0)
+        self.assertEqual(chain.get_tx_filter_status()['negative'], 2)
+        for tx_hash in tx_hashes:
+            self.assertEqual(chain.find_tx_by_key(tx_hash).get_tx_hash(), tx_hash)
+
+    def test_rebuild_filter_from_block_db(self):
+        # GIVEN
+        block_db = MemoryStore()
+        blocks = test_util.add_confirmed_blocks(
+            BlockChain(block_db), self.__peer_id, test_util.create_peer_auth(), 2, 10)
+        tx_hashes = [tx.get_tx_hash() for block in blocks for tx in block.confirmed_transaction_list]
+
+        # WHEN
+        chain = BlockChain(block_db)
+        chain.wait_tx_filter_ready()
+
+        # THEN
+        self.assertGreaterEqual(chain.get_tx_filter_status()['count'], len(tx_hashes))
+        for tx_hash in tx_hashes:
+            self.assertEqual(chain.find_tx_by_key(tx_hash).get_tx_hash(), tx_hash)
+
+    def test_disable_filter(self):
+        # GIVEN
+        enable_tx_bloom_filter = conf.ENABLE_TX_BLOOM_FILTER
+        conf.ENABLE_TX_BLOOM_FILTER = False
+
+        try:
+            # WHEN
+            chain = BlockChain(MemoryStore())
+
+            # THEN
+            self.assertIsNone(chain.get_tx_filter_status())
+            self.assertIsNone(chain.find_tx_by_key(make_hashes('unknown', 1)[0]))
+        finally:
+            conf.ENABLE_TX_BLOOM_FILTER = enable_tx_bloom_filter
+
+
+if __name__ == '__main__':
+    unittest.main()
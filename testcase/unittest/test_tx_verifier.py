@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Tx Verifier"""
+
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, BlockInValidError, Transaction, TxVerifier
+
+util.set_log_level_debug()
+
+
+class TestTxVerifier(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+
+    def test_verify_on_thread_pool(self):
+        # GIVEN
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 200)
+        invalid_txs = test_util.copy_txs(txs)
+        invalid_txs[150]._Transaction__signature = b'invalid_sign'
+        tx_verifier = TxVerifier(worker_count=4, use_process=False)
+
+        # WHEN
+        Transaction.verified_tx_cache.clear()
+        valid_result = tx_verifier.verify(test_util.copy_txs(txs))
+        invalid_result = tx_verifier.verify(invalid_txs)
+        tx_verifier.shutdown()
+
+        # THEN
+        self.assertIsNone(valid_result)
+        self.assertIs(invalid_result, invalid_txs[150])
+        status = tx_verifier.get_status()
+        self.assertEqual(status['verify_count'], 2)
+        self.assertEqual(status['fail_count'], 1)
+        self.assertEqual(status['tx_count'], 400)
+
+    def test_verify_on_process_pool(self):
+        # GIVEN
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 100)
+        invalid_txs = test_util.copy_txs(txs)
+        invalid_txs[30]._Transaction__data = b'invalid data'
+        tx_verifier = TxVerifier(worker_count=2, use_process=True)
+
+        # WHEN
+        Transaction.verified_tx_cache.clear()
+        valid_result = tx_verifier.verify(test_util.copy_txs(txs))
+        invalid_result = tx_verifier.verify(invalid_txs, verify_signature=False)
+        tx_verifier.shutdown()
+
+        # THEN worker process 에서 검증한 tx 도 이 process 의 verified tx cache 에 남는다.
+        self.assertIsNone(valid_result)
+        self.assertIs(invalid_result, invalid_txs[30])
+        self.assertEqual(Transaction.verified_tx_cache.get_status()['count'], 100)
+
+    def test_stop_at_invalid_tx(self):
+        # GIVEN 처음 tx 가 잘못된 block
+        txs = test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 1000)
+        invalid_txs = test_util.copy_txs(txs)
+        invalid_txs[0]._Transaction__signature = b'invalid_sign'
+        tx_verifier = TxVerifier(worker_count=4, use_process=False)
+
+        # WHEN
+        Transaction.verified_tx_cache.clear()
+        invalid_result = tx_verifier.verify(invalid_txs)
+        tx_verifier.shutdown()
+
+        # THEN 남은 tx 는 모두 검증하지 않는다.
+        self.assertIs(invalid_result, invalid_txs[0])
+        self.assertLess(Transaction.verified_tx_cache.get_status()['count'], len(txs) // 2)
+
+    def test_verify_integrity_with_invalid_tx(self):
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block.put_transaction(test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 100))
+        block.generate_block()
+        block.confirmed_transaction_list[70]._Transaction__signature = b'invalid_sign'
+
+        # WHEN THEN
+        with self.assertRaises(BlockInValidError):
+            block.verify_integrity(tx_verifier=TxVerifier(worker_count=4))
+        block.verify_integrity(verify_tx_signature=False, tx_verifier=TxVerifier(worker_count=4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,10 +16,12 @@
 # limitations under the License.
 """util functions for unittest"""
 
+import json
 import leveldb
 import logging
 import multiprocessing
 import os
+import pickle
 import random
 import time
 from sys import platform
@@ -31,11 +33,12 @@ import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, StubManager
 from loopchain.components import SingletonMetaClass
-from loopchain.blockchain import Transaction
+from loopchain.blockchain import Block, BlockStatus, Transaction, TransactionStatus
 from loopchain.container import ScoreService
 from loopchain.peer import PeerService, PeerAuthorization
 from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
 from loopchain.radiostation import RadioStationService
+from loopchain.storage import open_key_value_store
 
 util.set_log_level_debug()
 
@@ -165,6 +168,17 @@ def make_level_db(db_name=""):
     return blockchain_db
 
 
+def open_key_value_stores(path, name="") -> list:
+    """ conf.KeyValueStoreType 의 모든 store 를 path 아래에 연다.
+
+    :param path: store 를 만들 디렉토리
+    :param name: store 이름 뒤에 붙일 suffix
+    :return: [(store type name, store)]
+    """
+    return [(store_type.name, open_key_value_store(os.path.join(path, store_type.name + name), store_type.name))
+            for store_type in conf.KeyValueStoreType]
+
+
 def close_open_python_process():
     # ubuntu patch
     if platform == "darwin":
@@ -209,6 +223,115 @@ def create_basic_tx(peer_id: str, peer_auth: PeerAuthorization) -> Transaction:
     return tx
 
 
+def create_basic_txs(peer_id: str, peer_auth: PeerAuthorization, size: int) -> list:
+    """ create_basic_tx 로 서명한 tx 를 size 개 만든다.
+
+    :param peer_id: peer_id
+    :param peer_auth:
+    :param size: tx 개수
+    :return: transaction list
+    """
+    return [create_basic_tx(peer_id, peer_auth) for x in range(size)]
+
+
+def copy_txs(txs: list) -> list:
+    """ 다른 peer 에서 받은 tx 처럼 검증 전의 tx 를 만든다.
+
+    :param txs: transaction list
+    :return: pickle 로 복사한 transaction list
+    """
+    return pickle.loads(pickle.dumps(txs))
+
+
+def create_confirmed_txs(peer_id: str, peer_auth: PeerAuthorization, size: int) -> list:
+    """ tx 서명 시간을 줄이기 위해 하나의 tx 를 copy 하여 data 만 바꾼다.
+    서명 검증을 하지 않도록 confirmed 상태로 만든다.
+
+    :param peer_id: peer_id
+    :param peer_auth:
+    :param size: tx 개수
+    :return: transaction list
+    """
+    tx = create_basic_tx(peer_id, peer_auth)
+    tx.status = TransactionStatus.confirmed
+
+    txs = []
+    for x in range(size):
+        tx_copy = pickle.loads(pickle.dumps(tx))
+        tx_copy.put_data("{args:[" + str(x) + "]}")
+        txs.append(tx_copy)
+    return txs
+
+
+def create_icx_txs(peer_id: str, peer_auth: PeerAuthorization, size: int, max_bytes: int=None) -> list:
+    """ icx_sendTransaction 형태의 data 를 가진 tx 를 만든다.
+
+    :param peer_id: peer_id
+    :param peer_auth:
+    :param size: tx 개수
+    :param max_bytes: serialize 한 tx 크기의 합이 max_bytes 이상이 되면 size 보다 적게 만든다.
+    :return: transaction list
+    """
+    txs = []
+    total_bytes = 0
+    for index in range(size):
+        tx = Transaction()
+        tx.put_meta('peer_id', peer_id)
+        tx.put_data(json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'icx_sendTransaction',
+            'params': {
+                'from': f'hx{index:040x}',
+                'to': f'hx{index * 7:040x}',
+                'value': hex(index * 10 ** 18),
+                'fee': '0x2386f26fc10000',
+                'timestamp': str(1500000000000000 + index)}}))
+        tx.sign_hash(peer_auth)
+        txs.append(tx)
+
+        total_bytes += len(tx.serialize_tx())
+        if max_bytes is not None and total_bytes >= max_bytes:
+            break
+    return txs
+
+
+def create_confirmed_block(prev_block: Block, txs: list) -> Block:
+    """ txs 를 담아 prev_block 다음 높이의 confirmed block 을 만든다.
+
+    :param prev_block: 이전 block, None 이면 genesis block 을 만든다.
+    :param txs: block 에 담을 transaction list
+    :return: confirmed block
+    """
+    block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+    for tx in txs:
+        block.put_transaction(tx)
+    block.generate_block(prev_block)
+    block.block_status = BlockStatus.confirmed
+    return block
+
+
+def add_confirmed_blocks(chain, peer_id: str, peer_auth: PeerAuthorization, block_count: int,
+                         tx_count: int=10, is_signed: bool=False) -> list:
+    """ basic tx 를 tx_count 개씩 담은 confirmed block 을 block_count 개 만들어 chain 에 추가한다.
+
+    :param chain: block 을 추가할 BlockChain
+    :param peer_id: peer_id
+    :param peer_auth:
+    :param block_count: 추가할 block 개수
+    :param tx_count: block 마다 담을 tx 개수
+    :param is_signed: True 이면 peer_auth 로 block 을 서명한다.
+    :return: 추가한 block list
+    """
+    blocks = []
+    for x in range(block_count):
+        block = create_confirmed_block(chain.last_block, create_basic_txs(peer_id, peer_auth, tx_count))
+        if is_signed:
+            block.sign(peer_auth)
+        chain.add_block(block)
+        blocks.append(block)
+    return blocks
+
+
 def create_peer_auth() -> PeerAuthorization:
     peer_auth = PeerAuthorization(public_file=conf.PUBLIC_PATH,
                                   pri_file=conf.PRIVATE_PATH,
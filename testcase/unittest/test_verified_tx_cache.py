@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Verified Tx Cache"""
+
+import pickle
+import threading
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.blockchain import Block, Transaction, VerifiedTxCache
+
+util.set_log_level_debug()
+
+
+class TestVerifiedTxCache(unittest.TestCase):
+    __peer_id = 'aaa'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__peer_auth = test_util.create_peer_auth()
+        Transaction.verified_tx_cache.clear()
+
+    def tearDown(self):
+        Transaction.verified_tx_cache.clear()
+
+    def test_lru_eviction_and_status(self):
+        # GIVEN
+        cache = VerifiedTxCache(max_count=2)
+
+        # WHEN
+        cache.put("tx0", b"public", b"sign0")
+        cache.put("tx1", b"public", b"sign1")
+        self.assertTrue(cache.contains("tx0", b"public", b"sign0"))
+        cache.put("tx2", b"public", b"sign2")
+
+        # THEN tx1 이 가장 오래 쓰이지 않았으므로 제거된다.
+        self.assertFalse(cache.contains("tx1", b"public", b"sign1"))
+        self.assertTrue(cache.contains("tx0", b"public", b"sign0"))
+        self.assertTrue(cache.contains("tx2", b"public", b"sign2"))
+        # 같은 tx_hash 라도 public key 나 signature 가 다르면 찾지 못한다.
+        self.assertFalse(cache.contains("tx0", b"public", b"sign1"))
+        self.assertFalse(cache.contains("tx0", b"other public", b"sign0"))
+
+        status = cache.get_status()
+        self.assertEqual(status['count'], 2)
+        self.assertEqual(status['hit'], 3)
+        self.assertEqual(status['miss'], 3)
+        self.assertEqual(status['eviction'], 1)
+        self.assertEqual(status['hit_rate'], 0.5)
+
+    def test_disabled_cache(self):
+        # GIVEN
+        cache = VerifiedTxCache(max_count=0)
+
+        # WHEN
+        cache.put("tx0", b"public", b"sign0")
+
+        # THEN
+        self.assertFalse(cache.is_enabled)
+        self.assertFalse(cache.contains("tx0", b"public", b"sign0"))
+        self.assertEqual(cache.get_status()['count'], 0)
+
+    def test_put_from_threads(self):
+        # GIVEN
+        cache = VerifiedTxCache(max_count=1000)
+
+        def put_txs(thread_index):
+            for x in range(1000):
+                cache.put(f"tx{thread_index}_{x}", b"public", b"sign")
+                cache.contains(f"tx{thread_index}_{x}", b"public", b"sign")
+
+        # WHEN
+        threads = [threading.Thread(target=put_txs, args=(x,)) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # THEN
+        status = cache.get_status()
+        self.assertEqual(status['count'], 1000)
+        self.assertEqual(status['eviction'], 3000)
+        self.assertEqual(status['hit'] + status['miss'], 4000)
+
+    def test_validate_with_cache(self):
+        # GIVEN
+        tx = test_util.create_basic_tx(self.__peer_id, self.__peer_auth)
+        self.assertTrue(Transaction.validate(tx))
+        hit = Transaction.verified_tx_cache.get_status()['hit']
+
+        # WHEN THEN 받은 tx 를 다시 검증하면 cache 를 쓴다.
+        self.assertTrue(Transaction.validate(pickle.loads(pickle.dumps(tx))))
+        self.assertEqual(Transaction.verified_tx_cache.get_status()['hit'], hit + 1)
+
+        # signature 가 다르면 cache 를 쓰지 않고 검증에 실패한다.
+        invalid_sign_tx = pickle.loads(pickle.dumps(tx))
+        invalid_sign_tx._Transaction__signature = b'invalid_sign'
+        self.assertFalse(Transaction.validate(invalid_sign_tx, is_exception_log=False))
+
+        # tx 의 내용이 바뀌면 hash 검증에 실패한다.
+        invalid_data_tx = pickle.loads(pickle.dumps(tx))
+        invalid_data_tx._Transaction__data = b'invalid data'
+        self.assertFalse(Transaction.validate(invalid_data_tx, is_exception_log=False))
+
+    def test_validate_block_with_cache(self):
+        """ GIVEN block of 10 tx
+        WHEN verify the received block with empty cache and verify it again
+        THEN the first verification fills the cache and the second one verifies all tx by the cache
+        """
+        # GIVEN
+        block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        block.put_transaction(test_util.create_basic_txs(self.__peer_id, self.__peer_auth, 10))
+        block.generate_block()
+        block_dump = block.serialize_block()
+        Transaction.verified_tx_cache.clear()
+
+        # WHEN
+        received_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        received_block.deserialize_block(block_dump)
+        received_block.verify_integrity()
+        cold_status = Transaction.verified_tx_cache.get_status()
+
+        received_block = Block(channel_name=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        received_block.deserialize_block(block_dump)
+        received_block.verify_integrity()
+        warm_status = Transaction.verified_tx_cache.get_status()
+
+        # THEN
+        self.assertEqual(cold_status['count'], 10)
+        self.assertEqual(warm_status['count'], 10)
+        self.assertEqual(warm_status['hit'] - cold_status['hit'], 10)
+        self.assertEqual(warm_status['miss'], cold_status['miss'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 theloop, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Verify integrity of a stored chain without running a peer"""
+
+import getopt
+import logging
+import sys
+
+sys.path.append("loopchain/protos")
+import loopchain.utils as util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager  # loopchain.blockchain 보다 먼저 import 되어야 한다.
+from loopchain.blockchain import BlockchainError, ChainVerifier
+from loopchain.storage import KeyValueStoreError, open_key_value_store
+
+
+def main(argv):
+    try:
+        opts, args = getopt.getopt(argv, "dho:", ["help", "start=", "end=", "processes=", "shard=", "leader_key=",
+                                                  "configure_file_path="])
+    except getopt.GetoptError as e:
+        logging.error(e)
+        usage()
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if (opt == "-o") or (opt == "--configure_file_path"):
+            conf.Configure().load_configure_json(arg)
+
+    start_height = 0
+    end_height = None
+    process_count = None
+    shard_size = None
+    leader_public_keys = []
+    for opt, arg in opts:
+        if opt == "--start":
+            start_height = int(arg)
+        elif opt == "--end":
+            end_height = int(arg)
+        elif opt == "--processes":
+            process_count = int(arg)
+        elif opt == "--shard":
+            shard_size = int(arg)
+        elif opt == "--leader_key":
+            with open(arg, "rb") as der:
+                leader_public_keys.append(der.read())
+        elif opt == "-d":
+            util.set_log_level_debug()
+        elif (opt == "-h") or (opt == "--help"):
+            usage()
+            return
+
+    if len(args) != 1:
+        usage()
+        sys.exit(1)
+
+    db_path = args[0]
+    try:
+        block_db = open_key_value_store(db_path, create_if_missing=False)
+        verifier = ChainVerifier(block_db, db_path + conf.BLOCK_ARCHIVE_PATH_SUFFIX, process_count, shard_size,
+                                 leader_public_keys)
+        report = verifier.verify(start_height, end_height)
+    except (KeyValueStoreError, BlockchainError) as e:
+        util.exit_and_msg(f"fail to verify chain: {e}")
+
+    print(f"{db_path}: height({report['start_height']} ~ {report['end_height']}) "
+          f"blocks({report['block_count']}) txs({report['tx_count']}) "
+          f"header only blocks({report['header_only_count']}) "
+          f"block signature({('not verified', 'verified')[report['block_signature']]})")
+    print(f"elapsed({report['elapsed']:.3f}s) processes({report['process_count']}) "
+          f"throughput({report['blocks_per_second']:.1f} blocks/s, {report['txs_per_second']:.1f} txs/s)")
+
+    if report['invalid_height'] is not None:
+        print(f"INVALID: first inconsistent height({report['invalid_height']}) {report['error']}")
+        sys.exit(2)
+    print("OK")
+
+
+def usage():
+    print("USAGE: LoopChain Chain Verify Tool")
+    print("python3 verifytool.py [option] [value] ... [block db path]")
+    print("verify tx hashes, tx signatures, merkle tree root hashes, block hashes and links "
+          "of the block db (.storage/db_*).")
+    print("stop the peer before verifying its block db. the block db is not modified.")
+    print("exit code is 0 if the chain is valid, 2 if an inconsistent block is found.")
+    print("-------------------------------")
+    print("option list")
+    print("-------------------------------")
+    print("-o or --configure_file_path : json configure file path")
+    print("-h or --help : print this usage")
+    print("-d : Display colored log.")
+    print("--start : height of the first block to verify (default 0)")
+    print("--end : height of the last block to verify (default last block)")
+    print("--processes : count of worker processes (default CHAIN_VERIFIER_PROCESS_COUNT, 0 is count of cpu)")
+    print("--shard : count of blocks verified by a worker at once (default CHAIN_VERIFIER_SHARD_SIZE)")
+    print("--leader_key : der public key file of a leader to verify block signatures, can be given several times")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])